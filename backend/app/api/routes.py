@@ -1,31 +1,134 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List, Dict
-from ..schemas.train import TicketQuery, TrainInfo, TrainStop
+import asyncio
+import time
+from datetime import datetime, time as dtime, timedelta
+from urllib.parse import quote, urlencode
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from starlette.responses import StreamingResponse
+from typing import List, Dict, Optional
+from ..core.config import settings
+from ..core.encoding import EncodedPayload, dumps, encoded_json_response
+from ..schemas.train import (SeatHistoryEntry, TicketQuery, TicketRangeQuery, TicketViewOptions, TrainInfo,
+                             TrainStop, TransferQuery, TransferRoute)
+from ..services.parser import SEAT_INDEX
+from ..services.ratelimit import UpstreamUnavailableError
+from ..services.ticket_filter import TicketView
 from ..services.train_service import TrainService
-from fastapi.concurrency import run_in_threadpool
 
 router = APIRouter()
-train_service = TrainService()
+
+async def get_train_service(request: Request) -> TrainService:
+    """获取在应用启动时创建的 TrainService"""
+    return request.app.state.train_service
+
+async def get_ready_train_service(request: Request) -> TrainService:
+    """获取已加载站点表的 TrainService，启动阶段等待片刻后仍未就绪则返回 503"""
+    train_service = request.app.state.train_service
+    if not await train_service.wait_ready(settings.ready_timeout):
+        raise HTTPException(
+            status_code=503,
+            detail="Service is starting, station data not loaded yet"
+        )
+    return train_service
+
+def build_view(query: TicketViewOptions) -> TicketView:
+    """把请求中的附加过滤、排序、投影与分页条件转换为 TicketView，不合法时抛出 ValueError"""
+    return TicketView.build(
+        arrival_start=query.arrival_start.strftime("%H:%M") if query.arrival_start else None,
+        arrival_end=query.arrival_end.strftime("%H:%M") if query.arrival_end else None,
+        max_duration=query.max_duration,
+        seat_classes=query.seat_classes,
+        min_seats=query.min_seats,
+        sort_by=query.sort_by,
+        descending=query.descending,
+        fields=query.fields,
+        offset=query.offset,
+        limit=query.limit
+    )
+
+def total_count(payload: EncodedPayload) -> Optional[int]:
+    """分页结果的分页前车次数"""
+    if payload.headers and 'X-Total-Count' in payload.headers:
+        return int(payload.headers['X-Total-Count'])
+    return None
+
+def canonical_query(query: TicketQuery) -> str:
+    """车票查询的规范查询字符串：参数按名称排序，省略默认值，时刻为 HH:MM，列表以逗号分隔
+
+    同一查询总是得到同一个 URL，便于 HTTP 缓存与反向代理按 URL 缓存 GET 请求。
+    """
+    params = []
+    for name, field in sorted(TicketQuery.__fields__.items()):
+        value = getattr(query, name)
+        if value is None or value == field.default or value == []:
+            continue
+        if name in ('train_types', 'seat_classes'):
+            value = ','.join(sorted({item.upper() if name == 'train_types' else item for item in value}))
+        elif isinstance(value, list):
+            value = ','.join(value)
+        elif isinstance(value, bool):
+            value = 'true' if value else 'false'
+        elif isinstance(value, dtime):
+            value = value.strftime("%H:%M")
+        params.append((name, value))
+    return urlencode(params, quote_via=quote, safe=':,')
+
+def split_list(values: Optional[List[str]]) -> Optional[List[str]]:
+    """查询参数中的列表：可重复参数，也可以逗号分隔"""
+    if not values:
+        return None
+    return [item for value in values for item in value.split(',') if item]
+
+@router.get("/tickets/query", response_model=List[TrainInfo])
+async def get_tickets(request: Request, from_station: str, to_station: str, train_date: str,
+                      purpose_codes: str = "ADULT",
+                      start_time: Optional[dtime] = None, end_time: Optional[dtime] = None,
+                      train_types: Optional[List[str]] = Query(None), via_station: Optional[str] = None,
+                      include_stops: bool = False, include_prices: bool = False,
+                      arrival_start: Optional[dtime] = None, arrival_end: Optional[dtime] = None,
+                      max_duration: Optional[int] = None, seat_classes: Optional[List[str]] = Query(None),
+                      min_seats: Optional[int] = None, sort_by: Optional[str] = None, descending: bool = False,
+                      fields: Optional[List[str]] = Query(None), offset: int = 0, limit: Optional[int] = None,
+                      train_service: TrainService = Depends(get_ready_train_service)):
+    """GET 形式的车票查询，参数与 POST 相同，可被 HTTP 缓存与反向代理缓存
+
+    响应头 Content-Location 为规范形式的 URL，参数顺序与写法不同的同一查询对应同一个 URL。
+    """
+    query = TicketQuery(
+        from_station=from_station, to_station=to_station, train_date=train_date,
+        purpose_codes=purpose_codes, start_time=start_time, end_time=end_time,
+        train_types=split_list(train_types), via_station=via_station,
+        include_stops=include_stops, include_prices=include_prices,
+        arrival_start=arrival_start, arrival_end=arrival_end, max_duration=max_duration,
+        seat_classes=split_list(seat_classes), min_seats=min_seats, sort_by=sort_by,
+        descending=descending, fields=split_list(fields), offset=offset, limit=limit
+    )
+    return await query_tickets(query, request, train_service)
 
 @router.post("/tickets/query", response_model=List[TrainInfo])
-async def query_tickets(query: TicketQuery):
+async def query_tickets(query: TicketQuery, request: Request,
+                        train_service: TrainService = Depends(get_ready_train_service)):
+    """查询车票，返回 ETag 与按结果缓存剩余有效期设置的 Cache-Control，If-None-Match 匹配时返回 304"""
     try:
         # Get station codes
-        from_code = await run_in_threadpool(train_service.get_station_code, query.from_station)
-        to_code = await run_in_threadpool(train_service.get_station_code, query.to_station)
+        from_code = await train_service.get_station_code(query.from_station)
+        to_code = await train_service.get_station_code(query.to_station)
         
         if not from_code or not to_code:
             raise HTTPException(
                 status_code=400,
                 detail="Invalid station name. Please check the station names."
             )
+        try:
+            view = build_view(query)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
         # Convert time objects to strings if they exist
         start_time = query.start_time.strftime("%H:%M") if query.start_time else None
         end_time = query.end_time.strftime("%H:%M") if query.end_time else None
 
-        # Query tickets using async method directly
-        trains = await train_service._async_query_tickets(
+        # 直接返回编码好的 JSON，跳过 response_model 的二次校验与序列化
+        payload = await train_service.query_tickets_payload(
             from_code,
             to_code,
             query.train_date,
@@ -33,26 +136,278 @@ async def query_tickets(query: TicketQuery):
             end_time=end_time,
             train_types=query.train_types,
             via_station=query.via_station,
-            include_stops=query.include_stops
+            include_stops=query.include_stops,
+            include_prices=query.include_prices,
+            view=view
+        )
+        # 客户端与中间缓存最多复用到服务端结果缓存过期为止
+        max_age = train_service.ticket_max_age(from_code, to_code, query.train_date)
+        return encoded_json_response(
+            request, payload,
+            cache_control=f"public, max-age={max_age}" if max_age > 0 else "no-cache",
+            headers={"Content-Location": f"{request.url.path}?{canonical_query(query)}"}
+        )
+
+    except HTTPException:
+        raise
+    except UpstreamUnavailableError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"12306 is temporarily unavailable: {str(e)}",
+            headers={"Retry-After": str(max(1, round(e.retry_after)))}
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to query tickets: {str(e)}"
+        )
+
+@router.post("/tickets/batch")
+async def query_tickets_batch(queries: List[TicketQuery], request: Request,
+                              train_service: TrainService = Depends(get_ready_train_service)):
+    """批量查询车票，按请求顺序返回各查询的结果或错误
+
+    站点名称统一解析一次，相同 (出发站, 到达站, 日期) 的查询共享同一次上游请求与解析结果。
+    每项为 {"status": 200, "trains": [...]}（分页时带 total），失败时为
+    {"status": 400/503/500, "detail": "..."}（503 时带 retry_after），与单个查询接口的状态码一致。
+    """
+    if not queries:
+        raise HTTPException(status_code=400, detail="At least one query is required")
+    if len(queries) > settings.batch_max_queries:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.batch_max_queries} queries per request"
+        )
+
+    codes = await train_service.resolve_stations(
+        name for query in queries for name in (query.from_station, query.to_station)
+    )
+    parts = [dumps({
+        "status": 400,
+        "detail": "Invalid station name. Please check the station names."
+    })] * len(queries)
+    valid = []  # (请求中的序号, 查询)
+    for index, query in enumerate(queries):
+        from_code, to_code = codes.get(query.from_station), codes.get(query.to_station)
+        try:
+            view = build_view(query)
+        except ValueError as e:
+            parts[index] = dumps({"status": 400, "detail": str(e)})
+            continue
+        if from_code and to_code:
+            valid.append((index, (from_code, to_code, query.train_date, {
+                "start_time": query.start_time.strftime("%H:%M") if query.start_time else None,
+                "end_time": query.end_time.strftime("%H:%M") if query.end_time else None,
+                "train_types": query.train_types,
+                "via_station": query.via_station,
+                "include_stops": query.include_stops,
+                "include_prices": query.include_prices,
+                "view": view,
+            })))
+    outcomes = await train_service.query_tickets_batch([item for _, item in valid])
+
+    for (index, _), outcome in zip(valid, outcomes):
+        if isinstance(outcome, EncodedPayload):
+            # 直接拼接已编码的车次列表，不重新解析
+            total = total_count(outcome)
+            head = b'{"status":200,' if total is None else b'{"status":200,"total":%d,' % total
+            parts[index] = head + b'"trains":' + outcome.body + b'}'
+        elif isinstance(outcome, UpstreamUnavailableError):
+            parts[index] = dumps({
+                "status": 503,
+                "detail": f"12306 is temporarily unavailable: {str(outcome)}",
+                "retry_after": max(1, round(outcome.retry_after)),
+            })
+        else:
+            parts[index] = dumps({"status": 500, "detail": f"Failed to query tickets: {str(outcome)}"})
+    return encoded_json_response(request, EncodedPayload(b'[' + b','.join(parts) + b']', fast=True))
+
+@router.post("/tickets/range")
+async def query_tickets_range(query: TicketRangeQuery, request: Request,
+                              train_service: TrainService = Depends(get_ready_train_service)):
+    """按日期范围（可含多个站点对）查询车票，每个 (站点对, 日期) 查询完成后立即推送一条结果
+
+    默认返回 NDJSON（每行一个 JSON 对象，分页时带 total）；Accept 包含 text/event-stream 时以 SSE 推送，
+    全部完成后发送 done 事件。
+    """
+    pairs = [(pair.from_station, pair.to_station) for pair in query.station_pairs or []]
+    if query.from_station and query.to_station:
+        pairs.insert(0, (query.from_station, query.to_station))
+    if not pairs:
+        raise HTTPException(status_code=400, detail="from_station/to_station or station_pairs is required")
+    if len(pairs) > settings.range_max_pairs:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.range_max_pairs} station pairs per request"
+        )
+
+    days = (query.end_date - query.start_date).days + 1
+    if days < 1 or days > settings.range_max_days:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Date range must cover 1 to {settings.range_max_days} days"
+        )
+    train_dates = [(query.start_date + timedelta(days=i)).isoformat() for i in range(days)]
+    try:
+        view = build_view(query)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # 与 pairs 一一对应的站点代码；输出使用请求中的站点名称（不同名称可能对应同一代码）
+    code_pairs = []
+    for from_station, to_station in pairs:
+        from_code = await train_service.get_station_code(from_station)
+        to_code = await train_service.get_station_code(to_station)
+        if not from_code or not to_code:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid station name: {from_station} -> {to_station}"
+            )
+        code_pairs.append((from_code, to_code))
+
+    start_time = query.start_time.strftime("%H:%M") if query.start_time else None
+    end_time = query.end_time.strftime("%H:%M") if query.end_time else None
+    sse = 'text/event-stream' in request.headers.get('accept', '')
+
+    async def stream():
+        results = train_service.query_tickets_range(
+            code_pairs, train_dates,
+            start_time=start_time,
+            end_time=end_time,
+            train_types=query.train_types,
+            via_station=query.via_station,
+            include_stops=query.include_stops,
+            include_prices=query.include_prices,
+            view=view
+        )
+        try:
+            async for index, train_date, payload in results:
+                # 直接拼接已编码的车次列表，不重新解析
+                from_station, to_station = pairs[index]
+                meta = {
+                    "from_station": from_station,
+                    "to_station": to_station,
+                    "train_date": train_date,
+                }
+                total = total_count(payload)
+                if total is not None:
+                    meta["total"] = total
+                head = dumps(meta)
+                line = head[:-1] + b',"trains":' + payload.body + b'}'
+                yield b'event: tickets\ndata: ' + line + b'\n\n' if sse else line + b'\n'
+            if sse:
+                yield b'event: done\ndata: {}\n\n'
+        finally:
+            await results.aclose()
+
+    media_type = 'text/event-stream' if sse else 'application/x-ndjson'
+    return StreamingResponse(stream(), media_type=media_type,
+                             headers={'Cache-Control': 'no-cache'})
+
+@router.get("/tickets/watch")
+async def watch_tickets(from_station: str, to_station: str, train_date: str, request: Request,
+                        seat_classes: Optional[str] = None,
+                        train_service: TrainService = Depends(get_ready_train_service)):
+    """订阅余票变化（SSE）
+
+    先推送一次 snapshot 事件（各车次指定席别的余票），之后仅在余票变化时推送 diff 事件
+    （changed / added / removed）。seat_classes 为逗号分隔的席别，如 "二等座,一等座"；
+    订阅相同条件的客户端共享同一个后台轮询。
+    """
+    from_code = await train_service.get_station_code(from_station)
+    to_code = await train_service.get_station_code(to_station)
+    if not from_code or not to_code:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid station name. Please check the station names."
         )
+    seats = [seat.strip() for seat in seat_classes.split(',') if seat.strip()] if seat_classes else None
+    unknown = [seat for seat in seats or () if seat not in SEAT_INDEX]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown seat class: {', '.join(unknown)}")
+
+    async def stream():
+        # 在生成器内订阅：响应未开始发送（如客户端提前断开）时生成器不会运行，也就不会留下无人取消的轮询
+        subscription = train_service.seat_watcher.subscribe(from_code, to_code, train_date, seats)
+        try:
+            while True:
+                try:
+                    event, data = await asyncio.wait_for(subscription.get(), settings.watch_keepalive)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield b': keepalive\n\n'
+                    continue
+                yield b'event: ' + event.encode() + b'\ndata: ' + dumps(data) + b'\n\n'
+        finally:
+            train_service.seat_watcher.unsubscribe(subscription)
+
+    return StreamingResponse(stream(), media_type='text/event-stream',
+                             headers={'Cache-Control': 'no-cache'})
 
-        if not trains:
-            return []
+@router.post("/tickets/transfer", response_model=List[TransferRoute])
+async def query_transfers(query: TransferQuery, request: Request,
+                          train_service: TrainService = Depends(get_ready_train_service)):
+    """查询一次换乘的行程，按总耗时升序"""
+    try:
+        from_code = await train_service.get_station_code(query.from_station)
+        to_code = await train_service.get_station_code(query.to_station)
+        if not from_code or not to_code:
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid station name. Please check the station names."
+            )
+        if not 0 <= query.min_connection <= query.max_connection:
+            raise HTTPException(
+                status_code=400,
+                detail="min_connection must be between 0 and max_connection"
+            )
 
-        return trains
+        plans = await train_service.plan_transfers(
+            from_code,
+            to_code,
+            query.train_date,
+            min_connection=query.min_connection,
+            max_connection=query.max_connection,
+            start_time=query.start_time.strftime("%H:%M") if query.start_time else None,
+            end_time=query.end_time.strftime("%H:%M") if query.end_time else None,
+            train_types=query.train_types,
+            limit=query.limit
+        )
+        return encoded_json_response(request, EncodedPayload(dumps(plans)))
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to query tickets: {str(e)}"
+            detail=f"Failed to plan transfers: {str(e)}"
         )
 
+@router.get("/cache/stats")
+async def get_cache_stats(train_service: TrainService = Depends(get_train_service)):
+    """车票查询缓存命中统计"""
+    return {
+        "tickets": train_service.ticket_cache.stats(),
+        "stops": train_service.stop_fetcher.cache.stats(),
+        "prices": train_service.price_fetcher.cache.stats(),
+        "shared": train_service.shared_cache.stats() if train_service.shared_cache is not None else None,
+        "prefetch": train_service.prefetcher.stats(),
+        "watch": train_service.seat_watcher.stats(),
+        "upstream": train_service.upstream_guard.state(),
+    }
+
 @router.get("/stations/{station_name}", response_model=List[Dict[str, str]])
-async def search_stations(station_name: str):
+async def search_stations(station_name: str, request: Request,
+                          train_service: TrainService = Depends(get_ready_train_service)):
     """搜索站点，支持模糊匹配"""
     try:
-        stations = await run_in_threadpool(train_service.search_stations, station_name)
-        return stations
+        # 已编码的响应与 ETag 随搜索结果缓存，If-None-Match 匹配时不重新搜索与序列化
+        payload = await train_service.search_stations_payload(station_name)
+        return encoded_json_response(
+            request, payload,
+            cache_control=f"public, max-age={settings.station_http_max_age}" if payload.body != b'[]' else "no-cache"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -60,19 +415,50 @@ async def search_stations(station_name: str):
         )
 
 @router.get("/trains/{train_code}/stops", response_model=List[TrainStop])
-async def get_train_stops(train_code: str, train_date: str = None):
+async def get_train_stops(train_code: str, request: Request, train_date: str = None,
+                          train_service: TrainService = Depends(get_train_service)):
     """获取列车经停站信息"""
     try:
-        # 从文件中读取经停站信息
-        stops = await run_in_threadpool(train_service.get_train_stops_from_file, train_code, train_date)
-        if not stops:
+        # 已编码的响应与 ETag 随经停站缓存，If-None-Match 匹配时不重新序列化
+        payload = await train_service.get_train_stops_payload(train_code, train_date)
+        if payload is None or payload.body == b'[]':
             raise HTTPException(
                 status_code=404,
                 detail=f"Train stops not found for train {train_code}"
             )
-        return stops
+        return encoded_json_response(
+            request, payload,
+            cache_control=f"public, max-age={settings.stops_http_max_age}"
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to get train stops: {str(e)}"
-        ) 
\ No newline at end of file
+        ) 
+
+@router.get("/trains/{train_code}/seat-history", response_model=List[SeatHistoryEntry])
+async def get_seat_history(train_code: str, train_date: str = None,
+                           from_station: str = None, to_station: str = None,
+                           since: Optional[datetime] = None, until: Optional[datetime] = None,
+                           limit: int = Query(1000, ge=1, le=10000),
+                           train_service: TrainService = Depends(get_ready_train_service)):
+    """查询车次的余票变化历史，默认最近 24 小时"""
+    if train_service.seat_history is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Seat history is not enabled"
+        )
+    until_ts = until.timestamp() if until else time.time()
+    since_ts = since.timestamp() if since else until_ts - 86400
+    try:
+        return await train_service.get_seat_history(
+            train_code, since_ts, until_ts, train_date=train_date,
+            from_station=from_station, to_station=to_station, limit=limit
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get seat history: {str(e)}"
+        )
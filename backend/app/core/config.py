@@ -0,0 +1,120 @@
+from typing import Dict, List, Optional
+
+from pydantic import BaseSettings
+
+
+class Settings(BaseSettings):
+    """应用配置，可通过环境变量或 .env 文件覆盖"""
+
+    # 本地数据目录（站点表缓存、车次索引等），默认为 backend/data
+    data_dir: Optional[str] = None
+
+    # 12306 上游
+    upstream_base_url: str = "https://kyfw.12306.cn"
+    upstream_pool_size: int = 10  # 连接池最大连接数
+
+    # 上游限流与熔断，状态保存在 DATA_DIR/upstream_guard.bin，多个 worker 进程共享
+    # 突发容量等于每秒请求数。queryByTrainNo 的额度需容纳一次 include_stops 查询的扇出
+    # （最多 stops_max_fetch_per_query 个未缓存车次），否则请求都耗在排队等令牌上；
+    # 额度越大，单次查询越快，但对 12306 的瞬时压力也越大
+    upstream_rate_limits: Dict[str, float] = {  # 接口名 -> 每秒请求数
+        "queryZ": 5.0,
+        "queryByTrainNo": 50.0,
+        "queryTicketPrice": 10.0,
+        "init": 1.0,
+        "station_name.js": 1.0,
+        "default": 5.0,
+    }
+    upstream_max_wait: float = 2.0  # 等待令牌的最长时间（秒），超过则直接返回 503
+    circuit_failure_threshold: int = 5  # 连续失败多少次后熔断
+    circuit_open_base: float = 5.0  # 首次熔断时长（秒），之后按指数增长
+    circuit_open_max: float = 300.0  # 最长熔断时长（秒）
+
+    # 日志
+    log_level: str = "INFO"
+    log_format: str = "text"  # text 或 json（每行一个 JSON 对象）
+    log_levels: Dict[str, str] = {}  # 按模块覆盖日志级别，如 {"app.services.upstream": "DEBUG"}
+    log_debug_sample_rate: float = 0.1  # DEBUG 日志的采样比例
+
+    # 监控
+    server_timing: bool = False  # 是否在响应头中返回 Server-Timing 分阶段耗时
+
+    # 启动
+    ready_timeout: float = 10.0  # 请求等待站点表加载完成的最长时间（秒）
+
+    # 多 worker 部署：车票、经停站与票价结果经由 DATA_DIR/shared_cache.db 在进程间共享
+    # 单 worker 时没有收益（每次未命中多一次 SQLite 读写），默认关闭，--workers > 1 时开启
+    shared_cache: bool = False
+    shared_cache_lease_timeout: float = 10.0  # 获取结果的进程异常退出后，其他进程等待多久接手（秒）；获取期间租约自动续期
+
+    # 站点表
+    station_refresh_interval: float = 6 * 3600  # 后台重新验证 station_name.js 的间隔（秒）
+    station_reload_min_interval: float = 300  # 搜索未命中触发重新加载的最小间隔（秒）
+    station_http_max_age: int = 3600  # 站点搜索响应的 Cache-Control max-age（秒）
+
+    # 车票查询结果缓存
+    ticket_cache_ttl: float = 10.0  # 缓存有效期（秒）
+    ticket_cache_size: int = 512  # 最多缓存的 (出发站, 到达站, 日期) 组合数
+    ticket_cache_stale: float = 600.0  # 上游不可用时可返回的过期结果的最长时间（秒）
+
+    # 热门路线预取：在车票结果缓存过期前提前刷新查询最多的 (路线, 日期)
+    # 默认关闭：每个热门键约每 (ticket_cache_ttl - prefetch_lead) 秒产生一次额外的 queryZ 请求
+    prefetch_enabled: bool = False
+    prefetch_top_k: int = 10  # 预取的热门 (路线, 日期) 数
+    prefetch_budget: float = 1.0  # 预取每秒最多发起的刷新数（多个 worker 共享）
+    prefetch_lead: float = 3.0  # 缓存剩余有效期不足该秒数时刷新
+    prefetch_interval: float = 1.0  # 调度周期（秒）
+    prefetch_half_life: float = 120.0  # 查询热度的半衰期（秒）
+    prefetch_min_score: float = 2.0  # 热度低于该值的路线不预取；最近 ticket_cache_ttl 秒内无查询的路线也不预取
+
+    # 余票历史：把每次从上游获取的余票追加到 DATA_DIR/seat_history 下的列式文件
+    seat_history_enabled: bool = False
+    seat_history_flush_interval: float = 5.0  # 批量落盘间隔（秒）
+    seat_history_compact_interval: float = 600.0  # 压缩已结束分区的检查间隔（秒）
+    seat_history_retention_days: float = 30.0  # 超过该天数的分区被删除
+    seat_history_max_pending: int = 100000  # 落盘失败时内存中最多保留的行数，超出时丢弃最早的行
+
+    # 经停站
+    stops_concurrency: int = 8  # 同时向 queryByTrainNo 发起的请求数上限
+    stops_cache_ttl: float = 6 * 3600  # 经停站缓存有效期（秒）
+    stops_cache_size: int = 4096
+    stops_max_retries: int = 3
+    # 单次车票查询最多向上游获取的未缓存车次数，超出的车次本次不带经停站（结果标记为不完整、不缓存，
+    # 后续查询继续补齐），避免一次查询排队等待大量令牌；0 表示不限制
+    stops_max_fetch_per_query: int = 50
+    stops_http_max_age: int = 3600  # 经停站响应的 Cache-Control max-age（秒）
+
+    # 票价
+    price_concurrency: int = 8  # 同时向 queryTicketPrice 发起的请求数上限
+    price_cache_ttl: float = 24 * 3600  # 票价缓存有效期（秒）
+    price_cache_size: int = 8192
+    price_max_retries: int = 3
+
+    # 多日期范围查询
+    range_concurrency: int = 4  # 同时进行的 (站点对, 日期) 查询数上限
+    range_max_days: int = 30  # 单次请求最多覆盖的天数
+    range_max_pairs: int = 5  # 单次请求最多的站点对数
+
+    # 批量车票查询
+    batch_max_queries: int = 50  # 单次请求最多的查询数
+    batch_concurrency: int = 8  # 同时进行的 (出发站, 到达站, 日期) 查询数
+
+    # 余票订阅
+    watch_min_interval: float = 10.0  # 余票有变化时的轮询间隔（秒）
+    watch_max_interval: float = 60.0  # 余票长时间无变化时的最长轮询间隔（秒）
+    watch_keepalive: float = 15.0  # SSE 心跳间隔（秒）
+
+    # 换乘规划
+    transfer_max_hubs: int = 6  # 每次规划最多尝试的换乘站数
+    transfer_concurrency: int = 4  # 同时查询的区间数
+    # 途经站点索引中缺少数据时补充的候选换乘站
+    transfer_hubs: List[str] = [
+        "郑州东", "武汉", "南京南", "济南西", "徐州东", "长沙南", "广州南",
+        "西安北", "杭州东", "合肥南", "石家庄", "成都东", "重庆北", "上海虹桥", "北京南",
+    ]
+
+    class Config:
+        env_file = ".env"
+
+
+settings = Settings()
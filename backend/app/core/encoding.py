@@ -0,0 +1,141 @@
+import gzip
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+try:
+    import orjson
+except ImportError:  # 可选依赖，未安装时使用标准库 json
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # 可选依赖，未安装时只支持 gzip
+    brotli = None
+
+# 小于该字节数的响应不压缩
+COMPRESS_MIN_SIZE = 1024
+
+
+def dumps(content: Any) -> bytes:
+    """序列化为紧凑的 UTF-8 JSON，优先使用 orjson"""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    """解析 JSON，优先使用 orjson"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _compress(body: bytes, encoding: str, fast: bool = False) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(body, quality=1 if fast else 5)
+    return gzip.compress(body, compresslevel=1 if fast else 6)
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """根据 Accept-Encoding 选择压缩方式，优先 br，其次 gzip
+
+    显式列出的编码以其 q 值为准（q=0 表示拒绝，即使同时有 *）；* 只作用于未列出的编码，此时使用 gzip。
+    """
+    qualities: Dict[str, float] = {}
+    for item in accept_encoding.lower().split(','):
+        token, _, params = item.partition(';')
+        params = params.strip().replace(' ', '')
+        try:
+            quality = float(params[2:]) if params.startswith('q=') else 1.0
+        except ValueError:
+            quality = 0.0
+        token = token.strip()
+        if token:
+            qualities[token] = quality
+    if brotli is not None and qualities.get('br', 0) > 0:
+        return 'br'
+    if qualities.get('gzip', qualities.get('*', 0)) > 0:
+        return 'gzip'
+    return None
+
+
+class EncodedPayload:
+    """已编码的 JSON 响应体，按需生成并缓存压缩后的版本
+
+    fast 用于每次请求重新拼接、不会被复用的响应体（如批量查询），以最快的级别压缩；
+    headers 为随响应体一起返回的附加响应头（如分页时的 X-Total-Count）。
+    """
+
+    __slots__ = ('body', 'fast', 'headers', '_variants', '_etag')
+
+    def __init__(self, body: bytes, fast: bool = False, headers: Optional[Dict[str, str]] = None):
+        self.body = body
+        self.fast = fast
+        self.headers = headers
+        self._variants: Dict[str, bytes] = {}
+        self._etag: Optional[str] = None
+
+    @property
+    def etag(self) -> str:
+        """响应体与附加响应头（如 X-Total-Count）的哈希（弱 ETag，各压缩版本共用），首次使用时计算并随响应体缓存"""
+        if self._etag is None:
+            digest = hashlib.blake2b(self.body, digest_size=16)
+            for name, value in sorted((self.headers or {}).items()):
+                digest.update(b'\0%s: %s' % (name.lower().encode('latin-1'), value.encode('latin-1')))
+            self._etag = 'W/"%s"' % digest.hexdigest()
+        return self._etag
+
+    def get(self, encoding: Optional[str]) -> bytes:
+        if encoding is None:
+            return self.body
+        compressed = self._variants.get(encoding)
+        if compressed is None:
+            compressed = _compress(self.body, encoding, self.fast)
+            self._variants[encoding] = compressed
+        return compressed
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 是否包含 etag（弱比较，忽略 W/ 前缀）"""
+    if not if_none_match:
+        return False
+    opaque = etag[2:] if etag.startswith('W/') else etag
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*':
+            return True
+        if (candidate[2:] if candidate.startswith('W/') else candidate) == opaque:
+            return True
+    return False
+
+
+def encoded_json_response(request: Request, payload: EncodedPayload, status_code: int = 200,
+                          cache_control: Optional[str] = None,
+                          headers: Optional[Dict[str, str]] = None) -> Response:
+    """直接返回已编码的 JSON，跳过 FastAPI 的 response_model 校验与二次序列化
+
+    指定 cache_control 时同时返回 ETag，请求的 If-None-Match 与之匹配时直接返回 304。
+    """
+    headers = dict(payload.headers or (), **(headers or {}), Vary='Accept-Encoding')
+    if cache_control is not None and status_code == 200:
+        headers['ETag'] = payload.etag
+        headers['Cache-Control'] = cache_control
+        if etag_matches(request.headers.get('if-none-match', ''), payload.etag):
+            return Response(status_code=304, headers=headers)
+    encoding = None
+    if len(payload.body) >= COMPRESS_MIN_SIZE:
+        encoding = choose_encoding(request.headers.get('accept-encoding', ''))
+    if encoding is not None:
+        headers['Content-Encoding'] = encoding
+    return Response(payload.get(encoding), status_code=status_code,
+                    media_type='application/json', headers=headers)
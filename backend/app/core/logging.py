@@ -0,0 +1,150 @@
+"""日志配置：队列化、结构化、带请求 ID 与调试日志采样
+
+事件循环线程中的 logger 调用只把记录放入队列，格式化与写出由 QueueListener 的后台线程完成。
+"""
+import atexit
+import contextvars
+import logging
+import queue
+import random
+import sys
+import time
+import uuid
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+from .config import settings
+from .encoding import dumps
+
+# 当前请求的关联 ID，由 RequestIdMiddleware 设置
+request_id_var: contextvars.ContextVar[str] = contextvars.ContextVar('request_id', default='-')
+
+REQUEST_ID_HEADER = b'x-request-id'
+
+_listener: Optional[QueueListener] = None
+
+
+class ContextQueueHandler(QueueHandler):
+    """在调用线程中只附加请求 ID 并入队，不做格式化
+
+    队列只在进程内使用，记录对象可以原样传给后台线程（包括 exc_info）。
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.request_id = request_id_var.get()
+        return record
+
+
+class DebugSamplingFilter(logging.Filter):
+    """按比例采样 DEBUG 级别的日志，INFO 及以上全部保留"""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.rate >= 1.0:
+            return True
+        return random.random() < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    """每条日志输出一行 JSON"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(record.created))
+                  + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "request_id": getattr(record, 'request_id', '-'),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return dumps(entry).decode('utf-8')
+
+
+TEXT_FORMAT = '%(asctime)s %(levelname)s [%(request_id)s] %(name)s: %(message)s'
+
+
+def setup_logging():
+    """配置根日志：日志级别、按模块的级别覆盖、采样与后台写出线程（重复调用无副作用）"""
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    if settings.log_format == 'json':
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = ContextQueueHandler(log_queue)
+    queue_handler.addFilter(DebugSamplingFilter(settings.log_debug_sample_rate))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(settings.log_level.upper())
+    set_module_levels(settings.log_levels)
+
+    # uvicorn 自带处理器：JSON 格式时统一经由根日志输出，否则保留 uvicorn 的输出并避免重复
+    for name in ('uvicorn', 'uvicorn.access'):
+        uvicorn_logger = logging.getLogger(name)
+        if settings.log_format == 'json':
+            uvicorn_logger.handlers.clear()
+            uvicorn_logger.propagate = True
+        else:
+            uvicorn_logger.propagate = False
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def set_module_levels(levels: Dict[str, str]):
+    """按模块设置日志级别，如 {"app.services.upstream": "DEBUG"}"""
+    for name, level in levels.items():
+        logging.getLogger(name).setLevel(level.upper())
+
+
+def shutdown_logging():
+    """停止后台线程，写出队列中剩余的日志"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+class RequestIdMiddleware:
+    """ASGI 中间件：为每个请求设置关联 ID（沿用请求头 X-Request-ID，否则生成），并在响应头中返回"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope.get('headers', ()):
+            if name == REQUEST_ID_HEADER:
+                request_id = value.decode('latin-1')[:64]
+                break
+        request_id = request_id or uuid.uuid4().hex
+        token = request_id_var.set(request_id)
+
+        async def send_wrapper(message):
+            if message['type'] == 'http.response.start':
+                message['headers'] = list(message.get('headers', [])) + [
+                    (REQUEST_ID_HEADER, request_id.encode('latin-1'))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_id_var.reset(token)
@@ -1,19 +1,22 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .api.routes import router as api_router
+from .services.train_service import TrainService
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
-import json
+from starlette.responses import Response
+from .core.config import settings
+from .core.encoding import dumps
+from .core.logging import RequestIdMiddleware, setup_logging
+from .core.metrics import REGISTRY, MetricsMiddleware
+
+# 日志经队列由后台线程写出，不阻塞事件循环
+setup_logging()
 
 class CustomJSONResponse(JSONResponse):
     def render(self, content) -> bytes:
-        return json.dumps(
-            content,
-            ensure_ascii=False,
-            allow_nan=False,
-            indent=None,
-            separators=(",", ":"),
-        ).encode("utf-8")
+        # 优先使用 orjson，未安装时回退到标准库 json
+        return dumps(content)
 
 app = FastAPI(
     title="12306 Train Ticket API",
@@ -31,9 +34,41 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 请求耗时、并发数与可选的 Server-Timing 响应头
+app.add_middleware(MetricsMiddleware, server_timing=settings.server_timing)
+# 请求关联 ID（最外层，使其他中间件与日志都能读取）
+app.add_middleware(RequestIdMiddleware)
+
 # Include API routes
 app.include_router(api_router, prefix="/api")
 
+@app.on_event("startup")
+async def startup():
+    # 在事件循环内创建服务，站点表与上游会话在后台加载，不阻塞启动
+    app.state.train_service = await TrainService.create()
+    REGISTRY.add_collector(app.state.train_service.collect_metrics)
+
+@app.on_event("shutdown")
+async def shutdown():
+    # 停止后台任务，关闭长连接的上游会话与连接池
+    REGISTRY.remove_collector(app.state.train_service.collect_metrics)
+    await app.state.train_service.close()
+
 @app.get("/")
 async def root():
-    return {"message": "Welcome to 12306 Train Ticket API"} 
\ No newline at end of file
+    return {"message": "Welcome to 12306 Train Ticket API"}
+
+@app.get("/ready")
+async def ready():
+    """就绪检查：站点表加载完成前返回 503"""
+    train_service = app.state.train_service
+    status = train_service.readiness()
+    return CustomJSONResponse(
+        {"ready": train_service.is_ready, **status},
+        status_code=200 if train_service.is_ready else 503
+    ) 
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 文本格式的指标"""
+    return Response(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from typing import List, Optional, Dict
-from datetime import time
+from datetime import date, datetime, time
 
 class TrainStop(BaseModel):
     station_name: str
@@ -19,7 +19,20 @@ class TrainInfo(BaseModel):
     prices: Dict[str, float]
     stops: Optional[List[TrainStop]] = None
 
-class TicketQuery(BaseModel):
+class TicketViewOptions(BaseModel):
+    """车票结果的附加过滤、排序、字段投影与分页条件，历时单位为分钟"""
+    arrival_start: Optional[time] = None
+    arrival_end: Optional[time] = None
+    max_duration: Optional[int] = None
+    seat_classes: Optional[List[str]] = None
+    min_seats: Optional[int] = None
+    sort_by: Optional[str] = None
+    descending: bool = False
+    fields: Optional[List[str]] = None
+    offset: int = 0
+    limit: Optional[int] = None
+
+class TicketQuery(TicketViewOptions):
     from_station: str
     to_station: str
     train_date: str
@@ -28,4 +41,54 @@ class TicketQuery(BaseModel):
     end_time: Optional[time] = None
     train_types: Optional[List[str]] = None
     via_station: Optional[str] = None
-    include_stops: Optional[bool] = False 
\ No newline at end of file
+    include_stops: Optional[bool] = False
+    include_prices: Optional[bool] = False
+
+class StationPair(BaseModel):
+    from_station: str
+    to_station: str
+
+class TicketRangeQuery(TicketViewOptions):
+    """按日期范围查询车票，可同时查询多个站点对（排序与分页对每个站点对与日期分别进行）"""
+    from_station: Optional[str] = None
+    to_station: Optional[str] = None
+    station_pairs: Optional[List[StationPair]] = None
+    start_date: date
+    end_date: date
+    purpose_codes: str = "ADULT"
+    start_time: Optional[time] = None
+    end_time: Optional[time] = None
+    train_types: Optional[List[str]] = None
+    via_station: Optional[str] = None
+    include_stops: Optional[bool] = False
+    include_prices: Optional[bool] = False
+
+
+class TransferQuery(BaseModel):
+    """一次换乘查询，换乘时间单位为分钟"""
+    from_station: str
+    to_station: str
+    train_date: str
+    min_connection: int = 30
+    max_connection: int = 240
+    start_time: Optional[time] = None
+    end_time: Optional[time] = None
+    train_types: Optional[List[str]] = None
+    limit: int = 20
+
+class TransferRoute(BaseModel):
+    transfer_station: str
+    departure_time: str
+    arrival_time: str
+    total_duration: str
+    wait_time: str
+    legs: List[TrainInfo]
+
+class SeatHistoryEntry(BaseModel):
+    """某个时刻观测到的余票（只包含发生变化的观测）"""
+    observed_at: datetime
+    train_date: str
+    train_code: str
+    from_station: str
+    to_station: str
+    seats: Dict[str, str]
@@ -0,0 +1,137 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """带过期时间的 LRU 缓存，并合并对同一个 key 的并发加载（single-flight）
+
+    stale_ttl > 0 时过期条目再保留 stale_ttl 秒，可通过 get_stale() 在上游不可用时读取。
+    backend 为跨进程的第二级缓存（见 shared_cache.SharedNamespace），进程内未命中时经由它加载，
+    条目的有效期取共享缓存中的剩余时间；on_load 在每次加载到进程内（无论来自上游还是共享缓存）后调用。
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 512, stale_ttl: float = 0.0,
+                 backend: Optional[Any] = None,
+                 on_load: Optional[Callable[[Hashable, Any], None]] = None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.stale_ttl = stale_ttl
+        self.backend = backend
+        self.on_load = on_load
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (过期时间, 值)
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.stale_hits = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """读取未过期的缓存值，不存在或已过期时返回 None"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        now = time.monotonic()
+        if expires_at <= now:
+            if expires_at + self.stale_ttl <= now:
+                del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """读取缓存值，允许已过期但仍在 stale_ttl 内的条目"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at + self.stale_ttl <= time.monotonic():
+            del self._data[key]
+            return None
+        self.stale_hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """写入缓存，超出容量时淘汰最久未使用的条目"""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def remaining(self, key: Hashable) -> float:
+        """条目的剩余有效期（秒），不存在或已过期时为 0"""
+        entry = self._data.get(key)
+        if entry is None:
+            return 0.0
+        return max(0.0, entry[0] - time.monotonic())
+
+    def invalidate(self, key: Hashable):
+        self._data.pop(key, None)
+
+    def clear(self):
+        self._data.clear()
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """命中缓存直接返回；否则加载一次，期间相同 key 的请求共享同一次加载结果"""
+        value = self.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._load(key, fetch))
+            # 发起方被取消时，避免无人读取的异常产生告警
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+        else:
+            self.coalesced += 1
+        # shield：单个调用方被取消不影响其他等待同一结果的请求
+        return await asyncio.shield(task)
+
+    async def refresh(self, key: Hashable, fetch: Callable[[], Awaitable[Any]],
+                      min_ttl: float = 0.0) -> Any:
+        """提前重新加载（用于预取）：期间的读取仍命中旧条目，与进行中的加载合并
+
+        有共享缓存时，其中剩余有效期不少于 min_ttl 的条目（如其他 worker 刚刷新的）直接采用。
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, fetch, min_ttl))
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _load(self, key: Hashable, fetch: Callable[[], Awaitable[Any]], min_ttl: float = 0.0) -> Any:
+        try:
+            if self.backend is None:
+                value = await fetch()
+                self.set(key, value)
+            else:
+                value, ttl = await self.backend.load(key, fetch, self.ttl, min_ttl)
+                self.set(key, value, ttl)
+            if self.on_load is not None:
+                self.on_load(key, value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "stale_hits": self.stale_hits,
+            "hit_ratio": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,212 @@
+import logging
+from typing import Any, Dict, List, Optional
+
+from ..core.encoding import dumps, loads
+from ..schemas.train import TrainInfo, TrainStop
+
+logger = logging.getLogger(__name__)
+
+# 席别名称 -> leftTicket/queryZ 结果中的字段下标
+SEAT_FIELDS = (
+    ("商务座", 32),
+    ("一等座", 31),
+    ("二等座", 30),
+    ("软卧", 23),
+    ("硬卧", 28),
+    ("硬座", 29),
+    ("无座", 26),
+)
+MIN_FIELDS = max(index for _, index in SEAT_FIELDS) + 1
+SEAT_INDEX = {name: index for index, (name, _) in enumerate(SEAT_FIELDS)}  # 席别名称 -> seat_counts 中的下标
+# 12306 余票不少于 20 张时显示 "有"，按 20 计
+SEATS_PLENTY = 20
+# 查询票价所需的字段：出发站序号、到达站序号、席别代码串
+FROM_STATION_NO_FIELD = 16
+TO_STATION_NO_FIELD = 17
+SEAT_TYPES_FIELD = 35
+
+
+def to_minutes(value: str) -> Optional[int]:
+    """把 "HH:MM" 转换为分钟数，格式不正确时返回 None"""
+    hours, sep, minutes = value.partition(':')
+    if not sep or not hours.isdigit() or not minutes.isdigit():
+        return None
+    return int(hours) * 60 + int(minutes)
+
+
+def seat_count(value: str) -> int:
+    """余票显示值 -> 张数："有" 按 SEATS_PLENTY 计，"无"、"--"、"*" 等为 0"""
+    if value.isdigit():
+        return int(value)
+    return SEATS_PLENTY if value == '有' else 0
+
+
+def get_train_type(train_code: str) -> str:
+    """根据车次编号判断列车类型"""
+    if not train_code:
+        return "未知"
+    first_letter = train_code[0].upper()
+    if first_letter == 'G':
+        return "高铁"
+    elif first_letter == 'D':
+        return "动车"
+    elif first_letter in ['Z', 'T', 'K']:
+        return "普通列车"
+    else:
+        return "其他"
+
+
+class TrainRecord:
+    """一条解析后的车次记录
+
+    使用 __slots__ 的轻量结构保存在结果缓存中，过滤直接在记录上进行；
+    只有最终返回的车次才转换为 pydantic 模型或响应字典。
+    构造时预先计算过滤与排序用的整数字段：出发/到达时刻与历时（分钟，格式不正确时为 None）
+    以及按 SEAT_FIELDS 顺序的各席别余票张数。
+    """
+
+    __slots__ = (
+        'train_no', 'train_code', 'train_type', 'from_code', 'to_code',
+        'from_station', 'to_station', 'departure_time', 'arrival_time',
+        'duration', 'seats', 'from_station_no', 'to_station_no', 'seat_types',
+        'departure_minutes', 'arrival_minutes', 'duration_minutes', 'seat_counts',
+    )
+
+    def __init__(self, train_no: str, train_code: str, from_code: str, to_code: str,
+                 from_station: str, to_station: str, departure_time: str,
+                 arrival_time: str, duration: str, seats: Dict[str, str],
+                 from_station_no: str = '', to_station_no: str = '', seat_types: str = ''):
+        self.train_no = train_no
+        self.train_code = train_code
+        self.train_type = get_train_type(train_code)
+        self.from_code = from_code
+        self.to_code = to_code
+        self.from_station = from_station
+        self.to_station = to_station
+        self.departure_time = departure_time
+        self.arrival_time = arrival_time
+        self.duration = duration
+        self.seats = seats
+        self.from_station_no = from_station_no
+        self.to_station_no = to_station_no
+        self.seat_types = seat_types
+        self.departure_minutes = to_minutes(departure_time)
+        self.arrival_minutes = to_minutes(arrival_time)
+        self.duration_minutes = to_minutes(duration)
+        self.seat_counts = tuple(seat_count(seats.get(name, '--')) for name, _ in SEAT_FIELDS)
+
+    # 构造参数的顺序，用于在共享缓存中按行保存记录
+    ROW_FIELDS = (
+        'train_no', 'train_code', 'from_code', 'to_code', 'from_station', 'to_station',
+        'departure_time', 'arrival_time', 'duration', 'seats',
+        'from_station_no', 'to_station_no', 'seat_types',
+    )
+
+    def to_row(self) -> List[Any]:
+        return [getattr(self, field) for field in self.ROW_FIELDS]
+
+    @property
+    def price_key(self) -> tuple:
+        """票价缓存键，不含日期（由调用方加上）"""
+        return (self.train_no, self.from_station_no, self.to_station_no, self.seat_types)
+
+    def to_dict(self, stops: Optional[List[Dict]] = None,
+                prices: Optional[Dict[str, float]] = None) -> Dict:
+        """转换为与 TrainInfo 结构一致的字典（跳过 pydantic 校验）"""
+        return {
+            "train_no": self.train_no,
+            "train_code": self.train_code,
+            "train_type": self.train_type,
+            "from_station": {
+                "station_name": self.from_station,
+                "arrival_time": None,
+                "departure_time": self.departure_time,
+                "stopover_time": None,
+            },
+            "to_station": {
+                "station_name": self.to_station,
+                "arrival_time": self.arrival_time,
+                "departure_time": None,
+                "stopover_time": None,
+            },
+            "duration": self.duration,
+            "seats": dict(self.seats),
+            # 票价来自 queryTicketPrice，只在请求 include_prices 时获取
+            "prices": dict(prices) if prices else {},
+            "stops": stops,
+        }
+
+    def to_model(self, stops: Optional[List[Dict]] = None,
+                 prices: Optional[Dict[str, float]] = None) -> TrainInfo:
+        return TrainInfo(
+            train_no=self.train_no,
+            train_code=self.train_code,
+            train_type=self.train_type,
+            from_station=TrainStop(station_name=self.from_station, departure_time=self.departure_time),
+            to_station=TrainStop(station_name=self.to_station, arrival_time=self.arrival_time),
+            duration=self.duration,
+            seats=dict(self.seats),
+            prices=dict(prices) if prices else {},
+            stops=[TrainStop(**stop) for stop in stops] if stops is not None else None
+        )
+
+
+class TrainResultSet:
+    """一次上游查询的全部车次记录，连同按过滤条件缓存的已编码响应
+
+    作为结果缓存的值，随缓存条目一起过期。
+    """
+
+    __slots__ = ('records', 'encoded')
+
+    MAX_ENCODED = 64  # 每个结果集最多缓存的过滤条件组合数
+
+    def __init__(self, records: List[TrainRecord]):
+        self.records = records
+        self.encoded: Dict[tuple, Any] = {}
+
+    def store_encoded(self, key: tuple, payload: Any):
+        if len(self.encoded) >= self.MAX_ENCODED:
+            self.encoded.clear()
+        self.encoded[key] = payload
+
+    def dump(self) -> bytes:
+        """序列化全部记录（不含已编码响应），供跨进程的共享缓存使用"""
+        return dumps([record.to_row() for record in self.records])
+
+    @classmethod
+    def load(cls, data: bytes) -> "TrainResultSet":
+        return cls([TrainRecord(*row) for row in loads(data)])
+
+
+def parse_results(results: List[str], station_map: Dict[str, str]) -> List[TrainRecord]:
+    """一次遍历解析 queryZ 的 data.result 数组，跳过格式不正确的行"""
+    records = []
+    skipped = 0
+    get_name = station_map.get
+    for train_str in results:
+        fields = train_str.split('|')
+        if len(fields) < MIN_FIELDS:
+            skipped += 1
+            continue
+        from_code = fields[6]
+        to_code = fields[7]
+        records.append(TrainRecord(
+            train_no=fields[2],
+            train_code=fields[3],
+            from_code=from_code,
+            to_code=to_code,
+            from_station=get_name(from_code) or from_code,
+            to_station=get_name(to_code) or to_code,
+            departure_time=fields[8],
+            arrival_time=fields[9],
+            duration=fields[10],
+            seats={name: fields[index] or "--" for name, index in SEAT_FIELDS},
+            from_station_no=fields[FROM_STATION_NO_FIELD],
+            to_station_no=fields[TO_STATION_NO_FIELD],
+            seat_types=fields[SEAT_TYPES_FIELD] if len(fields) > SEAT_TYPES_FIELD else '',
+        ))
+    if skipped:
+        logger.error(f"解析车次信息失败: 跳过 {skipped} 条格式不正确的记录")
+    logger.debug(f"成功解析 {len(records)} 条车次信息")
+    return records
@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import math
+import time
+from datetime import date
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (出发站代码, 到达站代码, 日期)
+RouteKey = Tuple[str, str, str]
+
+
+class RoutePopularity:
+    """按 (出发站, 到达站, 日期) 统计查询热度，热度按半衰期指数衰减
+
+    只保留 max_size 个键，超出时淘汰热度最低的一半（均摊 O(1)）。
+    """
+
+    def __init__(self, half_life: float, max_size: int = 1024):
+        self.decay = math.log(2) / half_life
+        self.max_size = max_size
+        self._scores: Dict[RouteKey, Tuple[float, float]] = {}  # 键 -> (热度, 更新时间)
+
+    def _score(self, entry: Tuple[float, float], now: float) -> float:
+        score, updated_at = entry
+        return score * math.exp(-self.decay * (now - updated_at))
+
+    def record(self, key: RouteKey, now: Optional[float] = None):
+        now = time.monotonic() if now is None else now
+        entry = self._scores.get(key)
+        self._scores[key] = ((self._score(entry, now) if entry else 0.0) + 1.0, now)
+        if len(self._scores) > self.max_size:
+            ranked = sorted(self._scores.items(), key=lambda item: self._score(item[1], now), reverse=True)
+            self._scores = dict(ranked[:self.max_size // 2])
+
+    def top(self, k: int, min_score: float = 0.0, now: Optional[float] = None,
+            recent: Optional[float] = None) -> List[Tuple[RouteKey, float]]:
+        """热度最高的 k 个键（不低于 min_score，给出 recent 时还要求最近 recent 秒内被查询过），
+        已过去的日期会被移除"""
+        now = time.monotonic() if now is None else now
+        today = date.today().isoformat()
+        ranked = []
+        for key in list(self._scores):
+            if key[2] < today:
+                del self._scores[key]
+                continue
+            entry = self._scores[key]
+            if recent is not None and now - entry[1] > recent:
+                continue
+            score = self._score(entry, now)
+            if score >= min_score:
+                ranked.append((key, score))
+        ranked.sort(key=lambda item: item[1], reverse=True)
+        return ranked[:k]
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+
+class PrefetchScheduler:
+    """热门路线预取：在车票结果缓存过期前提前刷新查询最多的 top_k 个 (路线, 日期)
+
+    只有最近 recent 秒内仍有用户查询的键才会被刷新，无人查询的路线随即停止预取。
+    每个周期挑出剩余有效期不足 lead 秒的热门键，按剩余有效期从短到长依次刷新；每次刷新
+    先向 try_acquire 申请预算（多个 worker 共享的令牌桶），预算不足时本周期停止。
+    刷新期间的用户查询仍命中旧条目，热门路线因此几乎总是命中缓存。
+    """
+
+    def __init__(self, refresh: Callable[[RouteKey, float], Awaitable[object]],
+                 remaining: Callable[[RouteKey], float], try_acquire: Callable[[], bool],
+                 top_k: int = 10, lead: float = 3.0, interval: float = 1.0,
+                 half_life: float = 120.0, min_score: float = 2.0, recent: Optional[float] = None):
+        self.refresh = refresh  # 刷新 (键, 要求共享缓存中至少剩余的有效期)
+        self.remaining = remaining  # 进程内缓存条目的剩余有效期
+        self.try_acquire = try_acquire
+        self.top_k = top_k
+        self.lead = lead
+        self.interval = interval
+        self.min_score = min_score
+        self.recent = recent  # 最近一次查询距今超过该秒数的键不刷新（None 为不限）
+        self.popularity = RoutePopularity(half_life)
+        self.refreshed = 0
+        self.skipped = 0  # 因预算不足跳过的刷新
+        self.errors = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def record(self, from_station: str, to_station: str, train_date: str):
+        """记录一次用户查询"""
+        self.popularity.record((from_station, to_station, train_date))
+
+    def due(self) -> List[RouteKey]:
+        """需要刷新的热门键，按剩余有效期升序"""
+        candidates = []
+        for key, _ in self.popularity.top(self.top_k, self.min_score, recent=self.recent):
+            remaining = self.remaining(key)
+            if remaining < self.lead:
+                candidates.append((remaining, key))
+        candidates.sort()
+        return [key for _, key in candidates]
+
+    async def run_once(self):
+        for key in self.due():
+            if not self.try_acquire():
+                self.skipped += 1
+                break
+            try:
+                await self.refresh(key, self.lead)
+                self.refreshed += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"预取失败 {key}: {str(e)}")
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"预取调度失败: {str(e)}")
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._loop())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def stats(self) -> Dict:
+        return {
+            "tracked": len(self.popularity),
+            "hot": len(self.popularity.top(self.top_k, self.min_score, recent=self.recent)),
+            "refreshed": self.refreshed,
+            "skipped": self.skipped,
+            "errors": self.errors,
+        }
@@ -0,0 +1,140 @@
+import asyncio
+import logging
+import random
+from typing import Dict, List, Optional, Tuple
+
+from ..core.encoding import dumps, loads
+from ..core.metrics import UPSTREAM_RETRIES
+from .cache import TTLCache
+from .parser import TrainRecord
+from .ratelimit import UpstreamUnavailableError
+from .shared_cache import SharedCache, SharedNamespace
+from .upstream import UpstreamClient
+
+logger = logging.getLogger(__name__)
+
+QUERY_TICKET_PRICE_PATH = '/otn/leftTicket/queryTicketPrice'
+
+# queryTicketPrice 返回的席别代码 -> 席别名称（与 SEAT_FIELDS 的名称一致）
+PRICE_SEAT_CODES = {
+    "A9": "商务座",
+    "P": "特等座",
+    "M": "一等座",
+    "O": "二等座",
+    "A6": "高级软卧",
+    "A4": "软卧",
+    "F": "动卧",
+    "A3": "硬卧",
+    "A1": "硬座",
+    "WZ": "无座",
+}
+
+
+def parse_prices(data: Dict) -> Dict[str, float]:
+    """把 queryTicketPrice 返回的 {"O": "¥553.0", ...} 整理为 {席别名称: 票价}"""
+    prices = {}
+    for code, name in PRICE_SEAT_CODES.items():
+        value = data.get(code)
+        if not isinstance(value, str):
+            continue
+        try:
+            prices[name] = float(value.lstrip('¥').strip())
+        except ValueError:
+            continue
+    return prices
+
+
+class PriceFetcher:
+    """票价获取器
+
+    一次 queryTicketPrice 请求返回该车次区间内所有席别的票价，因此按车次发起请求，
+    按 (train_no, 出发站序号, 到达站序号, 席别代码, 日期) 长时间缓存（票价很少变化，
+    提供 shared 时各 worker 进程共享）。
+    批量获取时先同步读取缓存，只为未命中的车次发起请求，并发受信号量限制，失败时按
+    指数退避加随机抖动重试。
+    """
+
+    def __init__(self, client: UpstreamClient, concurrency: int, ttl: float,
+                 maxsize: int, max_retries: int = 3, backoff: float = 0.5,
+                 shared: Optional[SharedCache] = None):
+        self.client = client
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.cache = TTLCache(
+            ttl, maxsize,
+            backend=SharedNamespace(shared, 'prices', dumps, loads) if shared is not None else None
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 延迟创建，保证信号量绑定到实际运行的事件循环
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    async def get_prices(self, record: TrainRecord, train_date: str) -> Dict[str, float]:
+        """获取单个车次的票价，失败时抛出异常（不写入缓存）"""
+        if not record.seat_types:
+            return {}
+        return await self.cache.get_or_fetch(
+            record.price_key + (train_date,),
+            lambda: self._fetch(record, train_date)
+        )
+
+    async def get_many(self, records: List[TrainRecord], train_date: str
+                       ) -> Tuple[Dict[str, Dict[str, float]], bool]:
+        """批量获取票价，返回 ({train_no: 票价}, 是否全部获取成功)"""
+        prices_by_train = {}
+        pending = []
+        for record in records:
+            if not record.seat_types:
+                continue
+            prices = self.cache.get(record.price_key + (train_date,))
+            if prices is not None:
+                self.cache.hits += 1
+                prices_by_train[record.train_no] = prices
+            else:
+                pending.append(record)
+        if not pending:
+            return prices_by_train, True
+
+        results = await asyncio.gather(
+            *(self.get_prices(record, train_date) for record in pending),
+            return_exceptions=True
+        )
+        complete = True
+        for record, prices in zip(pending, results):
+            if isinstance(prices, Exception):
+                logger.error(f"获取票价失败（{record.train_code}）: {str(prices)}")
+                complete = False
+                continue
+            prices_by_train[record.train_no] = prices
+        return prices_by_train, complete
+
+    async def _fetch(self, record: TrainRecord, train_date: str) -> Dict[str, float]:
+        params = {
+            'train_no': record.train_no,
+            'from_station_no': record.from_station_no,
+            'to_station_no': record.to_station_no,
+            'seat_types': record.seat_types,
+            'train_date': train_date
+        }
+        for attempt in range(self.max_retries):
+            try:
+                async with self._get_semaphore():
+                    result = await self.client.get_json(QUERY_TICKET_PRICE_PATH, params=params)
+                data = result.get('data') if result.get('status') else None
+                if not data:
+                    raise LookupError(f"No prices returned for train {record.train_code}")
+                return parse_prices(data)
+            except (LookupError, UpstreamUnavailableError):
+                raise
+            except Exception as e:
+                if attempt == self.max_retries - 1:
+                    raise
+                # 退避期间不占用并发名额
+                delay = self.backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+                UPSTREAM_RETRIES.inc(endpoint='queryTicketPrice')
+                logger.warning(f"获取票价失败（{record.train_code}），{delay:.2f}s 后重试: {str(e)}")
+                await asyncio.sleep(delay)
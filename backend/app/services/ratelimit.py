@@ -0,0 +1,219 @@
+import asyncio
+import logging
+import mmap
+import os
+import random
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows 没有 fcntl，此时状态只在进程内共享
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'UPG1'
+HEADER_SIZE = 8
+# 每个接口一个槽位：令牌数, 上次补充时间, 连续失败次数, 熔断截止时间
+SLOT = struct.Struct('<ddid')
+MAX_FAILURES = 2 ** 31 - 1  # 连续失败次数饱和于 int32 上限
+MAX_BACKOFF_EXPONENT = 30  # 熔断时长按 open_base * 2 ** n 计算时 n 的上限
+
+
+def endpoint_name(path: str) -> str:
+    """上游路径 -> 限流使用的接口名，如 /otn/leftTicket/queryZ -> queryZ"""
+    return path.split('?', 1)[0].rstrip('/').rsplit('/', 1)[-1]
+
+
+class UpstreamUnavailableError(Exception):
+    """上游暂不可用（熔断或限流），不应重试"""
+
+    def __init__(self, endpoint: str, retry_after: float, reason: str):
+        super().__init__(f"Upstream {endpoint} {reason}, retry after {retry_after:.1f}s")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(UpstreamUnavailableError):
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(endpoint, retry_after, "circuit open")
+
+
+class RateLimitedError(UpstreamUnavailableError):
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(endpoint, retry_after, "rate limited")
+
+
+class UpstreamGuard:
+    """按上游接口的令牌桶限流与熔断器，状态通过共享内存文件在多个 worker 进程间共享
+
+    状态文件用 mmap 映射，读写时以 flock 加锁（临界区只有几次 struct 读写）。
+    连续失败达到阈值后熔断，熔断时长按指数退避加随机抖动增长；熔断到期后只放行
+    一个探测请求，成功则恢复，失败则再次熔断。未在 limits 中配置的接口使用 default。
+    """
+
+    def __init__(self, path: Optional[str], limits: Dict[str, float],
+                 failure_threshold: int = 5, open_base: float = 5.0,
+                 open_max: float = 300.0, max_wait: float = 2.0, probe_timeout: float = 30.0):
+        self.path = path
+        self.limits = dict(limits)  # 接口名 -> 每秒请求数，<= 0 表示不限流
+        self.limits.setdefault('default', 0.0)
+        self.slots = {name: i for i, name in enumerate(sorted(self.limits))}
+        self.failure_threshold = failure_threshold
+        self.open_base = open_base
+        self.open_max = open_max
+        self.max_wait = max_wait
+        self.probe_timeout = probe_timeout
+        self._buf = None
+        self._fd: Optional[int] = None
+        self._thread_lock = threading.Lock()
+
+    def _size(self) -> int:
+        return HEADER_SIZE + SLOT.size * len(self.slots)
+
+    def _open(self):
+        """首次使用时映射状态文件；无法使用文件时退化为进程内状态"""
+        size = self._size()
+        if self.path is None or fcntl is None:
+            self._buf = bytearray(size)
+            return
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            header = os.pread(fd, HEADER_SIZE, 0)
+            if os.fstat(fd).st_size != size or header[:4] != MAGIC:
+                # 新文件或接口配置变化：重新初始化
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, size)
+                os.pwrite(fd, MAGIC.ljust(HEADER_SIZE, b'\0'), 0)
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        self._buf = mmap.mmap(fd, size)
+        self._fd = fd
+
+    @contextmanager
+    def _locked(self):
+        with self._thread_lock:
+            if self._buf is None:
+                self._open()
+            if self._fd is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if self._fd is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _slot(self, endpoint: str) -> int:
+        index = self.slots.get(endpoint, self.slots['default'])
+        return HEADER_SIZE + SLOT.size * index
+
+    def _rate(self, endpoint: str) -> float:
+        return self.limits.get(endpoint, self.limits['default'])
+
+    def _reserve(self, endpoint: str) -> float:
+        """检查熔断并取一个令牌，返回需要等待的秒数"""
+        now = time.time()
+        rate = self._rate(endpoint)
+        burst = max(1.0, rate)
+        with self._locked():
+            offset = self._slot(endpoint)
+            tokens, updated_at, failures, open_until = SLOT.unpack_from(self._buf, offset)
+            probing = False
+            if failures >= self.failure_threshold:
+                if now < open_until:
+                    raise CircuitOpenError(endpoint, open_until - now)
+                # 熔断到期：放行当前请求作为探测（取到令牌后才生效），其他请求在探测期间仍被拒绝
+                probing = True
+
+            wait = 0.0
+            if rate > 0:
+                tokens = burst if updated_at == 0 else min(burst, tokens + (now - updated_at) * rate)
+                if tokens < 1:
+                    wait = (1 - tokens) / rate
+                    if wait > self.max_wait:
+                        # 探测没有发出，保留原来的 open_until，下一个请求仍可探测
+                        SLOT.pack_into(self._buf, offset, tokens, now, failures, open_until)
+                        raise RateLimitedError(endpoint, wait)
+                # 令牌可以为负，表示已被排队中的请求预约
+                tokens -= 1
+            if probing:
+                open_until = now + self.probe_timeout
+                logger.info(f"Upstream circuit half-open for {endpoint}, probing")
+            SLOT.pack_into(self._buf, offset, tokens, now, failures, open_until)
+        return wait
+
+    async def acquire(self, endpoint: str):
+        """请求上游前调用：熔断时立即抛出 CircuitOpenError，令牌不足时最多等待 max_wait 秒"""
+        wait = self._reserve(endpoint)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def try_acquire(self, endpoint: str) -> bool:
+        """不等待地取一个令牌（用于预取等可以跳过的后台请求），令牌不足时返回 False"""
+        now = time.time()
+        rate = self._rate(endpoint)
+        if rate <= 0:
+            return True
+        burst = max(1.0, rate)
+        with self._locked():
+            offset = self._slot(endpoint)
+            tokens, updated_at, failures, open_until = SLOT.unpack_from(self._buf, offset)
+            tokens = burst if updated_at == 0 else min(burst, tokens + (now - updated_at) * rate)
+            acquired = tokens >= 1
+            if acquired:
+                tokens -= 1
+            SLOT.pack_into(self._buf, offset, tokens, now, failures, open_until)
+        return acquired
+
+    def record_success(self, endpoint: str):
+        with self._locked():
+            offset = self._slot(endpoint)
+            tokens, updated_at, failures, open_until = SLOT.unpack_from(self._buf, offset)
+            if failures:
+                if failures >= self.failure_threshold:
+                    logger.info(f"Upstream circuit closed for {endpoint}")
+                SLOT.pack_into(self._buf, offset, tokens, updated_at, 0, 0.0)
+
+    def record_failure(self, endpoint: str):
+        now = time.time()
+        with self._locked():
+            offset = self._slot(endpoint)
+            tokens, updated_at, failures, open_until = SLOT.unpack_from(self._buf, offset)
+            failures = min(failures + 1, MAX_FAILURES)
+            if failures >= self.failure_threshold:
+                # 指数先截断，避免长时间故障后 2 ** n 转 float 溢出
+                exponent = min(failures - self.failure_threshold, MAX_BACKOFF_EXPONENT)
+                delay = min(self.open_max, self.open_base * 2 ** exponent)
+                delay *= random.uniform(0.8, 1.2)
+                open_until = now + delay
+                logger.warning(f"Upstream circuit open for {endpoint} ({failures} failures), "
+                               f"retry in {delay:.1f}s")
+            SLOT.pack_into(self._buf, offset, tokens, updated_at, failures, open_until)
+
+    def state(self) -> Dict[str, Dict]:
+        now = time.time()
+        result = {}
+        with self._locked():
+            for name in self.slots:
+                tokens, updated_at, failures, open_until = SLOT.unpack_from(self._buf, self._slot(name))
+                result[name] = {
+                    "rate": self._rate(name),
+                    "failures": failures,
+                    "open": failures >= self.failure_threshold and now < open_until,
+                    "retry_after": round(max(0.0, open_until - now), 1),
+                }
+        return result
+
+    def close(self):
+        with self._thread_lock:
+            if isinstance(self._buf, mmap.mmap):
+                self._buf.close()
+            if self._fd is not None:
+                os.close(self._fd)
+            self._buf = None
+            self._fd = None
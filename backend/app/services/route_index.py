@@ -0,0 +1,88 @@
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+
+class TrainRouteIndex:
+    """按日期记录每趟列车途经的站点代码
+
+    由经停站获取结果填充，生命周期与服务相同（不随经停站缓存过期），
+    经停站点过滤只需对未收录的列车访问上游。只保留最近 max_dates 个日期。
+    """
+
+    def __init__(self, max_dates: int = 30):
+        self.max_dates = max_dates
+        self._routes: Dict[str, Dict[str, Tuple[str, ...]]] = {}  # 日期 -> train_no -> 有序站点代码
+        self._stations: Dict[str, Dict[str, FrozenSet[str]]] = {}  # 日期 -> train_no -> 站点代码集合
+        self._station_trains: Dict[str, Set[Tuple[str, str]]] = {}  # 站点代码 -> {(日期, train_no)}
+
+    def add(self, train_date: str, train_no: str, station_codes: Iterable[str]):
+        route = tuple(station_codes)
+        if train_date not in self._routes:
+            # 日期格式为 YYYY-MM-DD，字典序即时间顺序，淘汰最早的日期
+            while len(self._routes) >= self.max_dates:
+                oldest = min(self._routes)
+                if train_date < oldest:
+                    return
+                self._evict(oldest)
+            self._routes[train_date] = {}
+            self._stations[train_date] = {}
+        previous = self._routes[train_date].get(train_no)
+        if previous is not None:
+            self._unlink(train_date, train_no, previous)
+        self._routes[train_date][train_no] = route
+        self._stations[train_date][train_no] = frozenset(route)
+        for code in route:
+            self._station_trains.setdefault(code, set()).add((train_date, train_no))
+
+    def _unlink(self, train_date: str, train_no: str, route: Tuple[str, ...]):
+        for code in route:
+            trains = self._station_trains.get(code)
+            if trains is not None:
+                trains.discard((train_date, train_no))
+                if not trains:
+                    del self._station_trains[code]
+
+    def _evict(self, train_date: str):
+        for train_no, route in self._routes.pop(train_date).items():
+            self._unlink(train_date, train_no, route)
+        del self._stations[train_date]
+
+    def stations(self, train_date: str, train_no: str) -> Optional[FrozenSet[str]]:
+        """列车途经站点代码集合，未收录时返回 None"""
+        return self._stations.get(train_date, {}).get(train_no)
+
+    def route(self, train_date: str, train_no: str) -> Optional[Tuple[str, ...]]:
+        """列车按顺序途经的站点代码，未收录时返回 None"""
+        return self._routes.get(train_date, {}).get(train_no)
+
+    def hub_candidates(self, from_code: str, to_code: str, limit: int = 10) -> List[str]:
+        """根据已收录的线路推测换乘站：出发站的列车能到达、且有列车能从该站到达目的站的站点
+
+        按 min(出发站到该站的车次数, 该站到目的站的车次数) 降序返回，同一车次的不同日期只计一次。
+        """
+        outbound = self._reachable(from_code, after=True)
+        inbound = self._reachable(to_code, after=False)
+        scores = {code: min(outbound[code], inbound[code])
+                  for code in outbound.keys() & inbound.keys()
+                  if code not in (from_code, to_code)}
+        return sorted(scores, key=lambda code: (-scores[code], code))[:limit]
+
+    def _reachable(self, station_code: str, after: bool) -> Counter:
+        """经过 station_code 的列车在该站之后（after=True）或之前途经的站点 -> 车次数"""
+        counts = Counter()
+        seen = set()
+        for train_date, train_no in self._station_trains.get(station_code, ()):
+            if train_no in seen:
+                continue
+            seen.add(train_no)
+            route = self._routes[train_date][train_no]
+            index = route.index(station_code)
+            counts.update(set(route[index + 1:] if after else route[:index]))
+        return counts
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        train_date, train_no = key
+        return train_no in self._stations.get(train_date, {})
+
+    def __len__(self) -> int:
+        return sum(len(trains) for trains in self._stations.values())
@@ -0,0 +1,523 @@
+import asyncio
+import bisect
+import calendar
+import json
+import logging
+import os
+import shutil
+import struct
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows 没有 fcntl，此时不加锁（仅适用于单进程）
+    fcntl = None
+
+from .parser import SEAT_FIELDS, TrainRecord
+
+logger = logging.getLogger(__name__)
+
+SEAT_NAMES = tuple(name for name, _ in SEAT_FIELDS)
+PARTITION_SECONDS = 3600  # 每小时一个分区
+
+# 余票数编码为一个字节：数字原样保存（超过 MAX_SEAT_COUNT 的按上限计），其余标记使用保留值
+MAX_SEAT_COUNT = 252
+SEAT_PLENTY = 253  # "有"
+SEAT_OTHER = 254  # "*"（未开售）等其他标记
+SEAT_NA = 255  # "--"，不售该席别
+_SEAT_MARKS = {'无': 0, '有': SEAT_PLENTY, '*': SEAT_OTHER, '--': SEAT_NA, '': SEAT_NA}
+_SEAT_TEXT = ['无'] + [str(i) for i in range(1, MAX_SEAT_COUNT + 1)] + ['有', '*', '--']
+
+# 数据块：魔数、块体长度、行数、新增字典项数、块内最早/最晚观测时间（秒）、标志
+BLOCK = struct.Struct('<4sIIIIII')
+BLOCK_MAGIC = b'SHB1'
+SORTED_BY_TRAIN = 1  # 行按车次排序（压缩后的文件），车次列单调不减
+# 压缩文件头：魔数 + 元数据长度，元数据之后是数据块
+COMPACT = struct.Struct('<4sI')
+COMPACT_MAGIC = b'SHC1'
+MAX_DICT = 0xFFFF  # 字典编号为 uint16
+U32 = 'I' if array('I').itemsize == 4 else 'L'
+
+
+def encode_seat(value: str) -> int:
+    code = _SEAT_MARKS.get(value)
+    if code is not None:
+        return code
+    if value.isdigit():
+        return min(int(value), MAX_SEAT_COUNT)
+    return SEAT_OTHER
+
+
+def decode_seat(code: int) -> str:
+    return _SEAT_TEXT[code]
+
+
+def partition_start(ts: float) -> int:
+    return int(ts) // PARTITION_SECONDS * PARTITION_SECONDS
+
+
+def partition_name(start: int) -> str:
+    return time.strftime('%Y%m%d-%H', time.gmtime(start))
+
+
+class SeatSnapshot(NamedTuple):
+    """某个时刻观测到的一个车次的余票"""
+    observed_at: int
+    train_date: str
+    train_code: str
+    from_code: str
+    to_code: str
+    seats: Dict[str, str]
+
+
+class _Block:
+    """解析后的数据块，各列为 array；strings/lookup 为所在文件的字典（同一文件的块共用）"""
+
+    __slots__ = ('strings', 'lookup', 'min_ts', 'max_ts', 'flags', 'ts', 'date', 'train', 'frm', 'to', 'seats')
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+
+def _encode_block(rows: List[tuple], lookup: Dict[str, int], strings: List[str], flags: int = 0,
+                  written: Optional[int] = None) -> bytes:
+    """把行 (ts, 日期, 车次, 出发站, 到达站, 余票编码) 编码为数据块
+
+    字典中没有的字符串追加到 strings；strings 中前 written 项（默认全部）已在之前的块中写出。
+    """
+    start = len(strings) if written is None else written
+    columns = ([], [], [], [])
+    for row in rows:
+        for column, value in zip(columns, row[1:5]):
+            index = lookup.get(value)
+            if index is None:
+                index = lookup[value] = len(strings)
+                strings.append(value)
+            column.append(index)
+    new = '\n'.join(strings[start:]).encode('utf-8') if len(strings) > start else b''
+    ts = array(U32, [row[0] for row in rows])
+    parts = [struct.pack('<I', len(new)), new, ts.tobytes()]
+    parts.extend(array('H', column).tobytes() for column in columns)
+    # 余票按席别分列保存，每列每行一个字节
+    parts.extend(bytes(row[5][i] for row in rows) for i in range(len(SEAT_NAMES)))
+    body = b''.join(parts)
+    header = BLOCK.pack(BLOCK_MAGIC, len(body), len(rows), len(strings) - start,
+                        min(ts) if rows else 0, max(ts) if rows else 0, flags)
+    return header + body
+
+
+def _decode_blocks(data: bytes, offset: int = 0) -> List[_Block]:
+    """依次解析数据块，末尾不完整的块（写入中或进程异常退出）被忽略"""
+    strings: List[str] = []
+    lookup: Dict[str, int] = {}
+    blocks = []
+    while offset + BLOCK.size <= len(data):
+        magic, length, rows, new_strings, min_ts, max_ts, flags = BLOCK.unpack_from(data, offset)
+        body = offset + BLOCK.size
+        if magic != BLOCK_MAGIC or body + length > len(data):
+            break
+        (dict_length,) = struct.unpack_from('<I', data, body)
+        position = body + 4
+        if new_strings:
+            strings.extend(data[position:position + dict_length].decode('utf-8').split('\n'))
+        position += dict_length
+        block = _Block()
+        block.strings, block.lookup, block.min_ts, block.max_ts, block.flags = strings, lookup, min_ts, max_ts, flags
+        block.ts = array(U32)
+        block.ts.frombytes(data[position:position + rows * 4])
+        position += rows * 4
+        for name in ('date', 'train', 'frm', 'to'):
+            column = array('H')
+            column.frombytes(data[position:position + rows * 2])
+            setattr(block, name, column)
+            position += rows * 2
+        block.seats = [data[position + i * rows:position + (i + 1) * rows] for i in range(len(SEAT_NAMES))]
+        blocks.append(block)
+        offset = body + length
+    lookup.update((value, index) for index, value in enumerate(strings))
+    return blocks
+
+
+def _changes(snapshots: List[SeatSnapshot]) -> List[SeatSnapshot]:
+    """按时间排序的观测中，只保留与同一 (车次, 日期, 区间) 上一次观测时的状态不同的观测"""
+    groups: Dict[tuple, tuple] = {}  # 键 -> (观测时间, 上一次的状态, 本次的状态)
+    changes = []
+    for snapshot in snapshots:
+        key = snapshot[1:5]
+        state = tuple(snapshot.seats.values())
+        observed_at, previous_states, states = groups.get(key, (None, set(), set()))
+        if snapshot.observed_at != observed_at:
+            previous_states, states = states, set()
+            groups[key] = (snapshot.observed_at, previous_states, states)
+        states.add(state)
+        if state not in previous_states:
+            changes.append(snapshot)
+    return changes
+
+
+class _Segment:
+    """当前进程在一个分区中追加写入的文件，字典在文件内逐块累积"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lookup: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+
+class SeatHistory:
+    """余票历史：把每次从上游获取的车次余票追加到按小时分区的列式文件中
+
+    目录结构为 root/<YYYYMMDD-HH>/（UTC），每个进程在分区中追加写入自己的 seg-*.shb，
+    多个 worker 互不加锁。车次、日期与站点代码按文件字典编码为 uint16，余票数编码为一个
+    字节，每行共 19 字节。写入先进入内存队列，由后台任务批量落盘（在线程池中执行）；
+    持续写入失败时队列最多保留 max_pending 行，超出时丢弃最早的行。
+
+    已结束的分区定期压缩：合并全部文件，按 (车次, 日期, 区间, 时间) 排序，只保留余票发生
+    变化的观测，写为一个 compact-*.shc（元数据中记录被替换的文件），按车次查询时二分定位。
+    """
+
+    def __init__(self, root: str, flush_interval: float = 5.0, compact_interval: float = 600.0,
+                 compact_grace: float = 300.0, retention_days: float = 30.0,
+                 file_cache_size: int = 16, max_pending: int = 100000):
+        self.root = root
+        self.flush_interval = flush_interval
+        self.compact_interval = compact_interval
+        self.compact_grace = compact_grace  # 分区结束多久之后才压缩，等待各进程落盘
+        self.retention = retention_days * 86400
+        self.file_cache_size = file_cache_size
+        self.max_pending = max_pending
+        self._pending: List[tuple] = []
+        self._segments: Dict[int, _Segment] = {}  # 分区起始时间 -> 当前写入的文件
+        self._pid = os.getpid()
+        self._write_lock = threading.Lock()
+        self._files: "OrderedDict[str, Tuple[List[str], List[_Block]]]" = OrderedDict()  # 已解析的压缩文件（不可变）
+        self._files_lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._last_compact = time.monotonic()
+        self.rows_recorded = 0
+        self.bytes_written = 0
+        self.compactions = 0
+        self.errors = 0
+        self.dropped = 0  # 队列已满时丢弃的行数
+        self._dropping = False
+        os.makedirs(root, exist_ok=True)
+
+    def record(self, train_date: str, records: Iterable[TrainRecord], observed_at: Optional[float] = None):
+        """记录一次查询结果中全部车次的余票"""
+        ts = int(time.time() if observed_at is None else observed_at)
+        for record in records:
+            seats = record.seats
+            self._pending.append((ts, train_date, record.train_code, record.from_code, record.to_code,
+                                  tuple(seats.get(name, '--') for name in SEAT_NAMES)))
+        self._trim()
+
+    def _trim(self):
+        """队列超过 max_pending 时丢弃最早的行（落盘持续失败时防止无限增长）"""
+        excess = len(self._pending) - self.max_pending
+        if excess <= 0:
+            return
+        del self._pending[:excess]
+        self.dropped += excess
+        if not self._dropping:
+            self._dropping = True
+            logger.warning(f"余票历史写入队列已满（{self.max_pending} 行），丢弃最早的记录")
+
+    # ---- 写入 ----
+
+    def _segment(self, start: int, items: List[tuple]) -> _Segment:
+        # fork 之后、字典将满或文件已被压缩（删除）时换一个新文件
+        if self._pid != os.getpid():
+            self._segments = {}
+            self._pid = os.getpid()
+        segment = self._segments.get(start)
+        if segment is not None:
+            new_strings = {value for item in items for value in item[1:5]}.difference(segment.lookup)
+            if len(segment.strings) + len(new_strings) > MAX_DICT or not os.path.exists(segment.path):
+                segment = None
+        if segment is None:
+            directory = os.path.join(self.root, partition_name(start))
+            os.makedirs(directory, exist_ok=True)
+            segment = _Segment(os.path.join(directory, f"seg-{os.getpid()}-{time.time_ns()}.shb"))
+            self._segments[start] = segment
+        return segment
+
+    def _write(self, start: int, rows: List[tuple]) -> int:
+        """把一个分区的行追加到当前进程的文件，返回写入的字节数"""
+        with self._write_lock:
+            items = [(ts, train_date, train_code, from_code, to_code, bytes(encode_seat(value) for value in seats))
+                     for ts, train_date, train_code, from_code, to_code, seats in rows]
+            segment = self._segment(start, items)
+            try:
+                block = _encode_block(items, segment.lookup, segment.strings)
+                with open(segment.path, 'ab') as f:
+                    f.write(block)
+            except Exception:
+                # 字典已包含本块的新字符串，但文件中可能没有：之后换一个新文件
+                self._segments.pop(start, None)
+                raise
+            # 已经结束的分区不再写入，释放其字典
+            current = partition_start(time.time()) - PARTITION_SECONDS
+            for ended in [ended for ended in self._segments if ended < current]:
+                del self._segments[ended]
+            return len(block)
+
+    async def flush(self):
+        """把队列中的记录按分区追加到文件（在线程池中执行），写入失败的分区放回队列下次重试"""
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        partitions: Dict[int, List[tuple]] = {}
+        for row in rows:
+            partitions.setdefault(partition_start(row[0]), []).append(row)
+        loop = asyncio.get_running_loop()
+        starts = list(partitions)
+        for i, start in enumerate(starts):
+            try:
+                self.bytes_written += await loop.run_in_executor(None, self._write, start, partitions[start])
+                self.rows_recorded += len(partitions[start])
+            except Exception:
+                self.errors += 1
+                # 放在期间新记录的前面，保持时间顺序
+                self._pending[:0] = [row for start in starts[i:] for row in partitions[start]]
+                self._trim()
+                raise
+        self._dropping = False
+
+    # ---- 读取 ----
+
+    def _partition_files(self, directory: str) -> Tuple[Optional[str], List[str]]:
+        """分区中有效的文件：最新的压缩文件与未被其替换的追加文件"""
+        names = os.listdir(directory)
+        compacts = sorted(name for name in names if name.startswith('compact-') and name.endswith('.shc'))
+        latest = compacts[-1] if compacts else None
+        replaced = set(compacts)
+        if latest is not None:
+            replaced.update(self._load_compact(os.path.join(directory, latest))[0])
+        segments = sorted(name for name in names if name.startswith('seg-') and name not in replaced)
+        return latest, segments
+
+    def _load_compact(self, path: str) -> Tuple[List[str], List[_Block]]:
+        with self._files_lock:
+            cached = self._files.get(path)
+            if cached is not None:
+                self._files.move_to_end(path)
+                return cached
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, meta_length = COMPACT.unpack_from(data, 0)
+        if magic != COMPACT_MAGIC:
+            raise ValueError(f"Unknown seat history file: {path}")
+        meta = json.loads(data[COMPACT.size:COMPACT.size + meta_length])
+        loaded = (meta['replaces'], _decode_blocks(data, COMPACT.size + meta_length))
+        with self._files_lock:
+            self._files[path] = loaded
+            while len(self._files) > self.file_cache_size:
+                self._files.popitem(last=False)
+        return loaded
+
+    def _partition_blocks(self, directory: str) -> List[_Block]:
+        # 读取期间分区可能被压缩（追加文件被删除），此时重新列出文件
+        for _ in range(3):
+            latest, segments = self._partition_files(directory)
+            blocks = list(self._load_compact(os.path.join(directory, latest))[1]) if latest else []
+            try:
+                for name in segments:
+                    with open(os.path.join(directory, name), 'rb') as f:
+                        blocks.extend(_decode_blocks(f.read()))
+                return blocks
+            except FileNotFoundError:
+                continue
+        raise RuntimeError(f"Seat history partition keeps changing: {directory}")
+
+    def _partitions(self, since: int, until: int) -> Iterator[Tuple[int, str]]:
+        start = partition_start(since)
+        while start < until:
+            directory = os.path.join(self.root, partition_name(start))
+            if os.path.isdir(directory):
+                yield start, directory
+            start += PARTITION_SECONDS
+
+    def scan(self, since: float, until: float, train_code: Optional[str] = None,
+             train_date: Optional[str] = None, from_code: Optional[str] = None,
+             to_code: Optional[str] = None) -> Iterator[SeatSnapshot]:
+        """按时间范围 [since, until) 扫描，可按车次、日期与区间过滤；按分区依次返回，分区内不保证顺序"""
+        since, until = int(since), int(until)
+        wanted = (train_date, train_code, from_code, to_code)
+        for _, directory in self._partitions(since, until):
+            for block in self._partition_blocks(directory):
+                if block.max_ts < since or block.min_ts >= until:
+                    continue
+                yield from self._scan_block(block, since, until, wanted)
+
+    @staticmethod
+    def _scan_block(block: _Block, since: int, until: int, wanted: tuple) -> Iterator[SeatSnapshot]:
+        strings = block.strings
+        ids = []
+        for value in wanted:
+            if value is None:
+                ids.append(None)
+                continue
+            # 文件中没有该字符串时整块跳过
+            index = block.lookup.get(value)
+            if index is None:
+                return
+            ids.append(index)
+        date_id, train_id, from_id, to_id = ids
+        ts, date, train, frm, to, seats = block.ts, block.date, block.train, block.frm, block.to, block.seats
+
+        if train_id is not None and block.flags & SORTED_BY_TRAIN:
+            rows = range(bisect.bisect_left(train, train_id), bisect.bisect_right(train, train_id))
+        elif train_id is not None:
+            rows = [i for i, value in enumerate(train) if value == train_id]
+        else:
+            rows = range(len(block))
+        if block.min_ts < since or block.max_ts >= until:
+            rows = [i for i in rows if since <= ts[i] < until]
+        for column, wanted_id in ((date, date_id), (frm, from_id), (to, to_id)):
+            if wanted_id is not None:
+                rows = [i for i in rows if column[i] == wanted_id]
+
+        for i in rows:
+            yield SeatSnapshot(ts[i], strings[date[i]], strings[train[i]], strings[frm[i]], strings[to[i]],
+                               {name: _SEAT_TEXT[column[i]] for name, column in zip(SEAT_NAMES, seats)})
+
+    async def query(self, since: float, until: float, limit: Optional[int] = None,
+                    changes_only: bool = False, **filters) -> List[SeatSnapshot]:
+        """在线程池中扫描，结果按观测时间排序；changes_only 时与压缩一样只保留余票发生变化的观测
+
+        limit 限制返回最近的若干条（须为正数，None 表示不限制）。
+        """
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be positive")
+
+        def run():
+            result = sorted(self.scan(since, until, **filters), key=lambda snapshot: snapshot.observed_at)
+            if changes_only:
+                result = _changes(result)
+            return result[-limit:] if limit is not None else result
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, run)
+
+    # ---- 压缩 ----
+
+    def compact_partition(self, directory: str) -> Optional[Tuple[int, int]]:
+        """压缩一个分区，返回 (压缩前行数, 压缩后行数)；无需压缩或其他进程正在压缩时返回 None"""
+        lock_fd = None
+        if fcntl is not None:
+            lock_fd = os.open(os.path.join(directory, '.lock'), os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(lock_fd)
+                return None
+        try:
+            latest, segments = self._partition_files(directory)
+            if not segments:
+                return None
+            rows = []
+            for block in self._partition_blocks(directory):
+                strings, seats = block.strings, block.seats
+                for i in range(len(block)):
+                    rows.append((strings[block.train[i]], strings[block.date[i]], strings[block.frm[i]],
+                                 strings[block.to[i]], block.ts[i], bytes(column[i] for column in seats)))
+            rows.sort()
+
+            # 同一 (车次, 日期, 区间) 只保留余票发生变化的观测：与上一次观测时的状态比较
+            # （同一次查询中可能有多条记录，因此按集合比较）
+            kept = []
+            key = observed_at = None
+            previous_states, states = set(), set()
+            for row in rows:
+                if row[:4] != key:
+                    key, observed_at = row[:4], row[4]
+                    previous_states, states = set(), set()
+                elif row[4] != observed_at:
+                    observed_at = row[4]
+                    previous_states, states = states, set()
+                states.add(row[5])
+                if row[5] not in previous_states:
+                    kept.append((row[4], row[1], row[0], row[2], row[3], row[5]))
+
+            # 字典按字符串排序，使车次列的编号与行的顺序一致
+            strings = sorted({value for row in kept for value in row[1:5]})
+            lookup = {value: index for index, value in enumerate(strings)}
+            replaces = segments + ([latest] if latest else [])
+            meta = json.dumps({'replaces': replaces, 'rows_in': len(rows), 'rows': len(kept)}).encode('utf-8')
+            data = COMPACT.pack(COMPACT_MAGIC, len(meta)) + meta
+            data += _encode_block(kept, lookup, strings, SORTED_BY_TRAIN, written=0) if kept else b''
+
+            path = os.path.join(directory, f"compact-{time.time_ns()}.shc")
+            with open(f"{path}.tmp", 'wb') as f:
+                f.write(data)
+            os.replace(f"{path}.tmp", path)
+            for name in replaces:
+                try:
+                    os.remove(os.path.join(directory, name))
+                except FileNotFoundError:
+                    pass
+            self.compactions += 1
+            return len(rows), len(kept)
+        finally:
+            if lock_fd is not None:
+                os.close(lock_fd)
+
+    def compact_closed(self) -> int:
+        """压缩已结束的分区并删除超出保留期的分区，返回压缩的分区数"""
+        now = time.time()
+        compacted = 0
+        for name in sorted(os.listdir(self.root)):
+            directory = os.path.join(self.root, name)
+            try:
+                start = calendar.timegm(time.strptime(name, '%Y%m%d-%H'))
+            except ValueError:
+                continue
+            if start + PARTITION_SECONDS + self.retention < now:
+                shutil.rmtree(directory, ignore_errors=True)
+            elif start + PARTITION_SECONDS + self.compact_grace < now:
+                if self.compact_partition(directory) is not None:
+                    compacted += 1
+        return compacted
+
+    # ---- 后台任务 ----
+
+    async def _loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"写入余票历史失败: {str(e)}")
+            if time.monotonic() - self._last_compact >= self.compact_interval:
+                self._last_compact = time.monotonic()
+                try:
+                    compacted = await loop.run_in_executor(None, self.compact_closed)
+                    if compacted:
+                        logger.info(f"压缩了 {compacted} 个余票历史分区")
+                except Exception as e:
+                    self.errors += 1
+                    logger.error(f"压缩余票历史失败: {str(e)}")
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._loop())
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
+
+    def stats(self) -> Dict:
+        return {
+            "rows": self.rows_recorded,
+            "pending": len(self._pending),
+            "dropped": self.dropped,
+            "bytes": self.bytes_written,
+            "compactions": self.compactions,
+            "errors": self.errors,
+        }
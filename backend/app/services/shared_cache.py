@@ -0,0 +1,203 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(key: Hashable) -> str:
+    """进程内缓存键（字符串或字符串元组）-> 共享缓存中的文本键"""
+    if isinstance(key, tuple):
+        return '\x1f'.join('' if part is None else str(part) for part in key)
+    return str(key)
+
+
+class SharedCache:
+    """同一主机上多个 worker 进程共享的结果缓存，保存在 SQLite（WAL 模式）中
+
+    作为进程内 TTLCache 之后的第二级：进程内未命中时先查共享缓存，仍未命中时通过租约
+    保证同一时刻只有一个进程访问上游，其他进程轮询等待结果写入（租约过期则接手），
+    因此上游请求量不随 worker 数增加。读写都是单行的主键操作，在专用的单线程执行器中执行
+    （连接只在该线程中使用），等待写锁（不超过 busy_timeout）时不阻塞事件循环；WAL 模式下读不阻塞写。
+    """
+
+    def __init__(self, path: str, lease_timeout: float = 10.0, poll_interval: float = 0.02,
+                 busy_timeout: float = 0.2, purge_interval: float = 60.0):
+        self.path = path
+        self.lease_timeout = lease_timeout  # 租约有效期，持有者异常退出后其他进程可接手
+        self.poll_interval = poll_interval
+        self.busy_timeout = busy_timeout
+        self.purge_interval = purge_interval
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_pid: Optional[int] = None
+        self._last_purge = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.errors = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        # fork 之后不能沿用父进程的连接
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout,
+                                   isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    value BLOB NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                ) WITHOUT ROWID
+            ''')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS leases (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    owner TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                ) WITHOUT ROWID
+            ''')
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    async def _run(self, func: Callable, *args) -> Any:
+        """在专用线程中执行 SQLite 操作（fork 之后重新创建线程）"""
+        if self._executor is None or self._executor_pid != os.getpid():
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='shared-cache')
+            self._executor_pid = os.getpid()
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def get(self, namespace: str, key: str, min_ttl: float = 0.0) -> Optional[Tuple[bytes, float]]:
+        """读取剩余有效期超过 min_ttl 的条目，返回 (值, 剩余有效期)"""
+        now = time.time()
+        row = self._connect().execute(
+            'SELECT value, expires_at FROM entries WHERE namespace = ? AND key = ? AND expires_at > ?',
+            (namespace, key, now + min_ttl)
+        ).fetchone()
+        if row is None:
+            return None
+        return row[0], row[1] - now
+
+    def set(self, namespace: str, key: str, value: bytes, ttl: float):
+        conn = self._connect()
+        now = time.time()
+        conn.execute('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)',
+                     (namespace, key, now + ttl, value))
+        if now - self._last_purge >= self.purge_interval:
+            self._last_purge = now
+            conn.execute('DELETE FROM entries WHERE expires_at <= ?', (now,))
+            conn.execute('DELETE FROM leases WHERE expires_at <= ?', (now,))
+
+    def _try_lease(self, namespace: str, key: str) -> bool:
+        conn = self._connect()
+        now = time.time()
+        conn.execute('DELETE FROM leases WHERE namespace = ? AND key = ? AND expires_at <= ?',
+                     (namespace, key, now))
+        cursor = conn.execute('INSERT OR IGNORE INTO leases VALUES (?, ?, ?, ?)',
+                              (namespace, key, self.owner, now + self.lease_timeout))
+        return cursor.rowcount == 1
+
+    def _renew(self, namespace: str, key: str) -> bool:
+        cursor = self._connect().execute(
+            'UPDATE leases SET expires_at = ? WHERE namespace = ? AND key = ? AND owner = ?',
+            (time.time() + self.lease_timeout, namespace, key, self.owner)
+        )
+        return cursor.rowcount == 1
+
+    async def _keep_lease(self, namespace: str, key: str):
+        """获取期间定期续约，使租约在获取（含重试与退避）结束前不会过期；进程退出后租约自然过期"""
+        while True:
+            await asyncio.sleep(self.lease_timeout / 3)
+            try:
+                if not await self._run(self._renew, namespace, key):
+                    return
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to renew shared cache lease: {str(e)}")
+
+    def _release(self, namespace: str, key: str):
+        self._connect().execute('DELETE FROM leases WHERE namespace = ? AND key = ? AND owner = ?',
+                                (namespace, key, self.owner))
+
+    async def load(self, namespace: str, key: Hashable, fetch: Callable[[], Awaitable[Any]],
+                   ttl: float, encode: Callable[[Any], bytes],
+                   decode: Callable[[bytes], Any], min_ttl: float = 0.0) -> Tuple[Any, float]:
+        """读取共享缓存，未命中时由持有租约的进程调用 fetch 并写回，返回 (值, 剩余有效期)
+
+        min_ttl > 0 时剩余有效期不足的条目视为未命中（提前刷新）。
+        共享缓存不可用（如磁盘错误、锁等待超时）时直接调用 fetch，不影响查询。
+        """
+        text_key = cache_key(key)
+        while True:
+            try:
+                found = await self._run(self.get, namespace, text_key, min_ttl)
+                if found is not None:
+                    self.hits += 1
+                    return decode(found[0]), found[1]
+                leased = await self._run(self._try_lease, namespace, text_key)
+            except sqlite3.Error as e:
+                self.errors += 1
+                logger.warning(f"Shared cache unavailable, fetching directly: {str(e)}")
+                return await fetch(), ttl
+            if leased:
+                break
+            # 其他进程正在获取同一个键，等待其写回
+            self.waits += 1
+            await asyncio.sleep(self.poll_interval)
+
+        self.misses += 1
+        keeper = asyncio.ensure_future(self._keep_lease(namespace, text_key))
+        try:
+            value = await fetch()
+            try:
+                await self._run(self.set, namespace, text_key, encode(value), ttl)
+            except sqlite3.Error as e:
+                self.errors += 1
+                logger.warning(f"Failed to write shared cache: {str(e)}")
+            return value, ttl
+        finally:
+            keeper.cancel()
+            try:
+                await self._run(self._release, namespace, text_key)
+            except sqlite3.Error:
+                # 租约到期后会被其他进程清理
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "waits": self.waits, "errors": self.errors}
+
+    def close(self):
+        if self._executor is not None and self._executor_pid == os.getpid():
+            # 等待进行中的操作结束后再关闭连接
+            self._executor.shutdown(wait=True)
+        self._executor = None
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+
+
+class SharedNamespace:
+    """绑定命名空间与编解码函数的共享缓存，作为 TTLCache 的第二级"""
+
+    def __init__(self, shared: SharedCache, namespace: str,
+                 encode: Callable[[Any], bytes], decode: Callable[[bytes], Any]):
+        self.shared = shared
+        self.namespace = namespace
+        self.encode = encode
+        self.decode = decode
+
+    async def load(self, key: Hashable, fetch: Callable[[], Awaitable[Any]],
+                   ttl: float, min_ttl: float = 0.0) -> Tuple[Any, float]:
+        return await self.shared.load(self.namespace, key, fetch, ttl, self.encode, self.decode, min_ttl)
@@ -0,0 +1,145 @@
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Set
+
+
+class Station(NamedTuple):
+    name: str  # 站名，如 北京南
+    code: str  # 电报码，如 VNP
+    pinyin: str  # 全拼，如 beijingnan
+    initials: str  # 拼音首字母，如 bjn
+
+
+def parse_station_names(text: str) -> List[Station]:
+    """解析 station_name.js，格式为 @bjn|北京南|VNP|beijingnan|bjn|3|..."""
+    stations = []
+    for station in text.split('@')[1:]:
+        info = station.split('|')
+        if len(info) >= 3:
+            stations.append(Station(
+                name=info[1],
+                code=info[2],
+                pinyin=info[3] if len(info) > 3 else '',
+                initials=info[4] if len(info) > 4 else ''
+            ))
+    return stations
+
+
+class StationSearch:
+    """站点搜索算法，倒排表的存储方式由子类提供（内存字典或共享的 mmap 文件）
+
+    结果按 完全 > 前缀 > 子串 排序；倒排表按站点在 station_name.js 中的顺序存放。
+    """
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def station(self, idx: int) -> Station:
+        raise NotImplementedError
+
+    def station_keys(self, idx: int) -> Sequence[str]:
+        """站点的小写检索键（站名、电报码、全拼、首字母）"""
+        raise NotImplementedError
+
+    def exact_postings(self, key: str) -> Sequence[int]:
+        raise NotImplementedError
+
+    def prefix_postings(self, prefix: str) -> Sequence[int]:
+        raise NotImplementedError
+
+    def gram_postings(self, gram: str) -> Sequence[int]:
+        raise NotImplementedError
+
+    def _substring_candidates(self, keyword: str) -> Sequence[int]:
+        if len(keyword) == 1:
+            return self.gram_postings(keyword)
+        # 取所有二元组中最短的倒排表作为候选集
+        shortest = None
+        for i in range(len(keyword) - 1):
+            postings = self.gram_postings(keyword[i:i + 2])
+            if not postings:
+                return []
+            if shortest is None or len(postings) < len(shortest):
+                shortest = postings
+        return shortest
+
+    def search(self, keyword: str, limit: int = 10) -> List[Station]:
+        """搜索站点，结果按 完全匹配 > 前缀匹配 > 子串匹配 排序"""
+        keyword = keyword.strip().lower()
+        if not keyword:
+            return []
+
+        results: List[int] = []
+        seen: Set[int] = set()
+
+        def collect(ids: Iterable[int], match=None) -> bool:
+            for idx in ids:
+                if idx in seen:
+                    continue
+                if match is not None and not any(match(key) for key in self.station_keys(idx)):
+                    continue
+                seen.add(idx)
+                results.append(idx)
+                if len(results) >= limit:
+                    return True
+            return False
+
+        if not collect(self.exact_postings(keyword)) and not collect(self.prefix_postings(keyword)):
+            collect(self._substring_candidates(keyword), lambda key: keyword in key)
+        return [self.station(idx) for idx in results]
+
+
+def station_keys(station: Station) -> tuple:
+    return tuple({k.lower() for k in station if k})
+
+
+class StationIndex(StationSearch):
+    """内存中的站点搜索索引
+
+    在站点表加载时构建一次，覆盖站名、全拼、拼音首字母和电报码：
+    - 完全匹配：key -> 站点
+    - 前缀匹配：每个 key 的全部前缀 -> 站点
+    - 子串匹配：单字/二元组倒排表，查询时取最短的倒排表逐个校验
+    也用于生成 StationStore 中可跨进程共享的索引文件。
+    """
+
+    def __init__(self, stations: Iterable[Station]):
+        self.stations: List[Station] = []
+        self._keys: List[tuple] = []  # 每个站点的小写检索键
+        self._exact: Dict[str, List[int]] = {}
+        self._prefix: Dict[str, List[int]] = {}
+        self._grams: Dict[str, List[int]] = {}
+
+        for station in stations:
+            idx = len(self.stations)
+            self.stations.append(station)
+            keys = station_keys(station)
+            self._keys.append(keys)
+
+            prefixes: Set[str] = set()
+            grams: Set[str] = set()
+            for key in keys:
+                self._exact.setdefault(key, []).append(idx)
+                prefixes.update(key[:i] for i in range(1, len(key) + 1))
+                grams.update(key)
+                grams.update(key[i:i + 2] for i in range(len(key) - 1))
+            for prefix in prefixes:
+                self._prefix.setdefault(prefix, []).append(idx)
+            for gram in grams:
+                self._grams.setdefault(gram, []).append(idx)
+
+    def __len__(self) -> int:
+        return len(self.stations)
+
+    def station(self, idx: int) -> Station:
+        return self.stations[idx]
+
+    def station_keys(self, idx: int) -> Sequence[str]:
+        return self._keys[idx]
+
+    def exact_postings(self, key: str) -> Sequence[int]:
+        return self._exact.get(key, [])
+
+    def prefix_postings(self, prefix: str) -> Sequence[int]:
+        return self._prefix.get(prefix, [])
+
+    def gram_postings(self, gram: str) -> Sequence[int]:
+        return self._grams.get(gram, [])
@@ -0,0 +1,351 @@
+import asyncio
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows 没有 fcntl，此时各进程各自刷新
+    fcntl = None
+
+from .station_index import Station, StationIndex, StationSearch, station_keys
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'STN2'
+HEADER = struct.Struct('<4sI')  # 魔数 + 元数据长度
+ALIGN = 8
+SEARCH_CACHE_SIZE = 1024  # 每个进程缓存的搜索结果数
+
+
+class StationTable(NamedTuple):
+    stations: "MappedStations"
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+    file_id: Tuple[int, int] = (0, 0)  # (inode, mtime_ns)，用于发现其他进程写入的新文件
+
+
+def _uint32(values: Sequence[int]) -> bytes:
+    data = array('I', values)
+    if sys.byteorder != 'little':
+        data.byteswap()
+    return data.tobytes()
+
+
+def _blob(keys: Sequence[bytes]) -> Tuple[bytes, bytes]:
+    """把一组字节串拼接为 (数据, uint32 偏移表)，第 i 个元素为 数据[偏移[i]:偏移[i+1]]"""
+    offsets = [0]
+    for key in keys:
+        offsets.append(offsets[-1] + len(key))
+    return b''.join(keys), _uint32(offsets)
+
+
+def _postings_sections(name: str, postings: Dict[str, List[int]]) -> Dict[str, bytes]:
+    """倒排表：按 UTF-8 字节序排序的键 + 对应的站点下标列表"""
+    items = sorted((key.encode('utf-8'), ids) for key, ids in postings.items())
+    keys, key_offsets = _blob([key for key, _ in items])
+    post_offsets = [0]
+    flat: List[int] = []
+    for _, ids in items:
+        flat.extend(ids)
+        post_offsets.append(len(flat))
+    return {
+        f'{name}_keys': keys,
+        f'{name}_key_offsets': key_offsets,
+        f'{name}_post_offsets': _uint32(post_offsets),
+        f'{name}_postings': _uint32(flat),
+    }
+
+
+def build_sections(stations: List[Station]) -> Dict[str, bytes]:
+    """生成站点文件的各个数据段：站点记录、按站名/电报码排序的下标与三类搜索倒排表"""
+    index = StationIndex(stations)
+    records, record_offsets = _blob(['|'.join(station).encode('utf-8') for station in stations])
+    # 重名时保留最后出现的站点，与 dict 推导的覆盖语义一致
+    by_name = sorted(range(len(stations)), key=lambda i: (stations[i].name.encode('utf-8'), -i))
+    by_code = sorted(range(len(stations)), key=lambda i: (stations[i].code.encode('utf-8'), -i))
+    sections = {
+        'records': records,
+        'record_offsets': record_offsets,
+        'by_name': _uint32(by_name),
+        'by_code': _uint32(by_code),
+    }
+    sections.update(_postings_sections('exact', index._exact))
+    sections.update(_postings_sections('prefix', index._prefix))
+    sections.update(_postings_sections('grams', index._grams))
+    return sections
+
+
+class _Lookup:
+    """只读映射视图（站名 -> 电报码或电报码 -> 站名），在 mmap 中的有序下标上二分查找
+
+    查到的结果在进程内记忆（最多为站点总数），热点站点（如解析车票时的出发/到达站）只查找一次。
+    """
+
+    def __init__(self, stations: "MappedStations", order: memoryview, field: int, value: int):
+        self._stations = stations
+        self._order = order
+        self._field = field
+        self._value = value
+        self._memo: Dict[str, str] = {}
+
+    def _find(self, key: str) -> Optional[str]:
+        target = key.encode('utf-8')
+        order = self._order
+        lo, hi = 0, len(order)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._stations.field_bytes(order[mid], self._field) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(order) and self._stations.field_bytes(order[lo], self._field) == target:
+            return self._stations.station(order[lo])[self._value]
+        return None
+
+    def get(self, key: str, default=None):
+        value = self._memo.get(key)
+        if value is None and isinstance(key, str):
+            value = self._find(key)
+            if value is not None:
+                self._memo[key] = value
+        return default if value is None else value
+
+    def __contains__(self, key) -> bool:
+        return self.get(key) is not None
+
+    def __getitem__(self, key: str) -> str:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __bool__(self) -> bool:
+        return len(self._order) > 0
+
+
+class MappedStations(StationSearch):
+    """映射自站点文件的只读站点表与搜索索引
+
+    文件通过只读 mmap 打开，多个 worker 进程共享同一份页缓存；进程内只保存查找过的站点。
+    """
+
+    def __init__(self, data, sections: Dict[str, Tuple[int, int]]):
+        self._data = data
+        view = memoryview(data)
+        self._views: List[memoryview] = [view]  # 引用 mmap 的视图，关闭前须全部释放
+        self._bases = {name: offset for name, (offset, _) in sections.items()}
+        self._sections = {name: view[offset:offset + length] for name, (offset, length) in sections.items()}
+        self._views.extend(self._sections.values())
+        self._records = self._bases['records']
+        self._record_offsets = self._uint32('record_offsets')
+        self._postings = {
+            name: (self._bases[f'{name}_keys'], self._uint32(f'{name}_key_offsets'),
+                   self._uint32(f'{name}_post_offsets'), self._uint32(f'{name}_postings'))
+            for name in ('exact', 'prefix', 'grams')
+        }
+        self._cache: Dict[int, Station] = {}
+        self._keys: Dict[int, tuple] = {}
+        self._results: "OrderedDict[Tuple[str, int], List[Station]]" = OrderedDict()
+        self.code_to_name = _Lookup(self, self._uint32('by_code'), field=1, value=0)
+        self.name_to_code = _Lookup(self, self._uint32('by_name'), field=0, value=1)
+
+    @classmethod
+    def empty(cls) -> "MappedStations":
+        sections = build_sections([])
+        data = bytearray()
+        layout = {}
+        for name, payload in sections.items():
+            layout[name] = (len(data), len(payload))
+            data += payload + b'\0' * (-len(payload) % ALIGN)
+        return cls(bytes(data), layout)
+
+    def _uint32(self, name: str) -> memoryview:
+        # 文件按小端字节序写入；cast 使用本机字节序，常见平台（x86、ARM）均为小端
+        cast = self._sections[name].cast('I')
+        self._views.append(cast)
+        return cast
+
+    def close(self):
+        """释放视图并关闭 mmap（被新的站点表替换且不再有读者之后调用）"""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if isinstance(self._data, mmap.mmap):
+            try:
+                self._data.close()
+            except BufferError:
+                # 仍有临时切片引用（如进行中的查找），留给垃圾回收
+                logger.debug("Station map still referenced, leaving it to GC")
+
+    def __len__(self) -> int:
+        return len(self._record_offsets) - 1
+
+    def __iter__(self) -> Iterator[Station]:
+        return (self.station(idx) for idx in range(len(self)))
+
+    def __getitem__(self, idx: int) -> Station:
+        if not 0 <= idx < len(self):
+            raise IndexError(idx)
+        return self.station(idx)
+
+    def _record(self, idx: int) -> bytes:
+        # 直接切片 mmap 得到 bytes，避免经由 memoryview 复制
+        return self._data[self._records + self._record_offsets[idx]:self._records + self._record_offsets[idx + 1]]
+
+    def field_bytes(self, idx: int, field: int) -> bytes:
+        return self._record(idx).split(b'|')[field]
+
+    def station(self, idx: int) -> Station:
+        station = self._cache.get(idx)
+        if station is None:
+            station = self._cache[idx] = Station(*self._record(idx).decode('utf-8').split('|'))
+        return station
+
+    def station_keys(self, idx: int) -> Sequence[str]:
+        keys = self._keys.get(idx)
+        if keys is None:
+            keys = self._keys[idx] = station_keys(self.station(idx))
+        return keys
+
+    def search(self, keyword: str, limit: int = 10) -> List[Station]:
+        """在映射的倒排表上搜索；搜索词高度重复（输入联想），结果按 LRU 在进程内缓存"""
+        key = (keyword, limit)
+        results = self._results.get(key)
+        if results is not None:
+            self._results.move_to_end(key)
+            return list(results)
+        results = super().search(keyword, limit)
+        self._results[key] = results
+        if len(self._results) > SEARCH_CACHE_SIZE:
+            self._results.popitem(last=False)
+        return list(results)
+
+    def _lookup(self, name: str, key: str) -> Sequence[int]:
+        base, key_offsets, post_offsets, postings = self._postings[name]
+        data = self._data
+        target = key.encode('utf-8')
+        lo, hi = 0, len(key_offsets) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if data[base + key_offsets[mid]:base + key_offsets[mid + 1]] < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(key_offsets) - 1 and data[base + key_offsets[lo]:base + key_offsets[lo + 1]] == target:
+            return postings[post_offsets[lo]:post_offsets[lo + 1]]
+        return ()
+
+    def exact_postings(self, key: str) -> Sequence[int]:
+        return self._lookup('exact', key)
+
+    def prefix_postings(self, prefix: str) -> Sequence[int]:
+        return self._lookup('prefix', prefix)
+
+    def gram_postings(self, gram: str) -> Sequence[int]:
+        return self._lookup('grams', gram)
+
+
+class StationStore:
+    """station_name.js 解析结果的本地二进制文件，也是各 worker 共享的站点数据
+
+    文件格式：魔数 | 元数据长度 | JSON 元数据（ETag、Last-Modified、抓取时间、各数据段位置）|
+    按 8 字节对齐的数据段（站点记录、排序下标、搜索倒排表）。通过只读 mmap 加载，
+    查询直接读取映射的页面，不在每个进程中重建字典与索引；写入先落临时文件再原子替换，
+    已映射旧文件的进程可继续读取，直到重新加载。
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def file_id(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    @asynccontextmanager
+    async def refresh_lock(self, poll_interval: float = 0.05) -> AsyncIterator[None]:
+        """跨进程的刷新锁：同一时刻只有一个 worker 下载站点表，其他 worker 等待后加载其结果"""
+        if fcntl is None:
+            yield
+            return
+        fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    await asyncio.sleep(poll_interval)
+            yield
+        finally:
+            # 关闭文件描述符即释放锁
+            os.close(fd)
+
+    def load(self) -> Optional[StationTable]:
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_size < HEADER.size:
+                return None
+            # mmap 在文件关闭后仍然有效
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, meta_len = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            # 旧格式或损坏的文件：视为没有缓存，由后台任务重新下载
+            data.close()
+            return None
+        meta = json.loads(data[HEADER.size:HEADER.size + meta_len])
+        stations = MappedStations(data, {name: tuple(span) for name, span in meta['sections'].items()})
+        return StationTable(stations, meta.get('etag'), meta.get('last_modified'),
+                            meta.get('fetched_at', 0.0), (stat.st_ino, stat.st_mtime_ns))
+
+    def save(self, stations: List[Station], etag: Optional[str] = None,
+             last_modified: Optional[str] = None) -> StationTable:
+        fetched_at = time.time()
+        sections = build_sections(stations)
+
+        # 元数据长度决定数据段的起始位置，先按占位偏移估算长度再定稿
+        layout: Dict[str, List[int]] = {name: [0, len(payload)] for name, payload in sections.items()}
+        while True:
+            meta = json.dumps({
+                'etag': etag,
+                'last_modified': last_modified,
+                'fetched_at': fetched_at,
+                'count': len(stations),
+                'sections': layout,
+            }).encode('utf-8')
+            offset = HEADER.size + len(meta)
+            offset += -offset % ALIGN
+            new_layout = {}
+            for name, payload in sections.items():
+                new_layout[name] = [offset, len(payload)]
+                offset += len(payload) + (-len(payload) % ALIGN)
+            if new_layout == layout:
+                break
+            layout = new_layout
+
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, len(meta)))
+            f.write(meta)
+            for name, payload in sections.items():
+                f.write(b'\0' * (layout[name][0] - f.tell()))
+                f.write(payload)
+        os.replace(tmp_path, self.path)
+        return self.load()
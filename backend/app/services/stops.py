@@ -0,0 +1,119 @@
+import asyncio
+import logging
+import random
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..core.encoding import EncodedPayload, dumps, loads
+from ..core.metrics import UPSTREAM_RETRIES
+from .cache import TTLCache
+from .ratelimit import UpstreamUnavailableError
+from .shared_cache import SharedCache, SharedNamespace
+from .upstream import UpstreamClient
+
+logger = logging.getLogger(__name__)
+
+QUERY_BY_TRAIN_NO_PATH = '/otn/czxx/queryByTrainNo'
+
+
+def parse_stops(station_list: List[Dict]) -> List[Dict]:
+    """把 queryByTrainNo 返回的站点列表整理为经停站信息"""
+    stops = []
+    total_stations = len(station_list)
+    for i, station in enumerate(station_list):
+        is_first = i == 0
+        is_last = i == total_stations - 1
+        stops.append({
+            'station_name': station.get('station_name', ''),
+            'arrival_time': '--' if is_first else station.get('arrive_time', '--'),
+            'departure_time': '--' if is_last else station.get('start_time', '--'),
+            'stopover_time': '--' if is_first or is_last else station.get('stopover_time', '--')
+        })
+    return stops
+
+
+class StopFetcher:
+    """经停站获取器
+
+    经停站很少变化，按 (train_no, train_date) 长时间缓存，车票查询与
+    /trains/{train_code}/stops 共用同一份缓存（提供 shared 时各 worker 进程也共享）；
+    上游请求通过信号量限制并发，失败时按指数退避加随机抖动重试，避免触发 12306 限流。
+    """
+
+    def __init__(self, client: UpstreamClient, concurrency: int, ttl: float,
+                 maxsize: int, max_retries: int = 3, backoff: float = 0.5,
+                 on_fetched: Optional[Callable[[str, str, List[Dict]], None]] = None,
+                 shared: Optional[SharedCache] = None):
+        self.client = client
+        self.on_fetched = on_fetched  # 每次获取到进程内后回调 (train_no, train_date, stops)
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.cache = TTLCache(
+            ttl, maxsize,
+            backend=SharedNamespace(shared, 'stops', dumps, loads) if shared is not None else None,
+            on_load=self._loaded
+        )
+        # 已编码的经停站响应，与缓存中的经停站列表一一对应（列表被替换时重新编码）
+        self._payloads = TTLCache(ttl, maxsize)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 延迟创建，保证信号量绑定到实际运行的事件循环
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    def _loaded(self, key: Tuple[str, str], stops: List[Dict]):
+        if self.on_fetched is not None:
+            self.on_fetched(key[0], key[1], stops)
+
+    def is_cached(self, train_no: str, train_date: str) -> bool:
+        """进程内缓存中是否有未过期的经停站"""
+        return self.cache.remaining((train_no, train_date)) > 0
+
+    async def get_stops(self, train_no: str, from_station: str, to_station: str,
+                        train_date: str) -> List[Dict]:
+        """获取经停站，失败时抛出异常（不写入缓存）"""
+        return await self.cache.get_or_fetch(
+            (train_no, train_date),
+            lambda: self._fetch(train_no, from_station, to_station, train_date)
+        )
+
+    async def get_payload(self, train_no: str, from_station: str, to_station: str,
+                          train_date: str) -> EncodedPayload:
+        """获取已编码为 JSON 的经停站（连同 ETag 一起缓存），失败时抛出异常"""
+        key = (train_no, train_date)
+        stops = await self.get_stops(train_no, from_station, to_station, train_date)
+        cached = self._payloads.get(key)
+        if cached is not None and cached[0] is stops:
+            return cached[1]
+        payload = EncodedPayload(dumps(stops))
+        self._payloads.set(key, (stops, payload), self.cache.remaining(key) or None)
+        return payload
+
+    async def _fetch(self, train_no: str, from_station: str, to_station: str,
+                     train_date: str) -> List[Dict]:
+        params = {
+            'train_no': train_no,
+            'from_station_telecode': from_station,
+            'to_station_telecode': to_station,
+            'depart_date': train_date
+        }
+        for attempt in range(self.max_retries):
+            try:
+                async with self._get_semaphore():
+                    result = await self.client.get_json(QUERY_BY_TRAIN_NO_PATH, params=params)
+                station_list = (result.get('data') or {}).get('data') if result.get('status') else None
+                if not station_list:
+                    raise LookupError(f"No stops returned for train {train_no}")
+                return parse_stops(station_list)
+            except (LookupError, UpstreamUnavailableError):
+                raise
+            except Exception as e:
+                if attempt == self.max_retries - 1:
+                    raise
+                # 退避期间不占用并发名额
+                delay = self.backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+                UPSTREAM_RETRIES.inc(endpoint='queryByTrainNo')
+                logger.warning(f"获取经停站信息失败（{train_no}），{delay:.2f}s 后重试: {str(e)}")
+                await asyncio.sleep(delay)
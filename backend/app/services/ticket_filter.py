@@ -0,0 +1,137 @@
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from .parser import SEAT_INDEX, TrainRecord, to_minutes
+
+# 可投影的字段，与 TrainInfo 的字段一致
+PROJECTABLE_FIELDS = (
+    'train_no', 'train_code', 'train_type', 'from_station', 'to_station',
+    'duration', 'seats', 'prices', 'stops',
+)
+
+
+def _arrival(record: TrainRecord) -> Optional[int]:
+    """到达时间（出发当日零点起算的分钟数，跨日时大于 1440）"""
+    if record.departure_minutes is None or record.duration_minutes is None:
+        return None
+    return record.departure_minutes + record.duration_minutes
+
+
+# 排序方式 -> 排序键（值为 None 的车次排在最后）
+SORT_KEYS: Dict[str, Callable[[TrainRecord], Optional[int]]] = {
+    'departure': lambda record: record.departure_minutes,
+    'arrival': _arrival,
+    'duration': lambda record: record.duration_minutes,
+}
+
+
+class TicketView(NamedTuple):
+    """车票结果的附加过滤、排序、字段投影与分页条件
+
+    可哈希，作为编码结果缓存键的一部分；时刻与历时均为分钟数，席别为 SEAT_FIELDS 中的下标。
+    """
+    arrival_start: Optional[int] = None
+    arrival_end: Optional[int] = None
+    max_duration: Optional[int] = None
+    seat_classes: Tuple[int, ...] = ()
+    min_seats: int = 0  # 任一 seat_classes（未指定时为任一席别）的余票不少于该张数
+    sort_by: Optional[str] = None
+    descending: bool = False
+    fields: Tuple[str, ...] = ()
+    offset: int = 0
+    limit: Optional[int] = None
+
+    @classmethod
+    def build(cls, arrival_start: Optional[str] = None, arrival_end: Optional[str] = None,
+              max_duration: Optional[int] = None, seat_classes: Optional[Sequence[str]] = None,
+              min_seats: Optional[int] = None, sort_by: Optional[str] = None, descending: bool = False,
+              fields: Optional[Sequence[str]] = None, offset: int = 0,
+              limit: Optional[int] = None) -> "TicketView":
+        """校验并规范化条件（时刻为 "HH:MM"），不合法时抛出 ValueError"""
+        unknown = [name for name in seat_classes or () if name not in SEAT_INDEX]
+        if unknown:
+            raise ValueError(f"Unknown seat class: {', '.join(unknown)}")
+        if sort_by is not None and sort_by not in SORT_KEYS:
+            raise ValueError(f"sort_by must be one of: {', '.join(SORT_KEYS)}")
+        unknown = [name for name in fields or () if name not in PROJECTABLE_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown field: {', '.join(unknown)}")
+        if offset < 0 or (limit is not None and limit < 0) or (min_seats is not None and min_seats < 0):
+            raise ValueError("offset, limit and min_seats must not be negative")
+        return cls(
+            arrival_start=to_minutes(arrival_start) if arrival_start else None,
+            arrival_end=to_minutes(arrival_end) if arrival_end else None,
+            max_duration=max_duration,
+            seat_classes=tuple(sorted({SEAT_INDEX[name] for name in seat_classes or ()})),
+            # 只指定席别时，要求有票
+            min_seats=min_seats if min_seats is not None else (1 if seat_classes else 0),
+            sort_by=sort_by,
+            descending=bool(descending) and sort_by is not None,
+            fields=tuple(dict.fromkeys(fields or ())),
+            offset=offset,
+            limit=limit,
+        )
+
+    @property
+    def paginated(self) -> bool:
+        return bool(self.offset) or self.limit is not None
+
+    def arrange(self, records: List[TrainRecord]) -> List[TrainRecord]:
+        """排序并分页（排序稳定，相同值保持上游的顺序）"""
+        if self.sort_by is not None:
+            key = SORT_KEYS[self.sort_by]
+            known = [record for record in records if key(record) is not None]
+            known.sort(key=key, reverse=self.descending)
+            records = known + [record for record in records if key(record) is None]
+        if self.paginated:
+            end = None if self.limit is None else self.offset + self.limit
+            records = records[self.offset:end]
+        return records
+
+    def project(self, row: Dict) -> Dict:
+        """只保留请求的字段"""
+        if not self.fields:
+            return row
+        return {field: row[field] for field in self.fields}
+
+
+DEFAULT_VIEW = TicketView()
+
+
+def compile_filter(start_time: Optional[str] = None, end_time: Optional[str] = None,
+                   train_types: Optional[Set[str]] = None,
+                   view: TicketView = DEFAULT_VIEW) -> Callable[[TrainRecord], bool]:
+    """把过滤条件编译为一个判断函数，只比较车次记录上预先计算的整数字段
+
+    start_time/end_time 为出发时刻范围（"HH:MM"），train_types 为大写车型字母集合；
+    设置了时刻或历时条件时，对应字段格式不正确的车次被排除。
+    """
+    checks: List[Callable[[TrainRecord], bool]] = []
+
+    def window(attribute: Callable[[TrainRecord], Optional[int]], low: Optional[int], high: Optional[int]):
+        if low is None and high is None:
+            return
+        low = 0 if low is None else low
+        high = float('inf') if high is None else high
+        checks.append(lambda record: (value := attribute(record)) is not None and low <= value <= high)
+
+    window(lambda record: record.departure_minutes,
+           to_minutes(start_time) if start_time else None, to_minutes(end_time) if end_time else None)
+    window(lambda record: record.arrival_minutes, view.arrival_start, view.arrival_end)
+    window(lambda record: record.duration_minutes, None, view.max_duration)
+
+    if train_types:
+        checks.append(lambda record: record.train_code[:1].upper() in train_types)
+
+    if view.min_seats:
+        min_seats = view.min_seats
+        if view.seat_classes:
+            classes = view.seat_classes
+            checks.append(lambda record: any(record.seat_counts[index] >= min_seats for index in classes))
+        else:
+            checks.append(lambda record: max(record.seat_counts) >= min_seats)
+
+    if not checks:
+        return lambda record: True
+    if len(checks) == 1:
+        return checks[0]
+    return lambda record: all(check(record) for check in checks)
@@ -1,84 +1,354 @@
-import requests
 import logging
-from typing import Dict, List, Optional
-from datetime import datetime
+from typing import AsyncIterator, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
 import time
 import os
 import random
 from ..schemas.train import TrainInfo, TrainStop
+from ..core.config import settings
+from ..core.encoding import EncodedPayload, dumps
+from ..core.metrics import UPSTREAM_RETRIES, MetricFamily, timed
+from .cache import TTLCache
+from .upstream import UpstreamClient
+from .ratelimit import UpstreamGuard, UpstreamUnavailableError
+from .shared_cache import SharedCache, SharedNamespace
+from .station_index import parse_station_names
+from .station_store import MappedStations, StationStore, StationTable
+from .prefetch import PrefetchScheduler
+from .prices import PriceFetcher
+from .stops import StopFetcher
+from .route_index import TrainRouteIndex
+from .seat_history import SeatHistory
+from .ticket_filter import DEFAULT_VIEW, TicketView, compile_filter
+from .train_store import TrainStore
+from .transfer import TransferPlanner
+from .watcher import SeatWatchManager
+from .parser import TrainRecord, TrainResultSet, get_train_type, parse_results
 import asyncio
-import aiohttp
-from concurrent.futures import ThreadPoolExecutor
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+STATION_NAMES_PATH = '/otn/resources/js/framework/station_name.js'
+QUERY_PATH = '/otn/leftTicket/queryZ'
+STATION_RETIRE_GRACE = 60.0  # 被替换的站点表至少保留的秒数
+
+
+class TicketQueryResult(NamedTuple):
+    records: List[TrainRecord]
+    stops: Dict[str, List[Dict]]  # train_no -> 经停站
+    complete: bool  # 所需经停站与票价是否全部获取成功
+    prices: Dict[str, Dict[str, float]] = {}  # train_no -> {席别: 票价}
+    total: Optional[int] = None  # 分页前的车次数
+
+
 class TrainService:
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
-        self.station_map = {}  # 存储站点代码到名称的映射
-        self.name_to_code_map = {}  # 存储站点名称到代码的映射
+        """只做内存初始化，不发起网络请求；站点表与会话由 start() 在后台加载"""
+        # 站点数据映射自 StationStore 的文件，多个 worker 进程共享同一份只读页面
+        empty = MappedStations.empty()
+        self.station_map = empty.code_to_name  # 站点代码 -> 名称（只读映射视图）
+        self.name_to_code_map = empty.name_to_code  # 站点名称 -> 代码（只读映射视图）
+        self.station_index = empty  # 站名/拼音/电报码搜索索引
+        # 被替换的站点表 [(替换时间, 站点表)]，过了宽限期（进行中的查询已结束）后关闭其 mmap
+        self._retired_tables: List[Tuple[float, StationTable]] = []
+        # 站点搜索的已编码响应（含 ETag），键为 (站点表文件, 关键字)
+        self._station_payloads = TTLCache(settings.station_http_max_age, 1024)
         # 设置基础目录为当前文件所在目录的父级目录
         self.base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        # 创建保存文件的目录
-        self.data_dir = os.path.join(self.base_dir, 'data')
+        # 创建保存文件的目录（可通过 DATA_DIR 指定）
+        self.data_dir = settings.data_dir or os.path.join(self.base_dir, 'data')
         os.makedirs(self.data_dir, exist_ok=True)
-        self._init_session()
-        self._init_station_map()
-        
-        # 设置连接池
-        self.conn = aiohttp.TCPConnector(
-            limit=10,  # 限制并发连接数
-            ttl_dns_cache=300,  # DNS 缓存时间
-            enable_cleanup_closed=True  # 自动清理关闭的连接
+
+        # 按接口限流与熔断，状态在多个 worker 进程间共享
+        # prefetch 为预取的预算，与上游接口的额度一样在进程间共享
+        self.upstream_guard = UpstreamGuard(
+            os.path.join(self.data_dir, 'upstream_guard.bin'),
+            dict(settings.upstream_rate_limits, prefetch=settings.prefetch_budget),
+            failure_threshold=settings.circuit_failure_threshold,
+            open_base=settings.circuit_open_base,
+            open_max=settings.circuit_open_max,
+            max_wait=settings.upstream_max_wait
+        )
+        # 长连接的 12306 异步客户端，所有上游请求都经由它发出，Cookie 与连接池在应用生命周期内复用
+        self.client = UpstreamClient(settings.upstream_base_url, settings.upstream_pool_size,
+                                     guard=self.upstream_guard)
+
+        # 站点表本地缓存，启动时直接加载，后台按 ETag/Last-Modified 重新验证
+        self.station_store = StationStore(os.path.join(self.data_dir, 'station_names.bin'))
+        self.station_table: Optional[StationTable] = None
+        self._last_station_reload = 0.0
+        self._station_refresh_task = None
+        self._start_task = None
+        self._stations_ready: Optional[asyncio.Event] = None
+        self._station_reload_task: Optional[asyncio.Future] = None
+
+        # 多个 worker 进程共享的结果缓存，作为各进程内缓存的第二级，并保证同一结果只有一个进程访问上游
+        self.shared_cache = SharedCache(
+            os.path.join(self.data_dir, 'shared_cache.db'),
+            lease_timeout=settings.shared_cache_lease_timeout
+        ) if settings.shared_cache else None
+
+        # 车票查询结果缓存，键为 (出发站代码, 到达站代码, 日期)
+        self.ticket_cache = TTLCache(
+            settings.ticket_cache_ttl, settings.ticket_cache_size,
+            stale_ttl=settings.ticket_cache_stale,
+            backend=SharedNamespace(self.shared_cache, 'tickets', TrainResultSet.dump, TrainResultSet.load)
+            if self.shared_cache is not None else None
+        )
+
+        # 经停站获取器，按 (train_no, 日期) 缓存，车票查询与经停站接口共用
+        self.stop_fetcher = StopFetcher(
+            self.client,
+            concurrency=settings.stops_concurrency,
+            ttl=settings.stops_cache_ttl,
+            maxsize=settings.stops_cache_size,
+            max_retries=settings.stops_max_retries,
+            on_fetched=self._index_stops,
+            shared=self.shared_cache
+        )
+        # 票价获取器，按 (train_no, 站序, 席别代码, 日期) 长时间缓存
+        self.price_fetcher = PriceFetcher(
+            self.client,
+            concurrency=settings.price_concurrency,
+            ttl=settings.price_cache_ttl,
+            maxsize=settings.price_cache_size,
+            max_retries=settings.price_max_retries,
+            shared=self.shared_cache
+        )
+        # 车次编号索引 (train_code, 日期) -> train_no 及出发/到达站代码，批量异步落盘
+        self.train_store = TrainStore(os.path.join(self.data_dir, 'trains.db'))
+        # 余票历史（可选），按小时分区的列式文件，批量异步落盘
+        self.seat_history = SeatHistory(
+            os.path.join(self.data_dir, 'seat_history'),
+            flush_interval=settings.seat_history_flush_interval,
+            compact_interval=settings.seat_history_compact_interval,
+            retention_days=settings.seat_history_retention_days,
+            max_pending=settings.seat_history_max_pending
+        ) if settings.seat_history_enabled else None
+
+        # 列车途经站点索引，由经停站获取结果填充，用于快速按经停站过滤
+        self.route_index = TrainRouteIndex()
+
+        # 余票订阅，相同条件的订阅共用一个后台轮询（经由车票结果缓存访问上游）
+        self.seat_watcher = SeatWatchManager(
+            self._get_result_set,
+            min_interval=settings.watch_min_interval,
+            max_interval=settings.watch_max_interval
+        )
+
+        # 热门路线预取，经由车票结果缓存刷新，预算在多个 worker 间共享
+        self.prefetcher = PrefetchScheduler(
+            self._refresh_result_set,
+            self.ticket_cache.remaining,
+            lambda: self.upstream_guard.try_acquire('prefetch'),
+            top_k=settings.prefetch_top_k,
+            lead=settings.prefetch_lead,
+            interval=settings.prefetch_interval,
+            half_life=settings.prefetch_half_life,
+            min_score=settings.prefetch_min_score,
+            recent=settings.ticket_cache_ttl
+        )
+
+        # 换乘规划，候选换乘站由途经站点索引剪枝，区间查询共用车票结果缓存
+        self.transfer_planner = TransferPlanner(
+            self._get_result_set,
+            self.route_index,
+            max_hubs=settings.transfer_max_hubs,
+            concurrency=settings.transfer_concurrency
+        )
+
+    @classmethod
+    async def create(cls) -> "TrainService":
+        """异步工厂：在事件循环内创建服务，站点表与会话在后台并行加载，不阻塞启动"""
+        service = cls()
+        service._start_task = asyncio.ensure_future(service.start())
+        return service
+
+    async def start(self):
+        """并行加载本地站点表缓存并预热上游会话，然后启动后台任务"""
+        loop = asyncio.get_running_loop()
+        loaded, _ = await asyncio.gather(
+            loop.run_in_executor(None, self._load_cached_stations),
+            self._warm_up_session()
         )
-        
-        # 创建异步会话
-        self.async_session = None
-        
-        # 设置基础请求头
-        self.base_headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Referer': 'https://kyfw.12306.cn/otn/leftTicket/init',
-            'Accept': '*/*',
-            'X-Requested-With': 'XMLHttpRequest'
+        if loaded:
+            self._get_ready_event().set()
+        # 没有本地缓存时由后台任务立即下载站点表
+        self.start_background_tasks()
+
+    async def _warm_up_session(self):
+        try:
+            await self.client.warm_up()
+        except Exception as e:
+            # 预热失败不影响就绪，首次查询时会重新预热
+            logger.warning(f"Failed to warm up upstream session: {str(e)}")
+
+    def _get_ready_event(self) -> asyncio.Event:
+        if self._stations_ready is None:
+            self._stations_ready = asyncio.Event()
+        return self._stations_ready
+
+    @property
+    def is_ready(self) -> bool:
+        """站点表已加载即可提供查询服务"""
+        return bool(self.station_map)
+
+    def readiness(self) -> Dict[str, bool]:
+        return {
+            "stations": self.is_ready,
+            "session": self.client.is_warm,
         }
 
-    def _init_session(self):
+    async def wait_ready(self, timeout: float) -> bool:
+        """等待站点表加载完成，超时返回 False"""
+        if self.is_ready:
+            return True
+        try:
+            await asyncio.wait_for(self._get_ready_event().wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.is_ready
+
+    def _load_cached_stations(self) -> bool:
+        """从本地缓存加载站点表"""
         try:
-            self.session.get('https://kyfw.12306.cn/otn/leftTicket/init')
-            logger.info("Session initialized successfully")
+            table = self.station_store.load()
         except Exception as e:
-            logger.error(f"Failed to initialize session: {str(e)}")
-            raise
+            logger.error(f"Failed to load cached station map: {str(e)}")
+            return False
+        if not table or not table.stations:
+            return False
+        self._apply_table(table)
+        logger.info(f"Loaded {len(self.station_map)} station mappings from {self.station_store.path}")
+        return True
+
+    def _load_newer_station_file(self) -> bool:
+        """其他 worker 已写入更新的站点文件时直接映射它，返回是否加载"""
+        file_id = self.station_store.file_id()
+        if file_id is None or (self.station_table and file_id == self.station_table.file_id):
+            return False
+        table = self.station_store.load()
+        if not table or not table.stations:
+            return False
+        if self.station_table and table.fetched_at <= self.station_table.fetched_at:
+            return False
+        self._apply_table(table)
+        logger.info(f"Loaded {len(self.station_map)} station mappings updated by another worker")
+        return True
 
-    def _init_station_map(self):
-        """初始化站点映射"""
+    def _apply_table(self, table: StationTable):
+        """整体替换映射与索引，避免查询读到半成品"""
+        stations = table.stations
+        previous = self.station_table
+        self.station_table = table
+        self.station_map = stations.code_to_name
+        self.name_to_code_map = stations.name_to_code
+        self.station_index = stations
+        self._retire_table(previous)
+
+    def _retire_table(self, previous: Optional[StationTable]):
+        """关闭已超过宽限期的旧站点表；刚被替换的表可能仍有进行中的读者，留到下次替换时关闭"""
+        now = time.monotonic()
+        expired = [table for retired_at, table in self._retired_tables if now - retired_at >= STATION_RETIRE_GRACE]
+        self._retired_tables = [(retired_at, table) for retired_at, table in self._retired_tables
+                                if now - retired_at < STATION_RETIRE_GRACE]
+        if previous is not None:
+            self._retired_tables.append((now, previous))
+        for table in expired:
+            table.stations.close()
+
+    def _station_validators(self) -> Dict[str, str]:
+        """条件请求头：本地已有站点表时，只在上游发生变化时才重新下载"""
+        headers = {}
+        if self.station_table and self.station_table.stations:
+            if self.station_table.etag:
+                headers['If-None-Match'] = self.station_table.etag
+            if self.station_table.last_modified:
+                headers['If-Modified-Since'] = self.station_table.last_modified
+        return headers
+
+    def _update_station_table(self, status: int, text: str, headers) -> None:
+        if status == 304:
+            logger.info("Station map not modified")
+            return
+        if status != 200:
+            logger.warning(f"Unexpected status when loading station map: {status}")
+            return
+        stations = parse_station_names(text)
+        if not stations:
+            logger.warning("Station map response contained no stations")
+            return
+        self._apply_table(self.station_store.save(
+            stations, headers.get('ETag'), headers.get('Last-Modified')
+        ))
+        logger.info(f"Loaded {len(self.station_map)} station mappings")
+
+    async def refresh_station_map(self):
+        """后台重新验证站点表，解析与建索引放到线程池中执行
+
+        多个 worker 通过文件锁保证同一时刻只有一个下载；取得锁后先检查本地文件是否已被
+        其他 worker 更新，是则直接映射，不访问上游。
+        """
+        self._last_station_reload = time.monotonic()
+        loop = asyncio.get_running_loop()
+        async with self.station_store.refresh_lock():
+            if not await loop.run_in_executor(None, self._load_newer_station_file):
+                status, text, headers = await self.client.get_text(
+                    STATION_NAMES_PATH, headers=self._station_validators()
+                )
+                await loop.run_in_executor(None, self._update_station_table, status, text, headers)
+        if self.is_ready:
+            self._get_ready_event().set()
+
+    async def _station_refresh_loop(self):
+        # 本地缓存已过期或不存在时立即重新验证，之后按固定间隔
+        fetched_at = self.station_table.fetched_at if self.station_table else 0.0
+        delay = fetched_at + settings.station_refresh_interval - time.time()
+        while True:
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                await self.refresh_station_map()
+                delay = settings.station_refresh_interval
+            except Exception as e:
+                logger.error(f"Failed to refresh station map: {str(e)}")
+                delay = settings.station_reload_min_interval
+            if not self.is_ready:
+                # 尚未加载到任何站点时尽快重试
+                delay = 5
+
+    def start_background_tasks(self):
+        """在事件循环启动后调用，启动站点表的后台重新验证与车次索引的批量写入"""
+        if self._station_refresh_task is None:
+            self._station_refresh_task = asyncio.ensure_future(self._station_refresh_loop())
+        self.train_store.start()
+        if self.seat_history is not None:
+            self.seat_history.start()
+        if settings.prefetch_enabled:
+            self.prefetcher.start()
+
+    def _station_reload_allowed(self) -> bool:
+        """未命中触发的重新加载按最小间隔限流"""
+        return time.monotonic() - self._last_station_reload >= settings.station_reload_min_interval
+
+    async def _reload_stations_on_miss(self) -> bool:
+        """搜索未命中时重新验证站点表（限流），并发的未命中共享同一次重新加载，返回是否进行了加载"""
+        task = self._station_reload_task
+        if task is None or task.done():
+            if not self._station_reload_allowed():
+                return False
+            task = self._station_reload_task = asyncio.ensure_future(self.refresh_station_map())
         try:
-            response = self.session.get(
-                'https://kyfw.12306.cn/otn/resources/js/framework/station_name.js'
-            )
-            if response.status_code == 200:
-                station_data = response.text.split('@')[1:]
-                for station in station_data:
-                    info = station.split('|')
-                    if len(info) >= 3:
-                        name = info[1]
-                        code = info[2]
-                        self.station_map[code] = name
-                        self.name_to_code_map[name] = code
-                logger.info(f"Loaded {len(self.station_map)} station mappings")
+            await asyncio.shield(task)
         except Exception as e:
-            logger.error(f"Failed to initialize station map: {str(e)}")
+            logger.error(f"Failed to reload station map: {str(e)}")
+            return False
+        return True
 
     def get_station_name(self, code: str) -> Optional[str]:
         """根据站点代码获取站点名称"""
         return self.station_map.get(code)
 
-    def get_station_code(self, station_name: str) -> Optional[str]:
+    async def get_station_code(self, station_name: str) -> Optional[str]:
         """根据站点名称获取站点代码"""
         if not station_name:
             return None
@@ -90,7 +360,7 @@ class TrainService:
 
         # 如果没找到，尝试模糊匹配
         try:
-            matches = self.search_stations(station_name)
+            matches = await self.search_stations(station_name)
             if matches:
                 # 返回最匹配的结果
                 return matches[0]["code"]
@@ -101,352 +371,445 @@ class TrainService:
 
     def _get_train_type(self, train_code: str) -> str:
         """根据车次编号判断列车类型"""
-        if not train_code:
-            return "未知"
-        first_letter = train_code[0].upper()
-        if first_letter == 'G':
-            return "高铁"
-        elif first_letter == 'D':
-            return "动车"
-        elif first_letter in ['Z', 'T', 'K']:
-            return "普通列车"
-        else:
-            return "其他"
+        return get_train_type(train_code)
 
-    def get_train_stops(self, train_no: str, from_station: str, to_station: str, train_date: str) -> List[Dict]:
-        """获取列车经停站信息"""
-        logger.info(f"正在获取列车 {train_no} 的经停站信息...")
+    async def get_train_stops_by_code(self, train_code: str, train_date: str = None) -> List[TrainStop]:
+        """根据车次编号获取经停站信息，与车票查询共用经停站缓存"""
         try:
-            # 更新请求头
-            self.session.headers.update({
-                'Referer': 'https://kyfw.12306.cn/otn/leftTicket/init',
-                'X-Requested-With': 'XMLHttpRequest',
-                'Accept': '*/*'
-            })
-
-            # 构建请求URL
-            url = 'https://kyfw.12306.cn/otn/czxx/queryByTrainNo'
-            params = {
-                'train_no': train_no,
-                'from_station_telecode': from_station,
-                'to_station_telecode': to_station,
-                'depart_date': train_date
-            }
-
-            # 发送请求
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-
-            # 解析响应
-            result = response.json()
-            if result.get('status') and result.get('data', {}).get('data'):
-                stops = []
-                station_list = result['data']['data']
-                total_stations = len(station_list)
-
-                for i, station in enumerate(station_list):
-                    is_first = i == 0
-                    is_last = i == total_stations - 1
-                    
-                    stop = {
-                        'station_name': station.get('station_name', ''),
-                        'arrival_time': '--' if is_first else station.get('arrive_time', '--'),
-                        'departure_time': '--' if is_last else station.get('start_time', '--'),
-                        'stopover_time': '--' if is_first or is_last else station.get('stopover_time', '--')
-                    }
-                    stops.append(stop)
-                    
-                logger.info(f"成功获取到 {len(stops)} 个经停站")
-                return stops
-            logger.warning("未获取到经停站信息")
-            return []
+            found = await self.train_store.lookup(train_code, train_date)
+            if not found:
+                logger.warning(f"No stops found for train {train_code}")
+                return []
+
+            train_no, from_station_code, to_station_code, train_date = found
+            logger.debug(f"找到车次信息: {train_code}, train_no: {train_no}, "
+                        f"from: {from_station_code}, to: {to_station_code}, date: {train_date}")
+            # 使用12306 API获取完整的经停站信息
+            stops = await self.stop_fetcher.get_stops(train_no, from_station_code, to_station_code, train_date)
+            return [TrainStop(**stop) for stop in stops]
 
         except Exception as e:
-            logger.error(f"获取经停站信息失败: {str(e)}")
+            logger.error(f"Failed to get train stops: {str(e)}")
             return []
 
-    def get_train_stops_from_file(self, train_code: str, train_date: str = None) -> List[TrainStop]:
-        """获取列车经停站信息"""
+    async def get_train_stops_payload(self, train_code: str, train_date: str = None) -> Optional[EncodedPayload]:
+        """与 get_train_stops_by_code 相同，但直接返回缓存的已编码响应，找不到时返回 None"""
         try:
-            # 查找最近一次查询中的车次信息
-            file_path = os.path.join(self.data_dir, 'train_stops.txt')
-            if not os.path.exists(file_path):
-                logger.warning(f"Train stops file not found: {file_path}")
-                return []
-
-            train_info = None
-            train_no = None
-            from_station_code = None
-            to_station_code = None
-
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                # 获取查询日期
-                if lines and lines[0].startswith("查询日期:"):
-                    saved_date = lines[0].strip().split(": ")[1]
-                    train_date = train_date or saved_date
-
-                # 查找车次信息和车次号
-                for line in lines:
-                    if line.startswith("TRAIN|"):
-                        fields = line.strip().split("|")
-                        if len(fields) >= 4 and fields[2] == train_code:
-                            train_no = fields[1]
-                            from_station_code = fields[3]
-                            to_station_code = fields[4]
-                            break
-
-            if train_no and from_station_code and to_station_code and train_date:
-                logger.info(f"找到车次信息: {train_code}, train_no: {train_no}, "
-                          f"from: {from_station_code}, to: {to_station_code}, date: {train_date}")
-                # 使用12306 API获取完整的经停站信息
-                stops = self.get_train_stops(train_no, from_station_code, to_station_code, train_date)
-                if stops:
-                    return [TrainStop(
-                        station_name=stop['station_name'],
-                        arrival_time=stop['arrival_time'],
-                        departure_time=stop['departure_time'],
-                        stopover_time=stop['stopover_time']
-                    ) for stop in stops]
-
-            logger.warning(f"No stops found for train {train_code}")
-            return []
-
+            found = await self.train_store.lookup(train_code, train_date)
+            if not found:
+                return None
+            train_no, from_station_code, to_station_code, train_date = found
+            return await self.stop_fetcher.get_payload(train_no, from_station_code, to_station_code, train_date)
         except Exception as e:
             logger.error(f"Failed to get train stops: {str(e)}")
-            return []
+            return None
 
-    def save_train_stops(self, train_info_list: List[TrainInfo], train_date: str, 
-                     via_station: str = None, filename: str = 'train_stops.txt'):
-        """
-        保存列车经停站信息到文件
-        Args:
-            train_info_list: 列车信息列表
-            train_date: 查询日期
-            via_station: 经停站点（可选），如果指定，只保存包含该站点的车次
-            filename: 保存的文件名
-        """
-        if not train_info_list:
-            logger.warning("没有可保存的车次信息")
-            return
+    async def get_seat_history(self, train_code: str, since: float, until: float,
+                               train_date: str = None, from_station: str = None,
+                               to_station: str = None, limit: int = 1000) -> List[Dict]:
+        """查询车次在 [since, until) 内记录的余票变化，按观测时间排序（需开启 SEAT_HISTORY_ENABLED）"""
+        codes = []
+        for station in (from_station, to_station):
+            code = await self.get_station_code(station) if station else None
+            if station and not code:
+                return []
+            codes.append(code)
+        snapshots = await self.seat_history.query(
+            since, until, limit=limit, changes_only=True, train_code=train_code,
+            train_date=train_date, from_code=codes[0], to_code=codes[1]
+        )
+        return [{
+            "observed_at": snapshot.observed_at,
+            "train_date": snapshot.train_date,
+            "train_code": snapshot.train_code,
+            "from_station": self.station_map.get(snapshot.from_code) or snapshot.from_code,
+            "to_station": self.station_map.get(snapshot.to_code) or snapshot.to_code,
+            "seats": snapshot.seats,
+        } for snapshot in snapshots]
+
+    def _index_stops(self, train_no: str, train_date: str, stops: List[Dict]):
+        """把经停站结果写入途经站点索引（站名转换为站点代码，站点表中没有的站点被丢弃）"""
+        codes = []
+        for stop in stops:
+            code = self.name_to_code_map.get(stop['station_name'])
+            if code is None:
+                # 未知站名不能作为换乘站或途经站代码发给上游
+                logger.debug(f"经停站不在站点表中，不写入索引: {train_no} {stop['station_name']}")
+                continue
+            codes.append(code)
+        self.route_index.add(train_date, train_no, codes)
 
+    async def _async_query_tickets(self, from_station: str, to_station: str, train_date: str,
+                                 start_time: str = None, end_time: str = None,
+                                 train_types: List[str] = None, via_station: str = None,
+                                 include_stops: bool = False, include_prices: bool = False) -> List[TrainInfo]:
+        """异步查询车票信息"""
+        result = await self._query_records(
+            from_station, to_station, train_date, start_time, end_time,
+            train_types, via_station, include_stops, include_prices
+        )
+        # 只为最终返回的车次构建 pydantic 模型
+        return [record.to_model(result.stops.get(record.train_no, []) if include_stops else None,
+                                result.prices.get(record.train_no) if include_prices else None)
+                for record in result.records]
+
+    async def query_tickets_payload(self, from_station: str, to_station: str, train_date: str,
+                                    start_time: str = None, end_time: str = None,
+                                    train_types: List[str] = None, via_station: str = None,
+                                    include_stops: bool = False, include_prices: bool = False,
+                                    view: TicketView = DEFAULT_VIEW) -> EncodedPayload:
+        """查询车票并直接编码为 JSON，不经过 pydantic 模型
+
+        编码结果按过滤条件缓存在结果集上，随结果缓存一起过期。
+        """
+        self.prefetcher.record(from_station, to_station, train_date)
         try:
-            # 使用绝对路径，保存到data目录下
-            file_path = os.path.join(self.data_dir, filename)
-            logger.info(f"将保存文件到: {file_path}")
-
-            with open(file_path, 'w', encoding='utf-8') as f:
-                # 写入查询信息
-                f.write(f"查询日期: {train_date}\n")
-                if via_station:
-                    f.write(f"经停站点: {via_station}\n")
-                f.write("=" * 50 + "\n")
-                
-                # 保存原始查询结果
-                for info in train_info_list:
-                    # 保存原始查询结果，包含所有必要信息
-                    f.write(f"TRAIN|{info.train_no}|{info.train_code}|"
-                           f"{self.get_station_code(info.from_station.station_name)}|"
-                           f"{self.get_station_code(info.to_station.station_name)}|"
-                           f"{info.from_station.station_name}|{info.to_station.station_name}|"
-                           f"{info.from_station.departure_time}|{info.to_station.arrival_time}\n")
-
-            logger.info(f"所有列车信息已保存到 {file_path}")
-        except Exception as e:
-            logger.error(f"保存列车信息时出错: {str(e)}")
+            result_set = await self._get_result_set(from_station, to_station, train_date)
+        except UpstreamUnavailableError:
             raise
+        except Exception as e:
+            logger.error(f"查询车票失败: {str(e)}")
+            return EncodedPayload(b'[]')
+        return await self._encode_result_set(
+            result_set, from_station, to_station, train_date, start_time, end_time,
+            train_types, via_station, include_stops, include_prices, view
+        )
+
+    @staticmethod
+    def _encoded_key(start_time: str = None, end_time: str = None, train_types: List[str] = None,
+                     via_station: str = None, include_stops: bool = False, include_prices: bool = False,
+                     view: TicketView = DEFAULT_VIEW) -> tuple:
+        """编码结果的缓存键（过滤、排序、投影与分页条件）"""
+        return (start_time, end_time, tuple(sorted(train_types or ())), via_station,
+                bool(include_stops), bool(include_prices), view)
 
-    async def _get_async_session(self):
-        """获取或创建异步会话"""
+    async def _encode_result_set(self, result_set: TrainResultSet, from_station: str, to_station: str,
+                                 train_date: str, start_time: str = None, end_time: str = None,
+                                 train_types: List[str] = None, via_station: str = None,
+                                 include_stops: bool = False, include_prices: bool = False,
+                                 view: TicketView = DEFAULT_VIEW) -> EncodedPayload:
+        """在完整结果上按条件过滤并编码，编码结果按条件缓存在结果集上
+
+        分页时分页前的车次数放在 X-Total-Count 响应头中。
+        """
+        key = self._encoded_key(start_time, end_time, train_types, via_station, include_stops, include_prices, view)
+        payload = result_set.encoded.get(key)
+        if payload is not None:
+            return payload
+
+        result = await self._filter_result_set(
+            result_set, from_station, to_station, train_date, start_time, end_time,
+            train_types, via_station, include_stops, include_prices, view
+        )
+        with timed('encode'):
+            payload = EncodedPayload(dumps([
+                view.project(record.to_dict(result.stops.get(record.train_no, []) if include_stops else None,
+                                            result.prices.get(record.train_no) if include_prices else None))
+                for record in result.records
+            ]), headers={'X-Total-Count': str(result.total)} if view.paginated else None)
+        # 经停站或票价获取不完整时不缓存，下次请求重新获取
+        if result.complete:
+            result_set.store_encoded(key, payload)
+        return payload
+
+    async def resolve_stations(self, names: Iterable[str]) -> Dict[str, Optional[str]]:
+        """批量解析站点名称：去重后先精确匹配，未命中的并行模糊匹配，返回 {名称: 代码或 None}"""
+        codes = {}
+        missing = []
+        for name in set(names):
+            code = self.name_to_code_map.get(name) if name else None
+            if code:
+                codes[name] = code
+            else:
+                missing.append(name)
+        if missing:
+            found = await asyncio.gather(*(self.get_station_code(name) for name in missing))
+            codes.update(zip(missing, found))
+        return codes
+
+    async def query_tickets_batch(self, queries: Sequence[Tuple[str, str, str, Dict]]
+                                  ) -> List[Union[EncodedPayload, Exception]]:
+        """批量查询 [(出发站, 到达站, 日期, 过滤条件)]，返回与 queries 顺序一致的编码结果或异常
+
+        相同 (出发站, 到达站, 日期) 的查询只获取一次完整结果，再在共享的结果集上分别过滤；
+        过滤条件也相同的查询只编码一次。并发的 (出发站, 到达站, 日期) 数受 settings.batch_concurrency 限制。
+        """
+        semaphore = asyncio.Semaphore(settings.batch_concurrency)
+        groups: Dict[Tuple[str, str, str], List[int]] = {}
+        for index, (from_station, to_station, train_date, _) in enumerate(queries):
+            groups.setdefault((from_station, to_station, train_date), []).append(index)
+        results: List[Union[EncodedPayload, Exception, None]] = [None] * len(queries)
+
+        async def run_group(key: Tuple[str, str, str], indexes: List[int]):
+            async with semaphore:
+                for _ in indexes:
+                    self.prefetcher.record(*key)
+                try:
+                    result_set = await self._get_result_set(*key)
+                except UpstreamUnavailableError as e:
+                    for index in indexes:
+                        results[index] = e
+                    return
+                except Exception as e:
+                    # 与单个查询一致：上游请求失败时返回空结果
+                    logger.error(f"查询车票失败: {str(e)}")
+                    for index in indexes:
+                        results[index] = EncodedPayload(b'[]')
+                    return
+
+                by_filters: Dict[tuple, List[int]] = {}
+                for index in indexes:
+                    by_filters.setdefault(self._encoded_key(**queries[index][3]), []).append(index)
+                outcomes = await asyncio.gather(*(
+                    self._encode_result_set(result_set, *key, **queries[same[0]][3])
+                    for same in by_filters.values()
+                ), return_exceptions=True)
+                for same, outcome in zip(by_filters.values(), outcomes):
+                    for index in same:
+                        results[index] = outcome
+
+        await asyncio.gather(*(run_group(key, indexes) for key, indexes in groups.items()))
+        return results
+
+    async def query_tickets_range(self, station_pairs: Sequence[Tuple[str, str]], train_dates: Sequence[str],
+                                  start_time: str = None, end_time: str = None,
+                                  train_types: List[str] = None, via_station: str = None,
+                                  include_stops: bool = False, include_prices: bool = False,
+                                  view: TicketView = DEFAULT_VIEW
+                                  ) -> AsyncIterator[Tuple[int, str, EncodedPayload]]:
+        """并行查询多个 (站点对, 日期)，按完成顺序逐个产出 (站点对在 station_pairs 中的下标, 日期, 编码结果)
+
+        并发数受 settings.range_concurrency 限制，各查询共享上游会话与结果缓存；
+        调用方提前停止迭代（如客户端断开）时取消尚未完成的查询。
+        """
+        semaphore = asyncio.Semaphore(settings.range_concurrency)
+
+        async def query_one(index: int, train_date: str):
+            from_station, to_station = station_pairs[index]
+            async with semaphore:
+                try:
+                    payload = await self.query_tickets_payload(
+                        from_station, to_station, train_date, start_time, end_time,
+                        train_types, via_station, include_stops, include_prices, view
+                    )
+                except UpstreamUnavailableError as e:
+                    logger.warning(f"查询车票失败: {str(e)}")
+                    payload = EncodedPayload(b'[]')
+            return index, train_date, payload
+
+        tasks = [asyncio.ensure_future(query_one(index, train_date))
+                 for index in range(len(station_pairs))
+                 for train_date in train_dates]
         try:
-            if self.async_session is None or self.async_session.closed:
-                self.async_session = aiohttp.ClientSession(
-                    connector=self.conn,
-                    headers=self.base_headers,
-                    timeout=aiohttp.ClientTimeout(total=30),
-                    connector_owner=False  # 不自动关闭连接器
-                )
-            return self.async_session
-        except Exception as e:
-            logger.error(f"创建异步会话失败: {str(e)}")
-            # 如果创建失败，确保清理旧会话
-            if self.async_session and not self.async_session.closed:
-                await self.async_session.close()
-            self.async_session = None
-            raise
+            for future in asyncio.as_completed(tasks):
+                yield await future
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def plan_transfers(self, from_station: str, to_station: str, train_date: str,
+                             min_connection: int = 30, max_connection: int = 240,
+                             start_time: str = None, end_time: str = None,
+                             train_types: List[str] = None, limit: int = 20) -> List[Dict]:
+        """查询一次换乘的行程（出发时间过滤作用于第一段，车型过滤作用于两段）"""
+        train_types = {t.upper() for t in train_types} if train_types else None
+        accept = compile_filter(train_types=train_types)
+        fallback_hubs = [code for code in (self.name_to_code_map.get(name) for name in settings.transfer_hubs)
+                         if code]
+        return await self.transfer_planner.plan(
+            from_station, to_station, train_date,
+            fallback_hubs=fallback_hubs,
+            min_connection=min_connection,
+            max_connection=max_connection,
+            accept=accept,
+            accept_first=compile_filter(start_time, end_time),
+            limit=limit
+        )
+
+    async def _get_result_set(self, from_station: str, to_station: str, train_date: str) -> TrainResultSet:
+        """获取完整（未过滤）的查询结果，相同 (出发站, 到达站, 日期) 的查询共享缓存与同一次上游请求
 
-    async def _async_get_train_stops(self, session: aiohttp.ClientSession, train_no: str, 
-                                   from_station: str, to_station: str, train_date: str) -> List[Dict]:
-        """异步获取列车经停站信息"""
+        上游熔断、限流或请求失败时返回仍在保留期内的过期结果，没有则抛出原异常。
+        """
+        key = (from_station, to_station, train_date)
         try:
-            url = 'https://kyfw.12306.cn/otn/czxx/queryByTrainNo'
-            params = {
-                'train_no': train_no,
-                'from_station_telecode': from_station,
-                'to_station_telecode': to_station,
-                'depart_date': train_date
-            }
-
-            async with session.get(url, params=params, timeout=10) as response:
-                result = await response.json()
-                if result.get('status') and result.get('data', {}).get('data'):
-                    stops = []
-                    station_list = result['data']['data']
-                    total_stations = len(station_list)
-
-                    for i, station in enumerate(station_list):
-                        is_first = i == 0
-                        is_last = i == total_stations - 1
-                        stop = {
-                            'station_name': station.get('station_name', ''),
-                            'arrival_time': '--' if is_first else station.get('arrive_time', '--'),
-                            'departure_time': '--' if is_last else station.get('start_time', '--'),
-                            'stopover_time': '--' if is_first or is_last else station.get('stopover_time', '--')
-                        }
-                        stops.append(stop)
-                    return stops
-            return []
+            with timed('fetch'):
+                return await self.ticket_cache.get_or_fetch(
+                    key,
+                    lambda: self._fetch_trains(from_station, to_station, train_date)
+                )
         except Exception as e:
-            logger.error(f"获取经停站信息失败: {str(e)}")
-            return []
+            stale = self.ticket_cache.get_stale(key)
+            if stale is None:
+                raise
+            logger.warning(f"上游不可用，返回过期的查询结果 {key}: {str(e)}")
+            return stale
+
+    def ticket_max_age(self, from_station: str, to_station: str, train_date: str) -> int:
+        """车票结果缓存的剩余有效期（整秒），用作响应的 Cache-Control max-age"""
+        return int(self.ticket_cache.remaining((from_station, to_station, train_date)))
+
+    async def _refresh_result_set(self, key: Tuple[str, str, str], min_ttl: float):
+        """预取：提前重新加载车票结果（共享缓存中已有足够新的结果时直接采用）"""
+        from_station, to_station, train_date = key
+        await self.ticket_cache.refresh(
+            key, lambda: self._fetch_trains(from_station, to_station, train_date), min_ttl
+        )
 
-    async def _init_async_session(self, session: aiohttp.ClientSession):
-        """初始化异步会话"""
+    async def _query_records(self, from_station: str, to_station: str, train_date: str,
+                             start_time: str = None, end_time: str = None,
+                             train_types: List[str] = None, via_station: str = None,
+                             include_stops: bool = False, include_prices: bool = False,
+                             view: TicketView = DEFAULT_VIEW) -> TicketQueryResult:
+        """查询并过滤车次记录"""
+        self.prefetcher.record(from_station, to_station, train_date)
         try:
-            async with session.get('https://kyfw.12306.cn/otn/leftTicket/init', timeout=10) as response:
-                await response.text()
-            logger.info("Async session initialized successfully")
-            return True
+            result_set = await self._get_result_set(from_station, to_station, train_date)
         except Exception as e:
-            logger.error(f"Failed to initialize async session: {str(e)}")
-            return False
+            logger.error(f"查询车票失败: {str(e)}")
+            return TicketQueryResult([], {}, False)
+        return await self._filter_result_set(
+            result_set, from_station, to_station, train_date, start_time, end_time,
+            train_types, via_station, include_stops, include_prices, view
+        )
 
-    async def _async_query_tickets(self, from_station: str, to_station: str, train_date: str,
-                                 start_time: str = None, end_time: str = None,
+    async def _filter_result_set(self, result_set: TrainResultSet, from_station: str, to_station: str,
+                                 train_date: str, start_time: str = None, end_time: str = None,
                                  train_types: List[str] = None, via_station: str = None,
-                                 include_stops: bool = False) -> List[TrainInfo]:
-        """异步查询车票信息"""
-        session = None
+                                 include_stops: bool = False, include_prices: bool = False,
+                                 view: TicketView = DEFAULT_VIEW) -> TicketQueryResult:
+        """在缓存的完整结果上应用过滤条件，并按需获取经停站与票价（记录只读，无需复制）
+
+        排序与分页在所有过滤之后进行，经停站与票价只为分页后的车次获取。
+        """
+        train_types = {t.upper() for t in train_types} if train_types else None
+        with timed('filter'):
+            matches = compile_filter(start_time, end_time, train_types, view)
+            records = [record for record in result_set.records if matches(record)]
+
+        complete = True
+        if records and via_station:
+            # 经停站过滤需要全部候选车次的路线
+            _, complete = await self._get_stops(records, from_station, to_station, train_date,
+                                                False, True)
+            via_code = self.name_to_code_map.get(via_station, via_station)
+            records = [record for record in records
+                       if via_code in (self.route_index.stations(train_date, record.train_no) or ())]
+
+        total = len(records)
+        records = view.arrange(records)
+        if not records or not (include_stops or include_prices):
+            return TicketQueryResult(records, {}, complete, total=total)
+
+        stops_by_train, stops_complete = {}, True
+        prices_by_train, prices_complete = {}, True
+        if include_stops and include_prices:
+            (stops_by_train, stops_complete), (prices_by_train, prices_complete) = await asyncio.gather(
+                self._get_stops(records, from_station, to_station, train_date, True, False),
+                self._get_prices(records, train_date)
+            )
+        elif include_stops:
+            stops_by_train, stops_complete = await self._get_stops(records, from_station, to_station,
+                                                                   train_date, True, False)
+        else:
+            prices_by_train, prices_complete = await self._get_prices(records, train_date)
+        return TicketQueryResult(records, stops_by_train, complete and stops_complete and prices_complete,
+                                 prices_by_train, total)
+
+    async def _get_stops(self, records: List[TrainRecord], from_station: str, to_station: str,
+                         train_date: str, include_stops: bool, via_filter: bool
+                         ) -> Tuple[Dict[str, List[Dict]], bool]:
+        """按需获取经停站，返回 ({train_no: 经停站}, 是否全部获取成功)"""
+        # 需要经停站详情时获取全部车次；仅按经停站过滤时只获取索引中尚未收录的车次
+        if include_stops:
+            pending = records
+        elif via_filter:
+            pending = [record for record in records
+                       if (train_date, record.train_no) not in self.route_index]
+        else:
+            return {}, True
+        # 未缓存的车次过多时只获取前 stops_max_fetch_per_query 个，其余本次跳过（结果不完整）
+        skipped = set()
+        limit = settings.stops_max_fetch_per_query
+        if limit and len(pending) > limit:
+            uncached = [record.train_no for record in pending
+                        if not self.stop_fetcher.is_cached(record.train_no, train_date)]
+            skipped = set(uncached[limit:])
+            if skipped:
+                logger.debug(f"本次查询跳过 {len(skipped)} 个车次的经停站（超过 {limit} 个未缓存）")
+                pending = [record for record in pending if record.train_no not in skipped]
+        if not pending:
+            return {}, not skipped
+
+        # 并行获取经停站信息（并发数由 StopFetcher 限制，命中缓存的不访问上游）
+        with timed('stops'):
+            results = await asyncio.gather(
+                *(self.stop_fetcher.get_stops(record.train_no, from_station, to_station, train_date)
+                  for record in pending),
+                return_exceptions=True
+            )
+        stops_by_train = {}
+        for record, stops in zip(pending, results):
+            if isinstance(stops, Exception):
+                logger.error(f"获取经停站信息失败: {str(stops)}")
+                continue
+            stops_by_train[record.train_no] = stops
+        return stops_by_train, len(stops_by_train) == len(pending) and not skipped
+
+    async def _get_prices(self, records: List[TrainRecord], train_date: str
+                          ) -> Tuple[Dict[str, Dict[str, float]], bool]:
+        """批量获取票价（每个车次一次请求覆盖全部席别，命中缓存的不访问上游）"""
+        with timed('prices'):
+            return await self.price_fetcher.get_many(records, train_date)
+
+    async def _fetch_trains(self, from_station: str, to_station: str, train_date: str) -> TrainResultSet:
+        """从 12306 查询并解析全部车次（不做过滤），失败时抛出异常以免写入缓存"""
         retry_count = 0
         max_retries = 3
+        params = {
+            'leftTicketDTO.train_date': train_date,
+            'leftTicketDTO.from_station': from_station,
+            'leftTicketDTO.to_station': to_station,
+            'purpose_codes': 'ADULT'
+        }
 
-        while retry_count < max_retries:
+        while True:
             try:
-                session = await self._get_async_session()
-                
-                # 初始化会话
-                if not await self._init_async_session(session):
-                    raise Exception("Failed to initialize session")
-
-                url = f'https://kyfw.12306.cn/otn/leftTicket/queryZ?leftTicketDTO.train_date={train_date}&leftTicketDTO.from_station={from_station}&leftTicketDTO.to_station={to_station}&purpose_codes=ADULT'
-                
-                async with session.get(url, timeout=10) as response:
-                    # 检查响应类型
-                    content_type = response.headers.get('Content-Type', '')
-                    if 'application/json' not in content_type.lower():
-                        logger.warning(f"Unexpected content type: {content_type}")
-                        # 关闭当前会话并重试
-                        await session.close()
-                        self.async_session = None
-                        retry_count += 1
-                        if retry_count < max_retries:
-                            logger.info(f"Retrying query (attempt {retry_count + 1})")
-                            await asyncio.sleep(1)  # 等待1秒后重试
-                            continue
-                        else:
-                            raise Exception("Max retries reached")
-
-                    data = await response.json()
-                    if 'data' not in data or 'result' not in data['data']:
-                        return []
-
-                    # 解析基本车次信息
-                    trains = []
-                    stop_tasks = []
-                    
-                    for train_str in data['data']['result']:
-                        try:
-                            train_info = self._parse_train_info(train_str)
-                            if not train_info:
-                                continue
-
-                            # 应用过滤条件
-                            if not self._apply_filters(train_info, start_time, end_time, train_types):
-                                continue
-
-                            trains.append(train_info)
-                            
-                            # 如果需要经停站信息，创建异步任务
-                            if include_stops or via_station:
-                                task = self._async_get_train_stops(
-                                    session,
-                                    train_info.train_no,
-                                    from_station,
-                                    to_station,
-                                    train_date
-                                )
-                                stop_tasks.append((train_info, task))
-                        except Exception as e:
-                            logger.error(f"解析车次信息失败: {str(e)}")
-                            continue
-
-                    # 并行获取所有经停站信息
-                    if stop_tasks:
-                        results = await asyncio.gather(*(task for _, task in stop_tasks), return_exceptions=True)
-                        for (train_info, _), stops in zip(stop_tasks, results):
-                            if isinstance(stops, Exception):
-                                logger.error(f"获取经停站信息失败: {str(stops)}")
-                                continue
-                            if via_station and not any(stop['station_name'] == via_station for stop in stops):
-                                trains.remove(train_info)
-                                continue
-                            if include_stops:
-                                train_info.stops = [TrainStop(
-                                    station_name=stop['station_name'],
-                                    arrival_time=stop['arrival_time'],
-                                    departure_time=stop['departure_time'],
-                                    stopover_time=stop['stopover_time']
-                                ) for stop in stops]
-
-                    return trains
-
+                data = await self.client.get_json(QUERY_PATH, params=params)
+                if 'data' not in data or 'result' not in data['data']:
+                    return TrainResultSet([])
+
+                # 一次遍历解析全部车次
+                with timed('parse'):
+                    records = parse_results(data['data']['result'], self.station_map)
+
+                # 记录车次编号，供 /trains/{train_code}/stops 查询
+                self.train_store.record(train_date, (
+                    (record.train_code, record.train_no, record.from_code, record.to_code)
+                    for record in records
+                ))
+                if self.seat_history is not None:
+                    self.seat_history.record(train_date, records)
+                return TrainResultSet(records)
+
+            except UpstreamUnavailableError:
+                # 熔断或限流时不重试，避免加重上游压力
+                raise
             except Exception as e:
                 logger.error(f"查询车票失败: {str(e)}")
                 retry_count += 1
-                if retry_count < max_retries:
-                    logger.info(f"Retrying query (attempt {retry_count + 1})")
-                    await asyncio.sleep(1)  # 等待1秒后重试
-                    if session and not session.closed:
-                        await session.close()
-                        self.async_session = None
-                else:
-                    return []
-            finally:
-                if session and not session.closed:
-                    await session.close()
-                    self.async_session = None
-
-    def _apply_filters(self, train_info: TrainInfo, start_time: str, end_time: str, train_types: List[str]) -> bool:
-        """应用过滤条件"""
-        # 时间范围过滤
-        departure_time = train_info.from_station.departure_time
-        if start_time and departure_time < start_time:
-            return False
-        if end_time and departure_time > end_time:
-            return False
-        
-        # 车型过滤
-        if train_types:
-            train_first_letter = train_info.train_code[0].upper()
-            if train_first_letter not in [t.upper() for t in train_types]:
-                return False
-        
-        return True
+                if retry_count >= max_retries:
+                    raise Exception("Max retries reached") from e
+                # 指数退避加随机抖动，避免多个 worker 同时重试
+                delay = 0.5 * (2 ** (retry_count - 1)) * random.uniform(0.5, 1.5)
+                UPSTREAM_RETRIES.inc(endpoint='queryZ')
+                logger.info(f"Retrying query in {delay:.2f}s (attempt {retry_count + 1})")
+                await asyncio.sleep(delay)
 
     def query_tickets(self, from_station: str, to_station: str, train_date: str,
                      start_time: str = None, end_time: str = None,
                      train_types: List[str] = None, via_station: str = None,
-                     include_stops: bool = False) -> List[TrainInfo]:
+                     include_stops: bool = False, include_prices: bool = False) -> List[TrainInfo]:
         """同步查询接口，内部使用异步实现"""
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
@@ -455,122 +818,114 @@ class TrainService:
                 self._async_query_tickets(
                     from_station, to_station, train_date,
                     start_time, end_time, train_types,
-                    via_station, include_stops
+                    via_station, include_stops, include_prices
                 )
             )
         finally:
+            # 客户端会话绑定在当前事件循环上，随循环一起关闭
+            loop.run_until_complete(self.client.close())
             loop.close()
 
-    def _parse_train_info(self, train_str: str) -> Optional[TrainInfo]:
-        try:
-            fields = train_str.split('|')
-            
-            train_code = fields[3]
-            logger.debug(f"正在解析车次 {train_code} 的信息")
-            
-            # 获取实际的站点名称
-            from_station_name = self.get_station_name(fields[6]) or fields[6]
-            to_station_name = self.get_station_name(fields[7]) or fields[7]
-            
-            from_stop = TrainStop(
-                station_name=from_station_name,
-                departure_time=fields[8],
-                arrival_time=None,
-                stopover_time=None
-            )
-            
-            to_stop = TrainStop(
-                station_name=to_station_name,
-                arrival_time=fields[9],
-                departure_time=None,
-                stopover_time=None
-            )
-
-            seats = {
-                "商务座": fields[32] or "--",
-                "一等座": fields[31] or "--",
-                "二等座": fields[30] or "--",
-                "软卧": fields[23] or "--",
-                "硬卧": fields[28] or "--",
-                "硬座": fields[29] or "--",
-                "无座": fields[26] or "--"
-            }
-
-            # 添加座位信息日志
-            logger.info(f"车次 {train_code} 的座位信息:")
-            for seat_type, count in seats.items():
-                if count != "--":
-                    logger.info(f"  {seat_type}: {count}")
-
-            # Prices would be fetched from another API endpoint
-            prices = {}
-
-            train_info = TrainInfo(
-                train_no=fields[2],
-                train_code=train_code,
-                train_type=self._get_train_type(train_code),
-                from_station=from_stop,
-                to_station=to_stop,
-                duration=fields[10],
-                seats=seats,
-                prices=prices
-            )
-            
-            logger.debug(f"成功解析车次 {train_code} 的信息")
-            return train_info
+    async def search_stations(self, keyword: str) -> List[Dict[str, str]]:
+        """搜索站点，支持站名、拼音、拼音首字母和电报码的模糊匹配
 
-        except Exception as e:
-            logger.error(f"解析车次信息失败: {str(e)}")
-            return None 
-
-    def search_stations(self, keyword: str) -> List[Dict[str, str]]:
-        """搜索站点，支持模糊匹配"""
+        索引查询只需微秒级，直接在事件循环中执行；未命中时异步重新加载站点表。
+        """
         try:
             if not keyword:
                 return []
 
-            # 使用缓存的站点数据进行搜索
-            matches = []
-            for name, code in self.name_to_code_map.items():
-                if keyword.upper() in name.upper():  # 不区分大小写
-                    matches.append({
-                        "name": name,
-                        "code": code
-                    })
-                    if len(matches) >= 10:  # 限制返回数量
-                        break
-
-            # 如果没有找到匹配项，尝试重新加载站点数据
-            if not matches:
-                self._init_station_map()
-                for name, code in self.name_to_code_map.items():
-                    if keyword.upper() in name.upper():
-                        matches.append({
-                            "name": name,
-                            "code": code
-                        })
-                        if len(matches) >= 10:
-                            break
-
-            return matches
+            matches = self.station_index.search(keyword, limit=10)
+
+            # 如果没有找到匹配项，尝试重新加载站点数据（限流）
+            if not matches and await self._reload_stations_on_miss():
+                matches = self.station_index.search(keyword, limit=10)
+
+            return [{"name": station.name, "code": station.code} for station in matches]
 
         except Exception as e:
             logger.error(f"Failed to search stations: {str(e)}")
-            return [] 
-
-    def __del__(self):
-        """析构函数，确保资源被正确释放"""
-        if self.conn:
-            self.conn.close()
-        if hasattr(self, 'session'):
-            self.session.close()
-        
-        # 如果异步会话还存在，创建一个新的事件循环来关闭它
-        if hasattr(self, 'async_session') and self.async_session and not self.async_session.closed:
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(self.async_session.close())
-                loop.close()
-            except Exception:
-                pass 
\ No newline at end of file
+            return []
+
+    async def search_stations_payload(self, keyword: str) -> EncodedPayload:
+        """搜索站点并返回已编码的响应，按 (站点表文件, 关键字) 缓存，站点表更新后自然失效"""
+        file_id = self.station_table.file_id if self.station_table else None
+        payload = self._station_payloads.get((file_id, keyword))
+        if payload is not None:
+            return payload
+        stations = await self.search_stations(keyword)
+        payload = EncodedPayload(dumps(stations))
+        # 未命中的关键字会触发重新加载站点表，不缓存
+        if stations:
+            file_id = self.station_table.file_id if self.station_table else None
+            self._station_payloads.set((file_id, keyword), payload)
+        return payload
+
+    def collect_metrics(self) -> Iterable[MetricFamily]:
+        """导出缓存、连接池、熔断与订阅状态，供 /metrics 采集时调用"""
+        caches = {"tickets": self.ticket_cache, "stops": self.stop_fetcher.cache,
+                  "prices": self.price_fetcher.cache}
+        for field, metric_type in (("hits", "counter"), ("misses", "counter"),
+                                   ("coalesced", "counter"), ("stale_hits", "counter"),
+                                   ("size", "gauge"), ("hit_ratio", "gauge")):
+            suffix = "_total" if metric_type == "counter" else ""
+            yield (f"cache_{field}{suffix}", metric_type, f"Cache {field.replace('_', ' ')}",
+                   [({"cache": name}, cache.stats()[field]) for name, cache in caches.items()])
+
+        pool = self.client.pool_stats()
+        yield ("upstream_pool_connections", "gauge", "Upstream connection pool usage",
+               [({"state": "in_use"}, pool["in_use"]), ({"state": "idle"}, pool["idle"])])
+        yield ("upstream_pool_limit", "gauge", "Upstream connection pool size", [({}, pool["limit"])])
+
+        guard_state = self.upstream_guard.state()
+        yield ("upstream_circuit_open", "gauge", "Whether the circuit breaker is open",
+               [({"endpoint": name}, int(state["open"])) for name, state in guard_state.items()])
+        yield ("upstream_consecutive_failures", "gauge", "Consecutive upstream failures",
+               [({"endpoint": name}, state["failures"]) for name, state in guard_state.items()])
+
+        prefetch = self.prefetcher.stats()
+        yield ("prefetch_refreshes_total", "counter", "Prefetch refreshes by outcome",
+               [({"outcome": name}, prefetch[name]) for name in ("refreshed", "skipped", "errors")])
+        yield ("prefetch_hot_routes", "gauge", "Routes above the prefetch popularity threshold",
+               [({}, prefetch["hot"])])
+
+        if self.seat_history is not None:
+            history = self.seat_history.stats()
+            yield ("seat_history_rows_total", "counter", "Seat snapshots appended to the history store",
+                   [({}, history["rows"])])
+            yield ("seat_history_bytes_total", "counter", "Bytes appended to the history store",
+                   [({}, history["bytes"])])
+            yield ("seat_history_dropped_total", "counter", "Seat snapshots dropped because the write queue was full",
+                   [({}, history["dropped"])])
+
+        watch = self.seat_watcher.stats()
+        yield ("seat_watch_subscribers", "gauge", "Active seat watch subscribers", [({}, watch["subscribers"])])
+        yield ("seat_watch_pollers", "gauge", "Active seat watch pollers", [({}, watch["watches"])])
+        if self.shared_cache is not None:
+            shared = self.shared_cache.stats()
+            yield ("shared_cache_lookups_total", "counter", "Shared cache lookups by result",
+                   [({"result": name}, value) for name, value in shared.items()])
+        yield ("stations_loaded", "gauge", "Number of stations in the station index", [({}, len(self.station_map))])
+
+    async def close(self):
+        """停止后台任务并释放异步客户端（在应用关闭时调用）"""
+        for task in (self._start_task, self._station_refresh_task):
+            if task is not None:
+                task.cancel()
+        if self._station_reload_task is not None:
+            self._station_reload_task.cancel()
+        self._start_task = None
+        self._station_refresh_task = None
+        self._station_reload_task = None
+        self.seat_watcher.close()
+        self.prefetcher.stop()
+        await self.train_store.close()
+        if self.seat_history is not None:
+            await self.seat_history.close()
+        await self.client.close()
+        for _, table in self._retired_tables:
+            table.stations.close()
+        self._retired_tables = []
+        self.upstream_guard.close()
+        if self.shared_cache is not None:
+            self.shared_cache.close()
@@ -0,0 +1,149 @@
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TrainRef(NamedTuple):
+    train_no: str
+    from_code: str
+    to_code: str
+    train_date: str
+
+
+class TrainStore:
+    """车次编号索引：(train_code, train_date) -> train_no 及出发/到达站代码
+
+    所有查询结果都会写入，互不覆盖。读取先查内存字典（O(1)），未命中再查
+    SQLite（WAL 模式，读不阻塞写）；写入先进入内存与待写队列，由后台任务
+    批量落盘。
+    """
+
+    def __init__(self, path: str, flush_interval: float = 1.0, batch_size: int = 500):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._memory: Dict[Tuple[str, str], TrainRef] = {}
+        self._latest: Dict[str, str] = {}  # train_code -> 最近日期
+        self._pending: Dict[Tuple[str, str], TrainRef] = {}
+        self._local = threading.local()
+        self._flush_task = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 连接不能跨线程共享，每个线程一个连接
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._init_db(conn)
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _init_db(conn: sqlite3.Connection):
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS trains (
+                train_code TEXT NOT NULL,
+                train_date TEXT NOT NULL,
+                train_no TEXT NOT NULL,
+                from_code TEXT NOT NULL,
+                to_code TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (train_code, train_date)
+            ) WITHOUT ROWID
+        ''')
+        conn.commit()
+
+    def record(self, train_date: str, trains: Iterable[Tuple[str, str, str, str]]):
+        """记录一次查询结果中的车次 (train_code, train_no, from_code, to_code)"""
+        for train_code, train_no, from_code, to_code in trains:
+            if not (train_code and train_no and from_code and to_code):
+                continue
+            key = (train_code, train_date)
+            ref = TrainRef(train_no, from_code, to_code, train_date)
+            if self._memory.get(key) == ref:
+                continue
+            self._memory[key] = ref
+            self._pending[key] = ref
+            if train_date >= self._latest.get(train_code, ''):
+                self._latest[train_code] = train_date
+
+    async def lookup(self, train_code: str, train_date: Optional[str] = None) -> Optional[TrainRef]:
+        """查找车次，未指定日期时返回最近一次记录"""
+        if train_date is None:
+            train_date = self._latest.get(train_code)
+        if train_date is not None:
+            ref = self._memory.get((train_code, train_date))
+            if ref is not None:
+                return ref
+        loop = asyncio.get_running_loop()
+        ref = await loop.run_in_executor(None, self._lookup_db, train_code, train_date)
+        if ref is not None:
+            self._memory[(train_code, ref.train_date)] = ref
+        return ref
+
+    def _lookup_db(self, train_code: str, train_date: Optional[str]) -> Optional[TrainRef]:
+        conn = self._connect()
+        if train_date is None:
+            row = conn.execute(
+                'SELECT train_no, from_code, to_code, train_date FROM trains '
+                'WHERE train_code = ? ORDER BY train_date DESC LIMIT 1',
+                (train_code,)
+            ).fetchone()
+        else:
+            row = conn.execute(
+                'SELECT train_no, from_code, to_code, train_date FROM trains '
+                'WHERE train_code = ? AND train_date = ?',
+                (train_code, train_date)
+            ).fetchone()
+        return TrainRef(*row) if row else None
+
+    def _write(self, rows):
+        conn = self._connect()
+        now = time.time()
+        conn.executemany(
+            'INSERT OR REPLACE INTO trains VALUES (?, ?, ?, ?, ?, ?)',
+            [(code, date, ref.train_no, ref.from_code, ref.to_code, now)
+             for (code, date), ref in rows]
+        )
+        conn.commit()
+
+    async def flush(self):
+        """把待写入的记录批量写入 SQLite（在线程池中执行）"""
+        if not self._pending:
+            return
+        rows = list(self._pending.items())
+        self._pending = {}
+        loop = asyncio.get_running_loop()
+        for i in range(0, len(rows), self.batch_size):
+            batch = rows[i:i + self.batch_size]
+            try:
+                await loop.run_in_executor(None, self._write, batch)
+            except Exception:
+                # 写入失败的记录放回队列，下次重试（不覆盖期间写入的新记录）
+                for key, ref in rows[i:]:
+                    self._pending.setdefault(key, ref)
+                raise
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush train store: {str(e)}")
+
+    def start(self):
+        if self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self._flush_loop())
+
+    async def close(self):
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
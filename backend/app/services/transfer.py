@@ -0,0 +1,144 @@
+import asyncio
+import bisect
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from .parser import TrainRecord, TrainResultSet
+from .route_index import TrainRouteIndex
+
+logger = logging.getLogger(__name__)
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def format_minutes(total: int) -> str:
+    return f"{total // 60:02d}:{total % 60:02d}"
+
+
+class _Leg:
+    """参与换乘拼接的车次，时间换算为当日分钟数"""
+
+    __slots__ = ('record', 'departure', 'arrival')
+
+    def __init__(self, record: TrainRecord, departure: int, arrival: int):
+        self.record = record
+        self.departure = departure
+        self.arrival = arrival  # 出发当日零点起算，跨日时大于 1440
+
+
+def _legs(records: List[TrainRecord]) -> List[_Leg]:
+    legs = []
+    for record in records:
+        departure = record.departure_minutes
+        duration = record.duration_minutes
+        if departure is None or duration is None:
+            continue
+        legs.append(_Leg(record, departure, departure + duration))
+    legs.sort(key=lambda leg: leg.departure)
+    return legs
+
+
+class TransferPlanner:
+    """一次换乘的路线规划
+
+    候选换乘站优先取自途经站点索引（已缓存的经停站数据），不足时以配置的枢纽站补足，
+    每次规划最多查询 max_hubs 个换乘站。两段行程都通过车票结果缓存查询，同一规划
+    内去重，并发受信号量限制；不同规划请求之间共享缓存与进行中的上游请求。
+    """
+
+    def __init__(self, get_result_set: Callable[[str, str, str], Awaitable[TrainResultSet]],
+                 route_index: TrainRouteIndex, max_hubs: int = 6, concurrency: int = 4):
+        self.get_result_set = get_result_set
+        self.route_index = route_index
+        self.max_hubs = max_hubs
+        self.concurrency = concurrency
+
+    def candidate_hubs(self, from_code: str, to_code: str, fallback_hubs: Sequence[str]) -> List[str]:
+        hubs = self.route_index.hub_candidates(from_code, to_code, self.max_hubs)
+        for code in fallback_hubs:
+            if len(hubs) >= self.max_hubs:
+                break
+            if code not in hubs and code not in (from_code, to_code):
+                hubs.append(code)
+        return hubs
+
+    async def _fetch_legs(self, pairs: Set[Tuple[str, str]], train_date: str
+                          ) -> Dict[Tuple[str, str], List[TrainRecord]]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(from_code: str, to_code: str) -> List[TrainRecord]:
+            async with semaphore:
+                return (await self.get_result_set(from_code, to_code, train_date)).records
+
+        pairs = sorted(pairs)
+        results = await asyncio.gather(*(fetch(*pair) for pair in pairs), return_exceptions=True)
+        legs = {}
+        for pair, records in zip(pairs, results):
+            if isinstance(records, Exception):
+                logger.error(f"查询换乘区间失败 {pair}: {str(records)}")
+                continue
+            legs[pair] = records
+        return legs
+
+    async def plan(self, from_code: str, to_code: str, train_date: str,
+                   fallback_hubs: Sequence[str] = (),
+                   min_connection: int = 30, max_connection: int = 240,
+                   accept: Optional[Callable[[TrainRecord], bool]] = None,
+                   accept_first: Optional[Callable[[TrainRecord], bool]] = None,
+                   limit: int = 20) -> List[Dict]:
+        """规划 from_code -> 换乘站 -> to_code 的行程，按总耗时升序返回
+
+        两段在同一车站换乘，换乘时间在 [min_connection, max_connection] 分钟之间；
+        第二段只在出发当日查询，第一段跨日到达的车次不参与拼接。accept 作用于两段，
+        accept_first 只作用于第一段。
+        """
+        hubs = self.candidate_hubs(from_code, to_code, fallback_hubs)
+        if not hubs:
+            return []
+        pairs = {(from_code, hub) for hub in hubs} | {(hub, to_code) for hub in hubs}
+        fetched = await self._fetch_legs(pairs, train_date)
+
+        # 第二段按实际出发站分组（查询某城市时 12306 会返回同城各车站的车次）
+        second_legs: Dict[str, List[_Leg]] = {}
+        for hub in hubs:
+            for leg in _legs(fetched.get((hub, to_code), [])):
+                if accept is None or accept(leg.record):
+                    second_legs.setdefault(leg.record.from_code, []).append(leg)
+        for legs in second_legs.values():
+            legs.sort(key=lambda leg: leg.departure)
+        departures = {code: [leg.departure for leg in legs] for code, legs in second_legs.items()}
+
+        plans = []
+        seen = set()
+        for hub in hubs:
+            for first in _legs(fetched.get((from_code, hub), [])):
+                if accept is not None and not accept(first.record):
+                    continue
+                if accept_first is not None and not accept_first(first.record):
+                    continue
+                if first.arrival >= MINUTES_PER_DAY:
+                    continue
+                transfer_code = first.record.to_code
+                candidates = second_legs.get(transfer_code)
+                if not candidates:
+                    continue
+                start = bisect.bisect_left(departures[transfer_code], first.arrival + min_connection)
+                for second in candidates[start:]:
+                    wait = second.departure - first.arrival
+                    if wait > max_connection:
+                        break
+                    key = (first.record.train_no, second.record.train_no)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    plans.append((second.arrival - first.departure, wait, first, second))
+
+        plans.sort(key=lambda plan: (plan[0], plan[1]))
+        return [{
+            "transfer_station": first.record.to_station,
+            "departure_time": first.record.departure_time,
+            "arrival_time": format_minutes(second.arrival % MINUTES_PER_DAY),
+            "total_duration": format_minutes(total),
+            "wait_time": format_minutes(wait),
+            "legs": [first.record.to_dict(), second.record.to_dict()],
+        } for total, wait, first, second in plans[:limit]]
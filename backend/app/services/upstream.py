@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import aiohttp
+
+from ..core.metrics import UPSTREAM_REQUEST_SECONDS, add_request_timing, timed
+from .ratelimit import UpstreamGuard, UpstreamUnavailableError, endpoint_name
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Referer': 'https://kyfw.12306.cn/otn/leftTicket/init',
+    'Accept': '*/*',
+    'X-Requested-With': 'XMLHttpRequest'
+}
+
+
+INIT_PATH = '/otn/leftTicket/init'
+
+
+class SessionExpiredError(Exception):
+    """12306 返回了非 JSON 内容（通常是会话 Cookie 失效后的跳转页面）"""
+
+
+class UpstreamClient:
+    """长连接的 12306 异步客户端
+
+    会话、Cookie 与连接池在整个应用生命周期内复用：Cookie 只在首次请求前
+    预热一次，之后仅在上游提示会话失效时刷新。每次请求先经过 guard 的限流与熔断检查，
+    熔断或限流时抛出 UpstreamUnavailableError 而不发出请求。
+    """
+
+    def __init__(self, base_url: str, pool_size: int = 10, timeout: float = 30,
+                 guard: Optional[UpstreamGuard] = None):
+        self.base_url = base_url.rstrip('/')
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.guard = guard
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._cookie_generation = 0  # 每成功刷新一次 Cookie 加一
+        self._warmed = False
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+    def _get_lock(self) -> asyncio.Lock:
+        # 延迟创建，保证锁绑定到实际运行的事件循环
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """获取或创建共享会话（必须在事件循环内调用）"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,  # 限制并发连接数
+                ttl_dns_cache=300,  # DNS 缓存时间
+                enable_cleanup_closed=True  # 自动清理关闭的连接
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=DEFAULT_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._warmed = False
+        return self._session
+
+    @asynccontextmanager
+    async def _guarded(self, path: str):
+        """限流与熔断检查，并把请求结果计入熔断器（HTTP 错误、超时、会话失效均算失败）与耗时指标
+
+        块内抛出的异常都计为失败，因此封禁（403/429）与非 JSON 的跳转页面须在块内抛出。
+        """
+        endpoint = endpoint_name(path)
+        if self.guard is not None:
+            try:
+                with timed('rate_limit'):
+                    await self.guard.acquire(endpoint)
+            except UpstreamUnavailableError:
+                UPSTREAM_REQUEST_SECONDS.observe(0.0, endpoint=endpoint, outcome='rejected')
+                raise
+        start = time.perf_counter()
+        outcome = 'error'
+        try:
+            yield
+        except asyncio.CancelledError:
+            outcome = 'cancelled'
+            raise
+        except Exception:
+            if self.guard is not None:
+                self.guard.record_failure(endpoint)
+            raise
+        else:
+            outcome = 'success'
+            if self.guard is not None:
+                self.guard.record_success(endpoint)
+        finally:
+            elapsed = time.perf_counter() - start
+            UPSTREAM_REQUEST_SECONDS.observe(elapsed, endpoint=endpoint, outcome=outcome)
+            add_request_timing(f'upstream_{endpoint}', elapsed)
+
+    @property
+    def is_warm(self) -> bool:
+        return self._warmed and self._session is not None and not self._session.closed
+
+    async def warm_up(self):
+        """首次使用前访问 leftTicket/init 获取 Cookie"""
+        if self.is_warm:
+            return
+        await self.refresh_cookies(self._cookie_generation)
+
+    async def refresh_cookies(self, seen_generation: int):
+        """刷新 Cookie；多个请求同时发现会话失效时只刷新一次"""
+        async with self._get_lock():
+            if seen_generation != self._cookie_generation and self._warmed:
+                return  # 其他请求已经刷新过
+            session = self._get_session()
+            with timed('session'):
+                async with self._guarded(INIT_PATH), \
+                        session.get(self.url(INIT_PATH), timeout=aiohttp.ClientTimeout(total=10)) as response:
+                    await response.read()
+            self._cookie_generation += 1
+            self._warmed = True
+            logger.info("Upstream session cookies refreshed")
+
+    async def get_json(self, path: str, params: Optional[Dict[str, str]] = None,
+                       timeout: float = 10) -> Any:
+        """GET 一个 JSON 接口，会话失效时刷新 Cookie 后重试一次（每次非 JSON 响应都计入熔断失败）"""
+        await self.warm_up()
+        for attempt in range(2):
+            generation = self._cookie_generation
+            session = self._get_session()
+            try:
+                async with self._guarded(path):
+                    async with session.get(self.url(path), params=params,
+                                           timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                        response.raise_for_status()
+                        content_type = response.headers.get('Content-Type', '')
+                        if 'application/json' in content_type.lower():
+                            return await response.json()
+                        await response.read()
+                        raise SessionExpiredError(f"Unexpected content type: {content_type}")
+            except SessionExpiredError as e:
+                if attempt == 1:
+                    raise
+                logger.warning(f"{str(e)}, refreshing session")
+            await self.refresh_cookies(generation)
+
+    async def get_text(self, path: str, headers: Optional[Dict[str, str]] = None,
+                       timeout: float = 10) -> Tuple[int, str, Mapping[str, str]]:
+        """GET 静态资源，返回 (状态码, 文本, 响应头)，用于条件请求
+
+        响应头保持 aiohttp 的大小写不敏感映射，ETag/Last-Modified 无论上游如何书写都能取到。
+        """
+        session = self._get_session()
+        async with self._guarded(path), \
+                session.get(self.url(path), headers=headers,
+                            timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            if response.status >= 500 or response.status in (403, 429):
+                response.raise_for_status()  # 服务端错误与封禁计入熔断失败
+            return response.status, await response.text(), response.headers
+
+    def pool_stats(self) -> Dict[str, int]:
+        """连接池使用情况（读取 aiohttp 连接器的内部状态，版本不兼容时返回 0）"""
+        if self._session is None or self._session.closed:
+            return {"limit": self.pool_size, "in_use": 0, "idle": 0}
+        connector = self._session.connector
+        idle = sum(len(conns) for conns in getattr(connector, '_conns', {}).values())
+        return {
+            "limit": self.pool_size,
+            "in_use": len(getattr(connector, '_acquired', ())),
+            "idle": idle,
+        }
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._warmed = False
@@ -0,0 +1,160 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from .parser import TrainRecord, TrainResultSet
+
+logger = logging.getLogger(__name__)
+
+# (出发站代码, 到达站代码, 日期, 席别)
+WatchKey = Tuple[str, str, str, Tuple[str, ...]]
+# train_code -> {席别: 余票}
+SeatSnapshot = Dict[str, Dict[str, str]]
+
+
+def seat_snapshot(records: List[TrainRecord], seat_classes: Tuple[str, ...]) -> SeatSnapshot:
+    """提取各车次指定席别的余票，未指定席别时保留全部"""
+    if not seat_classes:
+        return {record.train_code: dict(record.seats) for record in records}
+    return {record.train_code: {seat: record.seats.get(seat, "--") for seat in seat_classes}
+            for record in records}
+
+
+def diff_snapshots(old: SeatSnapshot, new: SeatSnapshot) -> Optional[Dict]:
+    """比较两次余票快照，无变化时返回 None"""
+    changed = {}
+    added = {}
+    for train_code, seats in new.items():
+        previous = old.get(train_code)
+        if previous is None:
+            added[train_code] = seats
+            continue
+        delta = {seat: count for seat, count in seats.items() if previous.get(seat) != count}
+        if delta:
+            changed[train_code] = delta
+    removed = [train_code for train_code in old if train_code not in new]
+    if not (changed or added or removed):
+        return None
+    return {"changed": changed, "added": added, "removed": removed}
+
+
+class Subscription:
+    """一个客户端的订阅，事件为 (事件名, 数据)"""
+
+    def __init__(self, watch: "SeatWatch", maxsize: int):
+        self.watch = watch
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+
+    def push(self, event: str, data: Dict):
+        if self.queue.full():
+            # 客户端消费太慢，丢弃积压的差量，改为推送一次完整快照
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            event, data = "snapshot", {"trains": self.watch.snapshot}
+        self.queue.put_nowait((event, data))
+
+    async def get(self) -> Tuple[str, Dict]:
+        return await self.queue.get()
+
+
+class SeatWatch:
+    """同一 (出发站, 到达站, 日期, 席别) 的所有订阅共享的后台轮询
+
+    余票无变化时逐步拉长轮询间隔（最长 max_interval），有变化时恢复到 min_interval；
+    只向订阅者推送变化的余票。
+    """
+
+    def __init__(self, key: WatchKey, fetch: Callable[[str, str, str], Awaitable[TrainResultSet]],
+                 min_interval: float, max_interval: float):
+        self.key = key
+        self.fetch = fetch
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.snapshot: Optional[SeatSnapshot] = None
+        self.subscribers: Set[Subscription] = set()
+        self.polls = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._poll_loop())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _broadcast(self, event: str, data: Dict):
+        for subscription in self.subscribers:
+            subscription.push(event, data)
+
+    async def _poll_loop(self):
+        from_station, to_station, train_date, seat_classes = self.key
+        while True:
+            try:
+                result_set = await self.fetch(from_station, to_station, train_date)
+                self.polls += 1
+                snapshot = seat_snapshot(result_set.records, seat_classes)
+                if self.snapshot is None:
+                    self.snapshot = snapshot
+                    self._broadcast("snapshot", {"trains": snapshot})
+                else:
+                    diff = diff_snapshots(self.snapshot, snapshot)
+                    self.snapshot = snapshot
+                    if diff is not None:
+                        self._broadcast("diff", diff)
+                        self.interval = self.min_interval
+                    else:
+                        self.interval = min(self.interval * 1.5, self.max_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"余票轮询失败 {self.key}: {str(e)}")
+                self.interval = min(self.interval * 2, self.max_interval)
+            await asyncio.sleep(self.interval)
+
+
+class SeatWatchManager:
+    """管理余票订阅：相同条件的订阅共用一个 SeatWatch，最后一个订阅取消时停止轮询"""
+
+    def __init__(self, fetch: Callable[[str, str, str], Awaitable[TrainResultSet]],
+                 min_interval: float, max_interval: float, queue_size: int = 32):
+        self.fetch = fetch
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.queue_size = queue_size
+        self._watches: Dict[WatchKey, SeatWatch] = {}
+
+    def subscribe(self, from_station: str, to_station: str, train_date: str,
+                  seat_classes: Optional[List[str]] = None) -> Subscription:
+        key = (from_station, to_station, train_date, tuple(sorted(set(seat_classes or ()))))
+        watch = self._watches.get(key)
+        if watch is None:
+            watch = SeatWatch(key, self.fetch, self.min_interval, self.max_interval)
+            self._watches[key] = watch
+            watch.start()
+        subscription = Subscription(watch, self.queue_size)
+        watch.subscribers.add(subscription)
+        if watch.snapshot is not None:
+            subscription.push("snapshot", {"trains": watch.snapshot})
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        watch = subscription.watch
+        watch.subscribers.discard(subscription)
+        if not watch.subscribers:
+            watch.stop()
+            self._watches.pop(watch.key, None)
+
+    def stats(self) -> Dict:
+        return {
+            "watches": len(self._watches),
+            "subscribers": sum(len(watch.subscribers) for watch in self._watches.values()),
+            "polls": sum(watch.polls for watch in self._watches.values()),
+        }
+
+    def close(self):
+        for watch in self._watches.values():
+            watch.stop()
+        self._watches.clear()
@@ -0,0 +1,106 @@
+"""批量查询基准：N 个并发的 /api/tickets/query 与一次 /api/tickets/batch 的耗时与上游请求数
+
+运行：cd backend && python -m benchmarks.bench_batch --sizes 10,50 --rounds 20
+
+每个批次由 --keys 个不同的 (路线, 日期) 与若干过滤条件组合而成。cold 每轮使用新的日期
+（结果缓存未命中，需访问上游），warm 重复同一批查询（全部命中缓存，只剩请求本身的开销）。
+上游限流在基准中关闭。
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import time
+from typing import Dict, List
+
+import aiohttp
+
+from benchmarks.bench_workers import HOT_STATIONS
+from benchmarks.load_test import LocalStack, percentile
+
+FILTERS = [{}, {'train_types': ['G']}, {'start_time': '08:00', 'end_time': '12:00'}, {'train_types': ['D', 'K']}]
+
+
+def make_batch(size: int, keys: int, day: int) -> List[Dict]:
+    routes = [(a, b) for a in HOT_STATIONS for b in HOT_STATIONS if a != b][:keys]
+    train_date = (datetime.date.today() + datetime.timedelta(days=day)).isoformat()
+    return [dict(FILTERS[i % len(FILTERS)], from_station=routes[i % keys][0],
+                 to_station=routes[i % keys][1], train_date=train_date)
+            for i in range(size)]
+
+
+async def run_single(session: aiohttp.ClientSession, base: str, batch: List[Dict]) -> float:
+    start = time.perf_counter()
+
+    async def one(query):
+        async with session.post(f'{base}/tickets/query', json=query) as response:
+            await response.read()
+            response.raise_for_status()
+
+    await asyncio.gather(*(one(query) for query in batch))
+    return time.perf_counter() - start
+
+
+async def run_batch(session: aiohttp.ClientSession, base: str, batch: List[Dict]) -> float:
+    start = time.perf_counter()
+    async with session.post(f'{base}/tickets/batch', json=batch) as response:
+        items = json.loads(await response.read())
+        response.raise_for_status()
+    assert all(item['status'] == 200 for item in items), items
+    return time.perf_counter() - start
+
+
+async def bench(stack: LocalStack, sizes: List[int], keys: int, rounds: int, identity: bool = False):
+    base = f'{stack.api_url}/api'
+    day = 1
+    print(f"{'mode':<8}{'cache':<7}{'queries':>8}{'p50 ms':>9}{'p95 ms':>9}{'upstream/round':>16}")
+    headers = {'Accept-Encoding': 'identity'} if identity else {}
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0), headers=headers) as session:
+        for size in sizes:
+            for mode, run in (('single', run_single), ('batch', run_batch)):
+                for cache in ('cold', 'warm'):
+                    before = stack.upstream_stats().get('queryZ', 0)
+                    latencies = []
+                    warm_batch = make_batch(size, keys, 0)
+                    if cache == 'warm':
+                        await run(session, base, warm_batch)
+                        before = stack.upstream_stats().get('queryZ', 0)
+                    for _ in range(rounds):
+                        if cache == 'cold':
+                            # 日期最多 28 天之后循环；两次使用同一日期的间隔超过结果缓存有效期
+                            day = day % 28 + 1
+                            batch = make_batch(size, keys, day)
+                        else:
+                            batch = warm_batch
+                        latencies.append(await run(session, base, batch))
+                    upstream = stack.upstream_stats().get('queryZ', 0) - before
+                    print(f"{mode:<8}{cache:<7}{size:>8}{percentile(latencies, 50) * 1000:>9.1f}"
+                          f"{percentile(latencies, 95) * 1000:>9.1f}{upstream / rounds:>16.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='10,50', help='逗号分隔的批次大小')
+    parser.add_argument('--keys', type=int, default=5, help='每批中不同的 (路线, 日期) 数')
+    parser.add_argument('--rounds', type=int, default=20)
+    parser.add_argument('--identity', action='store_true', help='不请求压缩（Accept-Encoding: identity）')
+    parser.add_argument('--latency', type=float, default=50, help='替身延迟（毫秒）')
+    args = parser.parse_args()
+
+    env = {
+        'UPSTREAM_RATE_LIMITS': json.dumps({'default': 0}),
+        'TICKET_CACHE_TTL': '1',
+        'PREFETCH_ENABLED': 'false',
+        'LOG_LEVEL': 'WARNING',
+    }
+    stack = LocalStack(args.latency, 0.0, 0.0, 1, env=env)
+    stack.start()
+    try:
+        asyncio.run(bench(stack, [int(size) for size in args.sizes.split(',')], args.keys, args.rounds,
+                          args.identity))
+    finally:
+        stack.stop()
+
+
+if __name__ == '__main__':
+    main()
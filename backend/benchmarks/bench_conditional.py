@@ -0,0 +1,72 @@
+"""条件请求基准：带与不带 If-None-Match 时车票、站点与经停站接口的响应大小与延迟
+
+运行：cd backend && python -m benchmarks.bench_conditional --rounds 200
+
+每个接口先请求一次取得 ETag（结果进入缓存），之后分别以普通请求（200，完整响应体）与
+带 If-None-Match 的条件请求（304，无响应体）各请求 --rounds 次。车票查询使用 GET 形式
+（规范 URL），结果缓存有效期设为足够长，保证测量期间 ETag 不变。
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import time
+from typing import Dict
+
+import aiohttp
+
+from benchmarks.load_test import LocalStack, percentile
+
+
+async def bench(stack: LocalStack, rounds: int, identity: bool):
+    train_date = (datetime.date.today() + datetime.timedelta(days=1)).isoformat()
+    endpoints = [
+        ('tickets', '/api/tickets/query', {'from_station': '北京', 'to_station': '上海', 'train_date': train_date}),
+        ('tickets+stops', '/api/tickets/query', {'from_station': '北京', 'to_station': '上海',
+                                                 'train_date': train_date, 'include_stops': 'true'}),
+        ('stations', '/api/stations/北京', {}),
+        ('stops', '/api/trains/G806/stops', {'train_date': train_date}),
+    ]
+    headers: Dict[str, str] = {'Accept-Encoding': 'identity'} if identity else {}
+    print(f"{'endpoint':<16}{'request':<14}{'status':>7}{'bytes':>9}{'p50 ms':>9}{'p95 ms':>9}")
+    async with aiohttp.ClientSession(headers=headers) as session:
+        for label, path, params in endpoints:
+            async with session.get(f'{stack.api_url}{path}', params=params) as response:
+                await response.read()
+                response.raise_for_status()
+                etag = response.headers['ETag']
+            for mode, extra in (('full', {}), ('conditional', {'If-None-Match': etag})):
+                latencies, size, status = [], 0, 0
+                for _ in range(rounds):
+                    start = time.perf_counter()
+                    async with session.get(f'{stack.api_url}{path}', params=params, headers=extra) as response:
+                        raw = await response.read()
+                        status = response.status
+                        size = int(response.headers.get('Content-Length', len(raw)))
+                    latencies.append(time.perf_counter() - start)
+                print(f"{label:<16}{mode:<14}{status:>7}{size:>9}"
+                      f"{percentile(latencies, 50) * 1000:>9.2f}{percentile(latencies, 95) * 1000:>9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, default=200)
+    parser.add_argument('--identity', action='store_true', help='不请求压缩（Accept-Encoding: identity）')
+    args = parser.parse_args()
+
+    env = {
+        'UPSTREAM_RATE_LIMITS': json.dumps({'default': 0}),
+        'TICKET_CACHE_TTL': '600',
+        'PREFETCH_ENABLED': 'false',
+        'LOG_LEVEL': 'WARNING',
+    }
+    stack = LocalStack(0.0, 0.0, 0.0, 1, env=env)
+    stack.start()
+    try:
+        asyncio.run(bench(stack, args.rounds, args.identity))
+    finally:
+        stack.stop()
+
+
+if __name__ == '__main__':
+    main()
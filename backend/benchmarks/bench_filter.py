@@ -0,0 +1,101 @@
+"""服务端过滤、排序、投影与分页基准：响应大小、请求延迟与客户端处理耗时
+
+运行：cd backend && python -m benchmarks.bench_filter --rounds 200
+
+同一个 (路线, 日期) 预先查询一次使结果命中缓存，之后按以下方式各查询 --rounds 次：
+full 取回完整列表后由客户端解析、过滤（二等座有票、历时不超过 --max-duration 分钟、
+到达时刻在 12:00-20:00）并按历时排序取前 --limit 个；其余各行把同样的条件交给服务端，
+依次加上字段投影与分页。client ms 为客户端解析响应并完成剩余处理的耗时。
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import time
+from typing import Dict, List
+
+import aiohttp
+
+from benchmarks.load_test import LocalStack, percentile
+
+FILTERS = {'seat_classes': ['二等座'], 'arrival_start': '12:00', 'arrival_end': '20:00'}
+
+
+def minutes(value: str) -> int:
+    hours, mins = value.split(':')
+    return int(hours) * 60 + int(mins)
+
+
+def client_side(trains: List[Dict], max_duration: int, limit: int) -> List[Dict]:
+    """客户端的等价处理（full 模式）"""
+    kept = [train for train in trains
+            if train['seats'].get('二等座') not in ('无', '--', '*', '')
+            and minutes(train['duration']) <= max_duration
+            and '12:00' <= train['to_station']['arrival_time'] <= '20:00']
+    kept.sort(key=lambda train: minutes(train['duration']))
+    return kept[:limit]
+
+
+async def bench(stack: LocalStack, rounds: int, max_duration: int, limit: int, identity: bool):
+    url = f'{stack.api_url}/api/tickets/query'
+    train_date = (datetime.date.today() + datetime.timedelta(days=1)).isoformat()
+    query = {'from_station': '北京', 'to_station': '上海', 'train_date': train_date}
+    server = dict(query, **FILTERS, max_duration=max_duration, sort_by='duration')
+    cases = [
+        ('full', query, True),
+        ('filter+sort', server, False),
+        ('+fields', dict(server, fields=['train_code', 'from_station', 'to_station', 'duration', 'seats']), False),
+        ('+limit', dict(server, fields=['train_code', 'from_station', 'to_station', 'duration', 'seats'],
+                        limit=limit), False),
+    ]
+    headers = {'Accept-Encoding': 'identity'} if identity else {}
+    print(f"{'mode':<14}{'trains':>8}{'bytes':>10}{'p50 ms':>9}{'p95 ms':>9}{'client ms':>11}")
+    async with aiohttp.ClientSession(headers=headers) as session:
+        async with session.post(url, json=query) as response:
+            response.raise_for_status()
+            await response.read()
+        for label, body, filter_locally in cases:
+            latencies, client, size, count = [], [], 0, 0
+            for _ in range(rounds):
+                start = time.perf_counter()
+                async with session.post(url, json=body) as response:
+                    raw = await response.read()
+                    response.raise_for_status()
+                    size = int(response.headers.get('Content-Length', len(raw)))
+                received = time.perf_counter()
+                trains = json.loads(raw)
+                if filter_locally:
+                    trains = client_side(trains, max_duration, limit)
+                else:
+                    trains = trains[:limit]
+                done = time.perf_counter()
+                latencies.append(received - start)
+                client.append(done - received)
+                count = len(trains)
+            print(f"{label:<14}{count:>8}{size:>10}{percentile(latencies, 50) * 1000:>9.2f}"
+                  f"{percentile(latencies, 95) * 1000:>9.2f}{percentile(client, 50) * 1000:>11.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, default=200)
+    parser.add_argument('--max-duration', type=int, default=360, help='最长历时（分钟）')
+    parser.add_argument('--limit', type=int, default=10, help='取前几个车次')
+    parser.add_argument('--identity', action='store_true', help='不请求压缩（Accept-Encoding: identity）')
+    args = parser.parse_args()
+
+    env = {
+        'UPSTREAM_RATE_LIMITS': json.dumps({'default': 0}),
+        'PREFETCH_ENABLED': 'false',
+        'LOG_LEVEL': 'WARNING',
+    }
+    stack = LocalStack(0.0, 0.0, 0.0, 1, env=env)
+    stack.start()
+    try:
+        asyncio.run(bench(stack, args.rounds, args.max_duration, args.limit, args.identity))
+    finally:
+        stack.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""车次解析吞吐基准：逐行构建 pydantic 模型的旧实现 vs 批量解析为 TrainRecord
+
+运行：cd backend && python -m benchmarks.bench_parser [fixture.json ...]
+默认使用 benchmarks/fixtures/ 下的 queryZ 响应。
+"""
+import glob
+import io
+import json
+import logging
+import os
+import sys
+import time
+
+from app.schemas.train import TrainInfo, TrainStop
+from app.services.parser import get_train_type, parse_results
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+legacy_logger = logging.getLogger('bench.legacy')
+
+
+def legacy_parse(train_str, station_map):
+    """原 TrainService._parse_train_info：每行三个 pydantic 模型，逐席别 INFO 日志"""
+    fields = train_str.split('|')
+    train_code = fields[3]
+    from_stop = TrainStop(station_name=station_map.get(fields[6]) or fields[6], departure_time=fields[8])
+    to_stop = TrainStop(station_name=station_map.get(fields[7]) or fields[7], arrival_time=fields[9])
+    seats = {
+        "商务座": fields[32] or "--",
+        "一等座": fields[31] or "--",
+        "二等座": fields[30] or "--",
+        "软卧": fields[23] or "--",
+        "硬卧": fields[28] or "--",
+        "硬座": fields[29] or "--",
+        "无座": fields[26] or "--"
+    }
+    legacy_logger.info(f"车次 {train_code} 的座位信息:")
+    for seat_type, count in seats.items():
+        if count != "--":
+            legacy_logger.info(f"  {seat_type}: {count}")
+    return TrainInfo(train_no=fields[2], train_code=train_code, train_type=get_train_type(train_code),
+                     from_station=from_stop, to_station=to_stop, duration=fields[10],
+                     seats=seats, prices={})
+
+
+def bench(label, func, rows, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    elapsed = time.perf_counter() - start
+    rate = rows * rounds / elapsed
+    print(f"{label:<36}{elapsed / rounds * 1000:>8.2f} ms/response{rate:>12.0f} rows/s")
+    return elapsed
+
+
+def main(paths, rounds: int = 200):
+    # 旧实现的 INFO 日志写入内存，只统计格式化与处理器开销
+    handler = logging.StreamHandler(io.StringIO())
+    legacy_logger.addHandler(handler)
+    legacy_logger.setLevel(logging.INFO)
+    legacy_logger.propagate = False
+
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        rows = data['data']['result']
+        station_map = data['data'].get('map', {})
+        print(f"{os.path.basename(path)}: {len(rows)} rows")
+
+        legacy = bench("legacy (models + INFO logs)",
+                       lambda: [legacy_parse(row, station_map) for row in rows], len(rows), rounds)
+        bench("parse_results -> TrainRecord",
+              lambda: parse_results(rows, station_map), len(rows), rounds)
+
+        records = parse_results(rows, station_map)
+        returned = [r for r in records if r.train_code[:1] == 'G']
+        bench(f"to_model for {len(returned)} returned rows",
+              lambda: [r.to_model() for r in returned], len(rows), rounds)
+        batch = bench("parse + filter + to_dict (fast path)",
+                      lambda: [r.to_dict() for r in parse_results(rows, station_map)
+                               if r.train_code[:1] == 'G'], len(rows), rounds)
+        print(f"speedup vs legacy (fast path): {legacy / batch:.1f}x\n")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] or sorted(glob.glob(os.path.join(FIXTURE_DIR, 'queryZ_*.json'))))
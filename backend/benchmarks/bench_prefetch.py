@@ -0,0 +1,134 @@
+"""热门路线预取基准：偏斜流量下，开启与关闭预取时车票查询的延迟分布与上游请求量
+
+运行：cd backend && python -m benchmarks.bench_prefetch --duration 30 --rate 40
+
+按 Zipf 分布从若干 (路线, 日期) 中抽样，以固定速率发送车票查询（开环，不受响应时间影响），
+分别统计热门键（前 --top-k 个）与其余键的 p50/p95/p99，以及延迟超过 --cold-ms 的请求
+比例（即未命中缓存、等待上游的请求）。替身延迟默认 300ms，使命中与未命中容易区分。
+前 --warmup 秒（默认一个缓存有效期）为首次加载，不计入统计。
+上游接口限流在基准中关闭（预取预算仍然生效），只观察预取的效果。
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import random
+import time
+import urllib.request
+from typing import Dict, List, Tuple
+
+import aiohttp
+
+from benchmarks.bench_workers import HOT_STATIONS
+from benchmarks.load_test import LocalStack, percentile
+
+
+def zipf_weights(n: int, s: float) -> List[float]:
+    return [1.0 / (rank ** s) for rank in range(1, n + 1)]
+
+
+async def drive(api_url: str, keys: List[Tuple[str, str, str]], weights: List[float],
+                rate: float, duration: float, warmup: float) -> List[Tuple[int, float]]:
+    """按固定速率发送请求，返回预热之后的 [(键的排名, 延迟秒)]"""
+    base = f'{api_url}/api'
+    rng = random.Random(0)
+    results: List[Tuple[int, float]] = []
+    ranks = list(range(len(keys)))
+
+    async def one(session: aiohttp.ClientSession, rank: int, counted: bool):
+        from_station, to_station, train_date = keys[rank]
+        start = time.perf_counter()
+        async with session.post(f'{base}/tickets/query', json={
+            'from_station': from_station, 'to_station': to_station, 'train_date': train_date,
+        }) as response:
+            await response.read()
+            if counted and response.status < 400:
+                results.append((rank, time.perf_counter() - start))
+
+    connector = aiohttp.TCPConnector(limit=0)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        tasks = []
+        start = time.perf_counter()
+        sent = 0
+        while time.perf_counter() - start < warmup + duration:
+            elapsed = time.perf_counter() - start
+            due = int(elapsed * rate)
+            while sent < due:
+                rank = rng.choices(ranks, weights)[0]
+                tasks.append(asyncio.ensure_future(one(session, rank, elapsed >= warmup)))
+                sent += 1
+            await asyncio.sleep(0.005)
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return results
+
+
+def summarize(label: str, latencies: List[float], cold_ms: float) -> str:
+    cold = sum(1 for latency in latencies if latency * 1000 > cold_ms)
+    return (f"{label:<10}{len(latencies):>8}"
+            f"{percentile(latencies, 50) * 1000:>9.1f}{percentile(latencies, 95) * 1000:>9.1f}"
+            f"{percentile(latencies, 99) * 1000:>9.1f}{cold / max(1, len(latencies)) * 100:>9.1f}%")
+
+
+def run_case(prefetch: bool, args) -> Dict:
+    env = {
+        'PREFETCH_ENABLED': 'true' if prefetch else 'false',
+        'PREFETCH_TOP_K': str(args.top_k),
+        'PREFETCH_BUDGET': str(args.budget),
+        'TICKET_CACHE_TTL': str(args.ticket_ttl),
+        'UPSTREAM_RATE_LIMITS': json.dumps({'default': 0}),
+        'LOG_LEVEL': 'WARNING',
+    }
+    today = datetime.date.today()
+    routes = [(a, b) for a in HOT_STATIONS for b in HOT_STATIONS if a != b]
+    keys = [(a, b, (today + datetime.timedelta(days=day + 1)).isoformat())
+            for day in range(3) for a, b in routes][:args.keys]
+    random.Random(1).shuffle(keys)
+    weights = zipf_weights(len(keys), args.zipf)
+
+    stack = LocalStack(args.latency, 0.0, 0.0, 1, env=env)
+    stack.start()
+    warmup = args.ticket_ttl if args.warmup is None else args.warmup
+    try:
+        results = asyncio.run(drive(stack.api_url, keys, weights, args.rate, args.duration, warmup))
+        after = stack.upstream_stats()
+        with urllib.request.urlopen(f'{stack.api_url}/api/cache/stats') as response:
+            prefetch_stats = json.loads(response.read()).get('prefetch', {})
+    finally:
+        stack.stop()
+    hot = [latency for rank, latency in results if rank < args.top_k]
+    rest = [latency for rank, latency in results if rank >= args.top_k]
+    return {
+        'hot': hot,
+        'rest': rest,
+        'share': len(hot) / max(1, len(results)),
+        'prefetch': prefetch_stats,
+        'upstream': after.get('queryZ', 0) / (warmup + args.duration),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--duration', type=float, default=30)
+    parser.add_argument('--rate', type=float, default=40, help='每秒请求数')
+    parser.add_argument('--keys', type=int, default=60, help='(路线, 日期) 总数')
+    parser.add_argument('--zipf', type=float, default=1.1, help='Zipf 分布参数')
+    parser.add_argument('--top-k', type=int, default=10)
+    parser.add_argument('--budget', type=float, default=2.0, help='预取预算（次/秒）')
+    parser.add_argument('--ticket-ttl', type=float, default=10)
+    parser.add_argument('--latency', type=float, default=300, help='替身延迟（毫秒）')
+    parser.add_argument('--warmup', type=float, default=None, help='不计入统计的预热秒数')
+    parser.add_argument('--cold-ms', type=float, default=150, help='超过该延迟视为未命中缓存')
+    args = parser.parse_args()
+
+    print(f"{'prefetch':<10}{'keys':<10}{'requests':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'cold':>10}")
+    for prefetch in (False, True):
+        result = run_case(prefetch, args)
+        label = 'on' if prefetch else 'off'
+        print(f"{label:<10}" + summarize(f"top {args.top_k}", result['hot'], args.cold_ms))
+        print(f"{label:<10}" + summarize("others", result['rest'], args.cold_ms))
+        print(f"{'':<10}hot share {result['share'] * 100:.0f}%, "
+              f"upstream queryZ {result['upstream']:.2f} req/s, prefetch {json.dumps(result['prefetch'])}")
+
+
+if __name__ == '__main__':
+    main()
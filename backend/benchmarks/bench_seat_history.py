@@ -0,0 +1,145 @@
+"""余票历史基准：每条快照的磁盘占用，以及压缩前后的扫描速度
+
+运行：cd backend && python -m benchmarks.bench_seat_history [--routes 20 --hours 2 --interval 30]
+
+以 benchmarks/fixtures/ 中的 queryZ 响应为模板，模拟 --routes 条路线每 --interval 秒查询一次、
+持续 --hours 小时，每次查询中每个车次以 --change-rate 的概率余票减少。分别统计：
+追加写入的吞吐与每行字节数（对照为每行一个 JSON 对象的 JSON Lines），全量扫描与按车次
+查询的耗时，以及压缩（只保留变化的观测、按车次排序）之后的同样指标。
+"""
+import argparse
+import asyncio
+import glob
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+from typing import List
+
+from app.services.parser import TrainRecord, parse_results
+from app.services.seat_history import PARTITION_SECONDS, SEAT_NAMES, SeatHistory, partition_start
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def load_records() -> List[TrainRecord]:
+    path = sorted(glob.glob(os.path.join(FIXTURE_DIR, 'queryZ_*.json')))[0]
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return parse_results(data['data']['result'], data['data'].get('map', {}))
+
+
+def sell(seats: dict, rng: random.Random) -> dict:
+    """随机一个席别的余票减少（"有" 先变为具体数字）"""
+    name = rng.choice(SEAT_NAMES)
+    value = seats[name]
+    if value == '有':
+        value = str(rng.randint(10, 30))
+    elif value.isdigit():
+        value = str(int(value) - 1) if int(value) > 1 else '无'
+    return dict(seats, **{name: value})
+
+
+def disk_usage(root: str, pattern: str) -> int:
+    return sum(os.path.getsize(path) for path in glob.glob(os.path.join(root, '*', pattern)))
+
+
+def timed(label: str, func, rows: int = 0):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    rate = f"{rows / elapsed:>14,.0f} rows/s" if rows else ''
+    print(f"{label:<44}{elapsed * 1000:>10.1f} ms{rate}")
+    return result
+
+
+async def record_all(history: SeatHistory, routes, polls: int, interval: float, start: int,
+                     change_rate: float, jsonl_path: str) -> int:
+    rng = random.Random(0)
+    rows = 0
+    with open(jsonl_path, 'w', encoding='utf-8') as jsonl:
+        for poll in range(polls):
+            observed_at = start + poll * interval
+            for train_date, records in routes:
+                for record in records:
+                    if rng.random() < change_rate:
+                        record.seats = sell(record.seats, rng)
+                history.record(train_date, records, observed_at)
+                for record in records:
+                    jsonl.write(json.dumps({
+                        'observed_at': int(observed_at), 'train_date': train_date,
+                        'train_code': record.train_code, 'from_code': record.from_code,
+                        'to_code': record.to_code, 'seats': record.seats,
+                    }, ensure_ascii=False) + '\n')
+                rows += len(records)
+            # 与服务中一样按批落盘（每次约 flush_interval 秒内的查询）
+            if poll % 5 == 4:
+                await history.flush()
+    await history.flush()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--routes', type=int, default=20, help='路线数（各自一份车次列表）')
+    parser.add_argument('--hours', type=int, default=2)
+    parser.add_argument('--interval', type=float, default=30, help='每条路线的查询间隔（秒）')
+    parser.add_argument('--change-rate', type=float, default=0.02, help='每次查询中车次余票变化的概率')
+    args = parser.parse_args()
+
+    template = load_records()
+    routes = []
+    for i in range(args.routes):
+        records = [TrainRecord(*record.to_row()) for record in template]
+        for record in records:
+            record.from_code = f"F{i:02d}"
+        routes.append((f"2026-10-{i % 28 + 1:02d}", records))
+
+    root = tempfile.mkdtemp(prefix='seat-history-')
+    try:
+        history = SeatHistory(os.path.join(root, 'history'), compact_grace=0)
+        polls = int(args.hours * 3600 / args.interval)
+        # 分区都已结束，便于压缩
+        start = partition_start(time.time()) - (args.hours + 1) * PARTITION_SECONDS
+        end = start + args.hours * 3600
+        jsonl_path = os.path.join(root, 'baseline.jsonl')
+
+        print(f"{args.routes} routes x {len(template)} trains, {polls} polls")
+        write_start = time.perf_counter()
+        rows = asyncio.run(record_all(history, routes, polls, args.interval, start,
+                                      args.change_rate, jsonl_path))
+        write_elapsed = time.perf_counter() - write_start
+        raw = disk_usage(history.root, 'seg-*.shb')
+        jsonl = os.path.getsize(jsonl_path)
+        print(f"recorded {rows:,} snapshots in {write_elapsed:.1f}s (incl. JSON baseline)")
+        print(f"{'JSON Lines baseline':<44}{jsonl / rows:>10.1f} B/snapshot{jsonl / 1e6:>12.1f} MB")
+        print(f"{'columnar segments':<44}{raw / rows:>10.1f} B/snapshot{raw / 1e6:>12.1f} MB")
+
+        train_code = template[len(template) // 2].train_code
+        timed("full scan (segments)", lambda: sum(1 for _ in history.scan(start, end)), rows)
+        found = timed(f"scan train {train_code} (segments)",
+                      lambda: sum(1 for _ in history.scan(start, end, train_code=train_code)), rows)
+        print(f"  -> {found} snapshots")
+
+        kept = timed("compact all partitions", history.compact_closed)
+        compacted = disk_usage(history.root, 'compact-*.shc')
+        stored = sum(1 for _ in history.scan(start, end))
+        print(f"  -> {kept} partitions, {stored:,} observations kept")
+        print(f"{'compacted':<44}{compacted / rows:>10.2f} B/snapshot{compacted / 1e6:>12.2f} MB"
+              f"  ({compacted / max(1, stored):.1f} B/kept row)")
+
+        history._files.clear()
+        timed("full scan (compacted, cold)", lambda: sum(1 for _ in history.scan(start, end)), stored)
+        timed("full scan (compacted, parsed files cached)",
+              lambda: sum(1 for _ in history.scan(start, end)), stored)
+        found = timed(f"scan train {train_code} (compacted)",
+                      lambda: sum(1 for _ in history.scan(start, end, train_code=train_code)))
+        print(f"  -> {found} observations")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""启动耗时基准：启动一个 uvicorn 进程，测量 / 可访问与 /ready 就绪的耗时
+
+运行：cd backend && python -m benchmarks.bench_startup [--runs 5] [--cold]
+
+后端使用临时 DATA_DIR，上游为本地的 mock_upstream（--latency 毫秒延迟），不访问 12306，
+也不读写 backend/data。第一次启动时下载站点表并写入临时目录，之后的启动直接加载；
+--cold 会在每次启动前删除临时目录中的站点表缓存，测量没有本地缓存时的耗时。
+"""
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+from benchmarks.load_test import BACKEND_DIR, free_port, wait_http
+
+STATION_CACHE_NAME = 'station_names.bin'  # DATA_DIR 下的站点表缓存文件
+
+
+def wait_for(url: str, started: float, timeout: float) -> float:
+    """轮询直到 url 返回 200，返回自进程启动以来的秒数"""
+    while time.perf_counter() - started < timeout:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return time.perf_counter() - started
+        except (urllib.error.URLError, ConnectionError, OSError):
+            pass
+        time.sleep(0.005)
+    return float('nan')
+
+
+def run_once(cold: bool, timeout: float, data_dir: str, upstream_url: str):
+    station_cache = os.path.join(data_dir, STATION_CACHE_NAME)
+    if cold and os.path.exists(station_cache):
+        os.remove(station_cache)
+    port = free_port()
+    env = dict(os.environ, DATA_DIR=data_dir, UPSTREAM_BASE_URL=upstream_url)
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'app.main:app', '--port', str(port), '--log-level', 'warning'],
+        cwd=BACKEND_DIR, env=env,
+    )
+    try:
+        root = wait_for(f'http://127.0.0.1:{port}/', started, timeout)
+        ready = wait_for(f'http://127.0.0.1:{port}/ready', started, timeout)
+        return root, ready
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--cold', action='store_true', help='每次启动前删除本地站点表缓存')
+    parser.add_argument('--timeout', type=float, default=30)
+    parser.add_argument('--latency', type=float, default=50, help='替身延迟（毫秒）')
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp(prefix='12306-startup-')
+    upstream_port = free_port()
+    # aiohttp 默认的 CookieJar 不接受 IP 地址下发的 Cookie，替身需通过主机名访问
+    upstream_url = f'http://localhost:{upstream_port}'
+    upstream = subprocess.Popen(
+        [sys.executable, '-m', 'benchmarks.mock_upstream', '--port', str(upstream_port),
+         '--latency', str(args.latency)],
+        cwd=BACKEND_DIR,
+    )
+    roots, readies = [], []
+    try:
+        if not wait_http(f'{upstream_url}/__stats'):
+            raise RuntimeError('mock upstream failed to start')
+        for i in range(args.runs):
+            root, ready = run_once(args.cold, args.timeout, data_dir, upstream_url)
+            roots.append(root)
+            readies.append(ready)
+            print(f"run {i + 1}: / {root * 1000:.0f} ms, /ready {ready * 1000:.0f} ms")
+    finally:
+        upstream.terminate()
+        upstream.wait()
+        shutil.rmtree(data_dir, ignore_errors=True)
+    print(f"median: / {statistics.median(roots) * 1000:.0f} ms, "
+          f"/ready {statistics.median(readies) * 1000:.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
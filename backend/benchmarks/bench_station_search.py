@@ -0,0 +1,76 @@
+"""站点搜索微基准：对比逐个扫描的旧实现、StationIndex 与线上使用的 MappedStations
+
+MappedStations 由同一份站点数据经 StationStore 写入临时文件后 mmap 加载；uncached 一行绕过
+进程内的搜索结果 LRU，测量直接读取映射倒排表的开销。
+
+运行：cd backend && python -m benchmarks.bench_station_search
+"""
+import os
+import tempfile
+import time
+
+from app.services.station_index import StationIndex, StationSearch
+from app.services.station_store import StationStore
+from benchmarks.synthetic import generate_stations
+
+
+def linear_search(name_to_code_map, keyword, limit=10):
+    """原 TrainService.search_stations 的逐个扫描实现"""
+    matches = []
+    for name, code in name_to_code_map.items():
+        if keyword.upper() in name.upper():
+            matches.append({"name": name, "code": code})
+            if len(matches) >= limit:
+                break
+    return matches
+
+
+def bench(label, func, keywords, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for keyword in keywords:
+            func(keyword)
+    elapsed = time.perf_counter() - start
+    per_call = elapsed / (rounds * len(keywords)) * 1e6
+    print(f"{label:<18}{per_call:>10.2f} us/lookup")
+    return per_call
+
+
+def main(rounds: int = 200):
+    stations = generate_stations()
+    name_to_code_map = {s.name: s.code for s in stations}
+
+    start = time.perf_counter()
+    index = StationIndex(stations)
+    print(f"stations: {len(stations)}, index build: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    # 模拟逐字输入：完整站名的各个前缀，外加未命中与中间子串的输入
+    keywords = []
+    for station in stations[::97]:
+        keywords.extend(station.name[:i] for i in range(1, len(station.name) + 1))
+    keywords.extend(['不存在', '江东', '城南', '林'])
+    print(f"keywords: {len(keywords)}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = StationStore(os.path.join(tmp, 'stations.bin'))
+        store.save(stations)
+        start = time.perf_counter()
+        mapped = store.load().stations
+        print(f"mapped load: {(time.perf_counter() - start) * 1000:.2f} ms")
+
+        linear = bench("linear scan", lambda k: linear_search(name_to_code_map, k), keywords, rounds)
+        indexed = bench("StationIndex", lambda k: index.search(k), keywords, rounds)
+        uncached = bench("Mapped uncached", lambda k: StationSearch.search(mapped, k), keywords, rounds)
+        cached = bench("MappedStations", lambda k: mapped.search(k), keywords, rounds)
+        print(f"speedup vs linear: StationIndex {linear / indexed:.1f}x, "
+              f"mapped uncached {linear / uncached:.1f}x, MappedStations {linear / cached:.1f}x")
+
+        # 拼音/电报码只能通过索引检索，单独统计
+        pinyin_keywords = [s.pinyin[:4] for s in stations[::97]] + [s.code for s in stations[::97]]
+        bench("pinyin/code", lambda k: index.search(k), pinyin_keywords, rounds)
+        bench("mapped pinyin", lambda k: StationSearch.search(mapped, k), pinyin_keywords, rounds)
+        mapped.close()
+
+
+if __name__ == '__main__':
+    main()
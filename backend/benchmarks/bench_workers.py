@@ -0,0 +1,141 @@
+"""多 worker 基准：worker 数增加时，上游请求速率与内存占用的变化
+
+运行：cd backend && python -m benchmarks.bench_workers --workers 1,2,4 --duration 20 --compare
+
+对每个 worker 数启动 mock_upstream 与 uvicorn --workers N（共享同一个临时 DATA_DIR），
+以固定的热点路线集合压测车票查询，统计替身记录的 queryZ 请求速率，以及各 worker
+进程的 PSS（按共享页面均摊后的内存）。--compare 同时运行 SHARED_CACHE=false 作为对照：
+各 worker 各自缓存时，上游请求速率随 worker 数线性增长。
+上游限流在基准中关闭，只观察缓存的效果。
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import random
+import time
+from typing import Dict, List
+
+import aiohttp
+
+from benchmarks.load_test import LocalStack, percentile, run_level
+
+# 热点路线的站名取自 fixtures/station_name.js
+HOT_STATIONS = ['北京南', '上海虹桥', '南京南', '杭州东', '济南西', '天津南', '广州南', '武汉', '郑州东', '合肥']
+
+
+def worker_pids(parent: int) -> List[int]:
+    """uvicorn 主进程的子进程（各 worker）"""
+    pids = []
+    for name in os.listdir('/proc'):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f'/proc/{name}/stat') as f:
+                fields = f.read().rsplit(')', 1)[1].split()
+        except OSError:
+            continue
+        if int(fields[1]) == parent:
+            pids.append(int(name))
+    return pids
+
+
+def pss_kb(pid: int) -> int:
+    """进程的 PSS（KB），不支持 smaps_rollup 时返回 0"""
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as f:
+            for line in f:
+                if line.startswith('Pss:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+async def drive(api_url: str, pairs: int, dates: int, concurrency: int, duration: float):
+    base = f'{api_url}/api'
+    today = datetime.date.today()
+    train_dates = [(today + datetime.timedelta(days=i + 1)).isoformat() for i in range(dates)]
+    routes = [(a, b) for a in HOT_STATIONS for b in HOT_STATIONS if a != b][:pairs]
+    rng = random.Random(0)
+
+    def ticket_request():
+        from_station, to_station = rng.choice(routes)
+        return 'POST', f'{base}/tickets/query', {
+            'from_station': from_station, 'to_station': to_station,
+            'train_date': rng.choice(train_dates),
+        }
+
+    connector = aiohttp.TCPConnector(limit=0)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        # 预热：确保各 worker 都已加载站点表（请求分散到不同 worker）
+        await run_level(session, lambda: ('GET', f'{base}/stations/北京', None), concurrency, 2)
+        return await run_level(session, ticket_request, concurrency, duration)
+
+
+def run_case(workers: int, shared: bool, args) -> Dict:
+    env = {
+        'SHARED_CACHE': 'true' if shared else 'false',
+        'TICKET_CACHE_TTL': str(args.ticket_ttl),
+        'UPSTREAM_RATE_LIMITS': json.dumps({'default': 0}),
+        'LOG_LEVEL': 'WARNING',
+    }
+    stack = LocalStack(args.latency, args.jitter, 0.0, workers, env=env)
+    stack.start()
+    try:
+        before = stack.upstream_stats()
+        start = time.perf_counter()
+        latencies, errors = asyncio.run(drive(stack.api_url, args.pairs, args.dates,
+                                              args.concurrency, args.duration))
+        elapsed = time.perf_counter() - start
+        after = stack.upstream_stats()
+        # 单个 worker 时 uvicorn 不创建子进程，主进程即为 worker
+        pids = worker_pids(stack.procs[-1].pid) or [stack.procs[-1].pid]
+        memory = [pss_kb(pid) for pid in pids]
+    finally:
+        stack.stop()
+    upstream = after.get('queryZ', 0) - before.get('queryZ', 0)
+    return {
+        'workers': workers,
+        'shared': shared,
+        'requests': len(latencies) + errors,
+        'errors': errors,
+        'rps': (len(latencies) + errors) / args.duration,
+        'p50': percentile(latencies, 50) * 1000,
+        'p95': percentile(latencies, 95) * 1000,
+        'upstream_rps': upstream / elapsed,
+        'station_fetches': after.get('station_name', 0),
+        'pss_mb': sum(memory) / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', default='1,2,4', help='逗号分隔的 worker 数')
+    parser.add_argument('--duration', type=float, default=20, help='每个场景压测的秒数')
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--pairs', type=int, default=10, help='热点站点对数')
+    parser.add_argument('--dates', type=int, default=3, help='热点日期数')
+    parser.add_argument('--ticket-ttl', type=float, default=5, help='车票结果缓存有效期（秒）')
+    parser.add_argument('--latency', type=float, default=50, help='替身平均延迟（毫秒）')
+    parser.add_argument('--jitter', type=float, default=20, help='替身延迟浮动（毫秒）')
+    parser.add_argument('--compare', action='store_true', help='同时运行关闭共享缓存的对照组')
+    args = parser.parse_args()
+
+    keys = args.pairs * args.dates
+    print(f"hot keys: {keys}, ticket ttl: {args.ticket_ttl}s, "
+          f"ideal upstream rate: {keys / args.ticket_ttl:.1f} req/s")
+    print(f"{'workers':>8}{'shared':>8}{'requests':>10}{'errors':>8}{'rps':>10}{'p50 ms':>9}{'p95 ms':>9}"
+          f"{'upstream/s':>12}{'stations':>10}{'PSS MB':>9}")
+    modes = [True, False] if args.compare else [True]
+    for workers in [int(value) for value in args.workers.split(',')]:
+        for shared in modes:
+            result = run_case(workers, shared, args)
+            print(f"{result['workers']:>8}{str(result['shared']):>8}{result['requests']:>10}{result['errors']:>8}"
+                  f"{result['rps']:>10.1f}{result['p50']:>9.1f}{result['p95']:>9.1f}"
+                  f"{result['upstream_rps']:>12.2f}{result['station_fetches']:>10}{result['pss_mb']:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1 @@
+var station_names ='@bj|北京|BJP|beijing|bj|0@bjn|北京南|VNP|beijingnan|bjn|1@bjx|北京西|BXP|beijingxi|bjx|2@sh|上海|SHH|shanghai|sh|3@shhq|上海虹桥|AOH|shanghaihongqiao|shhq|4@njn|南京南|NKH|nanjingnan|njn|5@jnx|济南西|JGK|jinanxi|jnx|6@tjn|天津南|TIP|tianjinnan|tjn|7@xzd|徐州东|UUH|xuzhoudong|xzd|8@gzn|广州南|IZQ|guangzhounan|gzn|9@wh|武汉|WHN|wuhan|wh|10@zzd|郑州东|ZAF|zhengzhoudong|zzd|11@hzd|杭州东|HGH|hangzhoudong|hzd|12@xab|西安北|EAY|xianbei|xab|13@mhwb|门汉乌北|TYU|menhanwubei|mhwb|14@dscb|德苏春北|LAD|desuchunbei|dscb|15@wwn|乌武南|TNI|wuwunan|wwn|16@chn|长杭南|OXN|changhangnan|chn|17@ghjn|广杭京南|BZJ|guanghangjingnan|ghjn|18@jxd|江新东|TQU|jiangxindong|jxd|19@dcb|都重北|HST|duchongbei|dcb|20@ssn|沙沙南|NWO|shashanan|ssn|21@dtn|都太南|MAE|dutainan|dtn|22@mzd|门郑东|FQL|menzhengdong|mzd|23@sje|苏京尔|VET|sujinger|sje|24@znx|郑南西|WGU|zhengnanxi|znx|25@smld|石木林东|IEC|shimulindong|smld|26@csd|昌苏东|UHI|changsudong|csd|27@sz|山州|HCU|shanzhou|sz|28@hs|汉石|GSY|hanshi|hs|29@cqld|昌齐岭东|VKA|changqilingdong|cqld|30@hzz|杭郑郑|OXO|hangzhengzheng|hzz|31@hxn|河西南|VYK|hexinan|hxn|32@db|都白|LTR|dubai|db|33@bgbd|北广滨东|BYL|beiguangbindong|bgbd|34@mhkd|门哈口东|LBD|menhakoudong|mhkd|35@dcd|德长东|KLX|dechangdong|dcd|36@zl|圳连|HJS|zhenlian|zl|37@cjn|长金南|HWL|changjinnan|cjn|38@wd|武都|KVY|wudu|wd|39@zcb|郑长滨|MUW|zhengchangbin|zcb|40@ll|兰兰|AKM|lanlan|ll|41@ceh|春尔合|LES|chunerhe|ceh|42@cjtn|长津天南|TCF|changjintiannan|cjtn|43@qsb|青沈北|PBP|qingshenbei|qsb|44@hy|河宜|EBM|heyi|hy|45@zbqb|州白齐北|GJF|zhoubaiqibei|zbqb|46@slq|山林齐|OKD|shanlinqi|slq|47@bd|白岛|CAM|baidao|bd|48@chn|春汉南|TFL|chunhannan|chn|49@tzcn|太郑重南|MOS|taizhengchongnan|tzcn|50@fc|福成|ZOO|fucheng|fc|51@hslx|湖沈兰西|QON|hushenlanxi|hslx|52@dsb|岛山北|SOM|daoshanbei|dsb|53@sz|上州|CDL|shangzhou|sz|54@ahd|安合德|PFT|anhede|ahd|55@byb|北阳北|EFG|beiyangbei|byb|56@mdn|门都南|QUB|mendunan|mdn|57@wzjb|乌州江北|ZGS|wuzhoujiangbei|wzjb|58@aax|安安西|TXD|ananxi|aax|59@xh|西河|VYM|xihe|xh|60@bj|北津|MSL|beijin|bj|61@sxbd|苏兴滨东|UXH|suxingbindong|sxbd|62@szb|山郑北|YSW|shanzhengbei|szb|63@zexb|庄尔厦北|UMQ|zhuangerxiabei|zexb|64@dkx|大口西|HBX|dakouxi|dkx|65@hsx|哈山西|XNV|hashanxi|hsx|66@hzcx|汉圳昌西|BZK|hanzhenchangxi|hzcx|67@clsn|重兰苏南|HRU|chonglansunan|clsn|68@nkjd|南昆济东|YPV|nankunjidong|nkjd|69@qxjn|青厦家南|IZU|qingxiajianan|qxjn|70@xqd|新青东|ZWI|xinqingdong|xqd|71@bcq|白重齐|SQA|baichongqi|bcq|72@kb|口白|ZSW|koubai|kb|73@bq|北泉|OWG|beiquan|bq|74@xyd|西宜东|KNN|xiyidong|xyd|75@msb|明苏北|MQU|mingsubei|msb|76@gyj|贵宜津|JTN|guiyijin|gyj|77@lsn|连山南|YAJ|lianshannan|lsn|78@qsd|泉沙东|UQF|quanshadong|qsd|79@zb|庄北|YMA|zhuangbei|zb|80@asx|安深西|WTP|anshenxi|asx|81@hhgd|海海贵东|OAW|haihaiguidong|hhgd|82@shd|沙哈东|RXZ|shahadong|shd|83@zhsd|州海上东|WPO|zhouhaishangdong|zhsd|84@ezt|尔圳太|ZEH|erzhentai|ezt|85@xpeb|新平尔北|JGG|xinpingerbei|xpeb|86@yd|原德|SIM|yuande|yd|87@cwb|春乌北|NSE|chunwubei|cwb|88@dsd|东石东|JPK|dongshidong|dsd|89@xjhb|厦京哈北|GRH|xiajinghabei|xjhb|90@lx|林兴|EVK|linxing|lx|91@dadb|岛安德北|YYV|daoandebei|dadb|92@qj|泉江|UYA|quanjiang|qj|93@jhx|济合西|ZNB|jihexi|jhx|94@gzsd|广郑深东|LEM|guangzhengshendong|gzsd|95@jcd|江长东|IVU|jiangchangdong|jcd|96@cd|春都|LPA|chundu|cd|97@ck|成昆|UQY|chengkun|ck|98@xsb|新深滨|IJB|xinshenbin|xsb|99@nqx|南青西|BUK|nanqingxi|nqx|100@cgf|重广福|AWR|chongguangfu|cgf|101@hzcx|化圳重西|EBF|huazhenchongxi|hzcx|102@ssb|山上北|YNL|shanshangbei|ssb|103@jhpd|津湖平东|EZQ|jinhupingdong|jhpd|104@at|安太|EKU|antai|at|105@ljx|林津西|MGD|linjinxi|ljx|106@jhjb|家化家北|FYE|jiahuajiabei|jhjb|107@kdd|昆德东|YCW|kundedong|kdd|108@fzj|福庄江|FWD|fuzhuangjiang|fzj|109@qsdd|齐山岛东|VMP|qishandaodong|qsdd|110@sc|沈重|QPA|shenchong|sc|111@ktl|口太林|FRV|koutailin|ktl|112@gh|贵湖|HQG|guihu|gh|113@hg|杭贵|IAR|hanggui|hg|114@gc|贵城|UEF|guicheng|gc|115@qxm|庆西木|XPC|qingximu|qxm|116@syx|沙宜西|IWC|shayixi|syx|117@zsd|圳沈大|EAL|zhenshenda|zsd|118@eba|尔滨安|JAG|erbinan|eba|119@yd|原东|DSA|yuandong|yd|120@sm|山门|ABX|shanmen|sm|121@btb|滨太北|ZTO|bintaibei|btb|122@dzx|德庄西|OBN|dezhuangxi|dzx|123@znx|庄南西|SGO|zhuangnanxi|znx|124@znd|圳南东|AAS|zhennandong|znd|125@ncx|宁春西|ICW|ningchunxi|ncx|126@hhk|河湖昆|QSY|hehukun|hhk|127@ssxd|苏苏厦东|OFJ|susuxiadong|ssxd|128@nnn|南南南|SKY|nannannan|nnn|129@sycb|沙阳城北|FEE|shayangchengbei|sycb|130@lbq|林北庆|TKN|linbeiqing|lbq|131@bjn|滨京南|QMH|binjingnan|bjn|132@ldl|连岛兰|NCA|liandaolan|ldl|133@tdd|太德大|NKG|taideda|tdd|134@jq|京庆|MKM|jingqing|jq|135@xgd|新广东|WFE|xinguangdong|xgd|136@dckn|大昌口南|KMJ|dachangkounan|dckn|137@scb|深长北|OKW|shenchangbei|scb|138@zj|州家|KFD|zhoujia|zj|139@mbcb|木白春北|GVA|mubaichunbei|mbcb|140@yx|原厦|MBM|yuanxia|yx|141@ydxx|宜大西西|AGR|yidaxixi|ydxx|142@dxb|都西北|WWW|duxibei|dxb|143@gqb|广泉北|CTS|guangquanbei|gqb|144@edjn|尔都江南|DXO|erdujiangnan|edjn|145@sm|山明|MQR|shanming|sm|146@zsn|庄石南|OHS|zhuangshinan|zsn|147@ldd|连大东|SZT|liandadong|ldd|148@smb|上门北|FWL|shangmenbei|smb|149@hjzd|化济圳东|XNF|huajizhendong|hjzd|150@htcx|海太重西|VUQ|haitaichongxi|htcx|151@ht|合太|GTD|hetai|ht|152@sdx|沙都西|CDN|shaduxi|sdx|153@clx|成林西|ZBQ|chenglinxi|clx|154@syx|山原西|ABO|shanyuanxi|syx|155@ac|安长|HWF|anchang|ac|156@pbh|平白合|YNW|pingbaihe|pbh|157@yhh|原哈化|WZC|yuanhahua|yhh|158@xcfn|厦成福南|QYP|xiachengfunan|xcfn|159@mdx|门岛西|BNV|mendaoxi|mdx|160@al|安林|BJY|anlin|al|161@qcx|泉重西|LUZ|quanchongxi|qcx|162@hax|河安西|GUO|heanxi|hax|163@dhwb|德河武北|DQV|dehewubei|dhwb|164@llb|林林北|KRU|linlinbei|llb|165@qjxb|青江新北|QFA|qingjiangxinbei|qjxb|166@djnb|东津宁北|OVL|dongjinningbei|djnb|167@jyn|济阳南|TTR|jiyangnan|jyn|168@hzb|河圳北|UAF|hezhenbei|hzb|169@dxl|岛新连|BNE|daoxinlian|dxl|170@zhy|庄海原|WAL|zhuanghaiyuan|zhy|171@hxb|化厦北|FJX|huaxiabei|hxb|172@zhx|庄海西|DYF|zhuanghaixi|zhx|173@xlh|厦林哈|BNT|xialinha|xlh|174@pztb|平州太北|AEP|pingzhoutaibei|pztb|175@slx|山连西|JVN|shanlianxi|slx|176@blj|滨兰金|AJN|binlanjin|blj|177@yyjx|宜宜津西|MVD|yiyijinxi|yyjx|178@ljd|林津东|WUL|linjindong|ljd|179@jb|金北|UCJ|jinbei|jb|180@ll|岭林|BYI|linglin|ll|181@ayln|安原兰南|GLA|anyuanlannan|ayln|182@gmlb|广门岭北|ACC|guangmenlingbei|gmlb|183@lxx|岭厦西|EWL|lingxiaxi|lxx|184@kxx|昆西西|OIZ|kunxixi|kxx|185@yec|阳尔长|BRX|yangerchang|yec|186@dj|都江|GMR|dujiang|dj|187@djcb|岛济重北|LRI|daojichongbei|djcb|188@han|合安南|CMY|heannan|han|189@jx|津兴|OKL|jinxing|jx|190@wdx|乌东西|YCE|wudongxi|wdx|191@jqs|济齐深|IDK|jiqishen|jqs|192@bcn|白昌南|BGU|baichangnan|bcn|193@hd|海都|CMZ|haidu|hd|194@kfb|口福北|VKE|koufubei|kfb|195@kdhn|口岛汉南|VJZ|koudaohannan|kdhn|196@pbjx|平白京西|KVJ|pingbaijingxi|pbjx|197@hyx|合原西|UUM|heyuanxi|hyx|198@gcd|贵昌岛|XDN|guichangdao|gcd|199@ffn|肥福南|UHY|feifunan|ffn|200@hzx|合州西|THR|hezhouxi|hzx|201@wdb|武岛北|SFI|wudaobei|wdb|202@zj|州金|MBS|zhoujin|zj|203@mzy|明圳原|KTT|mingzhenyuan|mzy|204@ls|岭上|CNI|lingshang|ls|205@lqn|林齐南|PXE|linqinan|lqn|206@wx|乌厦|WMC|wuxia|wx|207@kzkx|昆庄口西|MYM|kunzhuangkouxi|kzkx|208@bn|北宁|DRY|beining|bn|209@nyd|宁宜东|VRO|ningyidong|nyd|210@tdb|天岛北|SKL|tiandaobei|tdb|211@hfb|合肥北|UKQ|hefeibei|hfb|212@hlb|杭岭北|BUF|hanglingbei|hlb|213@cfhx|成肥湖西|ABA|chengfeihuxi|cfhx|214@ydx|原岛西|MXH|yuandaoxi|ydx|215@dsdd|都深岛东|XRL|dushendaodong|dsdd|216@wlx|乌林西|JYE|wulinxi|wlx|217@hnk|湖南口|AIV|hunankou|hnk|218@sjn|石金南|TKS|shijinnan|sjn|219@hc|杭成|DSF|hangcheng|hc|220@hxn|合新南|LGN|hexinnan|hxn|221@hjx|海金西|PNW|haijinxi|hjx|222@scx|苏长西|PFQ|suchangxi|scx|223@xf|厦肥|QLL|xiafei|xf|224@xqn|兴泉南|MCF|xingquannan|xqn|225@ayb|安阳北|OCL|anyangbei|ayb|226@tmpn|天门平南|UCF|tianmenpingnan|tmpn|227@hyx|汉阳西|XAH|hanyangxi|hyx|228@ebd|尔北东|NSD|erbeidong|ebd|229@yhd|宜合东|AJB|yihedong|yhd|230@set|石尔天|OZJ|shiertian|set|231@zex|郑尔西|MBP|zhengerxi|zex|232@mh|木杭|TKG|muhang|mh|233@xh|厦合|VKG|xiahe|xh|234@lh|兰湖|OKE|lanhu|lh|235@sm|山木|PAE|shanmu|sm|236@hbld|湖白兰东|ZEO|hubailandong|hbld|237@hhb|哈河北|EXY|hahebei|hhb|238@jmn|江木南|MEC|jiangmunan|jmn|239@sab|石安北|UOH|shianbei|sab|240@mjnx|门家南西|RXD|menjiananxi|mjnx|241@dd|岛都|EKK|daodu|dd|242@xkx|厦口西|AKU|xiakouxi|xkx|243@sky|上口宜|SXM|shangkouyi|sky|244@hk|化口|KNK|huakou|hk|245@zcl|州城岭|RKN|zhouchengling|zcl|246@bejx|白尔津西|ZRG|baierjinxi|bejx|247@yjb|阳京北|OYZ|yangjingbei|yjb|248@tqb|太泉北|QQZ|taiquanbei|tqb|249@xhlb|西杭兰北|OLQ|xihanglanbei|xhlb|250@xsqd|兴山齐东|ZQP|xingshanqidong|xsqd|251@pll|平兰连|YDN|pinglanlian|pll|252@mjn|木京南|MEJ|mujingnan|mjn|253@jx|济西|HUL|jixi|jx|254@jfn|济肥南|MJX|jifeinan|jfn|255@yys|原阳深|WOV|yuanyangshen|yys|256@sc|苏成|FML|sucheng|sc|257@nmnn|宁明南南|NNU|ningmingnannan|nmnn|258@wxx|乌厦西|LJF|wuxiaxi|wxx|259@tb|太北|SQD|taibei|tb|260@yhl|阳海林|PQH|yanghailin|yhl|261@fxx|肥兴兴|EXZ|feixingxing|fxx|262@djsn|都江沙南|YCA|dujiangshanan|djsn|263@md|明德|FRE|mingde|md|264@td|太大|LAR|taida|td|265@cxb|重西北|MJN|chongxibei|cxb|266@dldd|大岭德东|QCH|dalingdedong|dldd|267@js|家沈|VMT|jiashen|js|268@qlmx|青连门西|IIM|qinglianmenxi|qlmx|269@ecb|尔重北|WDZ|erchongbei|ecb|270@hzx|汉郑西|DPW|hanzhengxi|hzx|271@pb|平滨|CGY|pingbin|pb|272@bf|滨福|ZJX|binfu|bf|273@bjb|北济北|LGF|beijibei|bjb|274@mc|门长|KPR|menchang|mc|275@zqh|庄泉化|SWM|zhuangquanhua|zqh|276@sh|山湖|RNA|shanhu|sh|277@ltqx|兰太泉西|IQH|lantaiquanxi|ltqx|278@fzdx|福庄都西|YWO|fuzhuangduxi|fzdx|279@clx|昌林西|IZT|changlinxi|clx|280@hsn|汉山南|YCU|hanshannan|hsn|281@mlb|明连北|VCW|minglianbei|mlb|282@hjd|哈金东|PMW|hajindong|hjd|283@hj|杭家|CQG|hangjia|hj|284@zhn|郑化南|MPS|zhenghuanan|zhn|285@xs|厦山|YDH|xiashan|xs|286@dlz|都林州|POQ|dulinzhou|dlz|287@qyb|泉宜北|ISF|quanyibei|qyb|288@fx|福新|OTN|fuxin|fx|289@ysj|宜山金|FLS|yishanjin|ysj|290@ctsd|成天苏东|IVG|chengtiansudong|ctsd|291@sbbn|山滨滨南|NUF|shanbinbinnan|sbbn|292@ly|兰原|PVH|lanyuan|ly|293@jdd|江大东|OVJ|jiangdadong|jdd|294@qf|庆肥|ZDM|qingfei|qf|295@lq|岭齐|CFY|lingqi|lq|296@fhd|福杭东|FCL|fuhangdong|fhd|297@lf|兰肥|HNX|lanfei|lf|298@dh|大哈|CRQ|daha|dh|299@cl|重林|XKT|chonglin|cl|300@hh|哈湖|IED|hahu|hh|301@hp|杭平|EMK|hangping|hp|302@wjjn|武家济南|PLD|wujiajinan|wjjn|303@hh|杭河|GVF|hanghe|hh|304@jjz|金济圳|LPB|jinjizhen|jjz|305@jtb|津太北|ESZ|jintaibei|jtb|306@fc|肥成|MFE|feicheng|fc|307@qwx|泉武西|FUD|quanwuxi|qwx|308@njkn|宁津昆南|TJU|ningjinkunnan|njkn|309@bln|滨岭南|HZS|binlingnan|bln|310@zq|郑齐|OPY|zhengqi|zq|311@jm|津明|SCR|jinming|jm|312@na|南安|NBK|nanan|na|313@dgx|东广西|WJB|dongguangxi|dgx|314@jcn|京重南|IMF|jingchongnan|jcn|315@hdzb|杭德圳北|LCS|hangdezhenbei|hdzb|316@lwb|连乌北|FJB|lianwubei|lwb|317@ae|安尔|WCC|aner|ae|318@qb|泉北|WES|quanbei|qb|319@xab|兴安北|CMB|xinganbei|xab|320@jhb|江河北|OLJ|jianghebei|jhb|321@nwh|宁乌河|UVN|ningwuhe|nwh|322@shm|石海门|NJU|shihaimen|shm|323@cln|重岭南|MWL|chonglingnan|cln|324@hcq|哈春齐|RBF|hachunqi|hcq|325@sp|沙平|ZFU|shaping|sp|326@pwcn|平乌成南|TXG|pingwuchengnan|pwcn|327@sn|深南|GGA|shennan|sn|328@zsj|圳深济|RIF|zhenshenji|zsj|329@cnd|昌南东|RHN|changnandong|cnd|330@xax|新安西|EUR|xinanxi|xax|331@hslx|合山林西|POT|heshanlinxi|hslx|332@hgjd|湖贵津东|ZFK|huguijindong|hgjd|333@my|明原|VYZ|mingyuan|my|334@jxbb|江新北北|MWF|jiangxinbeibei|jxbb|335@chn|成哈南|COZ|chenghanan|chn|336@jh|津杭|HLY|jinhang|jh|337@qqhb|泉泉河北|JQA|quanquanhebei|qqhb|338@qkh|庆口海|SLX|qingkouhai|qkh|339@sstx|上深天西|JQV|shangshentianxi|sstx|340@lwa|连武安|TXC|lianwuan|lwa|341@zj|庄江|WYW|zhuangjiang|zj|342@wymb|武原门北|QFL|wuyuanmenbei|wymb|343@wbb|乌白北|XTA|wubaibei|wbb|344@sqwn|山齐乌南|YAQ|shanqiwunan|sqwn|345@hjbx|哈家白西|ZMH|hajiabaixi|hjbx|346@jsbb|济山白北|DQL|jishanbaibei|jsbb|347@jdh|金东合|KJN|jindonghe|jdh|348@ncx|宁昌西|SNL|ningchangxi|ncx|349@zlx|州林西|FNO|zhoulinxi|zlx|350@bsb|北深北|DNC|beishenbei|bsb|351@xs|兴深|GAD|xingshen|xs|352@kzmx|口郑木西|HIE|kouzhengmuxi|kzmx|353@tsx|太沈西|OGV|taishenxi|tsx|354@hm|哈门|RBX|hamen|hm|355@qsx|泉石西|WQP|quanshixi|qsx|356@zwd|圳乌东|YLH|zhenwudong|zwd|357@ssx|沙石西|NMC|shashixi|ssx|358@kj|口津|KDF|koujin|kj|359@shx|深哈西|DSB|shenhaxi|shx|360@bc|北成|LIF|beicheng|bc|361@yld|原兰东|MZF|yuanlandong|yld|362@thn|天河南|UCP|tianhenan|thn|363@bln|白兰南|RVV|bailannan|bln|364@cbn|长滨南|AHT|changbinnan|cbn|365@qtx|齐天西|JJV|qitianxi|qtx|366@xm|兴木|JKY|xingmu|xm|367@jmd|家木东|VUE|jiamudong|jmd|368@jj|津济|JYP|jinji|jj|369@bz|北庄|FKS|beizhuang|bz|370@zz|圳庄|OHA|zhenzhuang|zz|371@jhx|家哈西|GPF|jiahaxi|jhx|372@eed|尔尔东|YQH|ererdong|eed|373@ltb|连天北|AKR|liantianbei|ltb|374@cnld|重宁林东|NOX|chongninglindong|cnld|375@hyn|杭原南|BRB|hangyuannan|hyn|376@hdd|合都东|HNZ|hedudong|hdd|377@sjx|深津西|JFR|shenjinxi|sjx|378@kx|口西|SFA|kouxi|kx|379@sa|石安|ZZY|shian|sa|380@xfj|兴福京|NYN|xingfujing|xfj|381@sshd|深上湖东|BLA|shenshanghudong|sshd|382@djmn|都金木南|ZIB|dujinmunan|djmn|383@jhn|京哈南|FWE|jinghanan|jhn|384@fz|肥州|PZR|feizhou|fz|385@fn|福宁|OIN|funing|fn|386@sqn|山齐南|BKT|shanqinan|sqn|387@sxd|石新东|SBM|shixindong|sxd|388@dsq|岛石青|GLZ|daoshiqing|dsq|389@jhx|津汉西|CEL|jinhanxi|jhx|390@kjd|昆济东|SCZ|kunjidong|kjd|391@shb|深河北|TTD|shenhebei|shb|392@jjjd|江家金东|BQC|jiangjiajindong|jjjd|393@hhsb|合合苏北|BXW|hehesubei|hhsb|394@tzd|天庄东|MHV|tianzhuangdong|tzd|395@hm|合木|SPC|hemu|hm|396@nbtn|南滨太南|DQN|nanbintainan|nbtn|397@lh|兰汉|GMI|lanhan|lh|398@qs|青沈|ESS|qingshen|qs|399@ycn|原长南|CVA|yuanchangnan|ycn|400@zyn|郑原南|DZT|zhengyuannan|zyn|401@lss|林上上|MHI|linshangshang|lss|402@xtb|新天北|XRQ|xintianbei|xtb|403@sd|山岛|FWH|shandao|sd|404@hdb|哈大北|NSO|hadabei|hdb|405@dsx|东沙西|LLV|dongshaxi|dsx|406@xcd|兴成东|EOQ|xingchengdong|xcd|407@jchb|济成哈北|XCM|jichenghabei|jchb|408@bdwd|北德武东|DBQ|beidewudong|bdwd|409@bnn|北宁南|PQF|beiningnan|bnn|410@wjjx|武家家西|LXT|wujiajiaxi|wjjx|411@tq|天泉|LWM|tianquan|tq|412@qzh|庆州汉|BGL|qingzhouhan|qzh|413@yx|阳兴|PZP|yangxing|yx|414@yl|阳岭|QHN|yangling|yl|415@lnx|林宁西|BAA|linningxi|lnx|416@gc|广昌|OCY|guangchang|gc|417@dmfb|大明福北|FZW|damingfubei|dmfb|418@ss|石沈|KDD|shishen|ss|419@ccs|春重沈|ITR|chunchongshen|ccs|420@qpd|齐平东|NIA|qipingdong|qpd|421@ghzb|广海郑北|BHV|guanghaizhengbei|ghzb|422@lg|兰贵|DXK|langui|lg|423@jwn|津乌南|DIP|jinwunan|jwn|424@dyx|都原厦|BDS|duyuanxia|dyx|425@essx|尔山深西|ALJ|ershanshenxi|essx|426@wbn|武白南|IZE|wubainan|wbn|427@sqy|山庆阳|ILE|shanqingyang|sqy|428@hmhx|海明湖西|JUX|haiminghuxi|hmhx|429@gh|广汉|IEI|guanghan|gh|430@zy|州原|ATR|zhouyuan|zy|431@scd|山昌东|XDK|shanchangdong|scd|432@myd|明原东|DHV|mingyuandong|myd|433@lyx|岭阳西|HUT|lingyangxi|lyx|434@qyl|泉原兰|GLT|quanyuanlan|qyl|435@acsx|安重山西|ZLY|anchongshanxi|acsx|436@dgj|德广金|TIV|deguangjin|dgj|437@jmx|津明西|YOX|jinmingxi|jmx|438@xmb|西门北|QER|ximenbei|xmb|439@zt|郑太|XZI|zhengtai|zt|440@xdy|厦大宜|PUN|xiadayi|xdy|441@qqe|齐青尔|OTZ|qiqinger|qqe|442@ccn|成重南|DEJ|chengchongnan|ccn|443@mgwd|明广乌东|HYA|mingguangwudong|mgwd|444@lldx|岭林东西|FFL|linglindongxi|lldx|445@sz|沙庄|VPZ|shazhuang|sz|446@cs|春深|WXZ|chunshen|cs|447@zxd|庄兴东|AOC|zhuangxingdong|zxd|448@cj|城京|WCY|chengjing|cj|449@lm|岭木|MWA|lingmu|lm|450@smn|沙明南|ZZU|shamingnan|smn|451@sphn|深平河南|IYW|shenpinghenan|sphn|452@hhj|化湖江|LVH|huahujiang|hhj|453@gh|广化|WAG|guanghua|gh|454@jfj|江福金|ALP|jiangfujin|jfj|455@lhb|连河北|PYA|lianhebei|lhb|456@ytn|宜天南|MBJ|yitiannan|ytn|457@sdd|上岛东|BMY|shangdaodong|sdd|458@cdjb|成都金北|OYS|chengdujinbei|cdjb|459@xe|西尔|RUE|xier|xe|460@hs|合苏|TGF|hesu|hs|461@cfd|长福东|WBR|changfudong|cfd|462@nm|宁木|NOB|ningmu|nm|463@hhd|湖杭大|QWM|huhangda|hhd|464@fwn|肥乌南|NBS|feiwunan|fwn|465@hzx|化州西|BNQ|huazhouxi|hzx|466@pyb|平宜北|KAQ|pingyibei|pyb|467@ykb|阳口北|HBV|yangkoubei|ykb|468@yfbn|阳肥滨南|KQP|yangfeibinnan|yfbn|469@fpdb|福平东北|GWZ|fupingdongbei|fpdb|470@wc|武城|MRI|wucheng|wc|471@shb|沈合北|ANK|shenhebei|shb|472@mb|明北|XAO|mingbei|mb|473@hbb|合白北|XXP|hebaibei|hbb|474@djd|大江东|NRF|dajiangdong|djd|475@wm|乌门|FKT|wumen|wm|476@lxn|连兴南|ZAG|lianxingnan|lxn|477@chcx|成化长西|VJG|chenghuachangxi|chcx|478@dx|东西|SMI|dongxi|dx|479@bzd|白圳东|QNU|baizhendong|bzd|480@tcz|天春郑|KTQ|tianchunzheng|tcz|481@yqn|宜齐南|YVO|yiqinan|yqn|482@qs|齐深|NLR|qishen|qs|483@jsb|金沙北|SEC|jinshabei|jsb|484@sln|沙连南|VOM|shaliannan|sln|485@hj|河江|XAJ|hejiang|hj|486@jlq|济岭庆|EGR|jilingqing|jlq|487@sf|沙肥|YJP|shafei|sf|488@csnn|成山宁南|TMZ|chengshanningnan|csnn|489@djb|都江北|XFX|dujiangbei|djb|490@kc|昆成|KEH|kuncheng|kc|491@ash|安石海|SUO|anshihai|ash|492@dqb|大庆北|VEA|daqingbei|dqb|493@xhf|新合福|QNI|xinhefu|xhf|494@jd|家都|QMW|jiadu|jd|495@std|石天德|KHB|shitiande|std|496@bs|北上|AMX|beishang|bs|497@nz|宁庄|VLP|ningzhuang|nz|498@dz|大圳|WQB|dazhen|dz|499@xxn|厦新南|ATY|xiaxinnan|xxn|500@hx|化兴|YHY|huaxing|hx|501@jkx|家昆西|QNE|jiakunxi|jkx|502@yq|阳庆|VUA|yangqing|yq|503@cjxb|昌家新北|RCO|changjiaxinbei|cjxb|504@zk|庄昆|XPL|zhuangkun|zk|505@jlj|江连济|BLJ|jianglianji|jlj|506@cwx|重武西|QME|chongwuxi|cwx|507@shx|沈湖西|ZGF|shenhuxi|shx|508@ljnn|岭津南南|JSX|lingjinnannan|ljnn|509@hjsb|杭江山北|ZTW|hangjiangshanbei|hjsb|510@sdb|深东白|PJA|shendongbai|sdb|511@lh|林哈|DNX|linha|lh|512@shx|山杭西|MFH|shanhangxi|shx|513@sxbn|苏兴滨南|ORG|suxingbinnan|sxbn|514@hl|化林|AAZ|hualin|hl|515@dn|岛宁|XWH|daoning|dn|516@qdj|青东家|GQZ|qingdongjia|qdj|517@gmn|贵门南|BTE|guimennan|gmn|518@ljb|连京北|XPF|lianjingbei|ljb|519@jb|家白|PQY|jiabai|jb|520@gpw|贵平乌|HTW|guipingwu|gpw|521@hhzx|杭合庄西|TCA|hanghezhuangxi|hhzx|522@pbbb|平滨北北|RCZ|pingbinbeibei|pbbb|523@xgn|兴贵南|ZTE|xingguinan|xgn|524@zz|郑州|KYU|zhengzhou|zz|525@azmx|安郑明西|EUM|anzhengmingxi|azmx|526@hhtb|海杭天北|GXX|haihangtianbei|hhtb|527@sxn|苏新南|VPW|suxinnan|sxn|528@zbt|圳北天|QKM|zhenbeitian|zbt|529@asb|安苏北|CFF|ansubei|asb|530@zd|州东|KEU|zhoudong|zd|531@zjlx|州京兰西|UWE|zhoujinglanxi|zjlx|532@zs|圳苏|UTR|zhensu|zs|533@dcd|大春东|XPD|dachundong|dcd|534@ba|滨安|VNI|binan|ba|535@cjxx|城家兴西|QWG|chengjiaxingxi|cjxx|536@bjc|白京重|DWU|baijingchong|bjc|537@hqd|杭青东|YHU|hangqingdong|hqd|538@ym|宜明|IFB|yiming|ym|539@dcx|都重西|ZUZ|duchongxi|dcx|540@xdn|新岛南|UQV|xindaonan|xdn|541@jk|金口|JZS|jinkou|jk|542@hjn|合家南|WXO|hejianan|hjn|543@hld|化兰东|BXV|hualandong|hld|544@ccbx|城成北西|HPS|chengchengbeixi|ccbx|545@dm|岛明|DIM|daoming|dm|546@lldb|岭兰大北|ZFH|linglandabei|lldb|547@sdy|沙大宜|WYU|shadayi|sdy|548@jszx|金沙州西|UPW|jinshazhouxi|jszx|549@sl|石兰|TGH|shilan|sl|550@ldn|兰都南|SZP|landunan|ldn|551@mzln|门州连南|DSK|menzhouliannan|mzln|552@dbd|德滨东|DRX|debindong|dbd|553@zcs|庄长深|LGS|zhuangchangshen|zcs|554@shb|深汉北|UTC|shenhanbei|shb|555@jw|津武|GRM|jinwu|jw|556@xzx|新州西|ZXW|xinzhouxi|xzx|557@xs|厦上|JEB|xiashang|xs|558@jk|京口|UAP|jingkou|jk|559@jz|津圳|FDH|jinzhen|jz|560@jh|家杭|AWY|jiahang|jh|561@ssd|上石东|RCS|shangshidong|ssd|562@mszb|明沈州北|ITA|mingshenzhoubei|mszb|563@tskd|太山口东|VWE|taishankoudong|tskd|564@cj|昌金|GWE|changjin|cj|565@stx|沙太西|UQE|shataixi|stx|566@bkj|北昆家|IVH|beikunjia|bkj|567@gms|广木沙|UAS|guangmusha|gms|568@qsz|齐苏圳|NTG|qisuzhen|qsz|569@xdhn|新都哈南|JFN|xinduhanan|xdhn|570@hccx|杭重重西|OYX|hangchongchongxi|hccx|571@msn|门沙南|UAC|menshanan|msn|572@qen|庆尔南|LBE|qingernan|qen|573@hwsn|汉乌深南|GXR|hanwushennan|hwsn|574@hmn|海明南|INW|haimingnan|hmn|575@gj|广金|ERH|guangjin|gj|576@tm|太门|HRR|taimen|tm|577@cyn|城宜南|KYZ|chengyinan|cyn|578@kyx|口阳西|ZAA|kouyangxi|kyx|579@hnd|海宁东|HRI|hainingdong|hnd|580@hdn|化岛南|GKB|huadaonan|hdn|581@zfn|庄肥南|WET|zhuangfeinan|zfn|582@zc|圳昌|VZL|zhenchang|zc|583@jzb|家庄北|NSA|jiazhuangbei|jzb|584@jzfb|京圳肥北|MGQ|jingzhenfeibei|jzfb|585@szn|上庄南|QTO|shangzhuangnan|szn|586@xxq|新西庆|WLK|xinxiqing|xxq|587@jnn|金南南|NHK|jinnannan|jnn|588@dsx|东山西|YNR|dongshanxi|dsx|589@dj|岛京|UOV|daojing|dj|590@hcb|河长北|EPX|hechangbei|hcb|591@zcn|郑春南|KGD|zhengchunnan|zcn|592@clk|长岭口|NRY|changlingkou|clk|593@ft|肥太|OXZ|feitai|ft|594@hz|杭州|ZCQ|hangzhou|hz|595@ljn|岭金南|UBM|lingjinnan|ljn|596@sttd|苏天天东|VAR|sutiantiandong|sttd|597@ydx|原大西|YNV|yuandaxi|ydx|598@xq|兴泉|DAC|xingquan|xq|599@gx|贵厦|VBL|guixia|gx|600@lkn|岭口南|EOG|lingkounan|lkn|601@mdnx|门大宁西|TRW|mendaningxi|mdnx|602@hszd|化苏圳东|SBL|huasuzhendong|hszd|603@zcd|庄城东|CMO|zhuangchengdong|zcd|604@hshd|化上湖东|XTY|huashanghudong|hshd|605@lcdn|岭城东南|YUA|lingchengdongnan|lcdn|606@dc|德成|LJN|decheng|dc|607@nn|南南|GZI|nannan|nn|608@sxn|石兴南|CPJ|shixingnan|sxn|609@chzb|城海州北|PHW|chenghaizhoubei|chzb|610@dmxn|德门厦南|NOC|demenxianan|dmxn|611@hgn|化广南|MGK|huaguangnan|hgn|612@cjcd|成金昌东|GZU|chengjinchangdong|cjcd|613@hxx|湖新西|ACH|huxinxi|hxx|614@hj|湖津|XUP|hujin|hj|615@qxq|庆厦庆|XAE|qingxiaqing|qxq|616@jx|江西|MDD|jiangxi|jx|617@tsz|天苏州|EIK|tiansuzhou|tsz|618@cx|春新|MVR|chunxin|cx|619@jdd|金德东|UWA|jindedong|jdd|620@hlb|化林北|VLS|hualinbei|hlb|621@sc|上长|ENI|shangchang|sc|622@qwn|庆乌南|UUZ|qingwunan|qwn|623@jy|江原|BDN|jiangyuan|jy|624@ch|长杭|DRZ|changhang|ch|625@nz|南圳|BJT|nanzhen|nz|626@kcz|口重州|JEI|kouchongzhou|kcz|627@ysd|原深东|TIQ|yuanshendong|ysd|628@yh|阳化|PKO|yanghua|yh|629@lbn|连滨南|DYE|lianbinnan|lbn|630@dt|德太|FIH|detai|dt|631@ktxb|昆天兴北|CJJ|kuntianxingbei|ktxb|632@zhx|圳海西|JOZ|zhenhaixi|zhx|633@lkbx|连口北西|VHB|liankoubeixi|lkbx|634@jzq|京庄泉|LUK|jingzhuangquan|jzq|635@jjsx|家金深西|IUN|jiajinshenxi|jjsx|636@mqs|明齐苏|CBW|mingqisu|mqs|637@dnn|都南南|MIP|dunannan|dnn|638@cqjb|重庆津北|JBX|chongqingjinbei|cqjb|639@dmx|岛明西|NOQ|daomingxi|dmx|640@htcn|海天成南|PKC|haitianchengnan|htcn|641@sjdx|沙京东西|AAQ|shajingdongxi|sjdx|642@ahzd|安合庄东|OYY|anhezhuangdong|ahzd|643@szx|石州西|URL|shizhouxi|szx|644@zdd|郑都都|IXS|zhengdudu|zdd|645@xcd|新昌东|TWE|xinchangdong|xcd|646@yjd|宜金东|ZYW|yijindong|yjd|647@mxtb|木新太北|FFY|muxintaibei|mxtb|648@zzb|郑郑北|VHQ|zhengzhengbei|zzb|649@ctd|春太东|OQQ|chuntaidong|ctd|650@djl|大金连|WWS|dajinlian|djl|651@dm|都门|PEP|dumen|dm|652@sch|深长湖|IGU|shenchanghu|sch|653@web|武尔滨|UDD|wuerbin|web|654@sjx|石济西|MOP|shijixi|sjx|655@xjn|兴江南|CTV|xingjiangnan|xjn|656@ykb|原昆北|SDD|yuankunbei|ykb|657@dqdb|岛庆大北|QOF|daoqingdabei|dqdb|658@zxd|州新东|LRX|zhouxindong|zxd|659@bc|滨昌|KQY|binchang|bc|660@hd|湖岛|FCN|hudao|hd|661@qdd|庆德东|BCR|qingdedong|qdd|662@sd|苏东|SYI|sudong|sd|663@jqd|济青东|RKO|jiqingdong|jqd|664@ck|春昆|LVK|chunkun|ck|665@kjj|口京京|IRV|koujingjing|kjj|666@cwb|城武北|DEM|chengwubei|cwb|667@acn|安成南|OCU|anchengnan|acn|668@xqn|兴庆南|RJV|xingqingnan|xqn|669@hhx|化哈西|IPR|huahaxi|hhx|670@cqb|长齐北|ULR|changqibei|cqb|671@hxn|哈新南|QJK|haxinnan|hxn|672@nyn|南宜南|QOU|nanyinan|nyn|673@xt|兴天|HGD|xingtian|xt|674@ta|太安|HJU|taian|ta|675@hwb|化武北|DTA|huawubei|hwb|676@yqsd|原泉上东|RBC|yuanquanshangdong|yqsd|677@etbd|尔天白东|LKU|ertianbaidong|etbd|678@jhx|京海西|XQJ|jinghaixi|jhx|679@mggn|门广贵南|CAG|menguangguinan|mggn|680@gd|广大|VNT|guangda|gd|681@yh|原湖|IGI|yuanhu|yh|682@wc|武重|MRH|wuchong|wc|683@jh|济湖|TGS|jihu|jh|684@bsd|滨上东|UMZ|binshangdong|bsd|685@lz|连郑|SWV|lianzheng|lz|686@qjwn|泉江武南|ETW|quanjiangwunan|qjwn|687@cmjx|成门江西|XAY|chengmenjiangxi|cmjx|688@gzb|广圳北|QCG|guangzhenbei|gzb|689@dsz|德沈庄|JGO|deshenzhuang|dsz|690@mc|明城|FRY|mingcheng|mc|691@sjb|苏济北|APB|sujibei|sjb|692@xhb|新合北|GLD|xinhebei|xhb|693@hhmx|化杭明西|PET|huahangmingxi|hhmx|694@jxx|家新西|FNG|jiaxinxi|jxx|695@bjdb|滨济大北|RCH|binjidabei|bjdb|696@mcn|木昌南|ECE|muchangnan|mcn|697@xkjx|新昆江西|OQM|xinkunjiangxi|xkjx|698@tlh|太连哈|DSI|tailianha|tlh|699@fs|肥苏|ICF|feisu|fs|700@hc|合春|DCL|hechun|hc|701@js|江深|LPT|jiangshen|js|702@jxx|京新西|QRO|jingxinxi|jxx|703@mwb|门武白|LJU|menwubai|mwb|704@qj|庆济|VKZ|qingji|qj|705@jz|江郑|AFJ|jiangzheng|jz|706@zlhn|郑林海南|NPE|zhenglinhainan|zlhn|707@ll|岭兰|DSM|linglan|ll|708@hcb|杭昌北|CIL|hangchangbei|hcb|709@zbln|郑白岭南|PAS|zhengbailingnan|zbln|710@zhb|庄化北|VDN|zhuanghuabei|zhb|711@nqb|南泉北|MDU|nanquanbei|nqb|712@lcs|林重山|WWA|linchongshan|lcs|713@he|化尔|IIU|huaer|he|714@ysn|宜上南|AQI|yishangnan|ysn|715@ltb|连太北|PDE|liantaibei|ltb|716@bk|北昆|WRH|beikun|bk|717@jld|金连东|BBF|jinliandong|jld|718@gmx|贵明西|BUQ|guimingxi|gmx|719@jmj|江木京|AHZ|jiangmujing|jmj|720@zcn|圳昌南|CIU|zhenchangnan|zcn|721@sk|上口|MGO|shangkou|sk|722@chn|春湖南|QRT|chunhunan|chn|723@cb|昌滨|ZAS|changbin|cb|724@jx|江兴|OKF|jiangxing|jx|725@dwj|岛乌江|LPG|daowujiang|dwj|726@cg|长贵|AHE|changgui|cg|727@xjs|新金沙|RNN|xinjinsha|xjs|728@gsn|贵沈南|VKF|guishennan|gsn|729@fqd|肥泉东|UBT|feiquandong|fqd|730@bh|北哈|XZE|beiha|bh|731@ycnn|原昌宁南|HUJ|yuanchangningnan|ycnn|732@cmcd|昌明春东|BJD|changmingchundong|cmcd|733@gd|广都|LRY|guangdu|gd|734@sk|石昆|IJO|shikun|sk|735@qtb|泉天北|BOM|quantianbei|qtb|736@mhn|木海南|PDJ|muhainan|mhn|737@cs|城沈|GBB|chengshen|cs|738@fen|福尔南|TVX|fuernan|fen|739@hhy|杭河阳|IDC|hangheyang|hhy|740@jjd|济金东|KBU|jijindong|jjd|741@sf|山福|WBA|shanfu|sf|742@jt|家太|WOM|jiatai|jt|743@xmn|新明南|NPM|xinmingnan|xmn|744@ec|尔成|JKD|ercheng|ec|745@xqc|兴泉重|MZL|xingquanchong|xqc|746@fmkx|福明口西|HOB|fumingkouxi|fmkx|747@hdhx|海都河西|RMA|haiduhexi|hdhx|748@hn|合南|GFF|henan|hn|749@hz|杭圳|ESB|hangzhen|hz|750@ld|岭德|GWP|lingde|ld|751@sb|深滨|WQZ|shenbin|sb|752@jczn|江昌郑南|UDX|jiangchangzhengnan|jczn|753@ksd|口石东|DBJ|koushidong|ksd|754@ls|兰沈|ALO|lanshen|ls|755@jagx|济安贵西|UVP|jianguixi|jagx|756@spb|沈平北|AJC|shenpingbei|spb|757@qhd|泉杭东|BEL|quanhangdong|qhd|758@lhjx|兰杭家西|YHI|lanhangjiaxi|lhjx|759@zz|庄圳|QRS|zhuangzhen|zz|760@jld|江林东|VVW|jianglindong|jld|761@hxd|合厦东|RQT|hexiadong|hxd|762@jld|津岭东|JQY|jinlingdong|jld|763@kyx|口宜西|FFB|kouyixi|kyx|764@shq|苏河庆|HHM|suheqing|shq|765@xj|兴家|EIZ|xingjia|xj|766@dcx|德长西|GHN|dechangxi|dcx|767@jn|济南|XSX|jinan|jn|768@qxj|青厦金|OVO|qingxiajin|qxj|769@wen|武尔南|GDL|wuernan|wen|770@hbx|湖白西|VAJ|hubaixi|hbx|771@cncn|昌南春南|GYY|changnanchunnan|cncn|772@hn|杭宁|IWK|hangning|hn|773@hq|湖庆|CXB|huqing|hq|774@nsn|宁山南|BEV|ningshannan|nsn|775@jb|津白|TWS|jinbai|jb|776@xjx|兴家西|CJV|xingjiaxi|xjx|777@fql|福泉岭|RED|fuquanling|fql|778@ystb|原山天北|LFN|yuanshantianbei|ystb|779@sl|山兰|PJT|shanlan|sl|780@hsb|杭沙北|ZYZ|hangshabei|hsb|781@dbn|东北南|SVS|dongbeinan|dbn|782@zssd|郑山山东|WIB|zhengshanshandong|zssd|783@lkf|连昆福|LFK|liankunfu|lkf|784@jzb|京郑北|HRX|jingzhengbei|jzb|785@ys|宜深|LVP|yishen|ys|786@hm|汉木|RAV|hanmu|hm|787@sbq|沈白泉|WHC|shenbaiquan|sbq|788@zjt|圳家天|OLA|zhenjiatian|zjt|789@dtsd|东太沙东|UPB|dongtaishadong|dtsd|790@mkb|明口北|WQM|mingkoubei|mkb|791@lynn|林宜南南|IMU|linyinannan|lynn|792@wn|武宁|KUB|wuning|wn|793@cshb|城深河北|EQM|chengshenhebei|cshb|794@sb|山北|EME|shanbei|sb|795@jcx|京昌西|EJL|jingchangxi|jcx|796@gy|贵阳|KGG|guiyang|gy|797@ml|木林|RFQ|mulin|ml|798@yj|阳江|WMT|yangjiang|yj|799@yll|阳兰林|QNW|yanglanlin|yll|800@bld|白连东|PEY|bailiandong|bld|801@xg|新贵|TOW|xingui|xg|802@qgqn|庆广青南|OXE|qingguangqingnan|qgqn|803@fcx|福长西|VZQ|fuchangxi|fcx|804@wqb|武齐北|BFF|wuqibei|wqb|805@sjb|沈金北|HDM|shenjinbei|sjb|806@sj|沙津|OAH|shajin|sj|807@qs|庆山|VKY|qingshan|qs|808@zs|庄沈|QQR|zhuangshen|zs|809@xgd|新贵东|CCT|xinguidong|xgd|810@js|江沈|EBR|jiangshen|js|811@wbn|乌北南|DFV|wubeinan|wbn|812@df|大福|VSL|dafu|df|813@nzbd|宁州滨东|VYG|ningzhoubindong|nzbd|814@dlhx|岛兰河西|SYF|daolanhexi|dlhx|815@lz|连圳|VAI|lianzhen|lz|816@ztjd|州天京东|PQP|zhoutianjingdong|ztjd|817@hch|化城湖|ATI|huachenghu|hch|818@sj|石江|KJG|shijiang|sj|819@ykj|原口江|NMP|yuankoujiang|ykj|820@cc|昌城|WFC|changcheng|cc|821@sb|沙白|IRS|shabai|sb|822@yqd|宜齐东|BDM|yiqidong|yqd|823@cbgb|城北贵北|PSI|chengbeiguibei|cbgb|824@jcb|津春北|YVM|jinchunbei|jcb|825@jcb|济城北|FZI|jichengbei|jcb|826@hfn|哈福南|YVP|hafunan|hfn|827@hjb|化津北|YEP|huajinbei|hjb|828@xl|厦林|GFE|xialin|xl|829@zhx|庄哈西|KMO|zhuanghaxi|zhx|830@zq|州泉|GPM|zhouquan|zq|831@dgdb|德贵都北|CPA|deguidubei|dgdb|832@dhn|大哈南|RPK|dahanan|dhn|833@bf|北福|XUB|beifu|bf|834@jl|金连|GDS|jinlian|jl|835@ah|安海|OKA|anhai|ah|836@cdfx|长东肥西|PSX|changdongfeixi|cdfx|837@zq|圳泉|RUA|zhenquan|zq|838@shn|苏河南|KVR|suhenan|shn|839@agj|安贵济|MSC|anguiji|agj|840@kc|昆重|OYM|kunchong|kc|841@bsex|白沙尔西|AKC|baishaerxi|bsex|842@twb|太武北|WZX|taiwubei|twb|843@fy|肥阳|YFR|feiyang|fy|844@lex|连尔西|SJK|lianerxi|lex|845@xzn|新郑南|THV|xinzhengnan|xzn|846@bcd|白重东|ENC|baichongdong|bcd|847@ss|上苏|YIO|shangsu|ss|848@sfjx|苏肥津西|RGJ|sufeijinxi|sfjx|849@zqb|州青北|MGS|zhouqingbei|zqb|850@hl|汉岭|VBN|hanling|hl|851@xfwb|兴福武北|BXU|xingfuwubei|xfwb|852@sz|沈庄|PDL|shenzhuang|sz|853@qx|青西|QEA|qingxi|qx|854@anhx|安南哈西|HSQ|annanhaxi|anhx|855@azn|安圳南|HHZ|anzhennan|azn|856@zbb|郑滨北|NOI|zhengbinbei|zbb|857@smx|上门西|OGF|shangmenxi|smx|858@qlb|齐兰北|WUO|qilanbei|qlb|859@chn|重河南|GOO|chonghenan|chn|860@yblb|阳白连北|PLO|yangbailianbei|yblb|861@hnj|河宁江|ZXP|heningjiang|hnj|862@zgd|州贵都|MHG|zhouguidu|zgd|863@bqhx|滨齐湖西|ONV|binqihuxi|bqhx|864@hc|汉长|JUF|hanchang|hc|865@hg|哈广|HQJ|haguang|hg|866@hzd|海庄东|MIU|haizhuangdong|hzd|867@kjb|昆济北|BWC|kunjibei|kjb|868@gdx|广都西|EQS|guangduxi|gdx|869@tcn|太重南|SLP|taichongnan|tcn|870@dlx|德兰西|EDV|delanxi|dlx|871@shhb|沈杭杭北|NDT|shenhanghangbei|shhb|872@qf|齐肥|LKN|qifei|qf|873@sfn|山福南|FDB|shanfunan|sfn|874@xh|新合|WNN|xinhe|xh|875@tqd|天齐东|MXK|tianqidong|tqd|876@qhs|青海沙|LJD|qinghaisha|qhs|877@ckdd|春口大东|AYX|chunkoudadong|ckdd|878@csdx|重上大西|RDD|chongshangdaxi|csdx|879@yax|阳安西|GNC|yanganxi|yax|880@bydb|滨宜都北|QHP|binyidubei|bydb|881@sln|沙岭南|ZWZ|shalingnan|sln|882@ts|天沈|WUA|tianshen|ts|883@ylmx|宜林明西|EUH|yilinmingxi|ylmx|884@tmd|天门东|PNB|tianmendong|tmd|885@mlj|木连江|WFH|mulianjiang|mlj|886@ahq|安汉青|WRA|anhanqing|ahq|887@dz|岛庄|NYB|daozhuang|dz|888@zfsx|郑福深西|UXW|zhengfushenxi|zfsx|889@xkb|厦口北|XEA|xiakoubei|xkb|890@wjx|乌京西|YXW|wujingxi|wjx|891@szlb|深州林北|IBD|shenzhoulinbei|szlb|892@bhx|北杭西|PTQ|beihangxi|bhx|893@jeb|家尔北|HNF|jiaerbei|jeb|894@xhh|新汉湖|GUP|xinhanhu|xhh|895@hmn|海门南|IUO|haimennan|hmn|896@lj|岭京|UIK|lingjing|lj|897@emcx|尔木城西|TRY|ermuchengxi|emcx|898@ddh|东东杭|VDJ|dongdonghang|ddh|899@syqd|苏原庆东|ZWY|suyuanqingdong|syqd|900@zn|圳南|IKJ|zhennan|zn|901@bs|白石|LZL|baishi|bs|902@jz|家郑|SAU|jiazheng|jz|903@kj|口家|IEZ|koujia|kj|904@ysd|阳山东|ETX|yangshandong|ysd|905@dcd|东城东|CAV|dongchengdong|dcd|906@dhxn|岛杭西南|TBS|daohangxinan|dhxn|907@zg|州贵|XGO|zhougui|zg|908@xhx|厦汉西|JEQ|xiahanxi|xhx|909@qw|青乌|NLD|qingwu|qw|910@xxb|西新北|WXX|xixinbei|xxb|911@wh|武化|WKA|wuhua|wh|912@gh|贵哈|DLN|guiha|gh|913@hld|海连岛|VKM|hailiandao|hld|914@fdd|福东东|GHE|fudongdong|fdd|915@lpb|连平北|FCB|lianpingbei|lpb|916@wax|乌安西|MAP|wuanxi|wax|917@hqs|汉庆山|ZAV|hanqingshan|hqs|918@hh|汉杭|FEA|hanhang|hh|919@th|太海|TMP|taihai|th|920@jahd|江安汉东|BLK|jianganhandong|jahd|921@sgd|石广东|TPP|shiguangdong|sgd|922@ffn|福福南|QZQ|fufunan|ffn|923@bs|白沈|LYV|baishen|bs|924@gjt|贵京天|HVL|guijingtian|gjt|925@jpn|江平南|YKF|jiangpingnan|jpn|926@cjb|春江北|FYQ|chunjiangbei|cjb|927@cc|长城|FUV|changcheng|cc|928@xb|新滨|DZN|xinbin|xb|929@eqn|尔泉南|GAV|erquannan|eqn|930@hjkd|汉津口东|TZZ|hanjinkoudong|hjkd|931@pf|平福|QOM|pingfu|pf|932@ct|长天|VLK|changtian|ct|933@xsx|西沈西|KCW|xishenxi|xsx|934@zzb|圳圳北|JFY|zhenzhenbei|zzb|935@lqn|连青南|DUN|lianqingnan|lqn|936@deb|东尔北|RZS|dongerbei|deb|937@nh|宁河|XBN|ninghe|nh|938@mkb|木口北|RRT|mukoubei|mkb|939@hwd|杭乌东|PFR|hangwudong|hwd|940@hndx|杭南东西|ERQ|hangnandongxi|hndx|941@cs|长山|YUQ|changshan|cs|942@xzt|兴州天|MNQ|xingzhoutian|xzt|943@cm|长木|YPS|changmu|cm|944@ewh|尔乌杭|YEZ|erwuhang|ewh|945@he|汉尔|ARQ|haner|he|946@jjb|济津滨|SRE|jijinbin|jjb|947@qhb|泉合北|GOI|quanhebei|qhb|948@xsj|新沈家|FIG|xinshenjia|xsj|949@blwx|白连乌西|IVS|bailianwuxi|blwx|950@bpf|滨平福|FLP|binpingfu|bpf|951@khn|昆化南|RQF|kunhuanan|khn|952@wd|乌岛|ALZ|wudao|wd|953@dzn|都州南|OMS|duzhounan|dzn|954@hsn|化山南|OQA|huashannan|hsn|955@hkd|汉昆东|OEU|hankundong|hkd|956@zh|郑合|OXP|zhenghe|zh|957@xbx|兴白西|QNV|xingbaixi|xbx|958@hsqd|化苏齐东|CMG|huasuqidong|hsqd|959@fwd|福武东|DZG|fuwudong|fwd|960@pcxx|平春厦西|WRB|pingchunxiaxi|pcxx|961@pcgd|平昌广东|VEC|pingchangguangdong|pcgd|962@gzqb|广圳青北|GUG|guangzhenqingbei|gzqb|963@jhk|京河口|HRY|jinghekou|jhk|964@chq|昌化齐|WQC|changhuaqi|chq|965@sh|深杭|TFN|shenhang|sh|966@hj|哈金|DYN|hajin|hj|967@sjq|山济齐|NOE|shanjiqi|sjq|968@yyhn|阳原河南|VVT|yangyuanhenan|yyhn|969@gacd|广安长东|OYL|guanganchangdong|gacd|970@qj|庆京|NNL|qingjing|qj|971@ydx|阳东西|XPH|yangdongxi|ydx|972@hhq|河汉庆|NKN|hehanqing|hhq|973@hl|汉兰|HEA|hanlan|hl|974@sjkd|沙家口东|OLE|shajiakoudong|sjkd|975@hlk|杭兰口|UJF|hanglankou|hlk|976@slsb|沈岭沙北|XLL|shenlingshabei|slsb|977@zdd|郑德东|BRH|zhengdedong|zdd|978@nm|宁明|ABZ|ningming|nm|979@yzf|阳庄福|IAE|yangzhuangfu|yzf|980@yjhb|阳济杭北|MQI|yangjihangbei|yjhb|981@znb|郑宁北|DLS|zhengningbei|znb|982@hzqn|哈庄青南|OOG|hazhuangqingnan|hzqn|983@nzn|南庄南|ZHK|nanzhuangnan|nzn|984@bjn|北家南|FTW|beijianan|bjn|985@jyfd|江宜肥东|CYX|jiangyifeidong|jyfd|986@qshn|庆苏杭南|GLU|qingsuhangnan|qshn|987@sjbd|苏家白东|EVB|sujiabaidong|sjbd|988@ycdx|宜成东西|VAK|yichengdongxi|ycdx|989@wzdd|乌圳都东|EOC|wuzhendudong|wzdd|990@kjd|昆济岛|GFH|kunjidao|kjd|991@th|天海|ISZ|tianhai|th|992@sct|深城太|SDR|shenchengtai|sct|993@jj|家京|QDU|jiajing|jj|994@ddb|德都北|XGS|dedubei|ddb|995@dzn|大圳南|RGX|dazhennan|dzn|996@lj|林家|LPP|linjia|lj|997@sz|深郑|EBI|shenzheng|sz|998@szdx|石郑大西|PQC|shizhengdaxi|szdx|999@wlx|武岭西|WAI|wulingxi|wlx|1000@yyjb|宜阳江北|AJF|yiyangjiangbei|yyjb|1001@xxx|兴厦西|DYW|xingxiaxi|xxx|1002@wc|武成|YUJ|wucheng|wc|1003@lns|连南石|SZB|liannanshi|lns|1004@mqb|明泉北|PXN|mingquanbei|mqb|1005@cld|昌林东|WPL|changlindong|cld|1006@ms|木石|KZR|mushi|ms|1007@bd|北都|YNS|beidu|bd|1008@zcqx|庄长庆西|RBE|zhuangchangqingxi|zcqx|1009@dwn|岛乌南|XHG|daowunan|dwn|1010@jwd|京乌东|CQH|jingwudong|jwd|1011@lg|连贵|DZZ|liangui|lg|1012@nmd|宁木东|WMN|ningmudong|nmd|1013@tnq|太宁庆|ZGC|tainingqing|tnq|1014@szc|沈州重|CYB|shenzhouchong|szc|1015@hj|化江|CRU|huajiang|hj|1016@djd|大家东|YQF|dajiadong|djd|1017@dnqb|东宁齐北|AOV|dongningqibei|dnqb|1018@jjb|津家北|BBL|jinjiabei|jjb|1019@lwb|林武北|GNI|linwubei|lwb|1020@ql|泉岭|BYM|quanling|ql|1021@wmy|乌木阳|EHQ|wumuyang|wmy|1022@zhn|郑河南|GVX|zhenghenan|zhn|1023@glx|广兰西|PZI|guanglanxi|glx|1024@kcc|口昌春|VHP|kouchangchun|kcc|1025@splx|石平兰西|YHH|shipinglanxi|splx|1026@sdx|苏东西|OYU|sudongxi|sdx|1027@lj|岭金|IEL|lingjin|lj|1028@shyb|上哈阳北|VSC|shanghayangbei|shyb|1029@gzlx|贵郑连西|ZRE|guizhenglianxi|gzlx|1030@ksd|口沙东|XEH|koushadong|ksd|1031@xsn|西沙南|DLB|xishanan|xsn|1032@cc|春长|ZZF|chunchang|cc|1033@ysd|阳上东|ECV|yangshangdong|ysd|1034@dzq|东圳青|JVH|dongzhenqing|dzq|1035@hj|湖济|EHH|huji|hj|1036@sq|石庆|GNJ|shiqing|sq|1037@cyd|春阳东|PPB|chunyangdong|cyd|1038@jbd|津北东|HFL|jinbeidong|jbd|1039@cxdb|昌厦大北|ETY|changxiadabei|cxdb|1040@hzb|海郑北|WNT|haizhengbei|hzb|1041@hs|海石|ENP|haishi|hs|1042@whcx|武哈城西|DMI|wuhachengxi|whcx|1043@hls|汉连苏|NZO|hanliansu|hls|1044@szx|苏郑西|LDA|suzhengxi|szx|1045@hsn|杭石南|DDT|hangshinan|hsn|1046@zbx|郑滨西|LHR|zhengbinxi|zbx|1047@hc|汉重|SIW|hanchong|hc|1048@jwb|京乌北|XLD|jingwubei|jwb|1049@nq|南庆|QRR|nanqing|nq|1050@sl|上兰|NVT|shanglan|sl|1051@hsd|汉上东|UGI|hanshangdong|hsd|1052@ck|重昆|IOV|chongkun|ck|1053@dgn|岛贵南|UIW|daoguinan|dgn|1054@mmj|门明金|NGY|menmingjin|mmj|1055@jyb|济宜北|TOX|jiyibei|jyb|1056@ytjn|阳太济南|VVC|yangtaijinan|ytjn|1057@hfh|杭肥哈|VYJ|hangfeiha|hfh|1058@bsd|白苏东|QEE|baisudong|bsd|1059@ezfb|尔郑福北|OKG|erzhengfubei|ezfb|1060@fwx|福乌西|OVN|fuwuxi|fwx|1061@cm|春木|JVZ|chunmu|cm|1062@qq|青庆|STH|qingqing|qq|1063@pcz|平长郑|SDQ|pingchangzheng|pcz|1064@lh|岭杭|JZW|linghang|lh|1065@zxd|郑兴都|OWN|zhengxingdu|zxd|1066@jh|济河|TYN|jihe|jh|1067@bet|北尔太|FNI|beiertai|bet|1068@fwqb|福乌庆北|PQA|fuwuqingbei|fwqb|1069@dhd|德河东|JNZ|dehedong|dhd|1070@smx|沙木西|BIV|shamuxi|smx|1071@jh|江湖|LGW|jianghu|jh|1072@gq|贵庆|NIY|guiqing|gq|1073@xt|兴太|ZST|xingtai|xt|1074@cyx|昌原西|XPT|changyuanxi|cyx|1075@hjh|合金汉|OKX|hejinhan|hjh|1076@bfs|白福深|AHI|baifushen|bfs|1077@xs|厦沙|KRS|xiasha|xs|1078@hqn|哈齐南|MQH|haqinan|hqn|1079@cxh|春西哈|MRA|chunxiha|cxh|1080@shd|深哈东|WNL|shenhadong|shd|1081@ehb|尔湖北|GQI|erhubei|ehb|1082@ch|城哈|YSM|chengha|ch|1083@yqb|原齐北|LWD|yuanqibei|yqb|1084@slb|上林北|YWI|shanglinbei|slb|1085@znx|州南西|PBM|zhounanxi|znx|1086@jh|津海|PRE|jinhai|jh|1087@mhcb|木合城北|SPJ|muhechengbei|mhcb|1088@klk|口兰口|LKK|koulankou|klk|1089@bchx|滨城化西|RCQ|binchenghuaxi|bchx|1090@dw|大武|UYT|dawu|dw|1091@txxd|天厦兴东|YKR|tianxiaxingdong|txxd|1092@dq|德青|HXD|deqing|dq|1093@wcn|武重南|VGB|wuchongnan|wcn|1094@qcqn|齐成泉南|ARF|qichengquannan|qcqn|1095@wcd|乌城东|ZMR|wuchengdong|wcd|1096@jbhx|金滨汉西|PMU|jinbinhanxi|jbhx|1097@jmx|津门西|PKU|jinmenxi|jmx|1098@dh|东河|YEN|donghe|dh|1099@ax|安厦|PCX|anxia|ax|1100@jl|家岭|MTN|jialing|jl|1101@bc|北昌|BCN|beichang|bc|1102@mbk|明白口|FXS|mingbaikou|mbk|1103@sd|沈德|LBX|shende|sd|1104@sxd|沙西东|VGF|shaxidong|sxd|1105@dcad|都重安东|FPB|duchongandong|dcad|1106@lxyx|兰兴宜西|LVI|lanxingyixi|lxyx|1107@byqx|北宜齐西|ZQG|beiyiqixi|byqx|1108@hxx|化兴西|FCZ|huaxingxi|hxx|1109@jncd|家宁春东|GUU|jianingchundong|jncd|1110@dj|东京|MKL|dongjing|dj|1111@hsx|汉沈西|UTJ|hanshenxi|hsx|1112@jhsb|济湖沙北|SJG|jihushabei|jhsb|1113@czd|成州东|MCJ|chengzhoudong|czd|1114@hjn|化江南|LZT|huajiangnan|hjn|1115@sxzx|苏西庄西|ALF|suxizhuangxi|sxzx|1116@cmn|成木南|IEE|chengmunan|cmn|1117@yxx|原兴西|PQQ|yuanxingxi|yxx|1118@hj|合家|WAB|hejia|hj|1119@xjn|厦济南|FPG|xiajinan|xjn|1120@hj|汉江|MQP|hanjiang|hj|1121@ctn|成太南|VBA|chengtainan|ctn|1122@chn|重杭南|OYI|chonghangnan|chn|1123@lxn|岭新南|EGQ|lingxinnan|lxn|1124@dh|德哈|AQN|deha|dh|1125@jzn|江庄南|PFP|jiangzhuangnan|jzn|1126@lm|林明|ORT|linming|lm|1127@yq|宜泉|KZV|yiquan|yq|1128@nkx|南口西|QDK|nankouxi|nkx|1129@bzlb|白州林北|LBN|baizhoulinbei|bzlb|1130@qfd|齐肥东|SZQ|qifeidong|qfd|1131@ggq|广广庆|ZCR|guangguangqing|ggq|1132@jgb|津贵北|QIJ|jinguibei|jgb|1133@sjx|石江西|HRW|shijiangxi|sjx|1134@dm|岛木|RAN|daomu|dm|1135@lcb|林长北|WTO|linchangbei|lcb|1136@kqd|口青东|WVQ|kouqingdong|kqd|1137@dzx|都郑西|TJO|duzhengxi|dzx|1138@cxs|昌新沙|YLZ|changxinsha|cxs|1139@syzn|沈原州南|TZS|shenyuanzhounan|syzn|1140@hsz|合苏庄|JHU|hesuzhuang|hsz|1141@dmn|东明宁|VDY|dongmingning|dmn|1142@qwcd|泉武重东|YPX|quanwuchongdong|qwcd|1143@dyd|德阳东|VDM|deyangdong|dyd|1144@nfb|南肥北|XDS|nanfeibei|nfb|1145@xxsx|厦新沙西|QAS|xiaxinshaxi|xxsx|1146@qhdn|齐化大南|ZDH|qihuadanan|qhdn|1147@csjn|昌上济南|NVX|changshangjinan|csjn|1148@qcn|泉长南|ABV|quanchangnan|qcn|1149@hhx|杭合西|CSO|hanghexi|hhx|1150@ls|连山|FHK|lianshan|ls|1151@wcsd|武城山东|AAI|wuchengshandong|wcsd|1152@xhw|西哈乌|AED|xihawu|xhw|1153@hc|哈昌|IJV|hachang|hc|1154@xqw|厦庆乌|DCI|xiaqingwu|xqw|1155@zd|郑都|PWZ|zhengdu|zd|1156@xc|西成|LFU|xicheng|xc|1157@hfd|汉福东|KIH|hanfudong|hfd|1158@sh|沈合|UEV|shenhe|sh|1159@tmd|天木东|JHW|tianmudong|tmd|1160@jcd|济重东|GKN|jichongdong|jcd|1161@bfn|滨肥南|TYD|binfeinan|bfn|1162@ccx|重城西|ODN|chongchengxi|ccx|1163@tbjb|太白京北|KCT|taibaijingbei|tbjb|1164@djd|大津东|UQU|dajindong|djd|1165@thx|天湖西|DRA|tianhuxi|thx|1166@xdl|兴东连|RTB|xingdonglian|xdl|1167@gqyd|贵庆阳东|TFD|guiqingyangdong|gqyd|1168@mhd|木杭东|OOZ|muhangdong|mhd|1169@wa|乌安|ZQB|wuan|wa|1170@lb|林滨|EIT|linbin|lb|1171@czx|春郑西|NME|chunzhengxi|czx|1172@smx|沙明西|WLH|shamingxi|smx|1173@dqn|德齐南|EAN|deqinan|dqn|1174@gjb|广津北|BUH|guangjinbei|gjb|1175@jh|江汉|IYK|jianghan|jh|1176@ncax|南昌安西|TSM|nanchanganxi|ncax|1177@dyd|东宜东|MZN|dongyidong|dyd|1178@chd|成湖东|KBR|chenghudong|chd|1179@pddb|平德东北|AKB|pingdedongbei|pddb|1180@hfx|化肥西|BEX|huafeixi|hfx|1181@deex|岛尔尔西|ZNU|daoererxi|deex|1182@bsn|白深南|IHZ|baishennan|bsn|1183@mmb|木明北|LNQ|mumingbei|mmb|1184@edn|尔德南|YTY|erdenan|edn|1185@mbd|明滨东|SYJ|mingbindong|mbd|1186@hyd|哈阳东|YGQ|hayangdong|hyd|1187@cfb|昌肥北|FAK|changfeibei|cfb|1188@wdh|乌东杭|IYB|wudonghang|wdh|1189@zex|州尔西|ILL|zhouerxi|zex|1190@lhdd|兰杭德东|RDB|lanhangdedong|lhdd|1191@zbn|郑北南|DFJ|zhengbeinan|zbn|1192@jz|江圳|UQQ|jiangzhen|jz|1193@xfsn|兴肥石南|NVD|xingfeishinan|xfsn|1194@lld|连兰东|NYP|lianlandong|lld|1195@dxc|东新城|KKI|dongxincheng|dxc|1196@xz|厦庄|FBR|xiazhuang|xz|1197@sb|山滨|RJO|shanbin|sb|1198@lnxn|林南兴南|FDG|linnanxingnan|lnxn|1199@ndb|南德白|CLJ|nandebai|ndb|1200@hcx|杭昌西|RBD|hangchangxi|hcx|1201@zt|州太|EHL|zhoutai|zt|1202@btn|北天南|PWK|beitiannan|btn|1203@syj|沙原津|NTH|shayuanjin|syj|1204@khyb|昆海原北|KSY|kunhaiyuanbei|khyb|1205@hc|汉昌|XCL|hanchang|hc|1206@dld|岛兰东|FNP|daolandong|dld|1207@ztzd|庄太庄东|HSD|zhuangtaizhuangdong|ztzd|1208@snhd|上宁汉东|MOR|shangninghandong|snhd|1209@hhzb|化湖庄北|QHL|huahuzhuangbei|hhzb|1210@dqf|东齐福|GZT|dongqifu|dqf|1211@mgd|明贵东|LLN|mingguidong|mgd|1212@bx|白新|RZE|baixin|bx|1213@clb|长林北|TQM|changlinbei|clb|1214@whl|武合兰|JDC|wuhelan|whl|1215@xdx|兴东西|AGN|xingdongxi|xdx|1216@egh|尔贵哈|KJV|erguiha|egh|1217@bad|滨安东|YDS|binandong|bad|1218@txsn|天厦深南|WKH|tianxiashennan|txsn|1219@hsd|合上东|PIB|heshangdong|hsd|1220@smx|山明西|TTQ|shanmingxi|smx|1221@cmzn|春木州南|FOF|chunmuzhounan|cmzn|1222@hz|汉州|PID|hanzhou|hz|1223@dq|岛青|BNY|daoqing|dq|1224@dsab|大上安北|ELE|dashanganbei|dsab|1225@kbb|昆白北|UVX|kunbaibei|kbb|1226@ygn|宜贵南|YSN|yiguinan|ygn|1227@jqb|江齐北|OKY|jiangqibei|jqb|1228@zc|圳城|DRF|zhencheng|zc|1229@scx|苏城西|ZZP|suchengxi|scx|1230@qc|泉成|DDM|quancheng|qc|1231@tnd|太宁东|JKA|tainingdong|tnd|1232@hnjb|杭南金北|AOF|hangnanjinbei|hnjb|1233@ypd|阳平东|WMS|yangpingdong|ypd|1234@hzd|化庄东|VQL|huazhuangdong|hzd|1235@afx|安福西|DHL|anfuxi|afx|1236@dcc|东重成|FWB|dongchongcheng|dcc|1237@hd|哈德|MUP|hade|hd|1238@dnc|大宁成|QKD|daningcheng|dnc|1239@dbgd|都滨贵东|OSD|dubinguidong|dbgd|1240@xha|厦海安|TQW|xiahaian|xha|1241@lzb|林庄北|XRK|linzhuangbei|lzb|1242@ldb|连岛北|KLI|liandaobei|ldb|1243@hs|汉沙|XHW|hansha|hs|1244@zxsd|庄厦沙东|PHU|zhuangxiashadong|zxsd|1245@tmb|太明北|DUB|taimingbei|tmb|1246@hqd|哈青岛|EEI|haqingdao|hqd|1247@xqn|西青宁|PTJ|xiqingning|xqn|1248@zhcb|州汉春北|HOQ|zhouhanchunbei|zhcb|1249@zld|郑连东|EWW|zhengliandong|zld|1250@bl|白林|BSO|bailin|bl|1251@ycb|原春北|VAD|yuanchunbei|ycb|1252@jh|京哈|INQ|jingha|jh|1253@yz|原郑|VTH|yuanzheng|yz|1254@jq|家庆|RTZ|jiaqing|jq|1255@add|安德东|FGJ|andedong|add|1256@lla|岭连安|RMB|linglianan|lla|1257@jh|京汉|XFW|jinghan|jh|1258@hnn|河宁南|HDK|heningnan|hnn|1259@qdn|泉东南|YQB|quandongnan|qdn|1260@hscb|哈沈长北|NLI|hashenchangbei|hscb|1261@ghbx|贵汉滨西|JZN|guihanbinxi|ghbx|1262@ddd|岛大东|YWJ|daodadong|ddd|1263@cy|长原|YBB|changyuan|cy|1264@hzn|汉庄南|CFI|hanzhuangnan|hzn|1265@cy|城原|AAD|chengyuan|cy|1266@cmjx|长门金西|PCV|changmenjinxi|cmjx|1267@zxn|郑厦南|NEG|zhengxianan|zxn|1268@mx|明厦|WKZ|mingxia|mx|1269@fhb|肥哈北|ERX|feihabei|fhb|1270@qqm|青齐明|XKB|qingqiming|qqm|1271@sdx|石岛西|KOP|shidaoxi|sdx|1272@zkb|庄昆北|DQZ|zhuangkunbei|zkb|1273@tq|太青|SDT|taiqing|tq|1274@eyf|尔阳肥|JHO|eryangfei|eyf|1275@gcy|贵成宜|AXQ|guichengyi|gcy|1276@cfj|成福京|TNX|chengfujing|cfj|1277@qqx|庆青西|IHY|qingqingxi|qqx|1278@phn|平海南|ZHO|pinghainan|phn|1279@dhhd|岛哈汉东|XWO|daohahandong|dhhd|1280@hjb|杭济北|YXV|hangjibei|hjb|1281@dny|岛宁原|UDT|daoningyuan|dny|1282@kyld|昆阳连东|GQH|kunyangliandong|kyld|1283@wj|乌京|LLQ|wujing|wj|1284@fgx|肥贵西|LAH|feiguixi|fgx|1285@mgb|木贵北|MUT|muguibei|mgb|1286@hj|哈家|GCE|hajia|hj|1287@jhc|京化昌|WFN|jinghuachang|jhc|1288@lh|岭哈|DHM|lingha|lh|1289@jxbb|金西白北|ILA|jinxibaibei|jxbb|1290@db|岛白|QOV|daobai|db|1291@kmab|口门安北|GYF|koumenanbei|kmab|1292@bx|白西|CVO|baixi|bx|1293@zhx|圳湖西|DDL|zhenhuxi|zhx|1294@jjx|家江西|KNV|jiajiangxi|jjx|1295@xg|厦广|ILP|xiaguang|xg|1296@zcx|圳城西|LEV|zhenchengxi|zcx|1297@npx|南平西|GMJ|nanpingxi|npx|1298@hzd|哈圳东|WFV|hazhendong|hzd|1299@bc|白城|NYD|baicheng|bc|1300@ctb|昌太北|YXS|changtaibei|ctb|1301@smb|山门北|YPI|shanmenbei|smb|1302@clk|昌林昆|MCC|changlinkun|clk|1303@xpx|兴平西|HWD|xingpingxi|xpx|1304@wsg|乌山贵|LUA|wushangui|wsg|1305@adn|安岛南|WTF|andaonan|adn|1306@xx|西厦|CFD|xixia|xx|1307@qyyx|青阳阳西|OKR|qingyangyangxi|qyyx|1308@fh|肥化|PRU|feihua|fh|1309@sxx|山兴厦|IXN|shanxingxia|sxx|1310@pmd|平明东|GCF|pingmingdong|pmd|1311@kbb|口白北|RQS|koubaibei|kbb|1312@cwn|长乌南|IJR|changwunan|cwn|1313@mdb|门岛北|ZWR|mendaobei|mdb|1314@zl|州林|YTG|zhoulin|zl|1315@jj|济金|TAX|jijin|jj|1316@hyb|海原北|HPF|haiyuanbei|hyb|1317@mq|门庆|JMX|menqing|mq|1318@hy|湖原|QLS|huyuan|hy|1319@hfcb|海肥成北|WJJ|haifeichengbei|hfcb|1320@chqb|长哈泉北|UXS|changhaquanbei|chqb|1321@bhx|白杭西|MYK|baihangxi|bhx|1322@yyd|原宜东|NBG|yuanyidong|yyd|1323@jgkx|津广昆西|XHR|jinguangkunxi|jgkx|1324@mj|木江|OMR|mujiang|mj|1325@hhx|合汉西|AVG|hehanxi|hhx|1326@sxcx|上新春西|DWM|shangxinchunxi|sxcx|1327@dxx|大新兴|UAO|daxinxing|dxx|1328@szhx|石圳海西|CQN|shizhenhaixi|szhx|1329@th|太汉|ZPL|taihan|th|1330@ksd|昆石东|WER|kunshidong|ksd|1331@dhd|都汉东|VZB|duhandong|dhd|1332@xsx|西苏西|FUO|xisuxi|xsx|1333@ynb|阳宁北|MMD|yangningbei|ynb|1334@szb|山郑滨|XVJ|shanzhengbin|szb|1335@hj|海家|WVR|haijia|hj|1336@clsn|重兰石南|EJF|chonglanshinan|clsn|1337@lajb|岭安济北|NDX|linganjibei|lajb|1338@cjhn|成家汉南|OGO|chengjiahannan|cjhn|1339@lhp|连哈平|HMT|lianhaping|lhp|1340@psd|平深东|KAX|pingshendong|psd|1341@zk|郑口|ICX|zhengkou|zk|1342@dxy|大新原|FFE|daxinyuan|dxy|1343@cys|重阳石|JTI|chongyangshi|cys|1344@xah|新安杭|DWL|xinanhang|xah|1345@nj|宁济|VOY|ningji|nj|1346@jj|金金|GLB|jinjin|jj|1347@mxb|门兴北|HNI|menxingbei|mxb|1348@nhsx|宁海沙西|QGM|ninghaishaxi|nhsx|1349@db|大滨|GUJ|dabin|db|1350@sy|沙阳|QHF|shayang|sy|1351@hwmx|杭武木西|BVP|hangwumuxi|hwmx|1352@nfx|南肥西|RXB|nanfeixi|nfx|1353@cs|城深|YIM|chengshen|cs|1354@jzn|家州南|IEV|jiazhounan|jzn|1355@smd|山木东|AXV|shanmudong|smd|1356@jxa|家兴安|QSA|jiaxingan|jxa|1357@yhb|阳哈北|XBA|yanghabei|yhb|1358@dkd|大口东|ZBK|dakoudong|dkd|1359@sqd|深庆岛|QJS|shenqingdao|sqd|1360@kcpn|昆城平南|ZVM|kunchengpingnan|kcpn|1361@jdd|京大东|OSA|jingdadong|jdd|1362@hqn|杭青南|COW|hangqingnan|hqn|1363@lld|林林大|EUA|linlinda|lld|1364@khb|口海北|ARK|kouhaibei|khb|1365@nl|宁岭|NAR|ningling|nl|1366@zwhd|庄乌杭东|AYK|zhuangwuhangdong|zwhd|1367@jhd|金哈东|LIG|jinhadong|jhd|1368@htd|化太东|JJD|huataidong|htd|1369@dmnx|东木宁西|GWT|dongmuningxi|dmnx|1370@hndd|湖宁德东|HOS|huningdedong|hndd|1371@hghb|合广河北|VMG|heguanghebei|hghb|1372@cc|重成|NFN|chongcheng|cc|1373@sdx|深都西|GJG|shenduxi|sdx|1374@xh|厦河|VQV|xiahe|xh|1375@lh|连化|CXE|lianhua|lh|1376@hjx|湖江西|XQL|hujiangxi|hjx|1377@qgzb|庆贵郑北|VGM|qingguizhengbei|qgzb|1378@bf|白肥|HKW|baifei|bf|1379@hhdn|化河岛南|INC|huahedaonan|hhdn|1380@js|金上|HEZ|jinshang|js|1381@qqhd|青齐汉东|GHC|qingqihandong|qqhd|1382@dpn|岛平南|MAJ|daopingnan|dpn|1383@ccsx|春春石西|NUY|chunchunshixi|ccsx|1384@gj|广济|XCE|guangji|gj|1385@zzc|圳庄春|DKY|zhenzhuangchun|zzc|1386@chd|成海东|GKD|chenghaidong|chd|1387@ysx|原沙西|WYT|yuanshaxi|ysx|1388@ed|尔德|VRX|erde|ed|1389@xsn|厦沈南|LNG|xiashennan|xsn|1390@hs|河沙|MHH|hesha|hs|1391@hwx|杭武西|ZIQ|hangwuxi|hwx|1392@cs|长沈|TMA|changshen|cs|1393@xbn|厦白南|QTN|xiabainan|xbn|1394@lxmx|连兴门西|FYS|lianxingmenxi|lxmx|1395@qhn|泉湖南|OVB|quanhunan|qhn|1396@slq|深林庆|GDD|shenlinqing|slq|1397@yjn|宜家南|ZTK|yijianan|yjn|1398@chl|长汉连|FUK|changhanlian|chl|1399@bj|北济|JVM|beiji|bj|1400@ltl|连天兰|EOK|liantianlan|ltl|1401@xdh|西都哈|CEB|xiduha|xdh|1402@hs|湖沈|ZPP|hushen|hs|1403@zhb|郑汉北|AOG|zhenghanbei|zhb|1404@csx|城沙西|FTN|chengshaxi|csx|1405@kqx|昆青西|JOM|kunqingxi|kqx|1406@sjd|深家东|TIN|shenjiadong|sjd|1407@ch|昌化|DXA|changhua|ch|1408@jl|津连|JFQ|jinlian|jl|1409@fd|福都|MRK|fudu|fd|1410@hdd|湖大东|ZJV|hudadong|hdd|1411@cjb|成金北|NCW|chengjinbei|cjb|1412@qkb|青口北|TDC|qingkoubei|qkb|1413@wslb|乌山岭北|TMS|wushanlingbei|wslb|1414@yfsd|原福上东|AZT|yuanfushangdong|yfsd|1415@hyx|杭阳西|JYO|hangyangxi|hyx|1416@nj|南京|ERL|nanjing|nj|1417@zqd|州齐东|RDS|zhouqidong|zqd|1418@ls|岭苏|MCX|lingsu|ls|1419@qj|泉京|OXM|quanjing|qj|1420@fzqd|肥郑泉东|VAT|feizhengquandong|fzqd|1421@zwb|庄乌北|VFJ|zhuangwubei|zwb|1422@pmd|平门东|CSF|pingmendong|pmd|1423@szn|沈州南|AGG|shenzhounan|szn|1424@atn|安太南|PTB|antainan|atn|1425@cyx|昌阳西|CQZ|changyangxi|cyx|1426@zmx|庄明西|PJV|zhuangmingxi|zmx|1427@cdmx|重都木西|NWK|chongdumuxi|cdmx|1428@qbqb|泉白庆北|ARG|quanbaiqingbei|qbqb|1429@ydq|阳德齐|RUD|yangdeqi|ydq|1430@xz|西州|PZC|xizhou|xz|1431@mqd|门庆东|MTM|menqingdong|mqd|1432@xdb|西东白|WMV|xidongbai|xdb|1433@lcbd|林春北东|JLX|linchunbeidong|lcbd|1434@qxc|齐新重|BEY|qixinchong|qxc|1435@qpd|庆平东|KKB|qingpingdong|qpd|1436@zdb|郑大北|RAD|zhengdabei|zdb|1437@ydn|原岛南|QXJ|yuandaonan|ydn|1438@hcd|哈长东|ZZO|hachangdong|hcd|1439@qjjn|青金京南|QPB|qingjinjingnan|qjjn|1440@hcs|杭长上|GMU|hangchangshang|hcs|1441@cdyn|重东阳南|NJH|chongdongyangnan|cdyn|1442@hcd|汉长东|DLO|hanchangdong|hcd|1443@shzx|沈杭郑西|RWM|shenhangzhengxi|shzx|1444@jme|京门尔|YZV|jingmener|jme|1445@bzn|白州南|EIP|baizhounan|bzn|1446@th|太合|QMS|taihe|th|1447@zln|郑林南|CBV|zhenglinnan|zln|1448@xxlb|兴新林北|FLQ|xingxinlinbei|xxlb|1449@cnt|成宁太|SIS|chengningtai|cnt|1450@ahx|安合西|TCR|anhexi|ahx|1451@zsb|郑石北|ROT|zhengshibei|zsb|1452@jyb|江宜北|LQK|jiangyibei|jyb|1453@fzx|肥州新|QFW|feizhouxin|fzx|1454@se|沈尔|XUG|shener|se|1455@xjd|西京东|OOE|xijingdong|xjd|1456@nsb|宁深北|QJC|ningshenbei|nsb|1457@lh|林海|PTX|linhai|lh|1458@jlh|家林海|KFY|jialinhai|jlh|1459@znb|庄宁北|TBQ|zhuangningbei|znb|1460@hcx|汉昌西|ABW|hanchangxi|hcx|1461@bl|北兰|PGD|beilan|bl|1462@blx|白岭西|ILB|bailingxi|blx|1463@qyx|庆阳西|NDO|qingyangxi|qyx|1464@dd|都都|GSI|dudu|dd|1465@hsz|化苏圳|HGM|huasuzhen|hsz|1466@zjzx|州济庄西|UEI|zhoujizhuangxi|zjzx|1467@ldw|连德乌|OHU|liandewu|ldw|1468@hd|合大|SOB|heda|hd|1469@mb|明白|MZY|mingbai|mb|1470@jhh|济湖合|CRO|jihuhe|jhh|1471@nm|南门|FHQ|nanmen|nm|1472@sbg|山白贵|XQK|shanbaigui|sbg|1473@mcn|明城南|VGQ|mingchengnan|mcn|1474@tdd|天岛东|JQF|tiandaodong|tdd|1475@nq|宁庆|HKT|ningqing|nq|1476@fbd|福滨东|ZPO|fubindong|fbd|1477@jbb|金北北|IXV|jinbeibei|jbb|1478@sj|深济|HZO|shenji|sj|1479@zhhn|庄海海南|NFF|zhuanghaihainan|zhhn|1480@wxd|武新东|LTB|wuxindong|wxd|1481@jwqd|津武泉东|JUT|jinwuquandong|jwqd|1482@kqn|昆齐南|KAR|kunqinan|kqn|1483@sk|沙口|PVI|shakou|sk|1484@smm|深门门|YVV|shenmenmen|smm|1485@ndd|宁岛东|LHE|ningdaodong|ndd|1486@dtd|都太东|EJA|dutaidong|dtd|1487@sdjn|上岛家南|CMV|shangdaojianan|sdjn|1488@zth|州太合|VKQ|zhoutaihe|zth|1489@mqq|木庆泉|RRY|muqingquan|mqq|1490@snb|上宁北|EMW|shangningbei|snb|1491@hp|哈平|EWD|haping|hp|1492@lfd|兰福东|QIL|lanfudong|lfd|1493@sd|上岛|HGS|shangdao|sd|1494@qj|泉家|QPD|quanjia|qj|1495@yyd|宜阳东|GZP|yiyangdong|yyd|1496@yxtd|阳兴太东|IDT|yangxingtaidong|yxtd|1497@flsb|福连苏北|NTD|fuliansubei|flsb|1498@bshb|北山汉北|HGX|beishanhanbei|bshb|1499@cfqn|城肥齐南|YHW|chengfeiqinan|cfqn|1500@gsd|贵沈东|ZKP|guishendong|gsd|1501@lhb|林海北|RHV|linhaibei|lhb|1502@qnk|庆宁昆|ODA|qingningkun|qnk|1503@hp|河平|FEY|heping|hp|1504@yb|宜滨|WLZ|yibin|yb|1505@cgs|城广山|YAX|chengguangshan|cgs|1506@shyb|山杭宜北|QBB|shanhangyibei|shyb|1507@jjd|济金岛|MVE|jijindao|jjd|1508@qq|齐泉|AOS|qiquan|qq|1509@sb|沙北|UTM|shabei|sb|1510@mqqd|明青青东|EOY|mingqingqingdong|mqqd|1511@hy|河原|LXE|heyuan|hy|1512@sj|深家|IHC|shenjia|sj|1513@sjd|沈济东|KHR|shenjidong|sjd|1514@scb|山成北|JDF|shanchengbei|scb|1515@alc|安岭重|CRJ|anlingchong|alc|1516@yfh|阳福杭|OIO|yangfuhang|yfh|1517@hw|汉武|RPY|hanwu|hw|1518@ccnx|昌长南西|LIE|changchangnanxi|ccnx|1519@zqz|圳泉郑|RAP|zhenquanzheng|zqz|1520@qcx|泉成西|KSD|quanchengxi|qcx|1521@slx|石连西|ZUQ|shilianxi|slx|1522@hcdd|合成大东|QYC|hechengdadong|hcdd|1523@ygx|宜贵厦|XNN|yiguixia|ygx|1524@zyn|州原南|NMY|zhouyuannan|zyn|1525@hxd|海西东|VON|haixidong|hxd|1526@yqqb|原青泉北|ATL|yuanqingquanbei|yqqb|1527@xqsn|西齐深南|HET|xiqishennan|xqsn|1528@xw|新武|AXZ|xinwu|xw|1529@epd|尔平大|PNZ|erpingda|epd|1530@llx|岭连西|LGP|linglianxi|llx|1531@skx|山口西|OTH|shankouxi|skx|1532@jxjd|津厦京东|TUB|jinxiajingdong|jxjd|1533@nqhd|宁齐汉东|YVZ|ningqihandong|nqhd|1534@scb|山城北|SZO|shanchengbei|scb|1535@hdjn|河都金南|KQS|hedujinnan|hdjn|1536@txyd|天厦原东|STM|tianxiayuandong|txyd|1537@md|门德|RZL|mende|md|1538@hqx|化庆西|LFG|huaqingxi|hqx|1539@chzx|城湖州西|OGY|chenghuzhouxi|chzx|1540@lswx|林沙武西|URG|linshawuxi|lswx|1541@sdcx|山都成西|SIU|shanduchengxi|sdcx|1542@fyn|福原南|ZMS|fuyuannan|fyn|1543@waz|乌安庄|ZKK|wuanzhuang|waz|1544@hd|海德|TRZ|haide|hd|1545@sy|沈宜|PDS|shenyi|sy|1546@jdn|江大南|KSC|jiangdanan|jdn|1547@lq|连庆|NMS|lianqing|lq|1548@kh|昆湖|QAK|kunhu|kh|1549@jx|津西|DTV|jinxi|jx|1550@hk|湖口|IFZ|hukou|hk|1551@jjd|津济东|UQT|jinjidong|jjd|1552@qh|齐汉|DTI|qihan|qh|1553@bhkb|滨化昆北|ZBH|binhuakunbei|bhkb|1554@lp|连平|XGW|lianping|lp|1555@hbg|杭白广|VIN|hangbaiguang|hbg|1556@xjn|新金南|XZD|xinjinnan|xjn|1557@ch|重汉|HTX|chonghan|ch|1558@cld|昌岭东|IVI|changlingdong|cld|1559@xm|新明|RAI|xinming|xm|1560@mjb|明家北|EUT|mingjiabei|mjb|1561@dh|东杭|EUJ|donghang|dh|1562@stx|苏太西|KOF|sutaixi|stx|1563@gzn|贵庄南|ABP|guizhuangnan|gzn|1564@sf|上肥|WBP|shangfei|sf|1565@aqkb|安泉口北|OGL|anquankoubei|aqkb|1566@yw|阳乌|TSN|yangwu|yw|1567@yt|宜太|YXE|yitai|yt|1568@dc|岛昌|BHY|daochang|dc|1569@hcjd|化长家东|FLT|huachangjiadong|hcjd|1570@lb|连北|XAF|lianbei|lb|1571@thb|太化北|SCN|taihuabei|thb|1572@la|兰安|QHK|lanan|la|1573@xzq|西圳青|TID|xizhenqing|xzq|1574@ht|汉太|KYJ|hantai|ht|1575@bpd|北平东|XJE|beipingdong|bpd|1576@wwa|乌武安|UNG|wuwuan|wwa|1577@jt|济天|QNY|jitian|jt|1578@smg|苏明贵|RVT|suminggui|smg|1579@zlz|庄岭州|HIM|zhuanglingzhou|zlz|1580@tjd|天家东|IPE|tianjiadong|tjd|1581@stn|深太南|RVR|shentainan|stn|1582@blc|北连成|PSK|beiliancheng|blc|1583@sc|上昌|EUB|shangchang|sc|1584@qld|青林东|PFL|qinglindong|qld|1585@dgx|都贵西|BTY|duguixi|dgx|1586@sqxn|上庆兴南|MAK|shangqingxingnan|sqxn|1587@zcd|州昌东|UUG|zhouchangdong|zcd|1588@hjx|合济西|QLP|hejixi|hjx|1589@hyhb|汉原杭北|CKS|hanyuanhangbei|hyhb|1590@fsfb|福深肥北|USG|fushenfeibei|fsfb|1591@jxn|金西南|KKZ|jinxinan|jxn|1592@ghzn|贵合庄南|UUW|guihezhuangnan|ghzn|1593@sdn|沈都南|WQK|shendunan|sdn|1594@fqd|肥青东|WBM|feiqingdong|fqd|1595@bc|白昌|HYK|baichang|bc|1596@jnx|京南西|VHD|jingnanxi|jnx|1597@dsan|德上安南|KRY|deshangannan|dsan|1598@amj|安门家|IRK|anmenjia|amj|1599@dsex|东沈尔西|QTL|dongshenerxi|dsex|1600@qjd|青津东|WTI|qingjindong|qjd|1601@dxx|大新西|UFT|daxinxi|dxx|1602@dndd|大南德东|HPO|danandedong|dndd|1603@gt|广天|CDF|guangtian|gt|1604@ll|林林|JFU|linlin|ll|1605@ynd|原南东|ZQO|yuannandong|ynd|1606@szj|沙郑江|XFL|shazhengjiang|szj|1607@zpd|圳平东|CWX|zhenpingdong|zpd|1608@nc|南重|FXM|nanchong|nc|1609@kcn|昆昌南|HMO|kunchangnan|kcn|1610@tg|天广|BRU|tianguang|tg|1611@hhjd|化杭京东|GGX|huahangjingdong|hhjd|1612@dmx|德门西|FXF|demenxi|dmx|1613@jqx|金齐西|ODK|jinqixi|jqx|1614@scb|苏昌北|DKX|suchangbei|scb|1615@jn|江南|ZUW|jiangnan|jn|1616@hzhb|河州杭北|PQG|hezhouhangbei|hzhb|1617@hbcb|化滨重北|ZMT|huabinchongbei|hbcb|1618@zqd|州泉东|RLD|zhouquandong|zqd|1619@ctb|成天北|KVB|chengtianbei|ctb|1620@cnh|重南合|RMR|chongnanhe|cnh|1621@czb|长州北|VHA|changzhoubei|czb|1622@flx|肥林西|BOI|feilinxi|flx|1623@skcn|沙昆昌南|HTL|shakunchangnan|skcn|1624@cfdx|城福大西|TVM|chengfudaxi|cfdx|1625@gh|贵海|ILS|guihai|gh|1626@zdcx|郑都春西|HYZ|zhengduchunxi|zdcx|1627@jy|家宜|XVG|jiayi|jy|1628@sy|山阳|ILO|shanyang|sy|1629@gsn|广深南|PKL|guangshennan|gsn|1630@zxtx|州厦太西|KLP|zhouxiataixi|zxtx|1631@whtn|乌汉天南|TTA|wuhantiannan|whtn|1632@qsd|青深东|NYH|qingshendong|qsd|1633@mql|门泉连|NFE|menquanlian|mql|1634@jlk|津兰口|KFK|jinlankou|jlk|1635@shg|山海广|VOE|shanhaiguang|shg|1636@sgn|沈广南|VWT|shenguangnan|sgn|1637@pwd|平武东|IFN|pingwudong|pwd|1638@bhbn|滨合白南|XOE|binhebainan|bhbn|1639@hx|河兴|WDY|hexing|hx|1640@zfp|庄福平|MNF|zhuangfuping|zfp|1641@phb|平合北|YJW|pinghebei|phb|1642@xhhb|厦海杭北|OFH|xiahaihangbei|xhhb|1643@cfyd|昌福阳东|BVL|changfuyangdong|cfyd|1644@ndd|宁德东|ASC|ningdedong|ndd|1645@jz|济郑|NXR|jizheng|jz|1646@my|门原|PYR|menyuan|my|1647@yq|原青|UVH|yuanqing|yq|1648@szn|上圳南|GXE|shangzhennan|szn|1649@dj|大金|CQO|dajin|dj|1650@fw|肥乌|ONJ|feiwu|fw|1651@ss|深上|UDB|shenshang|ss|1652@xfdn|兴肥都南|DIU|xingfeidunan|xfdn|1653@lc|岭春|QWE|lingchun|lc|1654@cgan|成贵安南|LXN|chengguiannan|cgan|1655@zlx|庄岭西|CAP|zhuanglingxi|zlx|1656@sln|沙林南|XSG|shalinnan|sln|1657@dl|岛林|YMY|daolin|dl|1658@kx|昆新|EKL|kunxin|kx|1659@gh|广河|WWY|guanghe|gh|1660@jwsx|江乌沙西|NYQ|jiangwushaxi|jwsx|1661@qqd|庆齐东|VEZ|qingqidong|qqd|1662@jjx|京津西|VWJ|jingjinxi|jjx|1663@cay|成安阳|FIT|chenganyang|cay|1664@zf|郑福|VAL|zhengfu|zf|1665@dz|大州|BEJ|dazhou|dz|1666@ybb|阳滨北|PUR|yangbinbei|ybb|1667@sdwx|山大武西|QRH|shandawuxi|sdwx|1668@zsj|庄山济|FZQ|zhuangshanji|zsj|1669@jzs|京州深|DAT|jingzhoushen|jzs|1670@zhn|庄合南|WPP|zhuanghenan|zhn|1671@tjn|太济南|VRL|taijinan|tjn|1672@cjb|昌金北|RNH|changjinbei|cjb|1673@zpd|庄平东|IAM|zhuangpingdong|zpd|1674@slc|沙连城|NJQ|shaliancheng|slc|1675@gg|贵广|CXZ|guiguang|gg|1676@eb|尔北|VSB|erbei|eb|1677@hb|杭北|FPE|hangbei|hb|1678@sf|沈肥|XWG|shenfei|sf|1679@lbj|林北金|USD|linbeijin|lbj|1680@qnd|庆宁东|XVE|qingningdong|qnd|1681@kbk|昆白口|FSY|kunbaikou|kbk|1682@cy|昌阳|SGB|changyang|cy|1683@fjs|福家沙|SOD|fujiasha|fjs|1684@hd|哈东|IEN|hadong|hd|1685@qaj|泉安津|ZHG|quananjin|qaj|1686@lbsn|岭白石南|NGW|lingbaishinan|lbsn|1687@ch|城杭|XTR|chenghang|ch|1688@lls|连林上|XFE|lianlinshang|lls|1689@cax|昌安西|YWE|changanxi|cax|1690@dcx|大昌西|ZCX|dachangxi|dcx|1691@wkdn|武昆大南|VNB|wukundanan|wkdn|1692@qq|青泉|FOZ|qingquan|qq|1693@dm|东木|RNQ|dongmu|dm|1694@xjx|兴济西|ONZ|xingjixi|xjx|1695@hdxx|哈东兴西|TXT|hadongxingxi|hdxx|1696@xcb|西重北|AGY|xichongbei|xcb|1697@sg|山广|HQK|shanguang|sg|1698@mwx|门乌西|AGM|menwuxi|mwx|1699@qhd|齐汉东|WUW|qihandong|qhd|1700@wjh|武家汉|QDJ|wujiahan|wjh|1701@ygcd|原广长东|BYJ|yuanguangchangdong|ygcd|1702@xs|新山|PGJ|xinshan|xs|1703@ch|成哈|BKN|chengha|ch|1704@lwx|岭武西|CBP|lingwuxi|lwx|1705@zwb|州乌北|FFA|zhouwubei|zwb|1706@xqb|新庆北|QSL|xinqingbei|xqb|1707@qljb|齐兰江北|BKS|qilanjiangbei|qljb|1708@cd|城东|KVV|chengdong|cd|1709@tlb|太兰北|JLV|tailanbei|tlb|1710@mxx|木厦西|IRD|muxiaxi|mxx|1711@ydc|原都重|NHC|yuanduchong|ydc|1712@kd|昆岛|LXZ|kundao|kd|1713@cyd|城阳东|TVW|chengyangdong|cyd|1714@hsld|化苏林东|HHI|huasulindong|hsld|1715@ptd|平天东|IKO|pingtiandong|ptd|1716@qcb|庆重北|LUO|qingchongbei|qcb|1717@bcq|滨春庆|MTU|binchunqing|bcq|1718@hed|化尔东|GEX|huaerdong|hed|1719@mxm|木厦明|PSR|muxiaming|mxm|1720@pdd|平大东|OGG|pingdadong|pdd|1721@acxx|安昌新西|SRR|anchangxinxi|acxx|1722@ylfd|原林肥东|TUI|yuanlinfeidong|ylfd|1723@sh|沙海|SBO|shahai|sh|1724@fcn|福重南|NKI|fuchongnan|fcn|1725@zgb|圳广北|XJW|zhenguangbei|zgb|1726@jd|家德|JVB|jiade|jd|1727@fcfx|福城肥西|MWE|fuchengfeixi|fcfx|1728@jm|江明|RID|jiangming|jm|1729@ekb|尔昆北|VRD|erkunbei|ekb|1730@cyb|城原北|UOB|chengyuanbei|cyb|1731@ykj|原口金|TED|yuankoujin|ykj|1732@zh|州河|VGP|zhouhe|zh|1733@dm|大明|ACP|daming|dm|1734@xwb|新乌北|DRU|xinwubei|xwb|1735@qz|泉郑|ZHN|quanzheng|qz|1736@zhsn|州哈石南|DFW|zhouhashinan|zhsn|1737@hcd|合成东|ZZA|hechengdong|hcd|1738@ygx|宜广西|KNX|yiguangxi|ygx|1739@znq|郑南庆|IHM|zhengnanqing|znq|1740@qwx|齐武西|UDQ|qiwuxi|qwx|1741@yx|阳新|MZV|yangxin|yx|1742@qp|泉平|PYH|quanping|qp|1743@sj|深津|WTW|shenjin|sj|1744@hj|河京|HGA|hejing|hj|1745@lc|兰城|XXS|lancheng|lc|1746@xp|厦平|ZRW|xiaping|xp|1747@cgbx|重贵白西|PWL|chongguibaixi|cgbx|1748@zcb|庄重北|BIM|zhuangchongbei|zcb|1749@xhd|西哈东|FUS|xihadong|xhd|1750@ssn|苏山南|ROX|sushannan|ssn|1751@zy|州阳|VRF|zhouyang|zy|1752@zan|圳安南|RRF|zhenannan|zan|1753@chsx|春哈沈西|HJQ|chunhashenxi|chsx|1754@cax|成安西|EMV|chenganxi|cax|1755@nt|宁太|IRW|ningtai|nt|1756@hmd|湖明东|DHS|humingdong|hmd|1757@dh|岛杭|KDX|daohang|dh|1758@fgld|肥贵岭东|GRX|feiguilingdong|fgld|1759@sq|山庆|LLL|shanqing|sq|1760@qqb|泉庆北|ZIZ|quanqingbei|qqb|1761@scg|苏城广|FWG|suchengguang|scg|1762@qhx|齐杭西|TSS|qihangxi|qhx|1763@yq|宜庆|YMK|yiqing|yq|1764@cxlx|长西连西|PEM|changxilianxi|cxlx|1765@qm|青明|KPZ|qingming|qm|1766@qsn|齐山南|EBW|qishannan|qsn|1767@ahb|安湖北|BKA|anhubei|ahb|1768@pbx|平北西|BRK|pingbeixi|pbx|1769@zdd|郑东东|WGH|zhengdongdong|zdd|1770@nenx|南尔南西|BSJ|nanernanxi|nenx|1771@dsqn|大上齐南|PXM|dashangqinan|dsqn|1772@cn|春宁|XDB|chunning|cn|1773@ssb|深苏北|VHS|shensubei|ssb|1774@hxb|河兴北|FNC|hexingbei|hxb|1775@zjb|州金北|CVT|zhoujinbei|zjb|1776@mmcn|明明昌南|OJC|mingmingchangnan|mmcn|1777@xd|新岛|JYU|xindao|xd|1778@tzl|太庄兰|UYY|taizhuanglan|tzl|1779@hc|湖成|CKD|hucheng|hc|1780@dbd|岛北东|XFV|daobeidong|dbd|1781@hqjd|哈青金东|GVI|haqingjindong|hqjd|1782@cdn|昌都南|YSV|changdunan|cdn|1783@zgb|州贵北|ULP|zhouguibei|zgb|1784@enc|尔南春|SRC|ernanchun|enc|1785@gdh|贵德海|SOK|guidehai|gdh|1786@gygd|贵宜贵东|ICH|guiyiguidong|gygd|1787@exx|尔兴西|JIY|erxingxi|exx|1788@dq|东泉|TWD|dongquan|dq|1789@cjdb|昌京大北|KSK|changjingdabei|cjdb|1790@jqyb|家庆阳北|ZFM|jiaqingyangbei|jqyb|1791@jc|津昌|GZA|jinchang|jc|1792@lhwb|岭合乌北|DUV|linghewubei|lhwb|1793@tfx|天福西|ZDI|tianfuxi|tfx|1794@zcn|庄重南|RIB|zhuangchongnan|zcn|1795@zdn|庄大南|IQS|zhuangdanan|zdn|1796@jc|金城|IUA|jincheng|jc|1797@hhb|杭汉北|LOX|hanghanbei|hhb|1798@zn|庄南|UFH|zhuangnan|zn|1799@pwn|平武南|SBP|pingwunan|pwn|1800@ztsn|州天苏南|LHJ|zhoutiansunan|ztsn|1801@ws|乌苏|HCI|wusu|ws|1802@szjn|沈州津南|GPV|shenzhoujinnan|szjn|1803@ss|沈上|YNE|shenshang|ss|1804@fmc|肥木重|JLB|feimuchong|fmc|1805@hxb|海新北|LWP|haixinbei|hxb|1806@gc|贵昌|QDI|guichang|gc|1807@xq|西泉|WEK|xiquan|xq|1808@dhhn|东汉哈南|OAR|donghanhanan|dhhn|1809@cln|长岭南|EDG|changlingnan|cln|1810@lxtd|林兴太东|NEA|linxingtaidong|lxtd|1811@cd|城岛|BOD|chengdao|cd|1812@es|尔沙|PWR|ersha|es|1813@cycx|重原成西|RQE|chongyuanchengxi|cycx|1814@ma|明安|OWS|mingan|ma|1815@zxtx|庄新太西|GCN|zhuangxintaixi|zxtx|1816@hsx|汉苏西|LQV|hansuxi|hsx|1817@fj|福京|BMM|fujing|fj|1818@gqxn|广庆兴南|DGO|guangqingxingnan|gqxn|1819@fhd|福湖东|COB|fuhudong|fhd|1820@mjx|门京西|ACN|menjingxi|mjx|1821@db|都滨|EKG|dubin|db|1822@dqd|东青东|RSP|dongqingdong|dqd|1823@kax|昆安西|NSL|kunanxi|kax|1824@lnh|岭南海|VRV|lingnanhai|lnh|1825@jl|济兰|LME|jilan|jl|1826@kfd|昆福东|CEK|kunfudong|kfd|1827@cmhn|昌门河南|OHH|changmenhenan|cmhn|1828@jhfb|金杭福北|DJJ|jinhangfubei|jhfb|1829@jjh|家京哈|IDI|jiajingha|jjh|1830@jkx|济口西|EGD|jikouxi|jkx|1831@smb|沈门北|CMT|shenmenbei|smb|1832@nj|宁江|ALX|ningjiang|nj|1833@qtwd|泉天武东|EZR|quantianwudong|qtwd|1834@zhtd|州汉天东|CAF|zhouhantiandong|zhtd|1835@cb|春北|LSL|chunbei|cb|1836@cyb|昌宜北|SNF|changyibei|cyb|1837@khlb|口化兰北|GAW|kouhualanbei|khlb|1838@jzd|济庄东|YBJ|jizhuangdong|jzd|1839@tzw|天圳武|DDO|tianzhenwu|tzw|1840@han|河安南|AEA|heannan|han|1841@jwz|江武州|VFS|jiangwuzhou|jwz|1842@qzb|青庄北|ITJ|qingzhuangbei|qzb|1843@hz|化郑|YIA|huazheng|hz|1844@hdqx|河大庆西|YAC|hedaqingxi|hdqx|1845@fdx|肥东西|OUJ|feidongxi|fdx|1846@snmx|沈宁明西|IAC|shenningmingxi|snmx|1847@bcx|白城西|FIS|baichengxi|bcx|1848@tsn|天苏南|VME|tiansunan|tsn|1849@bs|北深|RDW|beishen|bs|1850@xxtb|新新天北|XMM|xinxintianbei|xxtb|1851@ftd|肥太东|IDA|feitaidong|ftd|1852@hnj|汉南济|PMI|hannanji|hnj|1853@qeqb|齐尔泉北|VOK|qierquanbei|qeqb|1854@hcs|化重沙|HWJ|huachongsha|hcs|1855@ltwn|连天乌南|TRJ|liantianwunan|ltwn|1856@bz|滨庄|IVT|binzhuang|bz|1857@ptn|平天南|DWI|pingtiannan|ptn|1858@dhx|都湖西|EPE|duhuxi|dhx|1859@gc|贵长|YHT|guichang|gc|1860@lzb|岭郑北|ZGT|lingzhengbei|lzb|1861@zfd|州肥东|OKB|zhoufeidong|zfd|1862@txx|太新西|KXG|taixinxi|txx|1863@bck|北重昆|HMZ|beichongkun|bck|1864@lkb|林昆北|TCB|linkunbei|lkb|1865@zcb|州成北|SFO|zhouchengbei|zcb|1866@dl|东连|BIP|donglian|dl|1867@qh|泉湖|YGH|quanhu|qh|1868@bad|白安东|ALS|baiandong|bad|1869@gw|贵武|YQV|guiwu|gw|1870@hbxn|海北兴南|HUM|haibeixingnan|hbxn|1871@be|滨尔|YRW|biner|be|1872@sgx|深广西|UPE|shenguangxi|sgx|1873@zfqx|圳肥青西|FUP|zhenfeiqingxi|zfqx|1874@jdzn|金东圳南|BNR|jindongzhennan|jdzn|1875@shx|沈化西|LZK|shenhuaxi|shx|1876@gqy|贵青宜|CYU|guiqingyi|gqy|1877@jxx|京新兴|HEN|jingxinxing|jxx|1878@qshb|庆深化北|NAG|qingshenhuabei|qshb|1879@sfx|苏肥西|KNC|sufeixi|sfx|1880@ff|肥肥|WPJ|feifei|ff|1881@fhn|肥海南|RZO|feihainan|fhn|1882@dnsn|德宁沙南|YBI|deningshanan|dnsn|1883@hcd|海春东|SKQ|haichundong|hcd|1884@zs|圳沈|DEH|zhenshen|zs|1885@dpc|德平重|RJM|depingchong|dpc|1886@hs|湖苏|ESK|husu|hs|1887@qsd|庆山大|SFS|qingshanda|qsd|1888@pga|平广安|DGT|pingguangan|pga|1889@tq|太庆|YIY|taiqing|tq|1890@hd|杭大|XOQ|hangda|hd|1891@hjd|汉家东|HDL|hanjiadong|hjd|1892@qgx|庆广西|CYF|qingguangxi|qgx|1893@bdx|滨岛西|UDE|bindaoxi|bdx|1894@she|苏杭尔|YXR|suhanger|she|1895@fhf|福合福|CGZ|fuhefu|fhf|1896@xyq|新原齐|DGM|xinyuanqi|xyq|1897@aqhx|安庆河西|YOD|anqinghexi|aqhx|1898@xps|新平上|LNH|xinpingshang|xps|1899@sc|深春|FVK|shenchun|sc|1900@nd|南德|EEK|nande|nd|1901@ytsd|原天山东|DFE|yuantianshandong|ytsd|1902@kpbd|昆平北东|ONU|kunpingbeidong|kpbd|1903@nysn|南原山南|BIO|nanyuanshannan|nysn|1904@hmxn|河门厦南|LTF|hemenxianan|hmxn|1905@pfsd|平福苏东|EEE|pingfusudong|pfsd|1906@sxn|山兴南|RLB|shanxingnan|sxn|1907@jw|江武|MMF|jiangwu|jw|1908@bmw|滨门乌|UFG|binmenwu|bmw|1909@nhj|南湖津|JVD|nanhujin|nhj|1910@chb|成汉北|ZKC|chenghanbei|chb|1911@htzb|合天庄北|TAM|hetianzhuangbei|htzb|1912@qh|庆哈|DND|qingha|qh|1913@dsx|德深西|HCW|deshenxi|dsx|1914@wsd|乌深东|JVG|wushendong|wsd|1915@wf|武肥|KBQ|wufei|wf|1916@al|安兰|EFP|anlan|al|1917@djj|东金京|JGJ|dongjinjing|djj|1918@emb|尔木北|KWE|ermubei|emb|1919@hqb|杭庆北|IAH|hangqingbei|hqb|1920@ccx|重重西|EZZ|chongchongxi|ccx|1921@gsx|贵上新|SVB|guishangxin|gsx|1922@hegd|化尔贵东|QTF|huaerguidong|hegd|1923@mzdd|门圳岛东|TKP|menzhendaodong|mzdd|1924@mbd|木白东|CMW|mubaidong|mbd|1925@dq|东齐|PTO|dongqi|dq|1926@pj|平家|LFR|pingjia|pj|1927@ddn|岛东南|VLV|daodongnan|ddn|1928@fjb|肥家北|VPU|feijiabei|fjb|1929@cs|城苏|QFH|chengsu|cs|1930@had|汉安东|ICO|hanandong|had|1931@qcdb|泉城岛北|LZX|quanchengdaobei|qcdb|1932@ss|山深|DHX|shanshen|ss|1933@whw|乌化武|NNS|wuhuawu|whw|1934@hmn|湖门南|QEU|humennan|hmn|1935@hwn|杭乌南|TLC|hangwunan|hwn|1936@qhd|庆杭东|LWY|qinghangdong|qhd|1937@hz|河庄|BHR|hezhuang|hz|1938@hqd|汉庆德|FVG|hanqingde|hqd|1939@hxsn|化新沈南|ZHI|huaxinshennan|hxsn|1940@xjh|新金哈|TTV|xinjinha|xjh|1941@mc|门春|YOI|menchun|mc|1942@zc|郑昌|RAB|zhengchang|zc|1943@kkzd|口昆州东|GHZ|koukunzhoudong|kkzd|1944@hx|杭厦|DWB|hangxia|hx|1945@qb|庆滨|JCK|qingbin|qb|1946@cpd|春平东|YGI|chunpingdong|cpd|1947@sqcb|上庆长北|BKI|shangqingchangbei|sqcb|1948@jqhn|金泉杭南|JMR|jinquanhangnan|jqhn|1949@sdd|深德东|RIY|shendedong|sdd|1950@chd|长海东|HYL|changhaidong|chd|1951@tjx|太江西|TVO|taijiangxi|tjx|1952@ejn|尔津南|SCM|erjinnan|ejn|1953@sgb|沈贵北|WMW|shenguibei|sgb|1954@hde|化东尔|WIV|huadonger|hde|1955@jcn|津重南|GYQ|jinchongnan|jcn|1956@syn|沈原南|RSN|shenyuannan|syn|1957@lsx|兰沈西|QTZ|lanshenxi|lsx|1958@cqtb|长青太北|GNP|changqingtaibei|cqtb|1959@dsb|都石北|XLM|dushibei|dsb|1960@wl|乌连|FPM|wulian|wl|1961@lsbb|兰石白北|NTZ|lanshibaibei|lsbb|1962@ccq|春成齐|UJP|chunchengqi|ccq|1963@lc|兰春|LIS|lanchun|lc|1964@jqyb|家青原北|VHL|jiaqingyuanbei|jqyb|1965@xsx|厦石西|EZI|xiashixi|xsx|1966@xh|厦湖|XTH|xiahu|xh|1967@yy|原原|YXB|yuanyuan|yy|1968@sdb|沙都北|TVP|shadubei|sdb|1969@hjc|合津长|PRB|hejinchang|hjc|1970@lzx|兰庄西|WDS|lanzhuangxi|lzx|1971@bhn|滨海南|BGN|binhainan|bhn|1972@yf|阳肥|RNP|yangfei|yf|1973@mhb|门湖北|TKY|menhubei|mhb|1974@wm|乌明|QXR|wuming|wm|1975@pn|平南|IWD|pingnan|pn|1976@dlb|东岭北|GVU|donglingbei|dlb|1977@fmy|福门宜|VCR|fumenyi|fmy|1978@dzn|德州南|HQB|dezhounan|dzn|1979@jzcn|江圳长南|CNB|jiangzhenchangnan|jzcn|1980@lcx|兰长西|CCR|lanchangxi|lcx|1981@qchd|齐春哈东|YOT|qichunhadong|qchd|1982@swd|苏乌东|VXR|suwudong|swd|1983@tnn|天南南|HKP|tiannannan|tnn|1984@egq|尔贵齐|UMM|erguiqi|egq|1985@qssd|齐苏石东|RJK|qisushidong|qssd|1986@xhb|新杭北|CJZ|xinhangbei|xhb|1987@tm|天木|EIC|tianmu|tm|1988@myx|门宜西|YIW|menyixi|myx|1989@cyx|成宜西|PDC|chengyixi|cyx|1990@xsd|兴石东|MCA|xingshidong|xsd|1991@teb|太尔北|GAT|taierbei|teb|1992@chx|昌河西|UND|changhexi|chx|1993@jyn|津原南|OKS|jinyuannan|jyn|1994@bpb|白平北|FUI|baipingbei|bpb|1995@mab|明安北|LWA|minganbei|mab|1996@kzc|昆庄重|EGM|kunzhuangchong|kzc|1997@fnlb|肥宁林北|JII|feininglinbei|fnlb|1998@jh|江合|CWH|jianghe|jh|1999@qcd|青昌东|BEW|qingchangdong|qcd|2000@yln|阳连南|UBX|yangliannan|yln|2001@shcx|山湖昌西|IMV|shanhuchangxi|shcx|2002@yhc|阳哈重|NQP|yanghachong|yhc|2003@ehpb|尔合平北|VVU|erhepingbei|ehpb|2004@hy|合宜|CMI|heyi|hy|2005@dtj|东太江|PHK|dongtaijiang|dtj|2006@knq|昆宁庆|WAM|kunningqing|knq|2007@kjd|口金岛|NIR|koujindao|kjd|2008@sy|沙原|YCR|shayuan|sy|2009@ddb|都大北|JYD|dudabei|ddb|2010@yf|原肥|FLG|yuanfei|yf|2011@bzd|滨郑东|SOI|binzhengdong|bzd|2012@amhn|安门合南|ZJJ|anmenhenan|amhn|2013@wab|乌安北|XML|wuanbei|wab|2014@jkd|江昆东|ASX|jiangkundong|jkd|2015@hbb|河北北|WZY|hebeibei|hbb|2016@dp|大平|PFG|daping|dp|2017@jbb|家白北|MNK|jiabaibei|jbb|2018@zqn|庄泉南|HNT|zhuangquannan|zqn|2019@gdx|贵东西|KPE|guidongxi|gdx|2020@fsd|肥深东|EQI|feishendong|fsd|2021@hh|化湖|ZQJ|huahu|hh|2022@bkz|北口庄|RRD|beikouzhuang|bkz|2023@lcb|连成北|OLW|lianchengbei|lcb|2024@xnd|西宁东|ZJR|xiningdong|xnd|2025@whx|乌哈西|TOY|wuhaxi|whx|2026@sh|苏哈|DRH|suha|sh|2027@jblx|济北兰西|NFC|jibeilanxi|jblx|2028@qzj|庆州家|XYQ|qingzhoujia|qzj|2029@bzln|北圳连南|JNB|beizhenliannan|bzln|2030@xshn|新沙河南|SFU|xinshahenan|xshn|2031@dh|岛合|GHD|daohe|dh|2032@tjs|太金苏|NCU|taijinsu|tjs|2033@bzz|北郑州|EYS|beizhengzhou|bzz|2034@dn|东南|ZMQ|dongnan|dn|2035@bsdx|滨山东西|PIY|binshandongxi|bsdx|2036@fmb|福木北|NGJ|fumubei|fmb|2037@jln|津林南|PZB|jinlinnan|jln|2038@cjj|重金津|MRM|chongjinjin|cjj|2039@ysx|原苏西|WKN|yuansuxi|ysx|2040@hs|化深|UFX|huashen|hs|2041@mlxx|门林西西|NOS|menlinxixi|mlxx|2042@cjhd|昌金合东|OKU|changjinhedong|cjhd|2043@cbx|城北西|QIK|chengbeixi|cbx|2044@csmx|昌石门西|VVQ|changshimenxi|csmx|2045@ydx|原都西|QQM|yuanduxi|ydx|2046@yyx|原原西|RYL|yuanyuanxi|yyx|2047@nsn|宁苏南|MUB|ningsunan|nsn|2048@qhx|庆化西|DHJ|qinghuaxi|qhx|2049@hhs|杭杭深|UPX|hanghangshen|hhs|2050@cddb|重大都北|MPC|chongdadubei|cddb|2051@zm|圳门|QJY|zhenmen|zm|2052@cqs|成庆沈|TXP|chengqingshen|cqs|2053@gwn|广武南|CCF|guangwunan|gwn|2054@qsqn|泉深青南|TZM|quanshenqingnan|qsqn|2055@cxmb|昌厦门北|BSP|changxiamenbei|cxmb|2056@szn|沙圳南|WNE|shazhennan|szn|2057@yzsd|原庄上东|VFX|yuanzhuangshangdong|yzsd|2058@fg|肥贵|IHU|feigui|fg|2059@qbx|泉白西|OQG|quanbaixi|qbx|2060@kwb|口武北|ZCG|kouwubei|kwb|2061@jhd|家杭东|ODR|jiahangdong|jhd|2062@dxb|都新北|DLL|duxinbei|dxb|2063@xh|厦化|YFC|xiahua|xh|2064@jj|京金|VPJ|jingjin|jj|2065@bnx|滨南西|LYS|binnanxi|bnx|2066@htqb|河太泉北|PVX|hetaiquanbei|htqb|2067@gqn|贵齐南|NJG|guiqinan|gqn|2068@zhsb|圳化山北|ZTL|zhenhuashanbei|zhsb|2069@hw|海乌|PMF|haiwu|hw|2070@mdfb|明都肥北|JVT|mingdufeibei|mdfb|2071@sasn|沙安沙南|YEO|shaanshanan|sasn|2072@cyxd|春原新东|GXQ|chunyuanxindong|cyxd|2073@sz|石州|YKY|shizhou|sz|2074@yj|原江|MFQ|yuanjiang|yj|2075@cc|长昌|QZA|changchang|cc|2076@ndn|宁德南|DBB|ningdenan|ndn|2077@xk|新口|VII|xinkou|xk|2078@ddjd|德东江东|MLC|dedongjiangdong|ddjd|2079@hyn|合原南|BFY|heyuannan|hyn|2080@gcn|广成南|QTI|guangchengnan|gcn|2081@phq|平湖青|AMF|pinghuqing|phq|2082@dl|东兰|NON|donglan|dl|2083@lxx|岭新西|OVK|lingxinxi|lxx|2084@gh|广合|MJA|guanghe|gh|2085@jbn|金白南|GWA|jinbainan|jbn|2086@djx|德京西|WUG|dejingxi|djx|2087@hd|杭岛|QST|hangdao|hd|2088@xjd|西江东|DKP|xijiangdong|xjd|2089@tfb|天肥北|MMY|tianfeibei|tfb|2090@wj|乌津|ACE|wujin|wj|2091@cb|重北|HWN|chongbei|cb|2092@hpx|湖平新|KQO|hupingxin|hpx|2093@msd|门深东|GWM|menshendong|msd|2094@kbxx|口白新西|RWW|koubaixinxi|kbxx|2095@gyb|广阳北|HAZ|guangyangbei|gyb|2096@nhzn|南合郑南|IKL|nanhezhengnan|nhzn|2097@szn|深郑南|DBD|shenzhengnan|szn|2098@bld|白兰东|IVC|bailandong|bld|2099@ltx|岭天西|ZGZ|lingtianxi|ltx|2100@mgl|木贵连|KEE|muguilian|mgl|2101@cd|昌德|TZE|changde|cd|2102@xhh|新哈合|OMI|xinhahe|xhh|2103@qmq|泉明青|NNN|quanmingqing|qmq|2104@dmx|都明西|RDV|dumingxi|dmx|2105@fdc|肥东成|NIM|feidongcheng|fdc|2106@chz|长化州|WTM|changhuazhou|chz|2107@slb|深连北|JRL|shenlianbei|slb|2108@qh|青化|VUM|qinghua|qh|2109@dn|大南|LYL|danan|dn|2110@lhc|岭杭重|JNT|linghangchong|lhc|2111@mskx|木石昆西|FWJ|mushikunxi|mskx|2112@nq|南泉|TFC|nanquan|nq|2113@leb|岭尔北|ORP|lingerbei|leb|2114@ejx|尔京西|WKL|erjingxi|ejx|2115@lgn|林广南|ZYE|linguangnan|lgn|2116@mph|木平化|EQB|mupinghua|mph|2117@nt|南天|JWQ|nantian|nt|2118@jh|家汉|WLA|jiahan|jh|2119@hkn|合口南|YAK|hekounan|hkn|2120@gssx|广石山西|SMP|guangshishanxi|gssx|2121@ljh|林金湖|HMP|linjinhu|ljh|2122@jdld|金东林东|PTS|jindonglindong|jdld|2123@wzx|武州西|NGP|wuzhouxi|wzx|2124@fdb|福东北|HVX|fudongbei|fdb|2125@jhs|京河沙|UUT|jinghesha|jhs|2126@hy|哈阳|WVS|hayang|hy|2127@hzhn|杭庄杭南|FHF|hangzhuanghangnan|hzhn|2128@cln|成林南|GBY|chenglinnan|cln|2129@bdax|滨东安西|GBO|bindonganxi|bdax|2130@jzx|津郑西|EWJ|jinzhengxi|jzx|2131@thb|天海北|SAN|tianhaibei|thb|2132@mld|明岭德|MJO|minglingde|mld|2133@mw|木乌|DMA|muwu|mw|2134@kzjb|昆圳家北|OJO|kunzhenjiabei|kzjb|2135@wmqn|乌木泉南|FSC|wumuquannan|wmqn|2136@ltcx|林太城西|YBQ|lintaichengxi|ltcx|2137@ww|武乌|WSI|wuwu|ww|2138@xcmx|兴城门西|XUF|xingchengmenxi|xcmx|2139@slhd|苏岭海东|QVM|sulinghaidong|slhd|2140@xdl|兴岛兰|PCD|xingdaolan|xdl|2141@ksn|口深南|ZEA|koushennan|ksn|2142@lxzd|兰兴圳东|LAS|lanxingzhendong|lxzd|2143@gw|贵乌|JMU|guiwu|gw|2144@hkhb|河口海北|CWZ|hekouhaibei|hkhb|2145@xsd|西苏东|OFN|xisudong|xsd|2146@zbn|州滨南|AEM|zhoubinnan|zbn|2147@cyx|长宜兴|DAQ|changyixing|cyx|2148@ypc|原平昌|DUU|yuanpingchang|ypc|2149@lh|兰哈|LGD|lanha|lh|2150@clh|昌林湖|FDN|changlinhu|clh|2151@sd|石东|LUC|shidong|sd|2152@efx|尔肥西|OYJ|erfeixi|efx|2153@llnd|林兰南东|JGQ|linlannandong|llnd|2154@dznx|大州宁西|WMA|dazhouningxi|dznx|2155@jmkb|金明口北|EIA|jinmingkoubei|jmkb|2156@ccgx|春长广西|QZM|chunchangguangxi|ccgx|2157@dx|德厦|DUW|dexia|dx|2158@jhd|京海东|AMG|jinghaidong|jhd|2159@hqn|合泉南|TPT|hequannan|hqn|2160@llcd|兰岭城东|YKB|lanlingchengdong|llcd|2161@zhn|州杭南|HVR|zhouhangnan|zhn|2162@mhd|木汉东|AQC|muhandong|mhd|2163@jg|金广|ZOM|jinguang|jg|2164@sdn|石大宁|FAI|shidaning|sdn|2165@nltb|南兰天北|XMX|nanlantianbei|nltb|2166@wqn|乌齐南|XIL|wuqinan|wqn|2167@hl|合连|DTD|helian|hl|2168@gxqd|广新青东|EGA|guangxinqingdong|gxqd|2169@bhd|北河德|CXV|beihede|bhd|2170@hh|汉湖|SOH|hanhu|hh|2171@snx|沈宁西|PLC|shenningxi|snx|2172@ccb|春春北|NTW|chunchunbei|ccb|2173@pqd|平青东|ZGK|pingqingdong|pqd|2174@zcd|州成东|PKN|zhouchengdong|zcd|2175@dfn|岛肥南|KFC|daofeinan|dfn|2176@jjb|江津北|ART|jiangjinbei|jjb|2177@xxx|新新西|YEF|xinxinxi|xxx|2178@mdd|门大东|OUL|mendadong|mdd|2179@kcb|口春北|XVZ|kouchunbei|kcb|2180@bbd|北白东|OHD|beibaidong|bbd|2181@djn|德京南|SUI|dejingnan|djn|2182@lsbb|岭沙白北|YIT|lingshabaibei|lsbb|2183@shc|山湖重|UOG|shanhuchong|shc|2184@nk|南口|DGU|nankou|nk|2185@lsl|兰沙兰|WKB|lanshalan|lsl|2186@lfqd|连福青东|UYG|lianfuqingdong|lfqd|2187@tgkn|太贵口南|IZL|taiguikounan|tgkn|2188@wz|乌庄|LWW|wuzhuang|wz|2189@hqb|汉青北|SYS|hanqingbei|hqb|2190@xxw|厦兴武|EBS|xiaxingwu|xxw|2191@lbn|林白南|HRP|linbainan|lbn|2192@smn|沈门南|CWL|shenmennan|smn|2193@dx|岛厦|OXH|daoxia|dx|2194@hjd|哈济东|NUE|hajidong|hjd|2195@cgn|长广南|NIK|changguangnan|cgn|2196@zdb|庄岛北|GGM|zhuangdaobei|zdb|2197@hdmx|化大门西|OVG|huadamenxi|hdmx|2198@zwb|圳武北|QNL|zhenwubei|zwb|2199@ntx|宁太西|POX|ningtaixi|ntx|2200@bkn|滨口南|QND|binkounan|bkn|2201@gyx|贵宜西|SXK|guiyixi|gyx|2202@cx|昌西|ZZS|changxi|cx|2203@dcd|大城东|GAO|dachengdong|dcd|2204@dqq|德庆青|TON|deqingqing|dqq|2205@gwnd|贵乌宁东|HJF|guiwuningdong|gwnd|2206@ssj|沙山津|ZLG|shashanjin|ssj|2207@cw|春乌|DVH|chunwu|cw|2208@xc|西昌|YAO|xichang|xc|2209@zljx|圳连江西|UZY|zhenlianjiangxi|zljx|2210@gzx|贵圳西|AKE|guizhenxi|gzx|2211@hd|化大|XKA|huada|hd|2212@ec|尔长|UZA|erchang|ec|2213@zkn|圳昆南|ODS|zhenkunnan|zkn|2214@wl|武兰|DBV|wulan|wl|2215@bmx|滨明西|OWX|binmingxi|bmx|2216@lkj|连昆家|YZO|liankunjia|lkj|2217@hle|合连尔|LKC|helianer|hle|2218@qh|齐合|JFB|qihe|qh|2219@ds|德石|ODY|deshi|ds|2220@jcx|江长西|IAS|jiangchangxi|jcx|2221@zd|圳东|NRB|zhendong|zd|2222@xcn|厦成南|IGX|xiachengnan|xcn|2223@nh|南合|DWO|nanhe|nh|2224@ymd|宜明东|GKI|yimingdong|ymd|2225@bs|白苏|UIF|baisu|bs|2226@mfx|明福西|ZWT|mingfuxi|mfx|2227@ll|兰连|WQA|lanlian|ll|2228@ssn|苏石南|BXK|sushinan|ssn|2229@byb|北宜北|EAB|beiyibei|byb|2230@jshb|金石河北|WHY|jinshihebei|jshb|2231@hhx|杭汉西|MYJ|hanghanxi|hhx|2232@tyd|太原东|MQJ|taiyuandong|tyd|2233@zbwn|郑白武南|RRO|zhengbaiwunan|zbwn|2234@ycx|原昌西|VQA|yuanchangxi|ycx|2235@bcxb|滨昌兴北|KJO|binchangxingbei|bcxb|2236@hx|汉西|FFU|hanxi|hx|2237@bhh|白哈杭|RNS|baihahang|bhh|2238@lqd|林泉东|DVD|linquandong|lqd|2239@yzx|阳庄西|EYD|yangzhuangxi|yzx|2240@hxx|哈新西|BSQ|haxinxi|hxx|2241@mebn|明尔北南|NPJ|mingerbeinan|mebn|2242@ylb|宜兰北|BFU|yilanbei|ylb|2243@tb|天北|XPZ|tianbei|tb|2244@dsx|都山西|RLY|dushanxi|dsx|2245@hkz|湖昆圳|KNT|hukunzhen|hkz|2246@bl|滨岭|PII|binling|bl|2247@jfb|济福北|DEC|jifubei|jfb|2248@dbbx|大北白西|ZJN|dabeibaixi|dbbx|2249@dl|大岭|SJL|daling|dl|2250@njd|宁京东|GZN|ningjingdong|njd|2251@kd|昆东|AHR|kundong|kd|2252@dc|大城|FKI|dacheng|dc|2253@hw|杭武|WDW|hangwu|hw|2254@tqb|太青北|BMJ|taiqingbei|tqb|2255@ysb|原上北|RGN|yuanshangbei|ysb|2256@chd|长哈东|TQF|changhadong|chd|2257@xlb|西林北|BCQ|xilinbei|xlb|2258@hxl|海新岭|FEG|haixinling|hxl|2259@wwx|武武西|VQK|wuwuxi|wwx|2260@nyn|宁原南|GSC|ningyuannan|nyn|2261@sdb|深都北|ATB|shendubei|sdb|2262@stf|深天肥|MOC|shentianfei|stf|2263@fsy|肥山宜|LKJ|feishanyi|fsy|2264@qyx|泉宜西|FRJ|quanyixi|qyx|2265@tdsx|天德山西|IFI|tiandeshanxi|tdsx|2266@qxn|青厦南|NEC|qingxianan|qxn|2267@xdmx|西岛明西|JOH|xidaomingxi|xdmx|2268@jjcd|济金昌东|BJF|jijinchangdong|jjcd|2269@xa|厦安|PTR|xiaan|xa|2270@qhn|青汉南|TGJ|qinghannan|qhn|2271@hdh|化东海|LWU|huadonghai|hdh|2272@zsd|郑山东|UXM|zhengshandong|zsd|2273@jln|济林南|MFF|jilinnan|jln|2274@cls|昌兰山|NQQ|changlanshan|cls|2275@tsd|天沈东|SJO|tianshendong|tsd|2276@flld|肥林连东|REC|feilinliandong|flld|2277@syx|上阳厦|EZP|shangyangxia|syx|2278@ady|安岛宜|XEF|andaoyi|ady|2279@jsxd|津沈厦东|DUL|jinshenxiadong|jsxd|2280@jm|金门|FME|jinmen|jm|2281@xmjd|西明济东|MZT|ximingjidong|xmjd|2282@mck|门春口|LDV|menchunkou|mck|2283@qg|齐贵|KIY|qigui|qg|2284@sjsn|深济沙南|JKI|shenjishanan|sjsn|2285@gsqb|贵沙庆北|OEG|guishaqingbei|gsqb|2286@xjm|西津门|BWF|xijinmen|xjm|2287@zhz|州化圳|UFE|zhouhuazhen|zhz|2288@ysa|原山安|XJC|yuanshanan|ysa|2289@hjs|哈家沙|FCR|hajiasha|hjs|2290@zfx|郑福西|GII|zhengfuxi|zfx|2291@dhs|都哈上|VSU|duhashang|dhs|2292@qh|齐湖|YTW|qihu|qh|2293@hhn|汉杭宁|PLT|hanhangning|hhn|2294@hsx|化深西|JCI|huashenxi|hsx|2295@ns|南苏|IWV|nansu|ns|2296@kf|昆肥|SAA|kunfei|kf|2297@gfcn|贵肥长南|TPJ|guifeichangnan|gfcn|2298@hdb|杭德北|AZZ|hangdebei|hdb|2299@hhd|化化东|SAQ|huahuadong|hhd|2300@jtwn|家天乌南|WWJ|jiatianwunan|jtwn|2301@sq|深泉|QJQ|shenquan|sq|2302@gm|贵门|YBL|guimen|gm|2303@cqa|昌齐安|OIG|changqian|cqa|2304@sjd|沈家东|ZAO|shenjiadong|sjd|2305@mm|木门|CWF|mumen|mm|2306@yn|阳宁|WVB|yangning|yn|2307@ysx|阳苏西|TCL|yangsuxi|ysx|2308@nh|宁海|RJD|ninghai|nh|2309@qgn|庆广南|XJT|qingguangnan|qgn|2310@hljd|杭林家东|HQY|hanglinjiadong|hljd|2311@fjn|肥济南|WXD|feijinan|fjn|2312@qcs|齐长深|BRA|qichangshen|qcs|2313@qcd|青长东|FLE|qingchangdong|qcd|2314@acn|安春南|IXD|anchunnan|acn|2315@ss|深石|LPJ|shenshi|ss|2316@gsnb|广石南北|UUS|guangshinanbei|gsnb|2317@sbd|沈北东|WIA|shenbeidong|sbd|2318@ds|德山|VOF|deshan|ds|2319@xhh|西湖湖|CUO|xihuhu|xhh|2320@zln|州兰南|RGQ|zhoulannan|zln|2321@hyln|汉原岭南|GSS|hanyuanlingnan|hyln|2322@bhn|滨哈南|XKQ|binhanan|bhn|2323@knh|口南海|WSD|kounanhai|knh|2324@hxhb|汉厦哈北|DZW|hanxiahabei|hxhb|2325@dqn|东齐南|PNO|dongqinan|dqn|2326@ffs|肥肥沙|IJX|feifeisha|ffs|2327@lh|兰海|DEW|lanhai|lh|2328@dq|大齐|SKU|daqi|dq|2329@byn|北阳南|KXF|beiyangnan|byn|2330@bf|滨肥|STJ|binfei|bf|2331@yw|宜乌|ANE|yiwu|yw|2332@zcx|圳重西|OZQ|zhenchongxi|zcx|2333@mes|明尔山|IPA|mingershan|mes|2334@lqc|兰齐春|IBJ|lanqichun|lqc|2335@ltn|兰天南|TQS|lantiannan|ltn|2336@wsgn|乌苏贵南|FSB|wusuguinan|wsgn|2337@scnd|山成南东|SNU|shanchengnandong|scnd|2338@qnsn|青南石南|TTT|qingnanshinan|qnsn|2339@qgmb|青广门北|UHX|qingguangmenbei|qgmb|2340@hpy|合平阳|QBN|hepingyang|hpy|2341@bkkb|北口昆北|HAI|beikoukunbei|bkkb|2342@qc|齐春|GCW|qichun|qc|2343@hzsn|哈州石南|TRX|hazhoushinan|hzsn|2344@sxlx|沈厦林西|TLY|shenxialinxi|sxlx|2345@fzj|福庄金|NPZ|fuzhuangjin|fzj|2346@ykb|原口北|EHK|yuankoubei|ykb|2347@whjb|乌合京北|ZTP|wuhejingbei|whjb|2348@dzc|东州春|KLD|dongzhouchun|dzc|2349@hgn|汉贵南|ADS|hanguinan|hgn|2350@hl|化兰|NNX|hualan|hl|2351@hdn|海德南|QUC|haidenan|hdn|2352@etd|尔太东|UCU|ertaidong|etd|2353@sbn|上北南|VDH|shangbeinan|sbn|2354@hsd|哈深东|ZNQ|hashendong|hsd|2355@zdh|庄大杭|PVO|zhuangdahang|zdh|2356@fxd|福西东|BLD|fuxidong|fxd|2357@cc|城重|DHI|chengchong|cc|2358@sd|上都|NEB|shangdu|sd|2359@skzx|石口圳西|XKM|shikouzhenxi|skzx|2360@qj|齐家|DZI|qijia|qj|2361@ctx|重太西|ESM|chongtaixi|ctx|2362@jtcn|金天春南|XXB|jintianchunnan|jtcn|2363@xzj|新郑金|MUA|xinzhengjin|xzj|2364@sh|沈化|IBN|shenhua|sh|2365@dscx|都上成西|ULG|dushangchengxi|dscx|2366@hhx|海合西|IQY|haihexi|hhx|2367@qsb|青石北|YMF|qingshibei|qsb|2368@yjcd|阳金成东|XUC|yangjinchengdong|yjcd|2369@zq|圳青|CYQ|zhenqing|zq|2370@lmkx|林木昆西|NQR|linmukunxi|lmkx|2371@wcw|武长乌|CLK|wuchangwu|wcw|2372@hn|湖宁|TBR|huning|hn|2373@wthb|乌天哈北|CPR|wutianhabei|wthb|2374@bn|白宁|QZZ|baining|bn|2375@qcf|齐昌肥|PJE|qichangfei|qcf|2376@qj|泉津|YTQ|quanjin|qj|2377@blx|滨兰新|NIH|binlanxin|blx|2378@xhsb|兴海苏北|UYZ|xinghaisubei|xhsb|2379@dd|都大|XMR|duda|dd|2380@cgb|长广北|BBA|changguangbei|cgb|2381@ksx|口山西|AWL|koushanxi|ksx|2382@hh|湖杭|RNT|huhang|hh|2383@adb|安岛北|DZH|andaobei|adb|2384@md|明大|SIO|mingda|md|2385@zssx|圳沈沈西|MNW|zhenshenshenxi|zssx|2386@kl|昆兰|CKM|kunlan|kl|2387@sldd|苏林大东|KVF|sulindadong|sldd|2388@ymx|阳明西|YDM|yangmingxi|ymx|2389@mp|明平|LJX|mingping|mp|2390@zcs|郑长山|DSJ|zhengchangshan|zcs|2391@mzc|明圳重|WNW|mingzhenchong|mzc|2392@gxj|广厦金|UBS|guangxiajin|gxj|2393@stx|上太西|AUK|shangtaixi|stx|2394@jmb|京明北|YIR|jingmingbei|jmb|2395@dx|大厦|EVW|daxia|dx|2396@lbx|连滨西|VJD|lianbinxi|lbx|2397@qamb|青安明北|SIJ|qinganmingbei|qamb|2398@hab|河安北|VNG|heanbei|hab|2399@ljhx|岭家湖西|PLW|lingjiahuxi|ljhx|2400@hs|哈沈|ERN|hashen|hs|2401@ssen|苏苏尔南|QCR|susuernan|ssen|2402@qhn|青河南|YPJ|qinghenan|qhn|2403@bzn|北圳南|PAV|beizhennan|bzn|2404@jzd|江郑东|HJI|jiangzhengdong|jzd|2405@fh|福湖|MER|fuhu|fh|2406@ccx|长春西|YTE|changchunxi|ccx|2407@ch|长化|MYL|changhua|ch|2408@hh|化海|NMM|huahai|hh|2409@kjx|口江西|VIQ|koujiangxi|kjx|2410@jcb|金长北|ITP|jinchangbei|jcb|2411@jzld|家庄连东|CIP|jiazhuangliandong|jzld|2412@ftbx|福天白西|PSE|futianbaixi|ftbx|2413@qzxd|庆圳兴东|JMQ|qingzhenxingdong|qzxd|2414@zs|圳沙|ZPM|zhensha|zs|2415@hq|哈庆|HMQ|haqing|hq|2416@plx|平林西|SLJ|pinglinxi|plx|2417@dtdb|德天大北|VWL|detiandabei|dtdb|2418@ngb|南广北|EEX|nanguangbei|ngb|2419@cbd|成北东|EWT|chengbeidong|cbd|2420@hslx|杭苏兰西|OGC|hangsulanxi|hslx|2421@sd|苏都|VHF|sudu|sd|2422@tjn|太家南|BYW|taijianan|tjn|2423@ywn|原乌南|SJN|yuanwunan|ywn|2424@qwn|泉武南|JKU|quanwunan|qwn|2425@jcn|津长南|HCK|jinchangnan|jcn|2426@kq|口庆|THZ|kouqing|kq|2427@yjd|宜金德|CAC|yijinde|yjd|2428@kln|昆岭南|PTZ|kunlingnan|kln|2429@xldx|新林都西|EKR|xinlinduxi|xldx|2430@jnx|家南西|CRD|jiananxi|jnx|2431@zfzd|州肥圳东|XJY|zhoufeizhendong|zfzd|2432@hljd|汉连家东|WXV|hanlianjiadong|hljd|2433@dqb|东青北|RYI|dongqingbei|dqb|2434@jm|金木|NWL|jinmu|jm|2435@sc|深成|NHV|shencheng|sc|2436@jkw|济口武|UBR|jikouwu|jkw|2437@jc|京成|MAO|jingcheng|jc|2438@czb|城圳北|ADO|chengzhenbei|czb|2439@syd|沈宜东|NGQ|shenyidong|syd|2440@mjb|木江北|CML|mujiangbei|mjb|2441@wh|乌湖|CCY|wuhu|wh|2442@dgd|东贵东|ADK|dongguidong|dgd|2443@mkg|明口广|BZO|mingkouguang|mkg|2444@sw|沈武|RPO|shenwu|sw|2445@hsd|河深东|KER|heshendong|hsd|2446@wqp|乌青平|BUO|wuqingping|wqp|2447@qtx|青太西|LEL|qingtaixi|qtx|2448@gz|贵州|GBH|guizhou|gz|2449@jhx|金化西|MDN|jinhuaxi|jhx|2450@sszx|深沈圳西|COK|shenshenzhenxi|sszx|2451@py|平原|IEF|pingyuan|py|2452@qh|齐河|IKB|qihe|qh|2453@ccd|重昌东|WEX|chongchangdong|ccd|2454@tqjn|太青家南|UGN|taiqingjianan|tqjn|2455@yzd|阳州东|YMS|yangzhoudong|yzd|2456@ybd|原滨东|OUD|yuanbindong|ybd|2457@sl|上连|MHE|shanglian|sl|2458@kxb|昆新北|IRB|kunxinbei|kxb|2459@lnd|岭南东|XPX|lingnandong|lnd|2460@shx|石湖西|GOQ|shihuxi|shx|2461@sfx|沈福西|XZB|shenfuxi|sfx|2462@tqx|太青西|SSQ|taiqingxi|tqx|2463@dtx|岛太西|TAG|daotaixi|dtx|2464@ssn|深石南|WQO|shenshinan|ssn|2465@fdc|肥德长|HNN|feidechang|fdc|2466@zdn|州东南|GCA|zhoudongnan|zdn|2467@lscn|兰石昌南|AOQ|lanshichangnan|lscn|2468@lcx|林重新|WAX|linchongxin|lcx|2469@ntd|宁天德|JHC|ningtiande|ntd|2470@jcd|津长东|BXN|jinchangdong|jcd|2471@cwsd|城乌沙东|YSH|chengwushadong|cwsd|2472@zjl|庄京岭|XAK|zhuangjingling|zjl|2473@mda|木都安|DXD|muduan|mda|2474@hjx|哈金西|QQK|hajinxi|hjx|2475@mld|门连东|HAU|menliandong|mld|2476@bfsn|滨肥深南|WED|binfeishennan|bfsn|2477@nbg|南白广|NUV|nanbaiguang|nbg|2478@dsn|东沈南|CFT|dongshennan|dsn|2479@sz|苏庄|INO|suzhuang|sz|2480@dpld|东平连东|XIO|dongpingliandong|dpld|2481@dxb|大兴北|MYQ|daxingbei|dxb|2482@nhx|宁海西|LPE|ninghaixi|nhx|2483@hgb|河贵北|HVV|heguibei|hgb|2484@bq|滨齐|XXR|binqi|bq|2485@nj|南金|YAF|nanjin|nj|2486@wm|武木|XBL|wumu|wm|2487@wzd|武郑东|JNW|wuzhengdong|wzd|2488@nc|宁重|AMH|ningchong|nc|2489@qgz|齐广郑|BGA|qiguangzheng|qgz|2490@ss|上沙|YAL|shangsha|ss|2491@xcx|厦成新|XHK|xiachengxin|xcx|2492@zxhx|庄西湖西|HYC|zhuangxihuxi|zxhx|2493@lsj|连沈金|ZEJ|lianshenjin|lsj|2494@sh|深哈|NAV|shenha|sh|2495@hjd|合济东|IGD|hejidong|hjd|2496@qml|齐木林|EXQ|qimulin|qml|2497@dw|东武|SBQ|dongwu|dw|2498@zh|庄哈|WPR|zhuangha|zh|2499@ja|家安|QNZ|jiaan|ja|2500@hxx|化新西|MHB|huaxinxi|hxx|2501@cmc|长木春|KUG|changmuchun|cmc|2502@kccn|昆长成南|NQS|kunchangchengnan|kccn|2503@ds|东山|RGZ|dongshan|ds|2504@dxx|德厦西|CEJ|dexiaxi|dxx|2505@maw|门安乌|TZB|menanwu|maw|2506@gtd|广天东|MHM|guangtiandong|gtd|2507@zcb|州昌北|EMT|zhouchangbei|zcb|2508@ysx|宜山西|HHB|yishanxi|ysx|2509@nqzn|南泉郑南|WAW|nanquanzhengnan|nqzn|2510@jcn|江城南|QXZ|jiangchengnan|jcn|2511@dd|岛东|NPV|daodong|dd|2512@zfb|郑福北|SYQ|zhengfubei|zfb|2513@bqn|滨泉南|SBB|binquannan|bqn|2514@hqb|哈青北|CLW|haqingbei|hqb|2515@xz|新庄|IBR|xinzhuang|xz|2516@gyd|贵原东|IIX|guiyuandong|gyd|2517@nsx|宁苏西|QUS|ningsuxi|nsx|2518@sfn|上肥南|SBW|shangfeinan|sfn|2519@scd|深城东|UQJ|shenchengdong|scd|2520@ckd|重口东|DTW|chongkoudong|ckd|2521@ssjb|深上江北|FJO|shenshangjiangbei|ssjb|2522@hsh|哈深汉|CIW|hashenhan|hsh|2523@yma|阳木安|HQH|yangmuan|yma|2524@scb|沙昌北|TTZ|shachangbei|scb|2525@hld|湖林东|SAZ|hulindong|hld|2526@xgn|西广南|JLE|xiguangnan|xgn|2527@fcb|福重北|YST|fuchongbei|fcb|2528@fd|肥东|SCV|feidong|fd|2529@qlz|庆兰庄|KJK|qinglanzhuang|qlz|2530@nygn|宁宜广南|KVT|ningyiguangnan|nygn|2531@zhn|圳哈南|XZV|zhenhanan|zhn|2532@fmn|肥明南|CVV|feimingnan|fmn|2533@zfx|庄肥西|HGP|zhuangfeixi|zfx|2534@tmzx|太木州西|MXC|taimuzhouxi|tmzx|2535@mj|门家|FCH|menjia|mj|2536@awd|安武东|ACL|anwudong|awd|2537@pm|平木|PYS|pingmu|pm|2538@pjsn|平金沈南|XZA|pingjinshennan|pjsn|2539@scl|山城林|XUK|shanchenglin|scl|2540@jdb|江大北|HNJ|jiangdabei|jdb|2541@jsn|江沙南|UKT|jiangshanan|jsn|2542@hq|哈青|JRP|haqing|hq|2543@xzn|新州南|DOX|xinzhounan|xzn|2544@swx|石乌西|FBL|shiwuxi|swx|2545@eqbd|尔青白东|LPF|erqingbaidong|eqbd|2546@sm|苏木|BAV|sumu|sm|2547@cxc|昌新成|HER|changxincheng|cxc|2548@xkex|西口尔西|AOM|xikouerxi|xkex|2549@qq|青齐|TZC|qingqi|qq|2550@ghan|广汉安南|AZJ|guanghanannan|ghan|2551@jkjb|家口津北|LYI|jiakoujinbei|jkjb|2552@hfd|哈福东|EOJ|hafudong|hfd|2553@dh|都杭|ROD|duhang|dh|2554@fld|肥兰东|XDQ|feilandong|fld|2555@jqd|金庆东|FQT|jinqingdong|jqd|2556@dh|德汉|JQP|dehan|dh|2557@bwn|滨武南|YYE|binwunan|bwn|2558@sssx|石沙沈西|IAP|shishashenxi|sssx|2559@tjqd|天江庆东|SSZ|tianjiangqingdong|tjqd|2560@qhhb|青湖湖北|TBP|qinghuhubei|qhhb|2561@czsd|重庄沈东|UUN|chongzhuangshendong|czsd|2562@kkb|昆昆北|QBI|kunkunbei|kkb|2563@dhd|都哈东|GNZ|duhadong|dhd|2564@yqzd|原泉圳东|BPT|yuanquanzhendong|yqzd|2565@atx|安太西|QTP|antaixi|atx|2566@ff|福肥|AUW|fufei|ff|2567@lh|林河|BEU|linhe|lh|2568@sw|上武|XYY|shangwu|sw|2569@syd|深原东|MVT|shenyuandong|syd|2570@dcx|大重西|EGL|dachongxi|dcx|2571@dc|岛春|PHR|daochun|dc|2572@qecx|青尔城西|GDT|qingerchengxi|qecx|2573@msx|木沈西|EWU|mushenxi|msx|2574@xhd|西化东|GDJ|xihuadong|xhd|2575@jcjn|家成京南|ZDW|jiachengjingnan|jcjn|2576@sa|上安|OWB|shangan|sa|2577@nxx|宁西西|JDW|ningxixi|nxx|2578@bywd|滨原武东|YLF|binyuanwudong|bywd|2579@scd|苏昌东|SAK|suchangdong|scd|2580@bdh|滨都合|JWG|binduhe|bdh|2581@zdxx|州德兴西|QHA|zhoudexingxi|zdxx|2582@hly|海岭阳|BFO|hailingyang|hly|2583@kyc|口阳城|VXF|kouyangcheng|kyc|2584@hqcd|海青重东|BLM|haiqingchongdong|hqcd|2585@jq|济庆|KNF|jiqing|jq|2586@xsd|兴沙东|ZCB|xingshadong|xsd|2587@bqcb|北庆重北|BJA|beiqingchongbei|bqcb|2588@glk|广连昆|CYG|guangliankun|glk|2589@tdhx|太都汉西|XLY|taiduhanxi|tdhx|2590@xbx|厦北西|CKG|xiabeixi|xbx|2591@ss|石石|QKN|shishi|ss|2592@dwd|岛武东|JYT|daowudong|dwd|2593@dnb|岛宁北|OFM|daoningbei|dnb|2594@lhb|兰汉北|FHJ|lanhanbei|lhb|2595@yl|阳兰|ZLN|yanglan|yl|2596@sl|深连|BAH|shenlian|sl|2597@mxd|木新东|GCZ|muxindong|mxd|2598@jbb|济北北|QPQ|jibeibei|jbb|2599@snb|沙南北|HLJ|shananbei|snb|2600@gl|贵林|MSO|guilin|gl|2601@nwwb|宁武武北|EEV|ningwuwubei|nwwb|2602@dqd|岛泉都|LRK|daoquandu|dqd|2603@cmd|春明大|CEI|chunmingda|cmd|2604@mhb|明杭北|PBT|minghangbei|mhb|2605@ch|长湖|INT|changhu|ch|2606@ljn|兰津南|RRK|lanjinnan|ljn|2607@ssb|沙苏北|TNU|shasubei|ssb|2608@hqd|哈庆东|ZWE|haqingdong|hqd|2609@fw|福武|UNN|fuwu|fw|2610@jzm|津郑木|JKG|jinzhengmu|jzm|2611@fc|肥昌|ICY|feichang|fc|2612@mg|明广|AIW|mingguang|mg|2613@hqc|杭青重|NAF|hangqingchong|hqc|2614@nsbb|宁山滨北|JDO|ningshanbinbei|nsbb|2615@sb|深北|SSS|shenbei|sb|2616@qbcd|青滨昌东|HDT|qingbinchangdong|qbcd|2617@hjb|海济北|KTY|haijibei|hjb|2618@ztmb|庄天木北|OPG|zhuangtianmubei|ztmb|2619@xm|厦门|UBG|xiamen|xm|2620@ztd|州太东|NFP|zhoutaidong|ztd|2621@zmfn|郑明肥南|VPY|zhengmingfeinan|zmfn|2622@fnx|肥宁西|JMM|feiningxi|fnx|2623@lbhd|岭滨哈东|PKI|lingbinhadong|lbhd|2624@fjn|肥津南|BHE|feijinnan|fjn|2625@wsb|乌沙北|NLX|wushabei|wsb|2626@zy|郑宜|AVF|zhengyi|zy|2627@zwqn|郑乌泉南|OIC|zhengwuquannan|zwqn|2628@qsx|泉沈西|WBS|quanshenxi|qsx|2629@cd|长都|PDD|changdu|cd|2630@shd|苏哈东|RNE|suhadong|shd|2631@xq|新泉|NJO|xinquan|xq|2632@lc|林春|FMY|linchun|lc|2633@hnhd|海宁合东|ESN|haininghedong|hnhd|2634@mbn|明北宁|GOV|mingbeining|mbn|2635@hnb|海南北|DIT|hainanbei|hnb|2636@qw|青武|XWZ|qingwu|qw|2637@hb|湖北|MMI|hubei|hb|2638@wc|乌长|CPM|wuchang|wc|2639@zj|郑金|HIX|zhengjin|zj|2640@hbnx|哈滨宁西|TOR|habinningxi|hbnx|2641@scm|石重明|SKB|shichongming|scm|2642@mj|木金|HAF|mujin|mj|2643@lfd|林肥东|KPL|linfeidong|lfd|2644@dmx|德木西|CCO|demuxi|dmx|2645@exd|尔新东|PGA|erxindong|exd|2646@sj|山江|AVQ|shanjiang|sj|2647@ebjd|尔北金东|TVC|erbeijindong|ebjd|2648@hytn|海原天南|ZVV|haiyuantiannan|hytn|2649@km|口木|BFE|koumu|km|2650@qx|泉厦|QBL|quanxia|qx|2651@zdyb|圳都阳北|EZK|zhenduyangbei|zdyb|2652@smn|石门南|UWD|shimennan|smn|2653@cqyn|昌庆原南|XEU|changqingyuannan|cqyn|2654@kdn|昆东南|EAT|kundongnan|kdn|2655@hx|合西|OFK|hexi|hx|2656@bq|白泉|AUU|baiquan|bq|2657@td|太都|EOA|taidu|td|2658@lst|兰深天|WFB|lanshentian|lst|2659@ph|平海|UJC|pinghai|ph|2660@hhf|杭海肥|IUH|hanghaifei|hhf|2661@sc|上城|FQG|shangcheng|sc|2662@jsb|济沈北|FVX|jishenbei|jsb|2663@qk|青昆|IZG|qingkun|qk|2664@qb|齐北|NXK|qibei|qb|2665@xz|厦郑|YZT|xiazheng|xz|2666@my|木原|OHN|muyuan|my|2667@hjx|河家西|APM|hejiaxi|hjx|2668@hh|合合|JWZ|hehe|hh|2669@cscn|长沙昌南|JHE|changshachangnan|cscn|2670@dc|岛重|RMJ|daochong|dc|2671@qhn|泉杭南|DQS|quanhangnan|qhn|2672@yl|阳连|CJH|yanglian|yl|2673@jtd|津太德|RIZ|jintaide|jtd|2674@hx|海厦|FBJ|haixia|hx|2675@cwyd|城武阳东|SEF|chengwuyangdong|cwyd|2676@hhh|湖海汉|PMM|huhaihan|hhh|2677@jtx|济太西|OBS|jitaixi|jtx|2678@dhx|大化西|SGM|dahuaxi|dhx|2679@hyz|湖阳圳|JWF|huyangzhen|hyz|2680@qx|庆兴|JBO|qingxing|qx|2681@qkn|泉昆南|MFY|quankunnan|qkn|2682@xhd|厦杭东|GTQ|xiahangdong|xhd|2683@nmb|南木北|SBS|nanmubei|nmb|2684@xzd|厦庄东|DJN|xiazhuangdong|xzd|2685@xjb|新江北|QYH|xinjiangbei|xjb|2686@jc|津长|UOA|jinchang|jc|2687@lcj|林春济|OBX|linchunji|lcj|2688@jjdb|家金都北|XVY|jiajindubei|jjdb|2689@dnd|岛宁东|ADR|daoningdong|dnd|2690@qj|青江|HRC|qingjiang|qj|2691@shcx|山哈春西|DEO|shanhachunxi|shcx|2692@xj|新济|NIT|xinji|xj|2693@lcx|连长西|EAC|lianchangxi|lcx|2694@hdh|化都哈|QLJ|huaduha|hdh|2695@exx|尔厦西|AEQ|erxiaxi|exx|2696@xzd|西圳东|LLO|xizhendong|xzd|2697@swx|深乌西|VML|shenwuxi|swx|2698@wsx|乌沈西|MTH|wushenxi|wsx|2699@glx|贵林西|JSQ|guilinxi|glx|2700@bdn|北岛南|POH|beidaonan|bdn|2701@badn|滨安东南|MRC|binandongnan|badn|2702@tjn|太金南|EQX|taijinnan|tjn|2703@mkx|门昆西|DKJ|menkunxi|mkx|2704@zhn|州化南|FZM|zhouhuanan|zhn|2705@hfb|汉福北|OWP|hanfubei|hfb|2706@ljn|兰江南|UIH|lanjiangnan|ljn|2707@ddd|东德东|RFI|dongdedong|ddd|2708@mm|木明|GQY|muming|mm|2709@cqn|城青南|SON|chengqingnan|cqn|2710@hm|河明|VUK|heming|hm|2711@cd|重岛|PBZ|chongdao|cd|2712@nsx|宁石西|JSV|ningshixi|nsx|2713@pc|平城|BJW|pingcheng|pc|2714@fh|肥河|AOA|feihe|fh|2715@xdn|西大南|SVF|xidanan|xdn|2716@xfb|兴福北|NRD|xingfubei|xfb|2717@slq|沈兰庆|MOO|shenlanqing|slq|2718@cad|城安东|PFZ|chengandong|cad|2719@qqb|庆庆北|OZD|qingqingbei|qqb|2720@cad|昌安东|PPH|changandong|cad|2721@smd|石明东|UMK|shimingdong|smd|2722@msd|明苏东|LFP|mingsudong|msd|2723@ksbb|昆苏滨北|KZJ|kunsubinbei|ksbb|2724@smd|深门东|ZRU|shenmendong|smd|2725@sjx|沙江西|VJH|shajiangxi|sjx|2726@qen|青尔南|VQT|qingernan|qen|2727@lsj|岭山京|ALB|lingshanjing|lsj|2728@elx|尔岭西|LTV|erlingxi|elx|2729@ycsn|原城苏南|BKF|yuanchengsunan|ycsn|2730@hqx|汉青西|OBU|hanqingxi|hqx|2731@xnc|新南重|XBJ|xinnanchong|xnc|2732@gsx|广沈西|PVM|guangshenxi|gsx|2733@jbd|家白东|XIY|jiabaidong|jbd|2734@hbmn|化北明南|ATQ|huabeimingnan|hbmn|2735@bjd|北家东|BFL|beijiadong|bjd|2736@czn|长郑南|WTS|changzhengnan|czn|2737@xe|兴尔|ODE|xinger|xe|2738@ccwn|成昌乌南|MPD|chengchangwunan|ccwn|2739@lcl|林成林|YHC|linchenglin|lcl|2740@qzb|泉州北|PBB|quanzhoubei|qzb|2741@ljyb|兰江原北|BFB|lanjiangyuanbei|ljyb|2742@sp|苏平|EBO|suping|sp|2743@pkad|平昆安东|GTK|pingkunandong|pkad|2744@hsxx|合沙厦西|LTP|heshaxiaxi|hsxx|2745@tjan|天江安南|NYU|tianjiangannan|tjan|2746@shn|沙合南|FGY|shahenan|shn|2747@hhhn|化海湖南|XHT|huahaihunan|hhhn|2748@kmn|昆木南|MOQ|kunmunan|kmn|2749@jwd|家武岛|DYC|jiawudao|jwd|2750@wjx|乌江西|NOF|wujiangxi|wjx|2751@jesn|金尔苏南|DSX|jinersunan|jesn|2752@ml|木连|VSJ|mulian|ml|2753@fx|肥厦|ODW|feixia|fx|2754@kkb|昆口北|CHL|kunkoubei|kkb|2755@ss|深苏|ZVY|shensu|ss|2756@cmb|重门北|ZPR|chongmenbei|cmb|2757@hhx|湖海西|QMC|huhaixi|hhx|2758@yf|阳福|JJJ|yangfu|yf|2759@zcnb|庄春南北|CHO|zhuangchunnanbei|zcnb|2760@nscn|宁山昌南|JMT|ningshanchangnan|nscn|2761@dd|都岛|XWN|dudao|dd|2762@dz|东州|IUZ|dongzhou|dz|2763@xxx|厦厦西|XOF|xiaxiaxi|xxx|2764@thn|天化南|XQW|tianhuanan|thn|2765@hxab|汉兴安北|MNS|hanxinganbei|hxab|2766@gkx|贵口西|LPR|guikouxi|gkx|2767@qjn|泉金南|LBG|quanjinnan|qjn|2768@kxd|昆兴东|EBL|kunxingdong|kxd|2769@lqx|连泉西|SIE|lianquanxi|lqx|2770@blf|北兰肥|VUO|beilanfei|blf|2771@lac|岭安城|ZIU|lingancheng|lac|2772@zzb|郑庄北|YQK|zhengzhuangbei|zzb|2773@xq|西庆|XXD|xiqing|xq|2774@mxb|木新北|ITZ|muxinbei|mxb|2775@ygb|原广北|ZNS|yuanguangbei|ygb|2776@gcx|贵成西|DKU|guichengxi|gcx|2777@jnq|金南齐|RPU|jinnanqi|jnq|2778@hjlb|湖江兰北|GCX|hujianglanbei|hjlb|2779@cfdn|重福东南|HPB|chongfudongnan|cfdn|2780@tshb|太上哈北|ZBC|taishanghabei|tshb|2781@jq|江齐|ZBO|jiangqi|jq|2782@jjb|江金北|SFH|jiangjinbei|jjb|2783@jjn|津京南|MES|jinjingnan|jjn|2784@qsx|青苏西|QUD|qingsuxi|qsx|2785@hzd|哈庄东|SDM|hazhuangdong|hzd|2786@bsb|滨石北|IEJ|binshibei|bsb|2787@mchn|门成河南|OVA|menchenghenan|mchn|2788@dzlb|东庄林北|ICT|dongzhuanglinbei|dzlb|2789@cjhx|成济化西|HGV|chengjihuaxi|cjhx|2790@tjjd|太江江东|AYN|taijiangjiangdong|tjjd|2791@ydbx|原都北西|YPB|yuandubeixi|ydbx|2792@ts|天石|BCL|tianshi|ts|2793@ks|昆上|LRQ|kunshang|ks|2794@mkd|门昆东|IQW|menkundong|mkd|2795@qhyx|泉合阳西|XVB|quanheyangxi|qhyx|2796@sj|深京|PTI|shenjing|sj|2797@sbh|山滨化|UJS|shanbinhua|sbh|2798@mhn|门海南|TPF|menhainan|mhn|2799@jfb|江福北|YJI|jiangfubei|jfb|2800@jm|江门|KRN|jiangmen|jm|2801@wt|乌太|WTG|wutai|wt|2802@nf|宁福|GOF|ningfu|nf|2803@xzd|西郑东|AJU|xizhengdong|xzd|2804@cqb|重齐北|CKK|chongqibei|cqb|2805@cd|城德|BYX|chengde|cd|2806@lqtn|兰庆太南|IRH|lanqingtainan|lqtn|2807@jq|江青|KHM|jiangqing|jq|2808@qlx|齐岭西|KLC|qilingxi|qlx|2809@nqb|南庆北|HVQ|nanqingbei|nqb|2810@kjdd|昆家德东|FPR|kunjiadedong|kjdd|2811@lsb|兰沙北|PVY|lanshabei|lsb|2812@sccx|石长城西|ROE|shichangchengxi|sccx|2813@tjd|太津东|RVN|taijindong|tjd|2814@shlb|沈海连北|DVU|shenhailianbei|shlb|2815@cjx|重津厦|CFW|chongjinxia|cjx|2816@dhfb|岛哈肥北|PKK|daohafeibei|dhfb|2817@fsb|肥上北|RBK|feishangbei|fsb|2818@wgn|乌贵南|TFZ|wuguinan|wgn|2819@btsn|滨太山南|WSY|bintaishannan|btsn|2820@hc|化春|LSW|huachun|hc|2821@nhsd|南海沈东|QMJ|nanhaishendong|nhsd|2822@hhb|河河北|LYC|hehebei|hhb|2823@wjd|武江东|WCW|wujiangdong|wjd|2824@chhn|成湖哈南|KRR|chenghuhanan|chhn|2825@cdb|成东北|AMV|chengdongbei|cdb|2826@hk|杭昆|EMC|hangkun|hk|2827@js|济沈|NUM|jishen|js|2828@lq|林泉|UYJ|linquan|lq|2829@szh|石庄河|MZG|shizhuanghe|szh|2830@hsx|海上西|RJA|haishangxi|hsx|2831@qxn|庆厦南|TAL|qingxianan|qxn|2832@chxx|重化兴西|XNX|chonghuaxingxi|chxx|2833@jskx|家沙昆西|ZHR|jiashakunxi|jskx|2834@kcb|昆重北|JZG|kunchongbei|kcb|2835@xhdd|兴河东东|CJF|xinghedongdong|xhdd|2836@hdj|湖德济|SCT|hudeji|hdj|2837@gzxn|贵庄厦南|KMM|guizhuangxianan|gzxn|2838@qqwn|庆泉乌南|LLA|qingquanwunan|qqwn|2839@hy|化阳|ZCP|huayang|hy|2840@zdd|郑岛东|DRB|zhengdaodong|zdd|2841@jg|津贵|PLJ|jingui|jg|2842@cbzb|昌滨郑北|YDA|changbinzhengbei|cbzb|2843@fcb|肥城北|FOH|feichengbei|fcb|2844@jjfn|家江福南|SEP|jiajiangfunan|jjfn|2845@ded|德尔东|EYC|deerdong|ded|2846@hc|河重|WYH|hechong|hc|2847@nhx|南杭西|FJR|nanhangxi|nhx|2848@jgb|京贵北|SVC|jingguibei|jgb|2849@nxsb|宁西山北|TUW|ningxishanbei|nxsb|2850@gen|广尔南|DOQ|guangernan|gen|2851@wcdn|武成东南|DAS|wuchengdongnan|wcdn|2852@dx|都兴|BYU|duxing|dx|2853@shb|沙河北|CDT|shahebei|shb|2854@xcx|西城西|WHE|xichengxi|xcx|2855@yhn|阳合南|SEL|yanghenan|yhn|2856@xwn|新武南|ETU|xinwunan|xwn|2857@hc|哈重|QGK|hachong|hc|2858@xk|厦口|KTG|xiakou|xk|2859@bzh|北州哈|MCI|beizhouha|bzh|2860@myzn|明原圳南|XTW|mingyuanzhennan|myzn|2861@lndx|林南东西|WAR|linnandongxi|lndx|2862@jb|金白|LEE|jinbai|jb|2863@lhx|连湖西|LMG|lianhuxi|lhx|2864@zz|州圳|VND|zhouzhen|zz|2865@hxhn|哈新湖南|MDX|haxinhunan|hxhn|2866@xhn|兴汉南|YIZ|xinghannan|xhn|2867@zzx|庄庄西|HHG|zhuangzhuangxi|zzx|2868@nd|宁德|BXI|ningde|nd|2869@cnb|重宁北|TWY|chongningbei|cnb|2870@nf|南福|PJK|nanfu|nf|2871@zlb|庄兰北|KKK|zhuanglanbei|zlb|2872@ycdb|阳昌岛北|FRP|yangchangdaobei|ycdb|2873@ql|庆兰|JIW|qinglan|ql|2874@qhb|青哈北|ANZ|qinghabei|qhb|2875@bfy|白肥阳|WSL|baifeiyang|bfy|2876@syb|深原北|CAZ|shenyuanbei|syb|2877@ejz|尔京圳|QVW|erjingzhen|ejz|2878@hjn|杭江南|FVH|hangjiangnan|hjn|2879@szh|深郑杭|UCV|shenzhenghang|szh|2880@jh|江海|PUS|jianghai|jh|2881@eycb|尔阳重北|BKV|eryangchongbei|eycb|2882@eh|尔海|HBS|erhai|eh|2883@qse|齐山尔|YDI|qishaner|qse|2884@cs|成山|ODX|chengshan|cs|2885@zjy|州京阳|BJE|zhoujingyang|zjy|2886@ahd|安河东|DTM|anhedong|ahd|2887@bjb|滨家北|KSL|binjiabei|bjb|2888@hh|汉海|UXU|hanhai|hh|2889@dcd|大昌东|MMN|dachangdong|dcd|2890@nx|南厦|XXA|nanxia|nx|2891@bnn|滨南南|ITG|binnannan|bnn|2892@cywn|城阳乌南|NSM|chengyangwunan|cywn|2893@dkb|都昆北|LGO|dukunbei|dkb|2894@st|上太|DVY|shangtai|st|2895@jbh|津滨化|GHY|jinbinhua|jbh|2896@cqs|长庆石|VTU|changqingshi|cqs|2897@zzk|庄郑口|STN|zhuangzhengkou|zzk|2898@cc|城长|ITX|chengchang|cc|2899@hcx|汉春西|FSM|hanchunxi|hcx|2900@csd|城山东|CLT|chengshandong|csd|2901@sxsd|上兴苏东|ZXG|shangxingsudong|sxsd|2902@hhn|化湖南|BBO|huahunan|hhn|2903@msl|木石兰|MXM|mushilan|msl|2904@tn|天宁|GYV|tianning|tn|2905@msx|木上西|CFC|mushangxi|msx|2906@dj|岛金|TWK|daojin|dj|2907@lsb|兰石白|MKT|lanshibai|lsb|2908@sbjn|山滨京南|WKW|shanbinjingnan|sbjn|2909@hcn|化重南|RTK|huachongnan|hcn|2910@dsx|大沙西|IVQ|dashaxi|dsx|2911@jj|津家|ZPE|jinjia|jj|2912@jcb|济昌白|PHP|jichangbai|jcb|2913@mqqd|门青青东|MMO|menqingqingdong|mqqd|2914@lngd|连宁贵东|WOP|lianningguidong|lngd|2915@dnx|岛南西|GSW|daonanxi|dnx|2916@sq|上泉|YWX|shangquan|sq|2917@ftn|福天南|KUZ|futiannan|ftn|2918@bjn|北济南|XJZ|beijinan|bjn|2919@lqj|岭庆京|ZLM|lingqingjing|lqj|2920@tdn|天德南|QVS|tiandenan|tdn|2921@syb|沙原白|ACS|shayuanbai|syb|2922@myd|木阳东|ZSQ|muyangdong|myd|2923@ssb|山石北|FAE|shanshibei|ssb|2924@pcn|平成南|XRR|pingchengnan|pcn|2925@ch|成化|OSS|chenghua|ch|2926@cwed|昌武尔东|BKQ|changwuerdong|cwed|2927@jsx|济上西|IKN|jishangxi|jsx|2928@lgd|连广东|ODD|lianguangdong|lgd|2929@xgd|西广大|SRX|xiguangda|xgd|2930@sjn|石津南|WJM|shijinnan|sjn|2931@hj|杭京|OAL|hangjing|hj|2932@sxd|上兴东|CJA|shangxingdong|sxd|2933@dc|德长|BLU|dechang|dc|2934@qa|泉安|GQQ|quanan|qa|2935@xl|西兰|LNM|xilan|xl|2936@wzs|乌庄深|KZQ|wuzhuangshen|wzs|2937@lj|连家|NMU|lianjia|lj|2938@qa|青安|JQL|qingan|qa|2939@zxd|圳新东|NSR|zhenxindong|zxd|2940@lzb|兰州北|OOI|lanzhoubei|lzb|2941@wp|武平|WWC|wuping|wp|2942@man|明安南|KHE|mingannan|man|2943@xlm|厦兰木|XTF|xialanmu|xlm|2944@tb|天滨|CGR|tianbin|tb|2945@qhk|齐湖昆|LFW|qihukun|qhk|2946@fc|福重|WNO|fuchong|fc|2947@zcc|庄昌春|FTF|zhuangchangchun|zcc|2948@khn|口湖南|URA|kouhunan|khn|2949@bgdd|滨广东东|SLU|binguangdongdong|bgdd|2950@agcx|安贵城西|MXS|anguichengxi|agcx|2951@asbd|安沙白东|DKL|anshabaidong|asbd|2952@lld|连岭岛|NZC|lianlingdao|lld|2953@ywc|原武春|EYM|yuanwuchun|ywc|2954@qzd|庆圳东|XUY|qingzhendong|qzd|2955@zx|圳兴|HUS|zhenxing|zx|2956@cxg|春新广|JKR|chunxinguang|cxg|2957@lnh|连南汉|UAH|liannanhan|lnh|2958@qyz|青原圳|QAW|qingyuanzhen|qyz|2959@zlb|州岭北|VGW|zhoulingbei|zlb|2960@hf|合肥|DAL|hefei|hf|2961@xs|新上|QDX|xinshang|xs|2962@xml|西门林|ROF|ximenlin|xml|2963@mzbd|明郑北东|RML|mingzhengbeidong|mzbd|2964@qmgb|庆木广北|XBB|qingmuguangbei|qmgb|2965@qtq|青太泉|LIY|qingtaiquan|qtq|2966@jq|津泉|ZAD|jinquan|jq|2967@cqhn|春泉海南|RHO|chunquanhainan|cqhn|2968@gzx|广郑西|KMN|guangzhengxi|gzx|2969@hbb|湖北北|CTA|hubeibei|hbb|2970@qhn|齐杭南|KMA|qihangnan|qhn|2971@fh|肥汉|CFR|feihan|fh|2972@kq|昆庆|TUK|kunqing|kq|2973@gm|广门|UCE|guangmen|gm|2974@gdpx|广德平西|RKU|guangdepingxi|gdpx|2975@bjx|白金西|HXZ|baijinxi|bjx|2976@fsd|福石东|MNR|fushidong|fsd|2977@ybn|原滨南|RQB|yuanbinnan|ybn|2978@ax|安兴|GYS|anxing|ax|2979@dgdx|大广东西|HIC|daguangdongxi|dgdx|2980@kdd|口岛东|VJY|koudaodong|kdd|2981@qdq|庆德青|VZX|qingdeqing|qdq|2982@clx|昌连西|TZN|changlianxi|clx|2983@sb|沈白|NMJ|shenbai|sb|2984@jsb|济山北|MNP|jishanbei|jsb|2985@htb|河天北|BNG|hetianbei|htb|2986@ced|城尔东|WZL|chengerdong|ced|2987@gjhd|广江哈东|JGX|guangjianghadong|gjhd|2988@yb|阳滨|TGQ|yangbin|yb|2989@mx|明兴|OYC|mingxing|mx|2990@kw|口乌|PWV|kouwu|kw|2991@cfd|重福东|LET|chongfudong|cfd|2992@hyd|湖阳东|FZD|huyangdong|hyd|2993@jh|家海|YDF|jiahai|jh|2994@cc|春春|RPZ|chunchun|cc|2995@jcqn|津长青南|OQN|jinchangqingnan|jcqn|2996@ekd|尔口东|RLE|erkoudong|ekd|2997@hdn|杭东南|IJS|hangdongnan|hdn|2998@qsxx|齐石西西|SAS|qishixixi|qsxx|2999@mzn|木庄南|OSO|muzhuangnan|mzn|3000@xht|厦杭天|IOG|xiahangtian|xht|3001@mssd|门深深东|KLS|menshenshendong|mssd|3002@hpd|哈平东|VGD|hapingdong|hpd|3003@lcw|岭城乌|BTX|lingchengwu|lcw|3004@jld|津林东|FTH|jinlindong|jld|3005@dctx|都长太西|PKA|duchangtaixi|dctx|3006@zspn|州沈平南|OIJ|zhoushenpingnan|zspn|3007@bdb|滨德滨|GLR|bindebin|bdb|3008@mszd|明深州东|YTP|mingshenzhoudong|mszd|3009@dsn|德山南|PIL|deshannan|dsn|3010@px|平兴|UEE|pingxing|px|3011@chjn|长湖津南|LCB|changhujinnan|chjn|3012';
\ No newline at end of file
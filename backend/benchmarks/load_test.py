@@ -0,0 +1,209 @@
+"""负载基准：在本地 12306 替身之上压测后端接口，输出延迟分位数与吞吐
+
+运行：cd backend && python -m benchmarks.load_test --concurrency 1,10,50 --duration 10
+
+默认会启动 mock_upstream 与一个 uvicorn 进程（使用临时 DATA_DIR），完全离线；
+指定 --target 时直接压测已运行的服务（此时不会启动替身）。
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from typing import Callable, List, Optional, Tuple
+
+import aiohttp
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATION_KEYWORDS = ['北', '北京', '北京南', 'bj', 'bjn', 'shanghai', '上海', '虹桥', 'nan', '南京', 'AOH', '济南']
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_http(url: str, timeout: float = 30) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return True
+        except Exception:
+            pass
+        time.sleep(0.05)
+    return False
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return float('nan')
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, int(round(pct / 100 * len(values) + 0.5)) - 1))
+    return values[index]
+
+
+class LocalStack:
+    """启动 mock_upstream 与 uvicorn 子进程"""
+
+    def __init__(self, latency: float, jitter: float, error_rate: float, workers: int = 1,
+                 env: Optional[dict] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.workers = workers
+        self.env = env or {}  # 传给后端进程的额外环境变量（覆盖配置）
+        self.procs: List[subprocess.Popen] = []
+        self.data_dir = tempfile.mkdtemp(prefix='12306-bench-')
+        self.upstream_url = ''
+        self.api_url = ''
+
+    def start(self):
+        upstream_port = free_port()
+        # aiohttp 默认的 CookieJar 不接受 IP 地址下发的 Cookie，替身需通过主机名访问
+        self.upstream_url = f'http://localhost:{upstream_port}'
+        self.procs.append(subprocess.Popen(
+            [sys.executable, '-m', 'benchmarks.mock_upstream', '--port', str(upstream_port),
+             '--latency', str(self.latency), '--jitter', str(self.jitter),
+             '--error-rate', str(self.error_rate)],
+            cwd=BACKEND_DIR,
+        ))
+        if not wait_http(f'{self.upstream_url}/__stats'):
+            raise RuntimeError('mock upstream failed to start')
+
+        api_port = free_port()
+        self.api_url = f'http://127.0.0.1:{api_port}'
+        env = dict(os.environ, UPSTREAM_BASE_URL=self.upstream_url, DATA_DIR=self.data_dir, **self.env)
+        self.procs.append(subprocess.Popen(
+            [sys.executable, '-m', 'uvicorn', 'app.main:app', '--port', str(api_port),
+             '--workers', str(self.workers), '--log-level', 'warning'],
+            cwd=BACKEND_DIR, env=env,
+        ))
+        if not wait_http(f'{self.api_url}/ready'):
+            raise RuntimeError('backend failed to become ready')
+
+    def upstream_stats(self) -> dict:
+        with urllib.request.urlopen(f'{self.upstream_url}/__stats') as response:
+            return json.loads(response.read())
+
+    def stop(self):
+        for proc in reversed(self.procs):
+            proc.terminate()
+            proc.wait()
+
+
+async def run_level(session: aiohttp.ClientSession, make_request: Callable, concurrency: int,
+                    duration: float) -> Tuple[List[float], int]:
+    """concurrency 个并发循环发送请求 duration 秒，返回 (成功请求延迟列表, 失败数)"""
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            method, url, body = make_request()
+            start = time.perf_counter()
+            try:
+                async with session.request(method, url, json=body) as response:
+                    await response.read()
+                    ok = response.status < 400
+            except aiohttp.ClientError:
+                ok = False
+            if ok:
+                latencies.append(time.perf_counter() - start)
+            else:
+                errors += 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors
+
+
+async def run(api_url: str, levels: List[int], duration: float, endpoints: List[str], dates: int):
+    base = f'{api_url}/api'
+    today = datetime.date.today()
+    train_dates = [(today + datetime.timedelta(days=i)).isoformat() for i in range(dates)]
+    rng = random.Random(0)
+
+    def ticket_request():
+        return 'POST', f'{base}/tickets/query', {
+            'from_station': '北京南', 'to_station': '上海虹桥',
+            'train_date': rng.choice(train_dates), 'include_stops': True,
+        }
+
+    def station_request():
+        return 'GET', f'{base}/stations/{rng.choice(STATION_KEYWORDS)}', None
+
+    connector = aiohttp.TCPConnector(limit=0)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        # 先查询一次车票，取得可用于经停站接口的车次
+        async with session.post(f'{base}/tickets/query', json={
+            'from_station': '北京南', 'to_station': '上海虹桥', 'train_date': train_dates[0],
+        }) as response:
+            train_codes = [train['train_code'] for train in await response.json()][:50]
+        if not train_codes:
+            raise RuntimeError('warm-up ticket query returned no trains')
+
+        def stops_request():
+            return 'GET', f'{base}/trains/{rng.choice(train_codes)}/stops?train_date={train_dates[0]}', None
+
+        scenarios = {
+            'tickets': ticket_request,
+            'stations': station_request,
+            'stops': stops_request,
+        }
+
+        print(f"{'endpoint':<10}{'conc':>6}{'requests':>10}{'errors':>8}{'rps':>10}"
+              f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+        for name in endpoints:
+            for concurrency in levels:
+                latencies, errors = await run_level(session, scenarios[name], concurrency, duration)
+                total = len(latencies) + errors
+                print(f"{name:<10}{concurrency:>6}{total:>10}{errors:>8}{total / duration:>10.1f}"
+                      f"{percentile(latencies, 50) * 1000:>10.1f}"
+                      f"{percentile(latencies, 95) * 1000:>10.1f}"
+                      f"{percentile(latencies, 99) * 1000:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--target', help='压测已运行的服务，例如 http://127.0.0.1:8001')
+    parser.add_argument('--concurrency', default='1,10,50', help='逗号分隔的并发数')
+    parser.add_argument('--duration', type=float, default=10, help='每个并发级别持续的秒数')
+    parser.add_argument('--endpoints', default='tickets,stations,stops')
+    parser.add_argument('--dates', type=int, default=7, help='车票查询轮换的日期数')
+    parser.add_argument('--latency', type=float, default=50, help='替身平均延迟（毫秒）')
+    parser.add_argument('--jitter', type=float, default=20, help='替身延迟浮动（毫秒）')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='替身返回 502 的概率')
+    parser.add_argument('--workers', type=int, default=1, help='uvicorn worker 数')
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.concurrency.split(',')]
+    endpoints = args.endpoints.split(',')
+
+    stack: Optional[LocalStack] = None
+    api_url = args.target
+    if not api_url:
+        stack = LocalStack(args.latency, args.jitter, args.error_rate, args.workers)
+        stack.start()
+        api_url = stack.api_url
+    try:
+        asyncio.run(run(api_url, levels, args.duration, endpoints, args.dates))
+        if stack:
+            print(f"upstream requests: {json.dumps(stack.upstream_stats(), sort_keys=True)}")
+    finally:
+        if stack:
+            stack.stop()
+
+
+if __name__ == '__main__':
+    main()
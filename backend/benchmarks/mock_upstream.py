@@ -0,0 +1,144 @@
+"""本地 12306 替身：回放 benchmarks/fixtures/ 中录制格式的响应
+
+运行：cd backend && python -m benchmarks.mock_upstream --port 9306 --latency 50 --error-rate 0.01
+然后以 UPSTREAM_BASE_URL=http://localhost:9306 启动后端即可完全离线运行（不要用 127.0.0.1：
+aiohttp 默认的 CookieJar 不接受 IP 地址主机下发的 Cookie，每次 queryZ 都会返回会话失效页面）。
+
+- leftTicket/init：下发会话 Cookie
+- leftTicket/queryZ：优先回放 fixtures/queryZ_{from}_{to}.json，否则按站点对生成合成结果；
+  未携带 Cookie 时返回 HTML，模拟会话失效
+- czxx/queryByTrainNo：回放 fixtures/queryByTrainNo.json
+- leftTicket/queryTicketPrice：按 train_no 与 seat_types 生成确定的票价
+- station_name.js：回放 fixtures/station_name.js，支持 ETag / If-None-Match
+- /__stats：各接口的请求计数，供基准脚本统计上游请求量
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import random
+from collections import Counter
+
+from aiohttp import web
+
+from benchmarks.synthetic import generate_query_rows, query_response
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+SESSION_COOKIE = 'JSESSIONID'
+# seat_types 中的席别字符 -> queryTicketPrice 返回的席别代码与基础票价
+PRICE_CODES = {'9': ('A9', 1748.0), 'P': ('P', 1100.0), 'M': ('M', 933.0), 'O': ('O', 553.0),
+               '6': ('A6', 820.0), '4': ('A4', 410.0), 'F': ('F', 390.0), '3': ('A3', 263.0),
+               '1': ('A1', 156.5)}
+
+
+class MockUpstream:
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 fixture_dir: str = FIXTURE_DIR, seed: int = 12306):
+        self.latency = latency  # 平均响应延迟（秒）
+        self.jitter = jitter  # 延迟的随机浮动（秒）
+        self.error_rate = error_rate  # 返回错误的概率
+        self.fixture_dir = fixture_dir
+        self.rng = random.Random(seed)
+        self.counts = Counter()
+        self._query_cache = {}
+
+        with open(os.path.join(fixture_dir, 'station_name.js'), 'rb') as f:
+            self.station_js = f.read()
+        self.station_etag = '"%s"' % hashlib.md5(self.station_js).hexdigest()
+        with open(os.path.join(fixture_dir, 'queryByTrainNo.json'), 'rb') as f:
+            self.stops_body = f.read()
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get('/otn/leftTicket/init', self.init)
+        app.router.add_get('/otn/leftTicket/queryZ', self.query)
+        app.router.add_get('/otn/czxx/queryByTrainNo', self.stops)
+        app.router.add_get('/otn/leftTicket/queryTicketPrice', self.prices)
+        app.router.add_get('/otn/resources/js/framework/station_name.js', self.station_names)
+        app.router.add_get('/__stats', self.stats)
+        return app
+
+    async def _simulate(self, endpoint: str):
+        """计数并模拟延迟，按错误率抛出 502"""
+        self.counts[endpoint] += 1
+        if self.latency or self.jitter:
+            await asyncio.sleep(max(0.0, self.latency + self.rng.uniform(-self.jitter, self.jitter)))
+        if self.error_rate and self.rng.random() < self.error_rate:
+            self.counts[f'{endpoint}_error'] += 1
+            raise web.HTTPBadGateway(text='mock upstream error')
+
+    async def init(self, request: web.Request) -> web.Response:
+        await self._simulate('init')
+        response = web.Response(text='<html><body>leftTicket/init</body></html>', content_type='text/html')
+        response.set_cookie(SESSION_COOKIE, 'mock-session')
+        return response
+
+    def _query_body(self, from_code: str, to_code: str) -> bytes:
+        key = (from_code, to_code)
+        if key not in self._query_cache:
+            path = os.path.join(self.fixture_dir, f'queryZ_{from_code}_{to_code}.json')
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    body = f.read()
+            else:
+                seed = int(hashlib.md5(f'{from_code}{to_code}'.encode()).hexdigest()[:8], 16)
+                rows = generate_query_rows(from_code, to_code, count=120, seed=seed)
+                body = json.dumps(query_response(rows, {}), ensure_ascii=False).encode('utf-8')
+            self._query_cache[key] = body
+        return self._query_cache[key]
+
+    async def query(self, request: web.Request) -> web.Response:
+        await self._simulate('queryZ')
+        if SESSION_COOKIE not in request.cookies:
+            self.counts['queryZ_expired'] += 1
+            return web.Response(text='<html>session expired</html>', content_type='text/html')
+        from_code = request.query.get('leftTicketDTO.from_station', '')
+        to_code = request.query.get('leftTicketDTO.to_station', '')
+        return web.Response(body=self._query_body(from_code, to_code), content_type='application/json')
+
+    async def stops(self, request: web.Request) -> web.Response:
+        await self._simulate('queryByTrainNo')
+        return web.Response(body=self.stops_body, content_type='application/json')
+
+    async def prices(self, request: web.Request) -> web.Response:
+        await self._simulate('queryTicketPrice')
+        train_no = request.query.get('train_no', '')
+        # 同一车次的票价在基础票价上按车次浮动，保证多次请求结果一致
+        factor = 0.8 + int(hashlib.md5(train_no.encode()).hexdigest()[:4], 16) / 0xffff * 0.4
+        data = {'train_no': train_no, 'OT': []}
+        for char in request.query.get('seat_types', ''):
+            if char in PRICE_CODES:
+                code, base = PRICE_CODES[char]
+                data[code] = f'¥{round(base * factor, 1)}'
+        lowest = [code for code in ('O', 'A1') if code in data]
+        if lowest:
+            data['WZ'] = data[lowest[0]]
+        return web.json_response({'status': True, 'httpstatus': 200, 'data': data})
+
+    async def station_names(self, request: web.Request) -> web.Response:
+        await self._simulate('station_name')
+        if request.headers.get('If-None-Match') == self.station_etag:
+            return web.Response(status=304, headers={'ETag': self.station_etag})
+        return web.Response(body=self.station_js, content_type='application/javascript',
+                            headers={'ETag': self.station_etag})
+
+    async def stats(self, request: web.Request) -> web.Response:
+        return web.json_response(dict(self.counts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='本地 12306 替身')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=9306)
+    parser.add_argument('--latency', type=float, default=0, help='平均延迟（毫秒）')
+    parser.add_argument('--jitter', type=float, default=0, help='延迟浮动（毫秒）')
+    parser.add_argument('--error-rate', type=float, default=0, help='返回 502 的概率 0~1')
+    args = parser.parse_args()
+
+    upstream = MockUpstream(args.latency / 1000, args.jitter / 1000, args.error_rate)
+    web.run_app(upstream.app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == '__main__':
+    main()
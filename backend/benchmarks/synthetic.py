@@ -0,0 +1,101 @@
+"""生成与 12306 格式一致的合成数据，供离线基准测试使用"""
+import random
+from typing import List
+
+from app.services.station_index import Station
+
+# 常见地名用字及其拼音
+CHARS = {
+    '北': 'bei', '京': 'jing', '上': 'shang', '海': 'hai', '广': 'guang', '州': 'zhou',
+    '深': 'shen', '圳': 'zhen', '天': 'tian', '津': 'jin', '南': 'nan', '西': 'xi',
+    '安': 'an', '成': 'cheng', '都': 'du', '重': 'chong', '庆': 'qing', '武': 'wu',
+    '汉': 'han', '长': 'chang', '沙': 'sha', '杭': 'hang', '苏': 'su', '郑': 'zheng',
+    '济': 'ji', '青': 'qing', '岛': 'dao', '大': 'da', '连': 'lian', '沈': 'shen',
+    '阳': 'yang', '哈': 'ha', '尔': 'er', '滨': 'bin', '春': 'chun', '石': 'shi',
+    '家': 'jia', '庄': 'zhuang', '太': 'tai', '原': 'yuan', '合': 'he', '肥': 'fei',
+    '福': 'fu', '厦': 'xia', '门': 'men', '昌': 'chang', '贵': 'gui', '昆': 'kun',
+    '明': 'ming', '宁': 'ning', '兰': 'lan', '乌': 'wu', '木': 'mu', '齐': 'qi',
+    '山': 'shan', '江': 'jiang', '河': 'he', '湖': 'hu', '东': 'dong', '平': 'ping',
+    '新': 'xin', '城': 'cheng', '德': 'de', '兴': 'xing', '林': 'lin', '泉': 'quan',
+    '岭': 'ling', '口': 'kou', '白': 'bai', '化': 'hua', '宜': 'yi', '金': 'jin',
+}
+SUFFIXES = ['', '', '', '东', '西', '南', '北']
+
+
+def generate_stations(count: int = 3300, seed: int = 12306) -> List[Station]:
+    """生成 count 个不重名、电报码唯一的站点"""
+    rng = random.Random(seed)
+    chars = list(CHARS)
+    names, codes = set(), set()
+    stations = []
+    while len(stations) < count:
+        word = ''.join(rng.choice(chars) for _ in range(rng.choice((2, 2, 3)))) + rng.choice(SUFFIXES)
+        if word in names:
+            continue
+        code = ''.join(rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ') for _ in range(3))
+        if code in codes:
+            continue
+        names.add(word)
+        codes.add(code)
+        pinyin = [CHARS[c] for c in word]
+        stations.append(Station(word, code, ''.join(pinyin), ''.join(p[0] for p in pinyin)))
+    return stations
+
+
+def station_names_js(stations: List[Station]) -> str:
+    """把站点表编码为 station_name.js 的文本格式"""
+    body = ''.join(f"@{s.initials}|{s.name}|{s.code}|{s.pinyin}|{s.initials}|{i}"
+                   for i, s in enumerate(stations))
+    return f"var station_names ='{body}';"
+
+
+def generate_query_rows(from_code: str, to_code: str, count: int = 150, seed: int = 12306) -> List[str]:
+    """生成 leftTicket/queryZ 的 data.result 行（字段布局与 12306 一致）"""
+    rng = random.Random(seed)
+    availability = ['有', '无', '', '', '1', '5', '12', '20', '*']
+    rows = []
+    for i in range(count):
+        prefix = rng.choice('GGGDDKTZ')
+        number = rng.randint(1, 9999 if prefix in 'KTZ' else 2999)
+        train_code = f"{prefix}{number}"
+        depart = rng.randint(5 * 60, 23 * 60)
+        duration = rng.randint(4 * 60, 20 * 60) if prefix in 'KTZ' else rng.randint(4 * 60, 7 * 60)
+        arrive = (depart + duration) % (24 * 60)
+        fields = [''] * 57
+        fields[0] = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz%0123456789') for _ in range(120))
+        fields[1] = '预订'
+        fields[2] = f"{rng.randint(24, 99)}0000{train_code:0>6}"[-12:]
+        fields[3] = train_code
+        fields[4], fields[5], fields[6], fields[7] = from_code, to_code, from_code, to_code
+        fields[8] = f"{depart // 60:02d}:{depart % 60:02d}"
+        fields[9] = f"{arrive // 60:02d}:{arrive % 60:02d}"
+        fields[10] = f"{duration // 60:02d}:{duration % 60:02d}"
+        fields[11] = 'Y'
+        fields[13] = '20240121'
+        fields[14] = '3'
+        fields[15] = 'P2'
+        fields[16] = '01'
+        fields[17] = f"{rng.randint(2, 20):02d}"
+        fields[18] = '1'
+        fields[19] = '0'
+        if prefix in 'GD':
+            for index in (30, 31, 32):
+                fields[index] = rng.choice(availability)
+            fields[26] = rng.choice(availability)
+            fields[35] = 'O9M'
+        else:
+            for index in (23, 26, 28, 29):
+                fields[index] = rng.choice(availability)
+            fields[35] = '1413'
+        rows.append('|'.join(fields))
+    return rows
+
+
+def query_response(rows: List[str], station_map: dict) -> dict:
+    """把车次行包装为 queryZ 的 JSON 响应"""
+    return {
+        "httpstatus": 200,
+        "data": {"result": rows, "flag": "1", "map": station_map},
+        "messages": "",
+        "status": True,
+    }